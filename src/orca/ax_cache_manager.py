@@ -30,11 +30,14 @@
 from __future__ import annotations
 
 import contextvars
+import itertools
 import math
+import sys
 import threading
 import time
 import weakref
-from contextlib import contextmanager
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
@@ -42,7 +45,7 @@ from typing import TYPE_CHECKING, Any
 from . import debug
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Hashable, Iterator
+    from collections.abc import Callable, Hashable, Iterable, Iterator
     from types import TracebackType
 
 # Internal miss sentinel for callers that need to distinguish a cache miss from cached None.
@@ -52,6 +55,20 @@ MISSING = object()
 # The timeout limits stale data and cache growth when those events are missing.
 DEFAULT_CLEAR_INTERVAL_SECONDS = 60
 
+# Parent links recorded for subtree invalidation. When the limit is reached, the links are
+# discarded along with the values that depend on them.
+MAX_TREE_LINKS = 50000
+
+# The approximate size of the values in bounded caches (those registered with max_entries or
+# max_bytes) combined. When exceeded, values are evicted from the least recently used bounded
+# caches until their total is EVICTION_TARGET_FRACTION of the limit. Values in other caches may
+# not be recomputable, e.g. caret contexts or known-dead objects, so they are never evicted.
+DEFAULT_MEMORY_LIMIT_BYTES = 64 * 1024 * 1024
+EVICTION_TARGET_FRACTION = 0.9
+
+# Invalidation reasons counted separately for each cache; the rest are counted as "Other."
+MAX_INVALIDATION_REASONS = 16
+
 
 def get_object_key(obj: object) -> Hashable:
     """Returns the cache key for an accessible object."""
@@ -59,6 +76,17 @@ def get_object_key(obj: object) -> Hashable:
     return hash(obj)
 
 
+def _get_entry_size(key: Hashable, value: Any) -> int:
+    """Returns the approximate size of a cached value and its key in bytes."""
+
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
 class Lifetime(Enum):
     """Defines how long a cache registration retains its owner."""
 
@@ -82,13 +110,32 @@ class ClearPolicy(Enum):
 class _Cache:
     """Stores ownership and clearing policy for one cache."""
 
-    values: dict[Hashable, Any] = field(default_factory=dict)
+    values: OrderedDict[Hashable, Any] = field(default_factory=OrderedDict)
     invalidation_groups: frozenset[str] = field(default_factory=frozenset)
     clear_on_demand: ClearPolicy = ClearPolicy.CLEAR
     clear_interval_seconds: float | None = None
     next_clear_time: float | None = None
     expiration_times: dict[Hashable, float] = field(default_factory=dict)
     is_active: bool = True
+    # Keys are object keys, or tuples whose first item is an object key.
+    keyed_by_object: bool = False
+    compound_keys: dict[Hashable, set[Hashable]] = field(default_factory=dict)
+    # Values are kept in insertion order when either budget is set. Reads mark keys in referenced
+    # rather than reordering values so that they need not take the lock; eviction gives marked
+    # keys a second chance by moving them to the end, so they never disappear from a reader.
+    max_entries: int | None = None
+    max_bytes: int | None = None
+    bounded: bool = False
+    referenced: set[Hashable] = field(default_factory=set)
+    # Sizes are only measured for bounded caches, the only ones they are needed for.
+    sizes: dict[Hashable, int] = field(default_factory=dict)
+    total_bytes: int = 0
+    last_used: int = 0
+    hits: int = 0
+    misses: int = 0
+    puts: int = 0
+    evictions: int = 0
+    invalidations: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -231,6 +278,17 @@ class CacheAccessor:
 class AXCacheManager:
     """Stores accessibility-related values in owner-controlled named caches."""
 
+    STATISTICS = (
+        "gets",
+        "hits",
+        "misses",
+        "puts",
+        "invalidations",
+        "evictions",
+        "entries",
+        "bytes",
+    )
+
     def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
         self._clock = clock
         self._owner_caches: dict[int, _OwnerCaches] = {}
@@ -241,6 +299,12 @@ class AXCacheManager:
         self._lock = threading.RLock()
         self._condition = threading.Condition(self._lock)
         self._clearing_thread_started = False
+        self._memory_limit: int | None = DEFAULT_MEMORY_LIMIT_BYTES
+        self._bounded_bytes = 0
+        # next() on a count is atomic, so readers which do not take the lock can advance it.
+        self._ticks = itertools.count(1)
+        self._parents: dict[Hashable, Hashable] = {}
+        self._children: dict[Hashable, set[Hashable]] = {}
         self._accessor_backend = _CacheAccessorBackend(
             get_value=self._get_accessor_value,
             get_scoped_value=self._get_scoped_accessor_value,
@@ -260,8 +324,17 @@ class AXCacheManager:
         clear_on_demand: ClearPolicy = ClearPolicy.CLEAR,
         clear_interval_seconds: float | None = DEFAULT_CLEAR_INTERVAL_SECONDS,
         invalidation_groups: set[str] | frozenset[str] = frozenset(),
+        keyed_by_object: bool = False,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
     ) -> bool:
-        """Registers cache ownership and clearing policy, returning False on failure."""
+        """Registers cache ownership and clearing policy, returning False on failure.
+
+        Caches keyed_by_object lose only the affected values in invalidate_subtree. Their keys
+        must be object keys, or tuples whose first item is an object key. Caches with max_entries
+        or max_bytes evict values not read since they were stored or last passed over, oldest
+        first, to stay within that budget.
+        """
 
         if not cache_name:
             debug.print_message(debug.LEVEL_INFO, "AXCacheManager: Empty cache name.", True)
@@ -291,6 +364,14 @@ class AXCacheManager:
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return False
 
+        for budget_name, budget in (("max entries", max_entries), ("max bytes", max_bytes)):
+            if budget is not None and (
+                not isinstance(budget, int) or isinstance(budget, bool) or budget <= 0
+            ):
+                msg = f"AXCacheManager: Invalid {budget_name} for {cache_name}: {budget}"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
+                return False
+
         start_thread = False
         collision = False
         unsupported_owner = False
@@ -325,6 +406,10 @@ class AXCacheManager:
                         clear_on_demand=clear_on_demand,
                         clear_interval_seconds=clear_interval_seconds,
                         next_clear_time=next_clear_time,
+                        keyed_by_object=keyed_by_object,
+                        max_entries=max_entries,
+                        max_bytes=max_bytes,
+                        bounded=max_entries is not None or max_bytes is not None,
                     )
 
         if unsupported_owner:
@@ -387,7 +472,7 @@ class AXCacheManager:
         with self._lock:
             cache, failure = self._get_owned_cache_locked(owner, cache_name)
             if cache is not None:
-                self._clear_cache_values_locked(id(owner), cache_name, cache)
+                self._clear_cache_values_locked(id(owner), cache_name, cache, reason)
         if failure:
             debug.print_message(debug.LEVEL_INFO, failure, True)
         elif cache is not None and log:
@@ -401,7 +486,7 @@ class AXCacheManager:
             for owner_id, owner_caches in self._get_owner_cache_items_locked():
                 for cache_name, cache in owner_caches.caches.items():
                     if group in cache.invalidation_groups:
-                        self._clear_cache_values_locked(owner_id, cache_name, cache)
+                        self._clear_cache_values_locked(owner_id, cache_name, cache, reason)
                         cleared_cache_names.append(cache_name)
         self._log_invalidation(cleared_cache_names, reason)
 
@@ -413,9 +498,236 @@ class AXCacheManager:
             for owner_id, owner_caches in self._get_owner_cache_items_locked():
                 for cache_name, cache in owner_caches.caches.items():
                     if cache.clear_on_demand is ClearPolicy.CLEAR:
-                        self._clear_cache_values_locked(owner_id, cache_name, cache)
+                        self._clear_cache_values_locked(owner_id, cache_name, cache, reason)
+                        cleared_cache_names.append(cache_name)
+        self._log_invalidation(cleared_cache_names, reason)
+
+    def note_parent(self, child_key: Hashable, parent_key: Hashable) -> None:
+        """Records that the object with child_key is a child of the object with parent_key."""
+
+        if self._parents.get(child_key) == parent_key:
+            return
+
+        overflow = False
+        with self._lock:
+            old_parent_key = self._parents.get(child_key)
+            if old_parent_key is not None:
+                self._children.get(old_parent_key, set()).discard(child_key)
+            elif len(self._parents) >= MAX_TREE_LINKS:
+                self._parents.clear()
+                self._children.clear()
+                overflow = True
+            self._parents[child_key] = parent_key
+            self._children.setdefault(parent_key, set()).add(child_key)
+
+        if overflow:
+            self.clear_cache_now(f"Tree link limit ({MAX_TREE_LINKS}) reached.")
+
+    def invalidate_subtree(
+        self,
+        obj_key: Hashable,
+        ancestor_keys: Iterable[Hashable] = (),
+        reason: str = "",
+    ) -> None:
+        """Clears cached values for an object, its ancestors, and its known descendants.
+
+        Only caches participating in ordinary forced cache resets are affected. Those not
+        keyed_by_object are cleared entirely.
+        """
+
+        cleared_cache_names: list[str] = []
+        removed = 0
+        with self._lock:
+            region = self._get_subtree_region_locked(obj_key, ancestor_keys)
+            for owner_id, owner_caches in self._get_owner_cache_items_locked():
+                for cache_name, cache in owner_caches.caches.items():
+                    if cache.clear_on_demand is not ClearPolicy.CLEAR:
+                        continue
+                    if not cache.keyed_by_object:
+                        self._clear_cache_values_locked(owner_id, cache_name, cache, reason)
                         cleared_cache_names.append(cache_name)
+                        continue
+                    removed_from_cache = self._discard_object_values_locked(
+                        owner_id, cache_name, cache, region
+                    )
+                    if removed_from_cache:
+                        self._count_invalidation_locked(cache, reason)
+                    removed += removed_from_cache
+
         self._log_invalidation(cleared_cache_names, reason)
+        tokens = [
+            f"AXCacheManager: Invalidated {removed} value(s) for {len(region)} object(s)",
+            "in subtree.",
+        ]
+        if reason:
+            tokens.append(f"Reason: {reason}")
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+    def discard_subtree(
+        self,
+        owner: object,
+        cache_names: Iterable[str],
+        obj_key: Hashable,
+        ancestor_keys: Iterable[Hashable] = (),
+        reason: str = "",
+    ) -> int:
+        """Discards owned values for an object, its ancestors, and its known descendants.
+
+        Unlike invalidate_subtree, the named caches are affected regardless of their clear
+        policy, and the descendants' links are kept. Returns the number of values discarded.
+        """
+
+        removed = 0
+        with self._lock:
+            owner_caches = self._get_owner_caches_locked(owner)
+            if owner_caches is None:
+                return 0
+
+            region = self._get_subtree_region_locked(
+                obj_key, ancestor_keys, forget_descendants=False
+            )
+            for cache_name in cache_names:
+                cache = owner_caches.caches.get(cache_name)
+                if cache is None or not cache.keyed_by_object or not cache.is_active:
+                    continue
+                removed_from_cache = self._discard_object_values_locked(
+                    id(owner), cache_name, cache, region
+                )
+                if removed_from_cache:
+                    self._count_invalidation_locked(cache, reason)
+                removed += removed_from_cache
+
+        tokens = [
+            f"AXCacheManager: Discarded {removed} value(s) for {len(region)} object(s)",
+            "in subtree.",
+        ]
+        if reason:
+            tokens.append(f"Reason: {reason}")
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        return removed
+
+    def get_statistics(self) -> dict[str, dict[str, int]]:
+        """Returns the usage counts and size of each cache, combined by cache name."""
+
+        statistics: dict[str, dict[str, int]] = {}
+        with self._lock:
+            for _owner_id, owner_caches in self._get_owner_cache_items_locked():
+                for cache_name, cache in owner_caches.caches.items():
+                    entry = statistics.setdefault(cache_name, dict.fromkeys(self.STATISTICS, 0))
+                    entry["gets"] += cache.hits + cache.misses
+                    entry["hits"] += cache.hits
+                    entry["misses"] += cache.misses
+                    entry["puts"] += cache.puts
+                    entry["invalidations"] += sum(cache.invalidations.values())
+                    entry["evictions"] += cache.evictions
+                    entry["entries"] += len(cache.values)
+                    entry["bytes"] += cache.total_bytes
+        return statistics
+
+    def get_invalidation_reasons(self) -> dict[str, dict[str, int]]:
+        """Returns the number of invalidations of each cache by reason, combined by cache name."""
+
+        reasons: dict[str, dict[str, int]] = {}
+        with self._lock:
+            for _owner_id, owner_caches in self._get_owner_cache_items_locked():
+                for cache_name, cache in owner_caches.caches.items():
+                    entry = reasons.setdefault(cache_name, {})
+                    for reason, count in cache.invalidations.items():
+                        entry[reason] = entry.get(reason, 0) + count
+        return reasons
+
+    def get_hit_rate(self) -> float:
+        """Returns the fraction of lookups in all caches which were hits."""
+
+        hits = misses = 0
+        for entry in self.get_statistics().values():
+            hits += entry["hits"]
+            misses += entry["misses"]
+        if not hits + misses:
+            return 0.0
+        return hits / (hits + misses)
+
+    def reset_statistics(self) -> None:
+        """Resets the usage counts of all caches."""
+
+        with self._lock:
+            for _owner_id, owner_caches in self._get_owner_cache_items_locked():
+                for cache in owner_caches.caches.values():
+                    cache.hits = 0
+                    cache.misses = 0
+                    cache.puts = 0
+                    cache.evictions = 0
+                    cache.invalidations = {}
+
+    def set_memory_limit(self, limit_bytes: int | None) -> None:
+        """Sets the approximate size of the values in bounded caches, or None for no limit."""
+
+        with self._lock:
+            self._memory_limit = limit_bytes
+            evicted = self._enforce_memory_limit_locked()
+        self._log_eviction(evicted)
+
+    def get_memory_usage(self) -> int:
+        """Returns the approximate size of the values in bounded caches combined in bytes."""
+
+        return self._bounded_bytes
+
+    def _get_subtree_region_locked(
+        self,
+        obj_key: Hashable,
+        ancestor_keys: Iterable[Hashable],
+        forget_descendants: bool = True,
+    ) -> set[Hashable]:
+        """Returns the keys of obj_key, its ancestors, and its known descendants."""
+
+        region = {obj_key}
+        region.update(ancestor_keys)
+        parent_key = self._parents.get(obj_key)
+        while parent_key is not None and parent_key not in region:
+            region.add(parent_key)
+            parent_key = self._parents.get(parent_key)
+
+        if not forget_descendants:
+            pending = list(self._children.get(obj_key, ()))
+            while pending:
+                key = pending.pop()
+                if key not in region:
+                    region.add(key)
+                    pending.extend(self._children.get(key, ()))
+            return region
+
+        # The descendants' links are dropped; they are recorded again as the tree is walked.
+        pending = list(self._children.pop(obj_key, ()))
+        while pending:
+            key = pending.pop()
+            if key in region:
+                continue
+            region.add(key)
+            self._parents.pop(key, None)
+            pending.extend(self._children.pop(key, ()))
+        return region
+
+    def _discard_object_values_locked(
+        self, owner_id: int, cache_name: str, cache: _Cache, region: set[Hashable]
+    ) -> int:
+        """Discards the values of an object-keyed cache for the objects in region."""
+
+        keys: list[Hashable] = []
+        for obj_key in region:
+            keys.append(obj_key)
+            keys.extend(cache.compound_keys.pop(obj_key, ()))
+
+        removed = 0
+        for key in keys:
+            if self._remove_value_locked(cache, key):
+                removed += 1
+        for scoped_values in self._scoped_values.values():
+            values = scoped_values.get((owner_id, cache_name))
+            if not values:
+                continue
+            for key in keys:
+                values.pop(key, None)
+        return removed
 
     def _get_owned_cache_locked(
         self, owner: object, cache_name: str
@@ -461,21 +773,49 @@ class AXCacheManager:
         return values, None
 
     def _get_accessor_value(self, cache: _Cache, key: Hashable, default: Any) -> Any:
-        """Returns a value for a cache accessor."""
+        """Returns a value for a cache accessor without taking the lock.
+
+        Cache values are only changed with the lock held, one dict operation at a time, and a
+        key is only removed when its value is discarded, so a read sees either the old or the
+        new value and never misses a value which stays cached. The hit and miss counts updated
+        here are advisory and may occasionally lose a concurrent increment. Expired values are
+        removed under the lock.
+        """
+
+        if not cache.is_active:
+            return default
+
+        expiration_time = cache.expiration_times.get(key)
+        if expiration_time is not None and expiration_time <= self._clock():
+            return self._expire_accessor_value(cache, key, default)
+
+        value = cache.values.get(key, MISSING)
+        if value is MISSING:
+            cache.misses += 1
+            return default
+
+        cache.hits += 1
+        cache.last_used = next(self._ticks)
+        if cache.bounded:
+            cache.referenced.add(key)
+        return value
 
-        with self._lock:
-            if not cache.is_active:
-                return default
+    def _expire_accessor_value(self, cache: _Cache, key: Hashable, default: Any) -> Any:
+        """Removes the value for key if it has expired, returning the value or default."""
 
-            if key in cache.expiration_times and cache.expiration_times[key] <= self._clock():
-                cache.values.pop(key, None)
-                cache.expiration_times.pop(key, None)
+        with self._lock:
+            expiration_time = cache.expiration_times.get(key)
+            if expiration_time is not None and expiration_time <= self._clock():
+                self._remove_value_locked(cache, key)
+                cache.misses += 1
                 return default
 
-            try:
-                return cache.values[key]
-            except KeyError:
+            value = cache.values.get(key, MISSING)
+            if value is MISSING:
+                cache.misses += 1
                 return default
+            cache.hits += 1
+            return value
 
     def _get_scoped_accessor_value(
         self,
@@ -512,14 +852,15 @@ class AXCacheManager:
         """Stores a value for a cache accessor."""
 
         start_thread = False
+        evicted = 0
         with self._condition:
             if cache.is_active:
                 had_expiration = key in cache.expiration_times
                 if expires_at is not None and expires_at <= self._clock():
-                    cache.values.pop(key, None)
-                    cache.expiration_times.pop(key, None)
+                    self._remove_value_locked(cache, key)
                 else:
-                    cache.values[key] = value
+                    self._store_value_locked(cache, key, value)
+                    evicted = self._enforce_memory_limit_locked()
                     if expires_at is None:
                         cache.expiration_times.pop(key, None)
                     else:
@@ -534,9 +875,120 @@ class AXCacheManager:
                     and (had_expiration or expires_at is not None)
                 ):
                     self._condition.notify()
+        self._log_eviction(evicted)
         if start_thread:
             self._start_cache_cleanup_thread()
 
+    def _store_value_locked(self, cache: _Cache, key: Hashable, value: Any) -> None:
+        """Stores value as the newest, evicting values beyond the cache's budget."""
+
+        cache.last_used = next(self._ticks)
+        cache.puts += 1
+        # The key is never absent while its value is replaced, so readers do not miss it.
+        cache.values[key] = value
+        if cache.bounded:
+            cache.values.move_to_end(key)
+            size = _get_entry_size(key, value)
+            change = size - cache.sizes.get(key, 0)
+            cache.sizes[key] = size
+            cache.total_bytes += change
+            self._bounded_bytes += change
+        if cache.keyed_by_object and isinstance(key, tuple) and key:
+            cache.compound_keys.setdefault(key[0], set()).add(key)
+
+        while cache.values and (
+            (cache.max_entries is not None and len(cache.values) > cache.max_entries)
+            or (cache.max_bytes is not None and cache.total_bytes > cache.max_bytes)
+        ):
+            self._evict_one_locked(cache, key)
+
+    def _evict_one_locked(self, cache: _Cache, stored_key: Hashable = MISSING) -> None:
+        """Evicts the oldest value not read since it was stored or last passed over."""
+
+        # Passing over a key unmarks it and makes it the newest, so after len(values) passes the
+        # oldest key is unmarked. The value just stored is evicted only if it is the sole value.
+        for _i in range(len(cache.values)):
+            key = next(iter(cache.values))
+            if key != stored_key and key not in cache.referenced:
+                break
+            cache.referenced.discard(key)
+            cache.values.move_to_end(key)
+        else:
+            key = next(iter(cache.values))
+
+        self._remove_value_locked(cache, key)
+        cache.evictions += 1
+
+    def _remove_value_locked(self, cache: _Cache, key: Hashable) -> bool:
+        """Removes the value stored for key, returning True if there was one."""
+
+        cache.expiration_times.pop(key, None)
+        cache.referenced.discard(key)
+        if cache.values.pop(key, MISSING) is MISSING:
+            return False
+
+        if cache.bounded:
+            size = cache.sizes.pop(key, 0)
+            cache.total_bytes -= size
+            self._bounded_bytes -= size
+        return True
+
+    @staticmethod
+    def _count_invalidation_locked(cache: _Cache, reason: str) -> None:
+        """Counts an invalidation of cache for reason."""
+
+        reason = reason or "Unspecified."
+        reasons = cache.invalidations
+        if reason not in reasons and len(reasons) >= MAX_INVALIDATION_REASONS:
+            reason = "Other."
+        reasons[reason] = reasons.get(reason, 0) + 1
+
+    def _clear_values_locked(self, cache: _Cache) -> None:
+        """Removes all values stored in cache."""
+
+        self._bounded_bytes -= cache.total_bytes
+        cache.values.clear()
+        cache.expiration_times.clear()
+        cache.compound_keys.clear()
+        cache.referenced.clear()
+        cache.sizes.clear()
+        cache.total_bytes = 0
+
+    def _enforce_memory_limit_locked(self) -> int:
+        """Evicts values from the least recently used bounded caches if over the memory limit."""
+
+        if self._memory_limit is None or self._bounded_bytes <= self._memory_limit:
+            return 0
+
+        target = self._memory_limit * EVICTION_TARGET_FRACTION
+        caches = [
+            cache
+            for _owner_id, owner_caches in self._get_owner_cache_items_locked()
+            for cache in owner_caches.caches.values()
+            if cache.bounded and cache.values
+        ]
+        caches.sort(key=lambda cache: cache.last_used)
+        evicted = 0
+        for cache in caches:
+            while cache.values and self._bounded_bytes > target:
+                self._evict_one_locked(cache)
+                evicted += 1
+            if self._bounded_bytes <= target:
+                break
+        return evicted
+
+    def _log_eviction(self, evicted: int) -> None:
+        """Logs the number of values evicted to stay within the memory limit."""
+
+        if not evicted:
+            return
+
+        msg = (
+            f"AXCacheManager: Evicted {evicted} value(s) to stay within memory limit of "
+            f"{self._memory_limit} bytes."
+        )
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+
     def _put_scoped_accessor_value(
         self,
         owner_id: int,
@@ -561,8 +1013,7 @@ class AXCacheManager:
 
         with self._lock:
             if cache.is_active:
-                cache.values.pop(key, None)
-                cache.expiration_times.pop(key, None)
+                self._remove_value_locked(cache, key)
 
     def _discard_scoped_accessor_value(
         self,
@@ -589,18 +1040,20 @@ class AXCacheManager:
 
         with self._lock:
             if cache.is_active:
-                self._clear_cache_values_locked(owner_id, cache_name, cache)
+                self._clear_cache_values_locked(owner_id, cache_name, cache, reason)
                 cleared = True
             else:
                 cleared = False
         if cleared and log:
             self._log_invalidation([cache_name], reason)
 
-    def _clear_cache_values_locked(self, owner_id: int, cache_name: str, cache: _Cache) -> None:
+    def _clear_cache_values_locked(
+        self, owner_id: int, cache_name: str, cache: _Cache, reason: str
+    ) -> None:
         """Clears persistent and scoped values for one cache."""
 
-        cache.values.clear()
-        cache.expiration_times.clear()
+        self._clear_values_locked(cache)
+        self._count_invalidation_locked(cache, reason)
         for scoped_values in self._scoped_values.values():
             scoped_values.pop((owner_id, cache_name), None)
 
@@ -638,6 +1091,8 @@ class AXCacheManager:
             self._owner_caches.pop(owner_id, None)
             for cache in owner_caches.caches.values():
                 cache.is_active = False
+                self._bounded_bytes -= cache.total_bytes
+                cache.total_bytes = 0
             for scoped_values in self._scoped_values.values():
                 for cache_name in owner_caches.caches:
                     scoped_values.pop((owner_id, cache_name), None)
@@ -683,7 +1138,16 @@ class AXCacheManager:
     def _run_cache_cleanup_iteration(self) -> None:
         """Runs one timed cache cleanup pass and waits for the next deadline."""
 
-        self._clear_due_values()
+        # Importing TraceRecorder here would import AXObject before AXCacheManager initializes,
+        # and would make this thread import modules. Nothing is recorded until it is imported.
+        trace_recorder = sys.modules.get(f"{__package__}.trace_recorder")
+        trace_slice = (
+            trace_recorder.get_recorder().async_slice("clear due values", "cache")
+            if trace_recorder is not None
+            else nullcontext()
+        )
+        with trace_slice:
+            self._clear_due_values()
         with self._condition:
             seconds_until_next_cleanup = self._get_seconds_until_next_cleanup_locked()
             # Serialize schedule changes with waiting so earlier deadlines are not missed.
@@ -702,8 +1166,8 @@ class AXCacheManager:
                         and cache.clear_interval_seconds is not None
                         and now >= cache.next_clear_time
                     ):
-                        cache.values.clear()
-                        cache.expiration_times.clear()
+                        self._clear_values_locked(cache)
+                        self._count_invalidation_locked(cache, "Automatic interval-based clearing.")
                         cleared_cache_names.append(cache_name)
                         cache.next_clear_time = now + cache.clear_interval_seconds
                         continue
@@ -714,8 +1178,7 @@ class AXCacheManager:
                         if now >= expiration_time
                     ]
                     for key in expired_keys:
-                        cache.values.pop(key, None)
-                        cache.expiration_times.pop(key, None)
+                        self._remove_value_locked(cache, key)
 
         self._log_invalidation(cleared_cache_names, "Automatic interval-based clearing.")
 
@@ -0,0 +1,222 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Holds the caret contexts of a document in reading order, as they are visited."""
+
+from __future__ import annotations
+
+from enum import IntFlag, auto
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import ax_cache_manager, debug
+from .ax_object import AXObject
+from .ax_text import AXText
+from .ax_utilities_hypertext import OBJECT_REPLACEMENT_CHARACTER, ZERO_WIDTH_NO_BREAK_SPACE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from gi.repository import Atspi
+
+    from .ax_utilities_hypertext import CaretPolicy
+
+# Characters at which the caret walker does not stop within a text object.
+_NON_CONTEXT_CHARACTERS = (OBJECT_REPLACEMENT_CHARACTER, ZERO_WIDTH_NO_BREAK_SPACE)
+
+
+class RunFlags(IntFlag):
+    """Describes the caret contexts of a run."""
+
+    NONE = 0
+    TEXT = auto()
+    WHITESPACE = auto()
+
+
+class LinearRun(NamedTuple):
+    """Consecutive caret contexts in one object."""
+
+    obj: Atspi.Accessible
+    start: int
+    end: int
+    text: str
+    flags: RunFlags
+
+
+class AXLinearizedDocument:
+    """Holds the caret contexts of a document in reading order, as they are visited.
+
+    A text run is a stretch of characters in a text object without embedded objects, in
+    which the next and previous contexts are found by arithmetic. Any other context is a run
+    of its own. When the caret walker finds the context beyond the end of a run, the run is
+    linked to the run holding that context, so each walk across objects is done only once.
+    Contexts which have not been visited are not covered, and callers fall back to the walker.
+    """
+
+    MAX_RUNS = 50000
+
+    def __init__(self, policy: CaretPolicy) -> None:
+        self._policy = policy
+        self._runs: dict[Hashable, list[LinearRun]] = {}
+        self._links: dict[tuple[LinearRun, bool], tuple[LinearRun, int]] = {}
+        self._run_count: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def get_statistics(self) -> dict[str, int]:
+        """Returns the number of runs, links, and lookups answered and not answered."""
+
+        return {
+            "runs": self._run_count,
+            "links": len(self._links),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def clear(self, reason: str) -> None:
+        """Discards all runs and links."""
+
+        if self._run_count:
+            msg = f"AXLinearizedDocument: Clearing {self._run_count} runs. Reason: {reason}"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+
+        self._runs.clear()
+        self._links.clear()
+        self._run_count = 0
+
+    def discard(self, is_affected: Callable[[Atspi.Accessible], bool], reason: str) -> int:
+        """Discards the runs of objects for which is_affected is True, and all links.
+
+        Content can have been added between two runs which are themselves unaffected, so no
+        link is kept. Returns the number of runs discarded.
+        """
+
+        discarded = 0
+        for key, runs in list(self._runs.items()):
+            if runs and is_affected(runs[0].obj):
+                discarded += len(runs)
+                del self._runs[key]
+
+        self._run_count -= discarded
+        self._links.clear()
+        msg = f"AXLinearizedDocument: Discarded {discarded} runs. Reason: {reason}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        return discarded
+
+    def get_run(self, obj: Atspi.Accessible, offset: int) -> LinearRun | None:
+        """Returns the run holding the context at obj, offset, or None if it is not covered."""
+
+        for run in self._runs.get(ax_cache_manager.get_object_key(obj), ()):
+            if run.start <= offset < run.end:
+                return run
+        return None
+
+    def get_character(self, obj: Atspi.Accessible, offset: int) -> str | None:
+        """Returns the character at obj, offset, or None if it is not in a text run."""
+
+        run = self.get_run(obj, offset)
+        if run is None or not run.flags & RunFlags.TEXT:
+            return None
+        return run.text[offset - run.start]
+
+    def find_context(
+        self, obj: Atspi.Accessible, offset: int, previous: bool
+    ) -> tuple[Atspi.Accessible | None, int] | None:
+        """Returns the next or previous context of obj, offset, or None if it is not known."""
+
+        run = self.get_run(obj, offset)
+        if run is None:
+            self._misses += 1
+            return None
+
+        if run.flags & RunFlags.TEXT:
+            target = offset - 1 if previous else offset + 1
+            if run.start <= target < run.end:
+                self._hits += 1
+                return run.obj, target
+
+        link = self._links.get((run, previous))
+        if link is None:
+            self._misses += 1
+            return None
+
+        target_run, target_offset = link
+        if not AXObject.is_valid(target_run.obj):
+            self.discard(lambda x: x == target_run.obj, "Linked object is not valid.")
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return target_run.obj, target_offset
+
+    def record(
+        self,
+        obj: Atspi.Accessible,
+        offset: int,
+        result: tuple[Atspi.Accessible | None, int],
+        previous: bool,
+    ) -> None:
+        """Records that result is the next or previous context of obj, offset."""
+
+        result_obj, result_offset = result
+        if result_obj is None:
+            return
+
+        run = self.get_run(obj, offset) or self._add_run(obj, offset)
+        if run is None:
+            return
+
+        # Within a text run the contexts are found by arithmetic; only its ends are linked.
+        if run.flags & RunFlags.TEXT and offset != (run.start if previous else run.end - 1):
+            return
+
+        target = self.get_run(result_obj, result_offset) or self._add_run(result_obj, result_offset)
+        if target is None or target == run:
+            return
+
+        self._links[run, previous] = target, result_offset
+
+    def _add_run(self, obj: Atspi.Accessible, offset: int) -> LinearRun | None:
+        """Adds and returns the run holding the context at obj, offset."""
+
+        if offset < 0 or not AXObject.is_valid(obj):
+            return None
+
+        text = ""
+        if self._policy.can_have_caret_context(obj) and self._policy.treat_as_text_object(obj):
+            text = AXText.get_all_text(obj)
+        if 0 <= offset < len(text) and text[offset] not in _NON_CONTEXT_CHARACTERS:
+            start, end = offset, offset + 1
+            while start > 0 and text[start - 1] not in _NON_CONTEXT_CHARACTERS:
+                start -= 1
+            while end < len(text) and text[end] not in _NON_CONTEXT_CHARACTERS:
+                end += 1
+            flags = RunFlags.TEXT
+            if text[start:end].isspace():
+                flags |= RunFlags.WHITESPACE
+            run = LinearRun(obj, start, end, text[start:end], flags)
+        else:
+            run = LinearRun(obj, offset, offset + 1, "", RunFlags.NONE)
+
+        if self._run_count >= self.MAX_RUNS:
+            self.clear(f"Exceeded {self.MAX_RUNS} runs.")
+
+        self._runs.setdefault(ax_cache_manager.get_object_key(obj), []).append(run)
+        self._run_count += 1
+        return run
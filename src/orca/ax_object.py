@@ -34,7 +34,7 @@ import gi
 gi.require_version("Atspi", "2.0")
 from gi.repository import Atspi, GLib
 
-from . import ax_cache_manager, debug
+from . import ax_cache_manager, ax_tree_mirror, debug
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator, Hashable
@@ -61,6 +61,7 @@ class _AXObjectCache:
                 namespace,
                 lifetime=ax_cache_manager.Lifetime.PROCESS,
                 clear_on_demand=ax_cache_manager.ClearPolicy.CLEAR,
+                keyed_by_object=True,
             )
         self._known_dead = self._manager.get_cache(self, self.KNOWN_DEAD)
         self._object_attributes = self._manager.get_cache(self, self.OBJECT_ATTRIBUTES)
@@ -529,12 +530,15 @@ class AXObject:
         path = []
         acc = obj
         while acc:
-            try:
-                path.append(Atspi.Accessible.get_index_in_parent(acc))
-            except GLib.GError as error:
-                msg = f"AXObject: Exception getting index in parent for {acc}: {error}"
-                AXObject.handle_error(acc, error, msg)
-                return []
+            index = ax_tree_mirror.get_mirror().get_index_in_parent(acc)
+            if index < 0:
+                try:
+                    index = Atspi.Accessible.get_index_in_parent(acc)
+                except GLib.GError as error:
+                    msg = f"AXObject: Exception getting index in parent for {acc}: {error}"
+                    AXObject.handle_error(acc, error, msg)
+                    return []
+            path.append(index)
             acc = AXObject.get_parent_checked(acc)
 
         path.reverse()
@@ -547,6 +551,10 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return -1
 
+        index = ax_tree_mirror.get_mirror().get_index_in_parent(obj)
+        if index >= 0:
+            return index
+
         try:
             index = Atspi.Accessible.get_index_in_parent(obj)
         except GLib.GError as error:
@@ -563,12 +571,14 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return None
 
-        try:
-            parent = Atspi.Accessible.get_parent(obj)
-        except GLib.GError as error:
-            msg = f"AXObject: Exception in get_parent: {error}"
-            AXObject.handle_error(obj, error, msg)
-            return None
+        parent = ax_tree_mirror.get_mirror().get_parent(obj)
+        if parent is None:
+            try:
+                parent = Atspi.Accessible.get_parent(obj)
+            except GLib.GError as error:
+                msg = f"AXObject: Exception in get_parent: {error}"
+                AXObject.handle_error(obj, error, msg)
+                return None
 
         if parent == obj:
             tokens = ["AXObject:", obj, "claims to be its own parent"]
@@ -582,6 +592,10 @@ class AXObject:
             tokens = ["AXObject:", obj, "claims to have no parent"]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
+        if parent is not None:
+            ax_cache_manager.get_manager().note_parent(
+                ax_cache_manager.get_object_key(obj), ax_cache_manager.get_object_key(parent)
+            )
         return parent
 
     @staticmethod
@@ -654,6 +668,10 @@ class AXObject:
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return None
 
+        if child is not None:
+            ax_cache_manager.get_manager().note_parent(
+                ax_cache_manager.get_object_key(child), ax_cache_manager.get_object_key(obj)
+            )
         return child
 
     @staticmethod
@@ -890,6 +908,16 @@ class AXObject:
         if not AXObject.is_valid(obj):
             return
 
+        children = ax_tree_mirror.get_mirror().get_children(obj)
+        if children is not None:
+            # Children reached this way are linked so that subtree invalidation finds them.
+            manager = ax_cache_manager.get_manager()
+            obj_key = ax_cache_manager.get_object_key(obj)
+            for child in children:
+                manager.note_parent(ax_cache_manager.get_object_key(child), obj_key)
+            yield from (child for child in children if pred is None or pred(child))
+            return
+
         child_count = AXObject.get_child_count(obj)
         if child_count > 500:
             tokens = ["AXObject:", obj, "has more than 500 children"]
@@ -28,6 +28,7 @@
 
 from __future__ import annotations
 
+import bisect
 import contextlib
 import enum
 import locale
@@ -40,6 +41,7 @@ from gi.repository import Atspi, GLib
 
 from . import (
     ax_cache_manager,
+    ax_text_mirror,
     colornames,
     debug,
     language_utilities,
@@ -265,6 +267,52 @@ class AXText:
     # Widest span (in code points) a handled emoji cluster can occupy, including Gecko's
     # interleaved zero-width no-break spaces, with headroom. Bounds the text read for adjustment.
     _WHOLE_CHARACTER_MARGIN = 64
+    # A word and the non-word characters which follow it, as Atspi.TextGranularity.WORD has it.
+    _WORD_PATTERN = re.compile(r"\w+(?:['\u2019]\w+)*")
+    # Initial span (in code points) searched on either side of an offset for word starts.
+    _WORD_SEARCH_MARGIN = 256
+
+    @staticmethod
+    def _get_mirrored_text(obj: Atspi.Accessible) -> str | None:
+        """Returns the mirrored text of obj, mirroring it first if it is editable or a terminal."""
+
+        mirror = ax_text_mirror.get_mirror()
+        if not mirror.is_enabled():
+            return None
+
+        text = mirror.get_text(obj)
+        if text is not ax_cache_manager.MISSING:
+            return text
+
+        # Editors and terminals are where the caret moves, so they gain the most from mirroring.
+        if (
+            not AXObject.supports_text(obj)
+            or not (AXUtilitiesState.is_editable(obj) or AXUtilitiesRole.is_terminal(obj))
+            or not mirror.is_reliable_toolkit(AXObject.get_toolkit_name(obj))
+        ):
+            mirror.exclude(obj)
+            return None
+
+        return mirror.seed(obj)
+
+    @staticmethod
+    def _find_word_boundaries(text: str, offset: int) -> tuple[int, int]:
+        """Returns the start and end of the word at offset, including what follows the word."""
+
+        length = len(text)
+        margin = AXText._WORD_SEARCH_MARGIN
+        while True:
+            lo, hi = max(0, offset - margin), min(length, offset + margin)
+            starts = [match.start() for match in AXText._WORD_PATTERN.finditer(text, lo, hi)]
+            index = bisect.bisect_right(starts, offset)
+            # A match at lo may begin inside a word which started before the searched span.
+            start_known = lo == 0 or (index > 0 and starts[index - 1] > lo)
+            end_known = hi == length or index < len(starts)
+            if start_known and end_known:
+                start = starts[index - 1] if index > 0 else 0
+                end = starts[index] if index < len(starts) else length
+                return start, end
+            margin *= 4
 
     @staticmethod
     def _extends_previous_character(text: str, offset: int) -> bool:
@@ -356,6 +404,13 @@ class AXText:
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return "", 0, 0
 
+        text = AXText._get_mirrored_text(obj)
+        if text is not None and offset < length:
+            start, end = offset, offset + 1
+            if ensure_whole_characters:
+                start, end = AXText._adjust_to_whole_characters(text, start, end)
+            return text[start:end], start, end
+
         try:
             result = Atspi.Text.get_string_at_offset(obj, offset, Atspi.TextGranularity.CHAR)
         except GLib.GError as error:
@@ -400,6 +455,12 @@ class AXText:
             offset = AXText.get_caret_offset(obj)
 
         offset = min(max(0, offset), length - 1)
+        if (text := AXText._get_mirrored_text(obj)) is not None:
+            start, end = AXText._find_word_boundaries(text, offset)
+            if ensure_whole_characters:
+                start, end = AXText._adjust_to_whole_characters(text, start, end)
+            return text[start:end], start, end
+
         try:
             result = Atspi.Text.get_string_at_offset(obj, offset, Atspi.TextGranularity.WORD)
         except GLib.GError as error:
@@ -585,6 +646,9 @@ class AXText:
             offset = AXText.get_caret_offset(obj)
 
         offset = min(max(0, offset), length - 1)
+        if AXText._get_mirrored_text(obj) is not None:
+            return AXText._get_sentence_at_offset_fallback(obj, offset)
+
         try:
             result = Atspi.Text.get_string_at_offset(obj, offset, Atspi.TextGranularity.SENTENCE)
         except GLib.GError as error:
@@ -657,6 +721,9 @@ class AXText:
         if not AXObject.supports_text(obj):
             return 0
 
+        if (text := AXText._get_mirrored_text(obj)) is not None:
+            return len(text)
+
         key = ax_cache_manager.get_object_key(obj)
         cached = AXText._CACHE.get(AXText._CHARACTER_COUNT, key)
         if cached is not ax_cache_manager.MISSING:
@@ -720,6 +787,10 @@ class AXText:
         if end_offset == -1:
             end_offset = AXText.get_character_count(obj)
 
+        text = AXText._get_mirrored_text(obj) if min(start_offset, end_offset) >= 0 else None
+        if text is not None:
+            return text[start_offset:end_offset]
+
         try:
             result = Atspi.Text.get_text(obj, start_offset, end_offset)
         except GLib.GError as error:
@@ -736,6 +807,9 @@ class AXText:
     def get_all_text(obj: Atspi.Accessible, length: int | None = None) -> str:
         """Returns the text content of obj."""
 
+        if (text := AXText._get_mirrored_text(obj)) is not None:
+            return text
+
         key = ax_cache_manager.get_object_key(obj)
         cached = AXText._CACHE.get(AXText._ALL_TEXT, key)
         if cached is not ax_cache_manager.MISSING:
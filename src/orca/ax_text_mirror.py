@@ -0,0 +1,257 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Mirrors the text of accessible objects so it can be read without AT-SPI calls."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import gi
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi, GLib
+
+from . import ax_cache_manager, debug
+
+# The number of characters mirrored for one object. The text of larger objects is read from
+# AT-SPI, as is that of an object whose text grows beyond the limit.
+DEFAULT_MAX_CHARACTERS = 1000000
+
+# Toolkits whose text-changed events cannot be trusted to describe every change. In web content
+# the embedded object characters of hypertext change along with the children, often without a
+# text-changed event; and the events are merged or reordered when content is replaced.
+UNRELIABLE_TOOLKITS = ("chromium", "gecko", "webkitgtk")
+
+
+class AXTextMirror:
+    """Mirrors the text of accessible objects so it can be read without AT-SPI calls.
+
+    The text of an object is read in full the first time it is needed and then patched from
+    the text-changed events received for it. An event which does not match the mirrored text
+    discards it, so that the text is read again from AT-SPI. Objects which should not be
+    mirrored are recorded as such, so that callers decide only once per object. They are kept
+    apart from the text, so that they neither count against nor are evicted by its budget.
+    """
+
+    TEXT = "AXTextMirror.text"
+    EXCLUDED = "AXTextMirror.excluded"
+    MAX_OBJECTS = 32
+    MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(self) -> None:
+        self._enabled: bool = False
+        self._max_characters: int = DEFAULT_MAX_CHARACTERS
+        self._manager = ax_cache_manager.get_manager()
+        self._manager.register_cache(
+            self,
+            self.TEXT,
+            lifetime=ax_cache_manager.Lifetime.PROCESS,
+            clear_on_demand=ax_cache_manager.ClearPolicy.PRESERVE,
+            clear_interval_seconds=None,
+            keyed_by_object=True,
+            max_entries=self.MAX_OBJECTS,
+            max_bytes=self.MAX_BYTES,
+        )
+        self._manager.register_cache(
+            self,
+            self.EXCLUDED,
+            lifetime=ax_cache_manager.Lifetime.PROCESS,
+            keyed_by_object=True,
+        )
+        self._text = self._manager.get_cache(self, self.TEXT)
+        self._excluded = self._manager.get_cache(self, self.EXCLUDED)
+
+    def is_enabled(self) -> bool:
+        """Returns True if text is mirrored."""
+
+        return self._enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Sets whether text is mirrored, discarding all mirrored text when disabled."""
+
+        self._enabled = enabled
+        if not enabled:
+            self.clear("Mirroring disabled.")
+
+    def get_max_characters(self) -> int:
+        """Returns the number of characters which can be mirrored for one object."""
+
+        return self._max_characters
+
+    def set_max_characters(self, max_characters: int) -> None:
+        """Sets the number of characters which can be mirrored for one object."""
+
+        if max_characters < self._max_characters:
+            self.clear("Lower character limit.")
+        self._max_characters = max_characters
+
+    @staticmethod
+    def is_reliable_toolkit(toolkit_name: str) -> bool:
+        """Returns True if the text-changed events of toolkit_name can be used for mirroring."""
+
+        return not toolkit_name.startswith(UNRELIABLE_TOOLKITS)
+
+    def clear(self, reason: str) -> None:
+        """Discards all mirrored text and exclusions."""
+
+        for cache in (self._text, self._excluded):
+            if cache is not None:
+                cache.invalidate(f"AXTextMirror: {reason}")
+
+    def discard(self, obj: Atspi.Accessible, reason: str) -> None:
+        """Discards the mirrored text of obj, or its exclusion."""
+
+        if self._text is None or self._excluded is None:
+            return
+
+        tokens = ["AXTextMirror: Discarding text of", obj, reason]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        key = ax_cache_manager.get_object_key(obj)
+        self._text.discard(key)
+        self._excluded.discard(key)
+
+    def get_text(self, obj: Atspi.Accessible) -> Any:
+        """Returns the mirrored text of obj, None if it is not mirrored, or MISSING if unknown."""
+
+        if not self._enabled or self._text is None or self._excluded is None:
+            return None
+
+        key = ax_cache_manager.get_object_key(obj)
+        if self._excluded.get(key) is True:
+            return None
+        return self._text.get(key)
+
+    def exclude(self, obj: Atspi.Accessible) -> None:
+        """Records that the text of obj is not to be mirrored."""
+
+        if self._enabled:
+            self._exclude_key(ax_cache_manager.get_object_key(obj))
+
+    def _exclude_key(self, key: Any) -> None:
+        """Records that the text of the object with key is not to be mirrored."""
+
+        if self._text is None or self._excluded is None:
+            return
+
+        self._text.discard(key)
+        self._excluded.put(key, True)
+
+    def seed(self, obj: Atspi.Accessible) -> str | None:
+        """Mirrors the text of obj, returning the text or None if it is not mirrored."""
+
+        if not self._enabled or self._text is None:
+            return None
+
+        key = ax_cache_manager.get_object_key(obj)
+        try:
+            count = Atspi.Text.get_character_count(obj)
+            if count > self._max_characters:
+                tokens = ["AXTextMirror: Not mirroring", obj, f"which has {count} characters."]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                self._exclude_key(key)
+                return None
+            text = Atspi.Text.get_text(obj, 0, count)
+        except GLib.GError as error:
+            tokens = ["AXTextMirror: Exception mirroring", obj, f": {error}"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            return None
+
+        if len(text) != count:
+            tokens = ["AXTextMirror: Not mirroring", obj, f"whose text is not {count} characters."]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            self._exclude_key(key)
+            return None
+
+        tokens = ["AXTextMirror: Mirrored", count, "characters of", obj]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        self._text.put(key, text)
+        return text
+
+    def handle_event(self, event: Atspi.Event) -> None:
+        """Patches the mirrored text affected by event."""
+
+        if not self._enabled or self._text is None or self._excluded is None:
+            return
+
+        event_type = event.type
+        if not event_type.startswith(("object:text-changed", "object:state-changed")):
+            return
+
+        key = ax_cache_manager.get_object_key(event.source)
+        text = self._text.get(key)
+        if text is ax_cache_manager.MISSING and self._excluded.get(key) is not True:
+            return
+
+        # An object which becomes editable may now be mirrored, so its exclusion is dropped too.
+        if event_type.startswith(("object:state-changed:defunct", "object:state-changed:editable")):
+            self.discard(event.source, f"Due to {event_type}.")
+            return
+
+        if not isinstance(text, str):
+            return
+
+        if event_type.startswith("object:text-changed:insert"):
+            patched = self._apply_insertion(text, event.detail1, event.detail2, event.any_data)
+        elif event_type.startswith("object:text-changed:delete"):
+            patched = self._apply_deletion(text, event.detail1, event.detail2, event.any_data)
+        else:
+            return
+
+        if patched is None:
+            reason = f"Cannot apply {event_type} ({event.detail1}, {event.detail2})."
+            self.discard(event.source, reason)
+        elif len(patched) > self._max_characters:
+            tokens = ["AXTextMirror: Not mirroring", event.source, "which exceeds the limit."]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            self._exclude_key(key)
+        else:
+            self._text.put(key, patched)
+
+    @staticmethod
+    def _apply_insertion(text: str, offset: int, length: int, inserted: object) -> str | None:
+        """Returns text with inserted at offset, or None if the insertion does not fit text."""
+
+        if not isinstance(inserted, str) or len(inserted) != length:
+            return None
+        if not 0 <= offset <= len(text):
+            return None
+        return f"{text[:offset]}{inserted}{text[offset:]}"
+
+    @staticmethod
+    def _apply_deletion(text: str, offset: int, length: int, deleted: object) -> str | None:
+        """Returns text without the deleted range, or None if the deletion does not fit text."""
+
+        end = offset + length
+        if offset < 0 or length < 0 or end > len(text):
+            return None
+        # Some toolkits do not provide the deleted string. When provided, it must match.
+        if isinstance(deleted, str) and deleted and text[offset:end] != deleted:
+            return None
+        return f"{text[:offset]}{text[end:]}"
+
+
+_mirror: AXTextMirror = AXTextMirror()
+
+
+def get_mirror() -> AXTextMirror:
+    """Returns the AXTextMirror singleton."""
+
+    return _mirror
@@ -0,0 +1,658 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Mirrors the structure of accessible documents so it can be read without AT-SPI calls."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import gi
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi, GLib
+
+from . import ax_cache_manager, debug
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+# The number of objects mirrored for one document. Larger documents are not mirrored, and a
+# mirror which grows beyond the limit through mutations is discarded.
+DEFAULT_MAX_OBJECTS = 20000
+
+# The number of objects mirrored per main loop iteration while a document is being seeded.
+SEED_SLICE_SIZE = 500
+
+# The number of times seeding starts over for a document which changes while being seeded.
+MAX_SEED_RESTARTS = 3
+
+
+@dataclass
+class _DocumentMirror:
+    """Holds the mirrored structure of one document."""
+
+    document: Atspi.Accessible
+    # All mirrored objects, including the document. This and the other dicts are keyed by
+    # object key.
+    objects: dict[Hashable, Atspi.Accessible] = field(default_factory=dict)
+    # An object without children has an empty list; an object whose children are not known
+    # has no entry, and its children are read from AT-SPI.
+    children: dict[Hashable, list[Atspi.Accessible]] = field(default_factory=dict)
+    parents: dict[Hashable, Atspi.Accessible] = field(default_factory=dict)
+    indices: dict[Hashable, int] = field(default_factory=dict)
+
+
+@dataclass
+class _SeedProgress:
+    """Holds the progress of mirroring one document across main loop iterations."""
+
+    mirror: _DocumentMirror
+    # The descendants of the document in canonical order, and the keys of these and the
+    # document, so that events for them can be recognized.
+    objects: list[Atspi.Accessible]
+    keys: set[Hashable] = field(default_factory=set)
+    position: int = 0
+    # The objects whose children are still being listed, with the number not yet seen.
+    open_parents: list[tuple[Atspi.Accessible, int]] = field(default_factory=list)
+    restarts: int = 0
+
+
+class AXTreeMirror:
+    """Mirrors the structure of accessible documents so it can be read without AT-SPI calls.
+
+    A document is mirrored in slices, when the main loop is idle, after it finishes loading.
+    It is then patched from the children-changed, property-change:accessible-parent, and
+    state-changed events received for it. Readers fall back to AT-SPI for anything which is
+    not mirrored. When verify_reads is on, each read is compared with AT-SPI and a mismatch
+    discards the document's mirror.
+    """
+
+    def __init__(self) -> None:
+        self._enabled: bool = False
+        self._verify_reads: bool = False
+        self._max_objects: int = DEFAULT_MAX_OBJECTS
+        self._documents: dict[Hashable, _DocumentMirror] = {}
+        # The mirror containing each mirrored object, including the documents themselves.
+        self._owners: dict[Hashable, _DocumentMirror] = {}
+        # The documents waiting to be seeded, with the number of times each was restarted.
+        self._pending_seeds: dict[Hashable, tuple[Atspi.Accessible, int]] = {}
+        self._seed_progress: _SeedProgress | None = None
+        self._seed_id: int = 0
+
+    def is_enabled(self) -> bool:
+        """Returns True if documents are mirrored."""
+
+        return self._enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Sets whether documents are mirrored, discarding all mirrors when disabled."""
+
+        self._enabled = enabled
+        if not enabled:
+            self.clear("Mirroring disabled.")
+
+    def get_verify_reads(self) -> bool:
+        """Returns True if each read is compared with AT-SPI."""
+
+        return self._verify_reads
+
+    def set_verify_reads(self, verify: bool) -> None:
+        """Sets whether each read is compared with AT-SPI."""
+
+        self._verify_reads = verify
+
+    def get_max_objects(self) -> int:
+        """Returns the number of objects which can be mirrored for one document."""
+
+        return self._max_objects
+
+    def set_max_objects(self, max_objects: int) -> None:
+        """Sets the number of objects which can be mirrored for one document."""
+
+        self._max_objects = max_objects
+        for mirror in list(self._documents.values()):
+            if len(mirror.objects) > max_objects:
+                self._discard_mirror(mirror, "Exceeds the new object limit.")
+
+    def get_statistics(self) -> dict[str, int]:
+        """Returns the number of mirrored documents and objects."""
+
+        return {"documents": len(self._documents), "objects": len(self._owners)}
+
+    def clear(self, reason: str) -> None:
+        """Discards all mirrors and abandons any seeding."""
+
+        self._cancel_all_seeds()
+        if not self._documents:
+            return
+
+        msg = f"AXTreeMirror: Discarding {len(self._documents)} mirror(s). {reason}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        self._documents.clear()
+        self._owners.clear()
+
+    def discard(self, document: Atspi.Accessible, reason: str) -> None:
+        """Discards the mirror of document."""
+
+        mirror = self._documents.get(ax_cache_manager.get_object_key(document))
+        if mirror is not None:
+            self._discard_mirror(mirror, reason)
+
+    def _discard_mirror(self, mirror: _DocumentMirror, reason: str) -> None:
+        """Discards mirror and its record of the objects it contains."""
+
+        tokens = ["AXTreeMirror: Discarding mirror of", mirror.document, reason]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        self._documents.pop(ax_cache_manager.get_object_key(mirror.document), None)
+        for key in mirror.objects:
+            if self._owners.get(key) is mirror:
+                del self._owners[key]
+
+    @staticmethod
+    def _get_all_descendants(document: Atspi.Accessible) -> list[Atspi.Accessible] | None:
+        """Returns all descendants of document in one Collection call, or None if unsupported."""
+
+        try:
+            if Atspi.Accessible.get_collection_iface(document) is None:
+                return None
+            rule = Atspi.MatchRule.new(
+                Atspi.StateSet(),
+                Atspi.CollectionMatchType.ALL,
+                {},
+                Atspi.CollectionMatchType.ALL,
+                [],
+                Atspi.CollectionMatchType.ALL,
+                [],
+                Atspi.CollectionMatchType.ALL,
+                False,
+            )
+            return Atspi.Collection.get_matches(
+                document, rule, Atspi.CollectionSortOrder.CANONICAL, 0, True
+            )
+        except GLib.GError as error:
+            msg = f"AXTreeMirror: Exception getting all descendants: {error}"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return None
+
+    def _walk_descendants(self, document: Atspi.Accessible) -> list[Atspi.Accessible] | None:
+        """Returns all descendants of document in canonical order, or None if too many."""
+
+        result: list[Atspi.Accessible] = []
+        stack = [document]
+        while stack:
+            obj = stack.pop()
+            if obj is not document:
+                result.append(obj)
+            if len(result) >= self._max_objects:
+                return None
+            children = [
+                Atspi.Accessible.get_child_at_index(obj, i)
+                for i in range(Atspi.Accessible.get_child_count(obj))
+            ]
+            stack.extend(reversed([child for child in children if child is not None]))
+        return result
+
+    def seed(self, document: Atspi.Accessible) -> bool:
+        """Mirrors the structure of document immediately, returning True on success."""
+
+        if not self._enabled or document is None:
+            return False
+
+        self._cancel_seed(document)
+        progress = self._start_seed(document)
+        if progress is None:
+            return False
+        succeeded = self._advance_seed(progress, len(progress.objects))
+        return self._finish_seed(progress, succeeded is True)
+
+    def _schedule_seed(self, document: Atspi.Accessible, restarts: int = 0) -> None:
+        """Arranges for document to be mirrored in slices when the main loop is idle."""
+
+        self._cancel_seed(document)
+        self.discard(document, "Reseeding.")
+        self._pending_seeds[ax_cache_manager.get_object_key(document)] = (document, restarts)
+        if not self._seed_id:
+            self._seed_id = GLib.idle_add(self._seed_in_idle)
+
+    def _cancel_seed(self, document: Atspi.Accessible) -> None:
+        """Abandons any pending or in-progress seeding of document."""
+
+        self._pending_seeds.pop(ax_cache_manager.get_object_key(document), None)
+        if self._seed_progress is not None and self._seed_progress.mirror.document == document:
+            self._seed_progress = None
+
+    def _cancel_all_seeds(self) -> None:
+        """Abandons all pending and in-progress seeding."""
+
+        self._pending_seeds.clear()
+        self._seed_progress = None
+        if self._seed_id:
+            GLib.source_remove(self._seed_id)
+            self._seed_id = 0
+
+    def _seed_in_idle(self) -> bool:
+        """Mirrors the next slice of the document being seeded, returning True if more remain."""
+
+        if self._seed_progress is None and self._pending_seeds:
+            key = next(iter(self._pending_seeds))
+            document, restarts = self._pending_seeds.pop(key)
+            self._seed_progress = self._start_seed(document, restarts)
+
+        progress = self._seed_progress
+        if progress is not None:
+            result = self._advance_seed(progress, SEED_SLICE_SIZE)
+            if result is not None:
+                self._seed_progress = None
+                self._finish_seed(progress, result)
+
+        if self._seed_progress is not None or self._pending_seeds:
+            return True
+
+        self._seed_id = 0
+        return False
+
+    def _start_seed(self, document: Atspi.Accessible, restarts: int = 0) -> _SeedProgress | None:
+        """Returns the progress of mirroring document with its descendants listed, or None."""
+
+        try:
+            objects = self._get_all_descendants(document)
+            if objects is None:
+                objects = self._walk_descendants(document)
+            if objects is None or len(objects) + 1 > self._max_objects:
+                tokens = ["AXTreeMirror: Not mirroring", document, "which has too many objects."]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                return None
+            child_count = Atspi.Accessible.get_child_count(document)
+        except GLib.GError as error:
+            tokens = ["AXTreeMirror: Exception mirroring", document, f": {error}"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            return None
+
+        mirror = _DocumentMirror(document)
+        document_key = ax_cache_manager.get_object_key(document)
+        mirror.objects[document_key] = document
+        mirror.children[document_key] = []
+        progress = _SeedProgress(mirror, objects, restarts=restarts)
+        progress.keys = {ax_cache_manager.get_object_key(obj) for obj in objects}
+        progress.keys.add(document_key)
+        if child_count:
+            progress.open_parents.append((document, child_count))
+        return progress
+
+    @staticmethod
+    def _advance_seed(progress: _SeedProgress, count: int) -> bool | None:
+        """Mirrors up to count more objects, returning None if more remain, else success."""
+
+        # In canonical order each object follows its parent and the siblings before it, so
+        # the parent of each object is the nearest earlier object which still has children
+        # to account for. This needs only the child count of each object.
+        mirror = progress.mirror
+        end = min(progress.position + count, len(progress.objects))
+        try:
+            for obj in progress.objects[progress.position : end]:
+                while progress.open_parents and progress.open_parents[-1][1] == 0:
+                    progress.open_parents.pop()
+                key = ax_cache_manager.get_object_key(obj)
+                if not progress.open_parents or key in mirror.objects:
+                    tokens = ["AXTreeMirror: Not mirroring", mirror.document, "listed", obj]
+                    debug.print_tokens(debug.LEVEL_INFO, [*tokens, "out of order"], True)
+                    return False
+                parent, remaining = progress.open_parents[-1]
+                progress.open_parents[-1] = (parent, remaining - 1)
+                siblings = mirror.children[ax_cache_manager.get_object_key(parent)]
+                mirror.indices[key] = len(siblings)
+                mirror.objects[key] = obj
+                mirror.parents[key] = parent
+                mirror.children[key] = []
+                siblings.append(obj)
+                if child_count := Atspi.Accessible.get_child_count(obj):
+                    progress.open_parents.append((obj, child_count))
+        except GLib.GError as error:
+            tokens = ["AXTreeMirror: Exception mirroring", mirror.document, f": {error}"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            return False
+
+        progress.position = end
+        if end < len(progress.objects):
+            return None
+
+        if any(remaining for _parent, remaining in progress.open_parents):
+            tokens = ["AXTreeMirror: Not mirroring", mirror.document, "with unlisted objects"]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            return False
+        return True
+
+    def _finish_seed(self, progress: _SeedProgress, succeeded: bool) -> bool:
+        """Installs the mirror built by progress if succeeded, returning succeeded."""
+
+        if not succeeded:
+            return False
+
+        mirror = progress.mirror
+        self._documents[ax_cache_manager.get_object_key(mirror.document)] = mirror
+        for key in mirror.objects:
+            self._owners[key] = mirror
+        tokens = ["AXTreeMirror: Mirrored", len(mirror.objects), "objects of", mirror.document]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        return True
+
+    def _restart_seed_if_changed(self, event: Atspi.Event) -> None:
+        """Starts the in-progress seed over if event changes the document being mirrored."""
+
+        progress = self._seed_progress
+        if progress is None or not event.type.startswith(
+            (
+                "object:children-changed",
+                "object:property-change:accessible-parent",
+                "object:state-changed:defunct",
+            )
+        ):
+            return
+
+        if ax_cache_manager.get_object_key(event.source) not in progress.keys:
+            return
+
+        document = progress.mirror.document
+        self._seed_progress = None
+        if event.source == document and event.type.startswith("object:state-changed:defunct"):
+            return
+
+        if progress.restarts >= MAX_SEED_RESTARTS:
+            tokens = ["AXTreeMirror: Not mirroring", document, "which keeps changing."]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            return
+
+        tokens = ["AXTreeMirror: Restarting mirror of", document, "due to", event.type]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        self._schedule_seed(document, progress.restarts + 1)
+
+    @staticmethod
+    def _forget_children(mirror: _DocumentMirror, key: Hashable) -> None:
+        """Stops answering for the children of the object with key, and their indices."""
+
+        for child in mirror.children.pop(key, []):
+            mirror.indices.pop(ax_cache_manager.get_object_key(child), None)
+
+    @staticmethod
+    def _renumber(mirror: _DocumentMirror, siblings: list[Atspi.Accessible], start: int) -> None:
+        """Updates the indices of siblings from start onward."""
+
+        for index in range(start, len(siblings)):
+            mirror.indices[ax_cache_manager.get_object_key(siblings[index])] = index
+
+    def _remove_subtree(self, mirror: _DocumentMirror, obj: Atspi.Accessible) -> None:
+        """Removes obj and its mirrored descendants from mirror."""
+
+        stack = [obj]
+        while stack:
+            key = ax_cache_manager.get_object_key(stack.pop())
+            stack.extend(mirror.children.pop(key, []))
+            mirror.objects.pop(key, None)
+            mirror.parents.pop(key, None)
+            mirror.indices.pop(key, None)
+            if self._owners.get(key) is mirror:
+                del self._owners[key]
+
+    def _detach(self, mirror: _DocumentMirror, obj: Atspi.Accessible) -> None:
+        """Removes obj from its parent's children and removes its subtree from mirror."""
+
+        key = ax_cache_manager.get_object_key(obj)
+        if obj == mirror.document:
+            self._discard_mirror(mirror, "Document was removed.")
+            return
+
+        parent = mirror.parents.get(key)
+        if parent is not None:
+            parent_key = ax_cache_manager.get_object_key(parent)
+            siblings = mirror.children.get(parent_key)
+            index = mirror.indices.get(key, -1)
+            if siblings is not None and 0 <= index < len(siblings) and siblings[index] == obj:
+                del siblings[index]
+                self._renumber(mirror, siblings, index)
+            else:
+                self._forget_children(mirror, parent_key)
+        self._remove_subtree(mirror, obj)
+
+    def handle_event(self, event: Atspi.Event) -> None:
+        """Patches the mirror affected by event, or seeds one for a loaded document."""
+
+        if not self._enabled:
+            return
+
+        event_type = event.type
+        if event_type.startswith("document:load-complete"):
+            if event.source is not None:
+                self._schedule_seed(event.source)
+            return
+
+        self._restart_seed_if_changed(event)
+
+        if not self._owners or not event_type.startswith(
+            ("object:children-changed", "object:property-change", "object:state-changed")
+        ):
+            return
+
+        source_key = ax_cache_manager.get_object_key(event.source)
+        mirror = self._owners.get(source_key)
+        if mirror is None:
+            return
+
+        if event_type.startswith("object:children-changed:add"):
+            self._on_child_added(mirror, event.source, event.detail1, event.any_data)
+        elif event_type.startswith("object:children-changed:remove"):
+            self._on_child_removed(mirror, event.source, event.detail1, event.any_data)
+        elif event_type.startswith("object:property-change:accessible-parent"):
+            self._detach(mirror, event.source)
+            new_parent = event.any_data
+            if isinstance(new_parent, Atspi.Accessible):
+                new_parent_mirror = self._owners.get(ax_cache_manager.get_object_key(new_parent))
+                if new_parent_mirror is not None:
+                    self._forget_children(
+                        new_parent_mirror, ax_cache_manager.get_object_key(new_parent)
+                    )
+        elif event_type.startswith("object:state-changed:defunct") and event.detail1:
+            self._detach(mirror, event.source)
+        elif event_type.startswith("object:state-changed:busy") and event.detail1:
+            if source_key in self._documents:
+                self._discard_mirror(mirror, "Document is busy.")
+
+    def _on_child_added(
+        self,
+        mirror: _DocumentMirror,
+        parent: Atspi.Accessible,
+        index: int,
+        child: object,
+    ) -> None:
+        """Inserts child into the mirrored children of parent."""
+
+        parent_key = ax_cache_manager.get_object_key(parent)
+        siblings = mirror.children.get(parent_key)
+        if siblings is None:
+            return
+
+        if not isinstance(child, Atspi.Accessible) or not 0 <= index <= len(siblings):
+            self._forget_children(mirror, parent_key)
+            return
+
+        child_key = ax_cache_manager.get_object_key(child)
+        if child_key in self._owners:
+            self._detach(self._owners[child_key], child)
+            siblings = mirror.children.get(parent_key)
+            if siblings is None or index > len(siblings):
+                return
+
+        # The children of the new child are not known until read from AT-SPI.
+        siblings.insert(index, child)
+        mirror.objects[child_key] = child
+        mirror.parents[child_key] = parent
+        self._owners[child_key] = mirror
+        self._renumber(mirror, siblings, index)
+        if len(mirror.objects) > self._max_objects:
+            self._discard_mirror(mirror, "Exceeds the object limit.")
+
+    def _on_child_removed(
+        self,
+        mirror: _DocumentMirror,
+        parent: Atspi.Accessible,
+        index: int,
+        child: object,
+    ) -> None:
+        """Removes child from the mirrored children of parent."""
+
+        parent_key = ax_cache_manager.get_object_key(parent)
+        siblings = mirror.children.get(parent_key)
+        if not isinstance(child, Atspi.Accessible):
+            if siblings is not None:
+                self._forget_children(mirror, parent_key)
+            return
+
+        if siblings is not None and not (0 <= index < len(siblings) and siblings[index] == child):
+            index = next((i for i, sibling in enumerate(siblings) if sibling == child), -1)
+            if index < 0:
+                self._forget_children(mirror, parent_key)
+                siblings = None
+
+        if siblings is not None:
+            del siblings[index]
+            self._renumber(mirror, siblings, index)
+        self._remove_subtree(mirror, child)
+
+    def _report_mismatch(self, mirror: _DocumentMirror, tokens: list) -> None:
+        """Logs a difference between mirror and AT-SPI, and discards mirror."""
+
+        debug.print_tokens(debug.LEVEL_INFO, ["AXTreeMirror: Mismatch:", *tokens], True)
+        self._discard_mirror(mirror, "Does not match AT-SPI.")
+
+    def get_children(self, obj: Atspi.Accessible) -> list[Atspi.Accessible] | None:
+        """Returns the mirrored children of obj, or None if they are not mirrored."""
+
+        if not self._owners:
+            return None
+
+        key = ax_cache_manager.get_object_key(obj)
+        mirror = self._owners.get(key)
+        if mirror is None or (children := mirror.children.get(key)) is None:
+            return None
+
+        if self._verify_reads:
+            live = self._get_live_children(obj)
+            if live != children:
+                self._report_mismatch(mirror, [obj, "children:", children, "AT-SPI:", live])
+                return None
+        return list(children)
+
+    def get_parent(self, obj: Atspi.Accessible) -> Atspi.Accessible | None:
+        """Returns the mirrored parent of obj, or None if it is not mirrored."""
+
+        if not self._owners:
+            return None
+
+        key = ax_cache_manager.get_object_key(obj)
+        mirror = self._owners.get(key)
+        if mirror is None or (parent := mirror.parents.get(key)) is None:
+            return None
+
+        if self._verify_reads:
+            live = self._get_live_parent(obj)
+            if live != parent:
+                self._report_mismatch(mirror, [obj, "parent:", parent, "AT-SPI:", live])
+                return None
+        return parent
+
+    def get_index_in_parent(self, obj: Atspi.Accessible) -> int:
+        """Returns the mirrored index of obj in its parent, or -1 if it is not mirrored."""
+
+        if not self._owners:
+            return -1
+
+        key = ax_cache_manager.get_object_key(obj)
+        mirror = self._owners.get(key)
+        if mirror is None or (index := mirror.indices.get(key)) is None:
+            return -1
+
+        if self._verify_reads:
+            live = self._get_live_index_in_parent(obj)
+            if live != index:
+                self._report_mismatch(mirror, [obj, "index:", index, "AT-SPI:", live])
+                return -1
+        return index
+
+    @staticmethod
+    def _get_live_children(obj: Atspi.Accessible) -> list[Atspi.Accessible] | None:
+        """Returns the children of obj according to AT-SPI, or None on error."""
+
+        try:
+            return [
+                Atspi.Accessible.get_child_at_index(obj, i)
+                for i in range(Atspi.Accessible.get_child_count(obj))
+            ]
+        except GLib.GError:
+            return None
+
+    @staticmethod
+    def _get_live_parent(obj: Atspi.Accessible) -> Atspi.Accessible | None:
+        """Returns the parent of obj according to AT-SPI, or None on error."""
+
+        try:
+            return Atspi.Accessible.get_parent(obj)
+        except GLib.GError:
+            return None
+
+    @staticmethod
+    def _get_live_index_in_parent(obj: Atspi.Accessible) -> int:
+        """Returns the index of obj in its parent according to AT-SPI, or -1 on error."""
+
+        try:
+            return Atspi.Accessible.get_index_in_parent(obj)
+        except GLib.GError:
+            return -1
+
+    def check_consistency(self) -> list[str]:
+        """Compares every mirror with AT-SPI, returning a description of each mismatch."""
+
+        mismatches: list[str] = []
+        for mirror in list(self._documents.values()):
+            for key, obj in list(mirror.objects.items()):
+                children = mirror.children.get(key)
+                if children is not None and self._get_live_children(obj) != children:
+                    mismatches.append(f"{obj}: children differ")
+                parent = mirror.parents.get(key)
+                if parent is not None and self._get_live_parent(obj) != parent:
+                    mismatches.append(f"{obj}: parent differs")
+                index = mirror.indices.get(key)
+                if index is not None and self._get_live_index_in_parent(obj) != index:
+                    mismatches.append(f"{obj}: index in parent differs")
+
+        for mismatch in mismatches:
+            debug.print_message(debug.LEVEL_INFO, f"AXTreeMirror: Mismatch: {mismatch}", True)
+        msg = f"AXTreeMirror: Consistency check found {len(mismatches)} mismatch(es)."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        return mismatches
+
+
+_mirror: AXTreeMirror = AXTreeMirror()
+
+
+def get_mirror() -> AXTreeMirror:
+    """Returns the AXTreeMirror singleton."""
+
+    return _mirror
@@ -58,7 +58,7 @@ from .ax_utilities_table import AXUtilitiesTable
 from .ax_utilities_text import AXUtilitiesText
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
 
 _MAX_CHILDREN_FOR_SENSITIVITY_COUNT = 50
 
@@ -110,6 +110,7 @@ class _AXUtilitiesCache:
                 namespace,
                 lifetime=ax_cache_manager.Lifetime.PROCESS,
                 clear_on_demand=ax_cache_manager.ClearPolicy.CLEAR,
+                keyed_by_object=True,
             )
         self._members_cache = self._manager.get_cache(self, self.SET_MEMBERS)
         self._layout_only_cache = self._manager.get_cache(self, self.IS_LAYOUT_ONLY)
@@ -233,6 +234,30 @@ class AXUtilities:
                 AXTable.CACHE_INVALIDATION_GROUP, reason
             )
 
+    @staticmethod
+    def clear_subtree_cache_now(obj: Atspi.Accessible | None, reason: str = "") -> None:
+        """Clears cached information about obj, its ancestors, and its descendants immediately."""
+
+        if obj is None:
+            AXUtilities.clear_all_cache_now(obj, reason)
+            return
+
+        obj_key = ax_cache_manager.get_object_key(obj)
+        ancestor_keys: list[Hashable] = []
+        parent = AXObject.get_parent(obj)
+        while parent is not None:
+            key = ax_cache_manager.get_object_key(parent)
+            if key == obj_key or key in ancestor_keys:
+                break
+            ancestor_keys.append(key)
+            parent = AXObject.get_parent(parent)
+
+        ax_cache_manager.get_manager().invalidate_subtree(obj_key, ancestor_keys, reason)
+        if AXUtilitiesRole.is_table_related(obj):
+            ax_cache_manager.get_manager().invalidate_group(
+                AXTable.CACHE_INVALIDATION_GROUP, reason
+            )
+
     @staticmethod
     def can_be_active_window(window: Atspi.Accessible, clear_cache: bool = True) -> bool:
         """Returns True if window can be the active window based on its state."""
@@ -28,7 +28,8 @@
 # those which are added dynamically at runtime. This is needed for type
 # checkers, linters, and IDEs.
 
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Hashable, Iterable, Mapping
+from typing import TypeVar
 
 import gi
 
@@ -40,11 +41,15 @@ from .ax_utilities_event import TextEventReason
 from .ax_utilities_hypertext import CaretPolicy
 from .ax_utilities_text import CaretSetReason, LastCaretSet, TextUnit
 
+_PartitionKey = TypeVar("_PartitionKey", bound=Hashable)
+
 class AXUtilities:
     # From ax_utilities.py
     @staticmethod
     def clear_all_cache_now(obj: Atspi.Accessible | None = None, reason: str = "") -> None: ...
     @staticmethod
+    def clear_subtree_cache_now(obj: Atspi.Accessible | None, reason: str = "") -> None: ...
+    @staticmethod
     def can_be_active_window(window: Atspi.Accessible, clear_cache: bool = True) -> bool: ...
     @staticmethod
     def find_active_window() -> Atspi.Accessible | None: ...
@@ -1242,6 +1247,14 @@ class AXUtilities:
         pred: Callable | None = None,
     ) -> list[Atspi.Accessible]: ...
     @staticmethod
+    def find_all_partitioned_by_role(
+        root: Atspi.Accessible,
+        partitions: Mapping[
+            _PartitionKey,
+            tuple[Iterable[Atspi.Role], Callable[[Atspi.Accessible], bool] | None],
+        ],
+    ) -> dict[_PartitionKey, list[Atspi.Accessible]]: ...
+    @staticmethod
     def find_all_push_buttons(
         root: Atspi.Accessible,
         pred: Callable | None = None,
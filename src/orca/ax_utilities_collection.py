@@ -24,25 +24,159 @@
 
 from __future__ import annotations
 
+import dataclasses
 import inspect
 import time
+from dataclasses import dataclass
 
 import gi
 
 gi.require_version("Atspi", "2.0")
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from gi.repository import Atspi
 
-from . import debug
+from . import ax_cache_manager, debug
 from .ax_collection import AXCollection
+from .ax_object import AXObject
 from .ax_utilities_action import AXUtilitiesAction
 from .ax_utilities_debugging import AXUtilitiesDebugging
 from .ax_utilities_role import AXUtilitiesRole
 from .ax_utilities_state import AXUtilitiesState
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable, Iterable, Mapping
+    from typing import Any
+
+_PartitionKey = TypeVar("_PartitionKey", bound="Hashable")
+
+# The match rule criteria, mapped to the argument of create_match_rule with their match type.
+_MATCH_TYPE_ARGUMENTS = {
+    "states": "state_match_type",
+    "attributes": "attribute_match_type",
+    "interfaces": "interface_match_type",
+    "roles": "role_match_type",
+}
+
+# The interface names used in match rules, mapped to the AXObject check for their support.
+_INTERFACE_CHECKS = {
+    "Action": AXObject.supports_action,
+    "Collection": AXObject.supports_collection,
+    "Component": AXObject.supports_component,
+    "Document": AXObject.supports_document,
+    "EditableText": AXObject.supports_editable_text,
+    "Hyperlink": AXObject.supports_hyperlink,
+    "Hypertext": AXObject.supports_hypertext,
+    "Image": AXObject.supports_image,
+    "Selection": AXObject.supports_selection,
+    "Table": AXObject.supports_table,
+    "TableCell": AXObject.supports_table_cell,
+    "Text": AXObject.supports_text,
+    "Value": AXObject.supports_value,
+}
+
+
+@dataclass(frozen=True)
+class MatchPredicate:
+    """A predicate whose common conditions can be evaluated by Collection in the application.
+
+    An object satisfies the predicate if it has all of states, all of attributes (given as
+    "name:value"), and all of interfaces; if it has any of roles, when roles are given; and if
+    residual, when given, returns True for it. The find_all helpers add the conditions which
+    fit their match rule to it, and evaluate the others and residual in Orca.
+    """
+
+    states: tuple[Atspi.StateType, ...] = ()
+    attributes: tuple[str, ...] = ()
+    interfaces: tuple[str, ...] = ()
+    roles: tuple[Atspi.Role, ...] = ()
+    residual: Callable[[Atspi.Accessible], bool] | None = None
+
+    def __call__(self, obj: Atspi.Accessible) -> bool:
+        checks = [self._get_check(kind) for kind in _MATCH_TYPE_ARGUMENTS]
+        checks.append(self.residual)
+        return all(check(obj) for check in checks if check is not None)
+
+    def _get_check(self, kind: str) -> Callable[[Atspi.Accessible], bool] | None:
+        """Returns the Orca-side evaluation of the conditions of kind, or None if there are none."""
+
+        if not (values := getattr(self, kind)):
+            return None
+
+        if kind == "states":
+            return lambda obj: all(AXObject.has_state(obj, state) for state in values)
+        if kind == "attributes":
+            pairs = [attribute.split(":", 1) for attribute in values]
+            return lambda obj: all(AXObject.get_attribute(obj, k) == v for k, v in pairs)
+        if kind == "interfaces":
+            checks = [_INTERFACE_CHECKS.get(interface) for interface in values]
+            return lambda obj: all(check is not None and check(obj) for check in checks)
+        return lambda obj: AXObject.get_role(obj) in values
+
+    def push_down(
+        self, criteria: dict[str, Any]
+    ) -> tuple[dict[str, Any], Callable[[Atspi.Accessible], bool] | None, list[str]] | None:
+        """Adds the conditions which fit the match rule criteria to them.
+
+        Returns the new criteria, the check for the conditions which must be evaluated in Orca
+        (or None), and the kinds of condition added; or None if no object can match both.
+        """
+
+        criteria = dict(criteria)
+        pushed: list[str] = []
+        checks: list[Callable[[Atspi.Accessible], bool]] = []
+        for kind, match_type_argument in _MATCH_TYPE_ARGUMENTS.items():
+            values = list(getattr(self, kind))
+            if not values:
+                continue
+
+            base = list(criteria.get(kind) or [])
+            match_type = criteria.get(match_type_argument, Atspi.CollectionMatchType.ALL)
+            # A single value must be present whether the rule wants all or any of its values.
+            if len(base) == 1 and match_type == Atspi.CollectionMatchType.ANY:
+                match_type = Atspi.CollectionMatchType.ALL
+
+            merged: list[Any] | None = None
+            if kind == "roles":
+                if not base:
+                    merged = values
+                elif match_type == Atspi.CollectionMatchType.ANY or (
+                    match_type == Atspi.CollectionMatchType.ALL and len(base) == 1
+                ):
+                    merged = [role for role in values if role in base]
+                elif match_type == Atspi.CollectionMatchType.NONE:
+                    merged = [role for role in values if role not in base]
+                if merged is not None:
+                    if not merged:
+                        return None
+                    criteria[match_type_argument] = Atspi.CollectionMatchType.ANY
+            elif not base or match_type == Atspi.CollectionMatchType.ALL:
+                added = [value for value in values if value not in base]
+                # Other values of an attribute in the rule would be treated as alternatives.
+                if kind == "attributes":
+                    names = {value.split(":", 1)[0] for value in base}
+                    conflicts = any(value.split(":", 1)[0] in names for value in added)
+                else:
+                    conflicts = False
+                if not conflicts:
+                    merged = base + added
+                    criteria[match_type_argument] = Atspi.CollectionMatchType.ALL
+
+            if merged is None:
+                if (check := self._get_check(kind)) is not None:
+                    checks.append(check)
+                continue
+
+            criteria[kind] = merged
+            pushed.append(kind)
+
+        if self.residual is not None:
+            checks.append(self.residual)
+        if not checks:
+            return criteria, None, pushed
+        if len(checks) == 1:
+            return criteria, checks[0], pushed
+        return criteria, lambda obj: all(check(obj) for check in checks), pushed
 
 
 class AXUtilitiesCollection:
@@ -65,6 +199,56 @@ class AXUtilitiesCollection:
         debug.print_message(debug.LEVEL_INFO, msg, True)
         return matches
 
+    @staticmethod
+    def _find_all_matching(
+        root: Atspi.Accessible,
+        pred: Callable[[Atspi.Accessible], bool] | None,
+        **criteria: Any,
+    ) -> list[Atspi.Accessible]:
+        """Returns the descendants of root which match the rule criteria and pred.
+
+        The conditions of a MatchPredicate which fit the criteria are added to the match rule,
+        so Collection eliminates the objects which fail them. Other predicates are applied by
+        Orca to each match.
+        """
+
+        residual = pred
+        pushed: list[str] = []
+        original_criteria = criteria
+        if isinstance(pred, MatchPredicate):
+            compiled = pred.push_down(criteria)
+            if compiled is None:
+                tokens = ["AXUtilitiesCollection: No object can match", pred, "and", criteria]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                return []
+
+            criteria, residual, pushed = compiled
+            tokens = [
+                "AXUtilitiesCollection: Added",
+                pushed,
+                "of",
+                pred,
+                "to the match rule. Residual:",
+                residual,
+            ]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        rule = AXCollection.create_match_rule(**criteria)
+        matches = AXCollection.get_all_matches(root, rule)
+        if pushed and debug.debugLevel <= debug.LEVEL_ALL:
+            # This doubles the cost of the query, so it is only done at the most verbose level.
+            rule = AXCollection.create_match_rule(**original_criteria)
+            candidates = len(AXCollection.get_all_matches(root, rule))
+            msg = (
+                f"AXUtilitiesCollection: {candidates - len(matches)} of {candidates} "
+                "candidates eliminated by Collection"
+            )
+            debug.print_message(debug.LEVEL_ALL, msg, True)
+
+        if residual is not None:
+            matches = AXUtilitiesCollection._apply_predicate(matches, residual)
+        return matches
+
     @staticmethod
     def _find_all_with_states(
         root: Atspi.Accessible,
@@ -87,12 +271,12 @@ class AXUtilitiesCollection:
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        rule = AXCollection.create_match_rule(states=state_list, state_match_type=state_match_type)
-        matches = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            matches = AXUtilitiesCollection._apply_predicate(matches, pred)
-
-        return matches
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
+            states=state_list,
+            state_match_type=state_match_type,
+        )
 
     @staticmethod
     def _find_all_with_role(
@@ -116,12 +300,12 @@ class AXUtilitiesCollection:
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        rule = AXCollection.create_match_rule(roles=role_list, role_match_type=role_match_type)
-        matches = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            matches = AXUtilitiesCollection._apply_predicate(matches, pred)
-
-        return matches
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
+            roles=role_list,
+            role_match_type=role_match_type,
+        )
 
     @staticmethod
     def find_all_with_role(
@@ -164,17 +348,14 @@ class AXUtilitiesCollection:
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        rule = AXCollection.create_match_rule(
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
             roles=role_list,
             role_match_type=Atspi.CollectionMatchType.ANY,
             states=state_list,
             state_match_type=Atspi.CollectionMatchType.ALL,
         )
-        matches = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            matches = AXUtilitiesCollection._apply_predicate(matches, pred)
-
-        return matches
 
     @staticmethod
     def find_all_with_role_without_states(
@@ -202,17 +383,14 @@ class AXUtilitiesCollection:
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        rule = AXCollection.create_match_rule(
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
             roles=role_list,
             role_match_type=Atspi.CollectionMatchType.ANY,
             states=state_list,
             state_match_type=Atspi.CollectionMatchType.NONE,
         )
-        matches = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            matches = AXUtilitiesCollection._apply_predicate(matches, pred)
-
-        return matches
 
     @staticmethod
     def find_all_with_states(
@@ -310,6 +488,8 @@ class AXUtilitiesCollection:
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
+        residual = pred.residual if isinstance(pred, MatchPredicate) else pred
+
         def is_match(obj):
             result = AXUtilitiesAction.has_action(obj, "click")
             if debug.debugLevel <= debug.LEVEL_INFO:
@@ -323,9 +503,15 @@ class AXUtilitiesCollection:
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             if not result:
                 return False
-            return pred is None or pred(obj)
+            return residual is None or residual(obj)
 
-        rule = AXCollection.create_match_rule(
+        match_pred: Callable[[Atspi.Accessible], bool] = is_match
+        if isinstance(pred, MatchPredicate):
+            match_pred = dataclasses.replace(pred, residual=is_match)
+
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            match_pred,
             interfaces=interfaces,
             attributes=attributes,
             attribute_match_type=attribute_match_type,
@@ -334,9 +520,6 @@ class AXUtilitiesCollection:
             states=states,
             state_match_type=state_match_type,
         )
-        matches = AXCollection.get_all_matches(root, rule)
-        matches = AXUtilitiesCollection._apply_predicate(matches, is_match)
-        return matches
 
     @staticmethod
     def find_all_combo_boxes(
@@ -410,6 +593,8 @@ class AXUtilitiesCollection:
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
+        residual = pred.residual if isinstance(pred, MatchPredicate) else pred
+
         def is_match(obj):
             result = AXUtilitiesAction.has_action(obj, "click-ancestor")
             if debug.debugLevel <= debug.LEVEL_INFO:
@@ -423,18 +608,21 @@ class AXUtilitiesCollection:
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             if not result:
                 return False
-            return pred is None or pred(obj)
+            return residual is None or residual(obj)
 
-        rule = AXCollection.create_match_rule(
+        match_pred: Callable[[Atspi.Accessible], bool] = is_match
+        if isinstance(pred, MatchPredicate):
+            match_pred = dataclasses.replace(pred, residual=is_match)
+
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            match_pred,
             interfaces=interfaces,
             roles=roles,
             role_match_type=roles_match_type,
             states=states,
             state_match_type=state_match_type,
         )
-        matches = AXCollection.get_all_matches(root, rule)
-        matches = AXUtilitiesCollection._apply_predicate(matches, is_match)
-        return matches
 
     @staticmethod
     def find_all_form_fields(
@@ -466,12 +654,12 @@ class AXUtilitiesCollection:
 
         roles = [Atspi.Role.TABLE]
         attributes = ["xml-roles:grid"]
-        rule = AXCollection.create_match_rule(roles=roles, attributes=attributes)
-        grids = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            AXUtilitiesCollection._apply_predicate(grids, pred)
-
-        return grids
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
+            roles=roles,
+            attributes=attributes,
+        )
 
     @staticmethod
     def find_all_headings(
@@ -508,11 +696,12 @@ class AXUtilitiesCollection:
 
         roles = [Atspi.Role.HEADING]
         attributes = [f"level:{level}"]
-        rule = AXCollection.create_match_rule(roles=roles, attributes=attributes)
-        matches = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            matches = AXUtilitiesCollection._apply_predicate(matches, pred)
-        return matches
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
+            roles=roles,
+            attributes=attributes,
+        )
 
     @staticmethod
     def find_all_images_and_image_maps(
@@ -585,15 +774,12 @@ class AXUtilitiesCollection:
         levels = ["off", "polite", "assertive"]
         attributes = ["container-live:" + level for level in levels]
 
-        rule = AXCollection.create_match_rule(
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
             attributes=attributes,
             attribute_match_type=Atspi.CollectionMatchType.ANY,
         )
-        matches = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            matches = AXUtilitiesCollection._apply_predicate(matches, pred)
-
-        return matches
 
     @staticmethod
     def find_all_lists(
@@ -660,6 +846,64 @@ class AXUtilitiesCollection:
             roles.append(Atspi.Role.HEADING)
         return AXUtilitiesCollection.find_all_with_role(root, roles, pred)
 
+    @staticmethod
+    def find_all_partitioned_by_role(
+        root: Atspi.Accessible,
+        partitions: Mapping[
+            _PartitionKey,
+            tuple[Iterable[Atspi.Role], Callable[[Atspi.Accessible], bool] | None],
+        ],
+    ) -> dict[_PartitionKey, list[Atspi.Accessible]]:
+        """Returns the descendants of root for each partition, found with a single query.
+
+        Each partition is a list of roles and an optional predicate. The descendants with any
+        of the roles of any partition are found together, and then each is added to every
+        partition which has its role and whose predicate, if any, accepts it. The matches of
+        each partition are in document order.
+        """
+
+        if root is None:
+            return {}
+
+        keys_by_role: dict[Atspi.Role, list[_PartitionKey]] = {}
+        for key, (roles, _pred) in partitions.items():
+            for role in roles:
+                keys_by_role.setdefault(role, []).append(key)
+
+        tokens = [
+            "AXUtilitiesCollection:",
+            inspect.currentframe(),
+            "Root:",
+            root,
+            f"{len(partitions)} partitions of:",
+            list(keys_by_role),
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        result: dict[_PartitionKey, list[Atspi.Accessible]] = {key: [] for key in partitions}
+        rule = AXCollection.create_match_rule(
+            roles=list(keys_by_role),
+            role_match_type=Atspi.CollectionMatchType.ANY,
+        )
+        matches = AXCollection.get_all_matches(root, rule)
+        if not matches:
+            return result
+
+        start = time.time()
+        with ax_cache_manager.stable_tree_scope():
+            for match in matches:
+                for key in keys_by_role.get(AXObject.get_role(match), []):
+                    pred = partitions[key][1]
+                    if pred is None or pred(match):
+                        result[key].append(match)
+
+        msg = (
+            f"AXUtilitiesCollection: {len(matches)} matches partitioned in "
+            f"{time.time() - start:.4f}s"
+        )
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        return result
+
     @staticmethod
     def find_all_push_buttons(
         root: Atspi.Accessible,
@@ -716,18 +960,14 @@ class AXUtilitiesCollection:
         roles = [Atspi.Role.TABLE]
         attributes = ["layout-guess:true"]
         attribute_match_type = Atspi.CollectionMatchType.NONE
-        rule = AXCollection.create_match_rule(
+        return AXUtilitiesCollection._find_all_matching(
+            root,
+            pred,
             roles=roles,
             attributes=attributes,
             attribute_match_type=attribute_match_type,
         )
 
-        tables = AXCollection.get_all_matches(root, rule)
-        if pred is not None:
-            AXUtilitiesCollection._apply_predicate(tables, pred)
-
-        return tables
-
     @staticmethod
     def find_all_unvisited_links(
         root: Atspi.Accessible,
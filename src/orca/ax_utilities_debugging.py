@@ -91,6 +91,29 @@ class AXUtilitiesDebugging:
 
         return AXUtilitiesDebugging._as_string(obj, False)
 
+    @staticmethod
+    def as_brief_string(obj: Any) -> str:
+        """Turns obj into a string without asking the application for anything."""
+
+        if isinstance(obj, Atspi.Accessible):
+            return f"[accessible ({hex(id(obj))})]"
+
+        if isinstance(obj, Atspi.Event):
+            source = AXUtilitiesDebugging.as_brief_string(obj.source)
+            return f"{obj.type} for {source} ({obj.detail1}, {obj.detail2})"
+
+        if isinstance(obj, (list, set, tuple)):
+            return f"[{', '.join(map(AXUtilitiesDebugging.as_brief_string, obj))}]"
+
+        if isinstance(obj, dict):
+            values = (
+                f"{key}: {AXUtilitiesDebugging.as_brief_string(value)}"
+                for key, value in obj.items()
+            )
+            return f"{{{', '.join(values)}}}"
+
+        return AXUtilitiesDebugging.as_string(obj)
+
     @staticmethod
     def _as_string(obj: Any, format_strings: bool) -> str:
         """Turns obj into a human-consumable string, optionally formatting string values."""
@@ -156,6 +156,7 @@ class _AXUtilitiesEventCache:
                 self,
                 namespace,
                 lifetime=ax_cache_manager.Lifetime.PROCESS,
+                keyed_by_object=namespace != self.TEXT_EVENT_REASON,
             )
         self._caches = {
             namespace: self._manager.get_cache(self, namespace) for namespace in self._NAMESPACES
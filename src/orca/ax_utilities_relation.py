@@ -49,6 +49,7 @@ class _AXUtilitiesRelationCache:
                 namespace,
                 lifetime=ax_cache_manager.Lifetime.PROCESS,
                 clear_on_demand=ax_cache_manager.ClearPolicy.CLEAR,
+                keyed_by_object=True,
             )
         self._relations_cache = self._manager.get_cache(self, self.RELATIONS)
         self._targets_cache = self._manager.get_cache(self, self.TARGETS)
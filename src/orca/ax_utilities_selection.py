@@ -55,6 +55,7 @@ class _AXUtilitiesSelectionCache:
             self.IS_ALL_ITEMS_SELECTED,
             lifetime=ax_cache_manager.Lifetime.PROCESS,
             clear_interval_seconds=None,
+            keyed_by_object=True,
         )
         self._all_items_selected_cache = self._manager.get_cache(self, self.IS_ALL_ITEMS_SELECTED)
 
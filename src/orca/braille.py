@@ -40,7 +40,15 @@ from typing import TYPE_CHECKING, Any, cast
 
 from gi.repository import GLib
 
-from . import debug, language_utilities, script_manager, systemd, text_attribute_manager
+from . import (
+    debug,
+    language_utilities,
+    latency_tracker,
+    script_manager,
+    systemd,
+    text_attribute_manager,
+    trace_recorder,
+)
 from .ax_event_synthesizer import AXEventSynthesizer
 from .ax_hypertext import AXHypertext
 from .ax_object import AXObject
@@ -539,7 +547,8 @@ def _brlapi_worker_loop(token: int, task_queue: queue.Queue[_BrlapiTask | None])
             return
         GLib.idle_add(_note_brlapi_task_started, token, task.action)
         try:
-            task.func(task.brlapi)
+            with trace_recorder.get_recorder().async_slice(task.action, "brlapi"):
+                task.func(task.brlapi)
         except BRLAPI_ERRORS as error:
             GLib.idle_add(_note_brlapi_task_finished, token)
             callback = task.on_failure
@@ -2196,6 +2205,7 @@ def _paint_display(line_info: _LineInfo, start_position: int, end_position: int)
             msg = "BRAILLE: Cannot write: BrlAPI connection unavailable."
             debug.print_message(debug.LEVEL_WARNING, msg, True)
             return False
+        latency_tracker.get_tracker().note_output("braille")
 
     if _STATE.monitor_callback is not None:
         visible = line_info.string[start_position:end_position]
@@ -2285,7 +2295,9 @@ def refresh(
     # the first cursor position as opposed to 0.
     _set_cursor_cell(cursor_offset, start_position)
 
-    if not _paint_display(line_info, start_position, end_position):
+    with trace_recorder.get_recorder().slice("paint display", "braille"):
+        painted = _paint_display(line_info, start_position, end_position)
+    if not painted:
         return
 
     # Remember the text information we were presenting (if any)
@@ -0,0 +1,117 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+
+"""Provides the usage statistics of the accessibility caches."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from . import ax_cache_manager, dbus_service, debug
+
+if TYPE_CHECKING:
+    from . import input_event
+    from .scripts import default
+
+
+class CacheStatistics:
+    """Provides the usage statistics of the accessibility caches."""
+
+    def __init__(self) -> None:
+        dbus_service.get_remote_controller().register_decorated_module("CacheStatistics", self)
+
+    @dbus_service.getter
+    def get_statistics(self) -> dict[str, dict[str, int]]:
+        """Returns the gets, hits, misses, puts, invalidations, evictions, and size by cache."""
+
+        return ax_cache_manager.get_manager().get_statistics()
+
+    @dbus_service.getter
+    def get_invalidation_reasons(self) -> dict[str, dict[str, int]]:
+        """Returns the number of invalidations of each cache, by reason."""
+
+        return ax_cache_manager.get_manager().get_invalidation_reasons()
+
+    @dbus_service.getter
+    def get_hit_rate(self) -> float:
+        """Returns the fraction of lookups in all caches which were hits."""
+
+        return ax_cache_manager.get_manager().get_hit_rate()
+
+    @dbus_service.getter
+    def get_memory_usage(self) -> int:
+        """Returns the approximate size in bytes of the values in bounded caches combined."""
+
+        return ax_cache_manager.get_manager().get_memory_usage()
+
+    @dbus_service.command
+    def reset_statistics(
+        self,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = True,
+    ) -> bool:
+        """Resets the usage counts of all caches."""
+
+        tokens = [
+            "CACHE STATISTICS: reset_statistics. Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        ax_cache_manager.get_manager().reset_statistics()
+        return True
+
+    def get_report(self) -> list[str]:
+        """Returns the statistics as lines of a table, busiest caches first."""
+
+        manager = ax_cache_manager.get_manager()
+        statistics = manager.get_statistics()
+        reasons = manager.get_invalidation_reasons()
+        columns = ax_cache_manager.AXCacheManager.STATISTICS
+        width = max((len(name) for name in statistics), default=0)
+
+        lines = [
+            (
+                f"Hit rate: {manager.get_hit_rate():.1%}. "
+                f"Memory usage: {manager.get_memory_usage()} bytes in {len(statistics)} caches."
+            ),
+            f"{'cache':<{width}} " + " ".join(f"{column:>13}" for column in columns),
+        ]
+        for name, entry in sorted(statistics.items(), key=lambda item: -item[1]["gets"]):
+            values = " ".join(f"{entry[column]:>13}" for column in columns)
+            lines.append(f"{name:<{width}} {values}")
+            for reason, count in sorted(reasons.get(name, {}).items(), key=lambda item: -item[1]):
+                lines.append(f"{'':<{width}}   {count:>6} invalidated: {reason}")
+        return lines
+
+
+_statistics: CacheStatistics = CacheStatistics()
+
+
+def get_statistics() -> CacheStatistics:
+    """Returns the Cache Statistics singleton."""
+
+    return _statistics
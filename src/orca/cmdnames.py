@@ -599,6 +599,18 @@ DEBUG_CYCLE_LEVEL = _("Cycle the debug level at run time")
 # information which impacts Orca's logic and/or presentation to users.
 DEBUG_CLEAR_ATSPI_CACHE_FOR_APPLICATION = _("Clear the AT-SPI cache for the current application")
 
+# Translators: this is a debug message for advanced users and developers. Orca
+# always keeps its most recent debug messages in memory, even when debugging is
+# turned off. This command writes those messages to a file which can be attached
+# to a bug report.
+DEBUG_DUMP_FLIGHT_RECORDER = _("Save recent debug messages to a file")
+
+# Translators: this is a debug message for advanced users and developers. Orca
+# caches information about accessible objects. This command writes how often
+# each cache was used and how often it had the information needed to the debug
+# output.
+DEBUG_PRINT_CACHE_STATISTICS = _("Print cache statistics to the debug output")
+
 # Translators: Orca allows the item under the pointer to be spoken. This toggles
 # the feature without the need to get into a GUI.
 MOUSE_REVIEW_TOGGLE = _("Toggle mouse review mode")
@@ -19,13 +19,18 @@
 
 """Handles writing debugging messages to the debug file or stderr."""
 
+import collections
 import contextlib
+import glob
 import inspect
 import os
+import queue
 import re
 import sys
 import threading
+import time
 import traceback
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, TextIO
 
@@ -43,12 +48,48 @@ debugFile: TextIO | None = None
 
 _printing = threading.local()
 
+# Records are handed to a writer thread so that formatting and file I/O do not slow down the main
+# thread. When the writer falls this far behind, new records are dropped and counted instead.
+MAX_QUEUED_RECORDS = 10000
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+_records: queue.Queue[tuple[int, float | None, tuple[Any, ...], bool, str]] = queue.Queue(
+    MAX_QUEUED_RECORDS
+)
+_writer_lock = threading.Lock()
+
+# The flight recorder keeps the most recent records at this level and above no matter what
+# debugLevel is, so that a hang can be diagnosed from a session in which logging was off. Tokens
+# which are not also being written out are only described briefly, without asking the application
+# for anything, so that recording stays cheap; nothing live is kept in the recorder.
+FLIGHT_RECORDER_LEVEL = LEVEL_INFO
+FLIGHT_RECORDER_SIZE = 5000
+FLIGHT_RECORDER_MAX_FILES = 10
+FLIGHT_RECORDER_MIN_AUTOMATIC_INTERVAL = 60.0
+
+_flight_recorder: collections.deque[tuple[int, float, tuple[Any, ...], bool]] = collections.deque(
+    maxlen=FLIGHT_RECORDER_SIZE
+)
+
+
+@dataclass
+class _DebugState:
+    """Mutable state of the writer thread and the flight recorder."""
+
+    writer: threading.Thread | None = None
+    dropped_records: int = 0
+    reported_dropped_records: int = 0
+    last_automatic_dump: float = 0.0
+
+
+_STATE = _DebugState()
+
 
 def print_exception(level: int) -> None:
     """Prints out information regarding the current exception."""
-    if level >= debugLevel:
+    if level >= debugLevel or level >= FLIGHT_RECORDER_LEVEL:
         _print_text(level)
-        traceback.print_exc(100, debugFile)
+        _print_text(level, traceback.format_exc(100).rstrip("\n"))
         _print_text(level)
 
 
@@ -60,30 +101,47 @@ def print_tokens(
 ) -> None:
     """Prints out each token as a human-consumable string."""
 
-    if level < debugLevel:
+    # Describing accessibles and events can require calls to the application, so tokens nobody
+    # will write out are not described at all.
+    if level < debugLevel and level < FLIGHT_RECORDER_LEVEL:
         return
 
-    # Avoid importing AXObject through AXUtilitiesDebugging before AXCacheManager initializes.
-    # pylint: disable=import-outside-toplevel
-    from .ax_utilities_debugging import AXUtilitiesDebugging
+    content = tuple(tokens)
+    if level < debugLevel:
+        _record(level, content, True, describe_briefly=True)
+        return
 
-    text = " ".join(map(AXUtilitiesDebugging.as_string, tokens))
-    text = re.sub(r" (?=[,.:)])(?![\n])", "", text)
-    _print_text(level, text, timestamp, stack)
+    _enqueue(level, content, True, timestamp, stack)
 
 
 def print_message(level: int, text: str, timestamp: bool = False, stack: bool = False) -> None:
     """Prints out text."""
 
-    if level < debugLevel:
+    if level < debugLevel and level < FLIGHT_RECORDER_LEVEL:
         return
 
     _print_text(level, text, timestamp, stack)
 
 
+def get_dropped_record_count() -> int:
+    """Returns the number of records dropped because the writer thread fell behind."""
+
+    return _STATE.dropped_records
+
+
+def flush() -> None:
+    """Blocks until the writer thread has written every queued record."""
+
+    writer = _STATE.writer
+    if writer is None or not writer.is_alive() or writer is threading.current_thread():
+        return
+    _records.join()
+
+
 def shutdown() -> None:
     """Flushes debugFile and fsyncs it so no buffered writes are lost on exit."""
 
+    flush()
     if debugFile is None:
         return
     with contextlib.suppress(OSError):
@@ -116,10 +174,138 @@ def _stack_as_string(max_frames: int = 4) -> str:
     return " > ".join(map(AXUtilitiesDebugging.as_string, callers))
 
 
+def dump_flight_recorder(
+    reason: str = "",
+    path: str = "",
+    automatic: bool = False,
+    background: bool = False,
+) -> str:
+    """Writes the flight recorder to path, or a new file, returning the path or "" on failure.
+
+    If background is True, the file is written by another thread and the path is returned
+    before it has been written.
+    """
+
+    now = time.time()
+    if automatic:
+        if now - _STATE.last_automatic_dump < FLIGHT_RECORDER_MIN_AUTOMATIC_INTERVAL:
+            return ""
+        _STATE.last_automatic_dump = now
+
+    records = list(_flight_recorder)
+    is_default_path = not path
+    if is_default_path:
+        state_home = os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state")
+        local_time = datetime.fromtimestamp(now, tz=timezone.utc).astimezone()
+        path = os.path.join(
+            state_home, "orca", f"flight-recorder-{local_time:%Y-%m-%d-%H:%M:%S.%f}.out"
+        )
+
+    if background:
+        threading.Thread(
+            target=_write_flight_recorder,
+            args=(records, reason, path, is_default_path),
+            name="orca-flight-recorder",
+            daemon=True,
+        ).start()
+        return path
+
+    if not _write_flight_recorder(records, reason, path, is_default_path):
+        return ""
+    return path
+
+
+def _write_flight_recorder(
+    records: list[tuple[int, float, tuple[Any, ...], bool]],
+    reason: str,
+    path: str,
+    is_default_path: bool,
+) -> bool:
+    """Formats and writes records to path, returning True on success."""
+
+    lines = [f"Flight recorder: {len(records)} record(s). Reason: {reason}"]
+    for _level, when, content, is_tokens in records:
+        lines.append(_format_record(when, content, is_tokens, ""))
+
+    directory = os.path.dirname(path) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(
+            path,
+            "w",
+            encoding="utf-8",
+            opener=lambda name, flags: os.open(name, flags, 0o600),
+        ) as dump_file:
+            dump_file.write("\n".join(lines) + "\n")
+    except (OSError, UnicodeEncodeError) as error:
+        print_message(LEVEL_SEVERE, f"DEBUG: Could not write flight recorder: {error}", True)
+        return False
+
+    if is_default_path:
+        old_dumps = sorted(glob.glob(os.path.join(directory, "flight-recorder-*.out")))
+        for old_dump in old_dumps[:-FLIGHT_RECORDER_MAX_FILES]:
+            with contextlib.suppress(OSError):
+                os.remove(old_dump)
+
+    print_message(LEVEL_INFO, f"DEBUG: Flight recorder written to {path}. Reason: {reason}", True)
+    return True
+
+
+def _record(
+    level: int,
+    content: tuple[Any, ...],
+    is_tokens: bool,
+    describe_briefly: bool = False,
+) -> None:
+    """Adds the record to the flight recorder."""
+
+    if level < FLIGHT_RECORDER_LEVEL or getattr(_printing, "active", False):
+        return
+
+    if is_tokens and describe_briefly:
+        _printing.active = True
+        try:
+            content = _snapshot(content, brief=True)
+        finally:
+            _printing.active = False
+
+    _flight_recorder.append((level, time.time(), content, is_tokens))
+
+
+def _snapshot(content: tuple[Any, ...], brief: bool = False) -> tuple[Any, ...]:
+    """Returns content with each token which is not a plain value described as a string."""
+
+    if all(type(token) in _PLAIN_TYPES for token in content):
+        return content
+
+    # Avoid importing AXObject through AXUtilitiesDebugging before AXCacheManager initializes.
+    # pylint: disable-next=import-outside-toplevel
+    from .ax_utilities_debugging import AXUtilitiesDebugging
+
+    if brief:
+        describe = AXUtilitiesDebugging.as_brief_string
+    else:
+        describe = AXUtilitiesDebugging.as_string
+    return tuple(token if type(token) in _PLAIN_TYPES else describe(token) for token in content)
+
+
 def _print_text(level: int, text: str = "", timestamp: bool = False, stack: bool = False) -> None:
     if level < debugLevel:
+        _record(level, (text,), False)
         return
 
+    _enqueue(level, (text,), False, timestamp, stack)
+
+
+def _enqueue(
+    level: int,
+    content: tuple[Any, ...],
+    is_tokens: bool,
+    timestamp: bool,
+    stack: bool,
+) -> None:
+    """Snapshots what can only be described on this thread and queues the record for writing."""
+
     # Prevent reentrancy.
     if getattr(_printing, "active", False):
         return
@@ -127,39 +313,108 @@ def _print_text(level: int, text: str = "", timestamp: bool = False, stack: bool
     _printing.active = True
 
     try:
-        if timestamp:
-            text = text.replace("\n", f"\n{' ' * 18}")
-            local_time = datetime.now(tz=timezone.utc).astimezone()
-            text = f"{local_time.strftime('%H:%M:%S.%f')} - {text}"
-        if stack:
-            text += f" {_stack_as_string()}"
-
-        if debugFile:
-            try:
-                debugFile.write(f"{text}\n")
-            except (AttributeError, OSError):
-                return
-            except (TypeError, ValueError, UnicodeEncodeError) as error:
-                text = f"Exception trying to write text to file: {error}"
-                with contextlib.suppress(
-                    AttributeError, OSError, TypeError, ValueError, UnicodeEncodeError
-                ):
-                    debugFile.write(f"{text}\n")
-            if level >= LEVEL_SEVERE:
-                with contextlib.suppress(
-                    AttributeError, OSError, TypeError, ValueError, UnicodeEncodeError
-                ):
-                    sys.stderr.write(f"{text}\n")
-        else:
-            try:
-                sys.stderr.write(f"{text}\n")
-            except (AttributeError, OSError):
-                return
-            except (TypeError, ValueError, UnicodeEncodeError) as error:
-                text = f"Exception trying to write text to stderr: {error}"
-                with contextlib.suppress(
-                    AttributeError, OSError, TypeError, ValueError, UnicodeEncodeError
-                ):
-                    sys.stderr.write(f"{text}\n")
+        # Accessibles, events, and the like must be described now, on the main thread, while
+        # they are still valid. Plain values are left for the writer thread to stringify.
+        if is_tokens:
+            content = _snapshot(content)
+        when = time.time() if timestamp else None
+        stack_text = _stack_as_string() if stack else ""
     finally:
         _printing.active = False
+
+    # The flight recorder keeps the description made for the writer rather than making another.
+    _record(level, content, is_tokens)
+    _start_writer()
+    try:
+        _records.put_nowait((level, when, content, is_tokens, stack_text))
+    except queue.Full:
+        _STATE.dropped_records += 1
+
+
+def _start_writer() -> None:
+    """Starts the writer thread if it is not already running."""
+
+    if _STATE.writer is not None and _STATE.writer.is_alive():
+        return
+
+    with _writer_lock:
+        if _STATE.writer is not None and _STATE.writer.is_alive():
+            return
+        writer = threading.Thread(target=_write_records, name="orca-debug-writer", daemon=True)
+        _STATE.writer = writer
+        writer.start()
+
+
+def _write_records() -> None:
+    """Formats and writes queued records until the process exits."""
+
+    while True:
+        level, when, content, is_tokens, stack_text = _records.get()
+        try:
+            dropped = _STATE.dropped_records - _STATE.reported_dropped_records
+            if dropped:
+                _STATE.reported_dropped_records += dropped
+                _write_text(LEVEL_SEVERE, f"DEBUG: Dropped {dropped} record(s). Queue was full.")
+            _write_text(level, _format_record(when, content, is_tokens, stack_text))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # A token whose description fails must not stop the writer thread.
+            with contextlib.suppress(AttributeError, OSError, ValueError):
+                sys.stderr.write(f"DEBUG: Could not write record: {error!r}\n")
+        finally:
+            _records.task_done()
+
+
+def _format_record(
+    when: float | None,
+    content: tuple[Any, ...],
+    is_tokens: bool,
+    stack_text: str,
+) -> str:
+    """Returns the text for a queued record."""
+
+    if is_tokens:
+        text = " ".join(map(str, content))
+        text = re.sub(r" (?=[,.:)])(?![\n])", "", text)
+    else:
+        text = content[0]
+
+    if when is not None:
+        text = text.replace("\n", f"\n{' ' * 18}")
+        local_time = datetime.fromtimestamp(when, tz=timezone.utc).astimezone()
+        text = f"{local_time.strftime('%H:%M:%S.%f')} - {text}"
+    if stack_text:
+        text += f" {stack_text}"
+
+    return text
+
+
+def _write_text(level: int, text: str) -> None:
+    """Writes text to debugFile or stderr. Only called on the writer thread."""
+
+    if debugFile:
+        try:
+            debugFile.write(f"{text}\n")
+        except (AttributeError, OSError):
+            return
+        except (TypeError, ValueError, UnicodeEncodeError) as error:
+            text = f"Exception trying to write text to file: {error}"
+            with contextlib.suppress(
+                AttributeError, OSError, TypeError, ValueError, UnicodeEncodeError
+            ):
+                debugFile.write(f"{text}\n")
+        if level >= LEVEL_SEVERE:
+            with contextlib.suppress(
+                AttributeError, OSError, TypeError, ValueError, UnicodeEncodeError
+            ):
+                sys.stderr.write(f"{text}\n")
+    else:
+        try:
+            sys.stderr.write(f"{text}\n")
+        except (AttributeError, OSError):
+            return
+        except (TypeError, ValueError, UnicodeEncodeError) as error:
+            text = f"Exception trying to write text to stderr: {error}"
+            with contextlib.suppress(
+                AttributeError, OSError, TypeError, ValueError, UnicodeEncodeError
+            ):
+                sys.stderr.write(f"{text}\n")
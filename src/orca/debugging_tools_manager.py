@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import faulthandler
 import os
+import sys
 import time
 from typing import TYPE_CHECKING
 
@@ -34,6 +35,8 @@ gi.require_version("Atspi", "2.0")
 from gi.repository import Atspi
 
 from . import (  # pylint: disable=no-name-in-module
+    cache_statistics,
+    dbus_service,
     debug,
     debugging_tools_manager_command_definitions,
     focus_manager,
@@ -49,6 +52,7 @@ from .extension import Extension
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from types import TracebackType
 
     from .command import Command
     from .scripts import default
@@ -66,6 +70,18 @@ class DebuggingToolsManager(Extension):
             faulthandler.enable(all_threads=False)
         super().__init__()
 
+    def on_unhandled_exception(
+        self,
+        exc_type: type[BaseException],
+        exc_value: BaseException,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Dumps the flight recorder, then reports the exception. Installed as sys.excepthook."""
+
+        msg = f"DEBUGGING TOOLS MANAGER: Unhandled {exc_type.__name__}: {exc_value}"
+        debug.dump_flight_recorder(msg, automatic=True)
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+
     def _get_commands(self) -> list[Command]:
         return debugging_tools_manager_command_definitions.get_commands(self)
 
@@ -193,6 +209,71 @@ class DebuggingToolsManager(Extension):
             msg = f"DEBUGGING TOOLS MANAGER: {msg}"
             debug.print_message(debug.LEVEL_INFO, msg, True)
 
+    @dbus_service.command
+    def dump_flight_recorder(
+        self,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = True,
+    ) -> bool:
+        """Writes the most recent debug records, kept even when logging is off, to a file."""
+
+        tokens = [
+            "DEBUGGING TOOLS MANAGER: dump_flight_recorder. Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        path = debug.dump_flight_recorder("User request.")
+        if script is not None and notify_user:
+            if path:
+                presentation_manager.get_manager().present_message(
+                    messages.DEBUG_FLIGHT_RECORDER_DUMPED % path,
+                    messages.DEBUG_FLIGHT_RECORDER_DUMPED_BRIEF,
+                )
+            else:
+                presentation_manager.get_manager().present_message(
+                    messages.DEBUG_FLIGHT_RECORDER_DUMP_FAILED,
+                )
+        return True
+
+    @dbus_service.command
+    def print_cache_statistics(
+        self,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = True,
+    ) -> bool:
+        """Prints the usage statistics of the accessibility caches to the debug output."""
+
+        tokens = [
+            "DEBUGGING TOOLS MANAGER: print_cache_statistics. Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        for line in cache_statistics.get_statistics().get_report():
+            debug.print_message(debug.LEVEL_SEVERE, f"DEBUGGING TOOLS MANAGER: {line}", True)
+        if script is not None and notify_user:
+            presentation_manager.get_manager().present_message(
+                messages.DEBUG_CACHE_STATISTICS_PRINTED
+            )
+        return True
+
+    @dbus_service.getter
+    def get_dropped_debug_record_count(self) -> int:
+        """Returns the number of debug records dropped because the writer fell behind."""
+
+        return debug.get_dropped_record_count()
+
 
 _manager: DebuggingToolsManager = DebuggingToolsManager()
 
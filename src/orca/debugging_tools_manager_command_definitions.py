@@ -48,4 +48,16 @@ def get_commands(owner: DebuggingToolsManager) -> list[Command]:
             owner.GROUP_LABEL,
             cmdnames.DEBUG_CLEAR_ATSPI_CACHE_FOR_APPLICATION,
         ),
+        KeyboardCommand(
+            "dump_flight_recorder",
+            owner.dump_flight_recorder,
+            owner.GROUP_LABEL,
+            cmdnames.DEBUG_DUMP_FLIGHT_RECORDER,
+        ),
+        KeyboardCommand(
+            "print_cache_statistics",
+            owner.print_cache_statistics,
+            owner.GROUP_LABEL,
+            cmdnames.DEBUG_PRINT_CACHE_STATISTICS,
+        ),
     ]
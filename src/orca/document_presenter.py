@@ -113,6 +113,7 @@ class DocumentPresenter(Extension):
     KEY_PAGE_SUMMARY_ON_LOAD = "page-summary-on-load"
     KEY_FIND_RESULTS_VERBOSITY = "find-results-verbosity"
     KEY_FIND_RESULTS_MINIMUM_LENGTH = "find-results-minimum-length"
+    KEY_LINEARIZED_MODEL = "linearized-model"
 
     def _get_setting(self, key: str, gtype: str, default: Any) -> Any:
         """Returns the dconf value for key, or default if not in dconf."""
@@ -912,6 +913,35 @@ class DocumentPresenter(Extension):
         )
         return True
 
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_LINEARIZED_MODEL,
+        schema="document",
+        gtype="b",
+        default=False,
+        summary="Navigate visited web content using a linearized model",
+    )
+    @dbus_service.getter
+    def get_use_linearized_model(self) -> bool:
+        """Returns whether visited web content is navigated using a linearized model."""
+
+        return self._get_setting(self.KEY_LINEARIZED_MODEL, "b", False)
+
+    @dbus_service.setter
+    def set_use_linearized_model(self, value: bool) -> bool:
+        """Sets whether visited web content is navigated using a linearized model."""
+
+        if self.get_use_linearized_model() == value:
+            return True
+
+        msg = f"DOCUMENT PRESENTER: Setting use linearized model to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(
+            self._SCHEMA,
+            self.KEY_LINEARIZED_MODEL,
+            value,
+        )
+        return True
+
     @gsettings_registry.get_registry().gsetting(
         key=KEY_FIND_RESULTS_VERBOSITY,
         schema="document",
@@ -26,7 +26,9 @@
 
 from __future__ import annotations
 
+import collections
 import enum
+import heapq
 import itertools
 import queue
 import threading
@@ -39,21 +41,29 @@ gi.require_version("Atspi", "2.0")
 from gi.repository import Atspi, GLib
 
 from . import (
+    ax_text_mirror,
+    ax_tree_mirror,
     braille_presenter,
     dbus_service,
     debug,
     focus_manager,
+    gsettings_registry,
     input_event,
     input_event_manager,
+    latency_tracker,
     orca_modifier_manager,
     script_manager,
     systemd,
+    trace_recorder,
 )
 from .ax_object import AXObject
 from .ax_utilities import AXUtilities
 from .ax_utilities_debugging import AXUtilitiesDebugging
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import ClassVar
+
     from .scripts import default
 
 
@@ -69,9 +79,312 @@ class EventPriority(enum.IntEnum):
     LOW = enum.auto()
 
 
+class _ApplicationEventQueues:
+    """Per-application priority queues of object events, dispatched by weighted round-robin."""
+
+    # How many events the active application may have dispatched before another application
+    # with queued events is given a turn.
+    ACTIVE_APP_WEIGHT = 4
+
+    # Events at or above this priority (window and focus changes) are dispatched first, no
+    # matter which application they came from.
+    URGENT_PRIORITY = EventPriority.HIGH
+
+    # Once an application has this many queued events, low-priority events are shed.
+    MAX_APP_QUEUE_SIZE = 500
+    SHEDDABLE_PRIORITIES = (EventPriority.LOWER, EventPriority.LOW)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._queues: dict[int, list[tuple[EventPriority, int, Atspi.Event]]] = {}
+        # Sheddable items per application, ordered least urgent and then oldest first. Items
+        # which have since been dispatched are discarded lazily, as are shed items in _queues.
+        self._sheddable: dict[
+            int, list[tuple[int, int, tuple[EventPriority, int, Atspi.Event]]]
+        ] = {}
+        self._sheddable_counters: set[int] = set()
+        self._shed_counters: set[int] = set()
+        self._lengths: dict[int, int] = {}
+        self._apps: dict[int, Atspi.Accessible | None] = {}
+        self._rotation: collections.deque[int] = collections.deque()
+        self._active_served: int = 0
+        self._size: int = 0
+        self._dropped: dict[int, int] = {}
+        self._dropped_apps: dict[int, Atspi.Accessible | None] = {}
+
+    def qsize(self) -> int:
+        """Returns the total number of queued events."""
+
+        return self._size
+
+    def empty(self) -> bool:
+        """Returns True if no events are queued for any application."""
+
+        return self._size == 0
+
+    def clear(self) -> None:
+        """Removes all queued events. Drop counts are retained."""
+
+        with self._lock:
+            self._queues = {}
+            self._sheddable = {}
+            self._sheddable_counters.clear()
+            self._shed_counters.clear()
+            self._lengths = {}
+            self._apps = {}
+            self._rotation.clear()
+            self._active_served = 0
+            self._size = 0
+
+    def put(
+        self,
+        item: tuple[EventPriority, int, Atspi.Event],
+        app: Atspi.Accessible | None = None,
+    ) -> tuple[EventPriority, int, Atspi.Event] | None:
+        """Queues item for app, returning the event item shed to make room, if any."""
+
+        key = hash(app)
+        with self._lock:
+            heap = self._queues.get(key)
+            if heap is None:
+                heap = self._queues[key] = []
+                self._sheddable[key] = []
+                self._lengths[key] = 0
+                self._apps[key] = app
+                self._rotation.append(key)
+
+            shed = None
+            if self._lengths[key] >= self.MAX_APP_QUEUE_SIZE:
+                shed = self._shed(key, item)
+                if shed is not None:
+                    self._dropped[key] = self._dropped.get(key, 0) + 1
+                    self._dropped_apps[key] = app
+                    if shed is item:
+                        return shed
+
+            heapq.heappush(heap, item)
+            if item[0] in self.SHEDDABLE_PRIORITIES:
+                heapq.heappush(self._sheddable[key], (-item[0], item[1], item))
+                self._sheddable_counters.add(item[1])
+            self._lengths[key] += 1
+            self._size += 1
+            return shed
+
+    def _shed(
+        self,
+        key: int,
+        item: tuple[EventPriority, int, Atspi.Event],
+    ) -> tuple[EventPriority, int, Atspi.Event] | None:
+        """Sheds the lowest-priority, oldest sheddable item among key's queue and item."""
+
+        sheddable = self._sheddable[key]
+        while sheddable and sheddable[0][1] not in self._sheddable_counters:
+            heapq.heappop(sheddable)
+
+        candidate = None
+        if item[0] in self.SHEDDABLE_PRIORITIES:
+            candidate = (-item[0], item[1], item)
+        if sheddable and (candidate is None or sheddable[0][:2] < candidate[:2]):
+            _priority, counter, shed = heapq.heappop(sheddable)
+            self._sheddable_counters.discard(counter)
+            self._shed_counters.add(counter)
+            self._lengths[key] -= 1
+            self._size -= 1
+            self._discard_shed(self._queues[key])
+            return shed
+        if candidate is not None:
+            return item
+        return None
+
+    def _discard_shed(self, heap: list[tuple[EventPriority, int, Atspi.Event]]) -> None:
+        """Pops shed items off the top of heap so that heap[0] is always a queued item."""
+
+        while heap and heap[0][1] in self._shed_counters:
+            self._shed_counters.discard(heapq.heappop(heap)[1])
+
+    def _pop(self, key: int) -> tuple[EventPriority, int, Atspi.Event]:
+        """Removes and returns the most urgent item queued for the application with key."""
+
+        heap = self._queues[key]
+        item = heapq.heappop(heap)
+        self._sheddable_counters.discard(item[1])
+        self._discard_shed(heap)
+        self._lengths[key] -= 1
+        self._size -= 1
+        if not heap:
+            del self._queues[key]
+            del self._sheddable[key]
+            del self._lengths[key]
+            del self._apps[key]
+            self._rotation.remove(key)
+        return item
+
+    def get_nowait(
+        self,
+        active_app: Atspi.Accessible | None = None,
+    ) -> tuple[EventPriority, int, Atspi.Event]:
+        """Removes and returns the next item to dispatch, favoring active_app's events."""
+
+        with self._lock:
+            if not self._size:
+                raise queue.Empty
+
+            urgent = [
+                (heap[0], key)
+                for key, heap in self._queues.items()
+                if heap[0][0] <= self.URGENT_PRIORITY
+            ]
+            if urgent:
+                return self._pop(min(urgent)[1])
+
+            active_key = hash(active_app) if active_app is not None else None
+            if active_key in self._queues and self._active_served < self.ACTIVE_APP_WEIGHT:
+                self._active_served += 1
+                return self._pop(active_key)
+
+            for _i in range(len(self._rotation)):
+                key = self._rotation[0]
+                self._rotation.rotate(-1)
+                if key != active_key:
+                    self._active_served = 0
+                    return self._pop(key)
+
+            self._active_served = 1
+            return self._pop(self._rotation[0])
+
+    def get_depths(self) -> dict[str, int]:
+        """Returns the number of queued events for each application name."""
+
+        with self._lock:
+            snapshot = [(self._apps[key], length) for key, length in self._lengths.items()]
+
+        # Names are looked up outside the lock because doing so requires a round trip to the app.
+        depths: dict[str, int] = {}
+        for app, length in snapshot:
+            name = self._get_app_name(app)
+            depths[name] = depths.get(name, 0) + length
+        return depths
+
+    def get_dropped_counts(self) -> dict[str, int]:
+        """Returns the number of events shed from each application's full queue."""
+
+        with self._lock:
+            snapshot = [(self._dropped_apps[key], count) for key, count in self._dropped.items()]
+
+        dropped: dict[str, int] = {}
+        for app, count in snapshot:
+            name = self._get_app_name(app)
+            dropped[name] = dropped.get(name, 0) + count
+        return dropped
+
+    @staticmethod
+    def _get_app_name(app: Atspi.Accessible | None) -> str:
+        """Returns the name of app for reporting purposes."""
+
+        return (AXObject.get_name(app) if app else "") or "unknown"
+
+
+class _EventRateLimiter:
+    """Token buckets limiting how often each source may queue events of a given type."""
+
+    # The default number of events per second each source may queue, by event family (the
+    # second component of the event type, e.g. "children-changed").
+    DEFAULT_RATES: ClassVar[dict[str, float]] = {
+        "active-descendant-changed": 10.0,
+        "children-changed": 100.0,
+        "property-change": 10.0,
+        "selection-changed": 10.0,
+        "state-changed": 20.0,
+        "text-changed": 50.0,
+        "default": 10.0,
+    }
+
+    # A full bucket holds this many seconds' worth of events, so short bursts get through.
+    BURST_SECONDS = 0.3
+
+    # Buckets are pruned once there are this many; an unused bucket refills long before then.
+    MAX_BUCKETS = 2000
+
+    # Suppressions are summarized over windows of this many seconds.
+    SUMMARY_WINDOW = 1.0
+
+    def __init__(self) -> None:
+        self._buckets: dict[tuple[str, int, int], tuple[float, float]] = {}
+        self._window_start: float = 0.0
+        self._window_counts: collections.Counter[str] = collections.Counter()
+        self._suppressed: dict[str, int] = {}
+
+    def clear(self) -> None:
+        """Empties all buckets. Suppression counts are retained."""
+
+        self._buckets = {}
+        self._window_counts.clear()
+
+    @staticmethod
+    def get_family(event_type: str) -> str:
+        """Returns the family of event_type, e.g. "children-changed"."""
+
+        parts = event_type.split(":")
+        return parts[1] if len(parts) > 1 and parts[1] else parts[0]
+
+    def allow(self, key: tuple[str, int, int], rate: float, now: float) -> bool:
+        """Takes a token from key's bucket, returning False if the bucket is empty."""
+
+        capacity = max(1.0, rate * self.BURST_SECONDS)
+        tokens, last_time = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - last_time) * rate)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        else:
+            family = self.get_family(key[0])
+            self._suppressed[family] = self._suppressed.get(family, 0) + 1
+            self._window_counts[key[0]] += 1
+
+        if len(self._buckets) >= self.MAX_BUCKETS and key not in self._buckets:
+            self._prune(now)
+        self._buckets[key] = tokens, now
+        return allowed
+
+    def _prune(self, now: float) -> None:
+        """Removes the buckets which have had time to refill completely."""
+
+        stale = now - self.BURST_SECONDS * 2
+        self._buckets = {k: v for k, v in self._buckets.items() if v[1] > stale}
+
+    def take_summary(self, now: float, threshold: int) -> tuple[float, dict[str, int]]:
+        """Returns the window length and suppressions by type, if the window exceeded threshold."""
+
+        elapsed = now - self._window_start
+        if not self._window_start or elapsed < 0:
+            self._window_start = now
+            return 0.0, {}
+        if elapsed < self.SUMMARY_WINDOW:
+            return 0.0, {}
+
+        counts = dict(self._window_counts) if self._window_counts.total() > threshold else {}
+        self._window_start = now
+        self._window_counts.clear()
+        return elapsed, counts
+
+    def get_suppressed_counts(self) -> dict[str, int]:
+        """Returns the number of events suppressed for each event family."""
+
+        return dict(self._suppressed)
+
+
+@gsettings_registry.get_registry().gsettings_schema(
+    "org.gnome.Orca.EventManager",
+    name="event-manager",
+)
 class EventManager:
     """Manager for accessible object events."""
 
+    _SCHEMA = "event-manager"
+    KEY_DISPATCH_BUDGET = "dispatch-budget"
+    KEY_RATE_LIMITS = "rate-limits"
+    KEY_RATE_LIMIT_SUMMARY_THRESHOLD = "rate-limit-summary-threshold"
+
     _SKIPPABLE_SAME_TYPE_PREFIXES = (
         "document:page-changed",
         "object:active-descendant-changed",
@@ -91,23 +404,46 @@ class EventManager:
         "window:deactivate",
     )
 
+    _OBSOLESCENCE_RULES = ("same-type", "duplicate", "sibling", "window")
+
+    # Event types the event manager handles itself, e.g. to reclaim the scripts of closed
+    # applications, and therefore listens for no matter which scripts are registered.
+    _MANAGER_EVENT_TYPES = ("window:deactivate", "window:destroy")
+
+    # Focus and caret changes are what the user is waiting to hear; never rate-limit them.
+    _RATE_LIMIT_EXEMPT_PREFIXES = (
+        "object:state-changed:focused",
+        "object:text-caret-moved",
+    )
+
     def __init__(self) -> None:
         debug.print_message(debug.LEVEL_INFO, "EVENT MANAGER: Initializing", True)
         self._script_listener_counts: dict[str, int] = {}
+        self._script_event_types: dict[default.Script, list[str]] = {}
+        self._suspended_event_types: set[str] = set()
         self._active: bool = False
         self._paused: bool = False
         self._counter = itertools.count()
-        self._event_queue: queue.PriorityQueue[tuple[EventPriority, int, Atspi.Event]] = (
-            queue.PriorityQueue(0)
-        )
+        self._event_queue = _ApplicationEventQueues()
         self._gidle_id: int = 0
         self._gidle_lock = threading.Lock()
         self._listener: Atspi.EventListener = Atspi.EventListener.new(self._enqueue_object_event)
-        self._event_history: dict[str, tuple[int | None, float]] = {}
+        self._rate_limiter = _EventRateLimiter()
+        self._rate_limits: dict[str, float] | None = None
         self._latest_event: dict[tuple[str, int], int] = {}
+        self._latest_duplicate: dict[tuple[str, int, int, int, int], tuple[int, Atspi.Event]] = {}
+        self._latest_sibling: dict[tuple[str, int, int, int, int], tuple[int, Atspi.Event]] = {}
+        self._latest_window: dict[int, tuple[int, Atspi.Event]] = {}
+        self._obsoleted_counts: dict[str, int] = dict.fromkeys(self._OBSOLESCENCE_RULES, 0)
         dbus_service.get_remote_controller().register_decorated_module("EventManager", self)
+        gsettings_registry.get_registry().add_value_change_observer(self._on_settings_changed)
         debug.print_message(debug.LEVEL_INFO, "Event manager initialized", True)
 
+    def _on_settings_changed(self) -> None:
+        """Discards the cached rate limits so that they are looked up again."""
+
+        self._rate_limits = None
+
     def is_idle(self) -> bool:
         """Returns True if the object-event queue is empty and nothing is queued to process."""
 
@@ -135,6 +471,8 @@ class EventManager:
 
         input_event_manager.get_manager().start_key_watcher()
         orca_modifier_manager.get_manager().add_grabs_for_orca_modifiers()
+        for event_type in self._MANAGER_EVENT_TYPES:
+            self.register_listener(event_type)
         self._active = True
         debug.print_message(debug.LEVEL_INFO, "EVENT MANAGER: Activated", True)
 
@@ -147,11 +485,18 @@ class EventManager:
             return
 
         input_event_manager.get_manager().stop_key_watcher()
+        for event_type in self._MANAGER_EVENT_TYPES:
+            self.deregister_listener(event_type)
         self._active = False
         with self._gidle_lock:
-            self._event_queue = queue.PriorityQueue(0)
-            self._latest_event = {}
+            self._event_queue.clear()
+            latency_tracker.get_tracker().clear_queued()
+            self._clear_obsolescence_index()
         self._script_listener_counts = {}
+        self._script_event_types = {}
+        self._suspended_event_types = set()
+        ax_tree_mirror.get_mirror().clear("Event manager deactivated.")
+        ax_text_mirror.get_mirror().clear("Event manager deactivated.")
         debug.print_message(debug.LEVEL_INFO, "EVENT MANAGER: Deactivated", True)
 
     def pause_queuing(
@@ -167,10 +512,134 @@ class EventManager:
         self._paused = pause
         if clear_queue:
             with self._gidle_lock:
-                self._event_queue = queue.PriorityQueue(0)
-                self._latest_event = {}
+                self._event_queue.clear()
+                latency_tracker.get_tracker().clear_queued()
+                self._clear_obsolescence_index()
         input_event_manager.get_manager().pause_key_watcher(pause, reason)
 
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_DISPATCH_BUDGET,
+        schema="event-manager",
+        gtype="i",
+        default=0,
+        summary="Milliseconds spent processing queued events per main loop iteration",
+    )
+    @dbus_service.getter
+    def get_dispatch_budget(self) -> int:
+        """Returns the time in ms to spend processing queued events per idle callback (0 = one)."""
+
+        return gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_DISPATCH_BUDGET,
+            "i",
+            default=0,
+        )
+
+    @dbus_service.setter
+    def set_dispatch_budget(self, value: int) -> bool:
+        """Sets the time in ms to spend processing queued events per idle callback (0 = one)."""
+
+        if value < 0:
+            msg = f"EVENT MANAGER: Rejecting dispatch budget {value}. It cannot be negative."
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return False
+
+        if self.get_dispatch_budget() == value:
+            return True
+
+        msg = f"EVENT MANAGER: Setting dispatch budget to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(
+            self._SCHEMA,
+            self.KEY_DISPATCH_BUDGET,
+            value,
+        )
+        return True
+
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_RATE_LIMITS,
+        schema="event-manager",
+        gtype="a{sv}",
+        default={},
+        summary="Events per second each source may queue, by event family",
+    )
+    @dbus_service.getter
+    def get_rate_limits(self) -> dict[str, float]:
+        """Returns the events per second each source may queue, by event family."""
+
+        overrides = gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_RATE_LIMITS,
+            "a{sv}",
+            default={},
+        )
+        rates = dict(_EventRateLimiter.DEFAULT_RATES)
+        rates.update({family: float(rate) for family, rate in overrides.items()})
+        return rates
+
+    @dbus_service.setter
+    def set_rate_limits(self, value: dict[str, float]) -> bool:
+        """Sets the events per second each source may queue, by event family."""
+
+        if any(rate <= 0 for rate in value.values()):
+            msg = f"EVENT MANAGER: Rejecting rate limits {value}. Rates must be positive."
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return False
+
+        msg = f"EVENT MANAGER: Setting rate limits to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(
+            self._SCHEMA,
+            self.KEY_RATE_LIMITS,
+            {family: float(rate) for family, rate in value.items()},
+        )
+        return True
+
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_RATE_LIMIT_SUMMARY_THRESHOLD,
+        schema="event-manager",
+        gtype="i",
+        default=20,
+        summary="Suppressed events per second above which a summary is logged",
+    )
+    @dbus_service.getter
+    def get_rate_limit_summary_threshold(self) -> int:
+        """Returns the suppressed events per second above which a summary is logged."""
+
+        return gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_RATE_LIMIT_SUMMARY_THRESHOLD,
+            "i",
+            default=20,
+        )
+
+    @dbus_service.setter
+    def set_rate_limit_summary_threshold(self, value: int) -> bool:
+        """Sets the suppressed events per second above which a summary is logged."""
+
+        if value < 0:
+            msg = f"EVENT MANAGER: Rejecting rate limit summary threshold {value}. It is negative."
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return False
+
+        if self.get_rate_limit_summary_threshold() == value:
+            return True
+
+        msg = f"EVENT MANAGER: Setting rate limit summary threshold to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(
+            self._SCHEMA,
+            self.KEY_RATE_LIMIT_SUMMARY_THRESHOLD,
+            value,
+        )
+        return True
+
+    @dbus_service.getter
+    def get_suppressed_event_counts(self) -> dict[str, int]:
+        """Returns the number of events suppressed by the rate limiter, by event family."""
+
+        return self._rate_limiter.get_suppressed_counts()
+
     def _get_priority(self, event: Atspi.Event) -> EventPriority:
         """Returns the priority associated with event."""
 
@@ -208,92 +677,119 @@ class EventManager:
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
         return priority
 
-    # pylint: disable-next=too-many-return-statements
-    def _is_obsoleted_by(self, event: Atspi.Event, counter: int = -1) -> Atspi.Event | None:
-        """Returns the event which renders this one no longer worthy of being processed."""
+    @dbus_service.getter
+    def get_queue_depths(self) -> dict[str, int]:
+        """Returns the number of queued events for each application."""
 
-        if event.type.startswith(EventManager._SKIPPABLE_SAME_TYPE_PREFIXES):
-            key = (event.type, hash(event.source))
-            latest = self._latest_event.get(key, -1)
-            if latest > counter >= 0:
-                tokens = [
-                    "EVENT MANAGER:",
-                    event,
-                    f"(#{counter}) obsoleted: a newer {event.type} for same source"
-                    f" is queued (#{latest})",
-                ]
-                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-                return event
+        return self._event_queue.get_depths()
 
-        event_is_skippable_sibling = event.type.startswith(EventManager._SKIPPABLE_SIBLING_PREFIXES)
-        event_is_window = event.type.startswith(EventManager._SKIPPABLE_WINDOW_PREFIXES)
+    @dbus_service.getter
+    def get_dropped_event_counts(self) -> dict[str, int]:
+        """Returns the number of events dropped from each application's full queue."""
 
-        if not event_is_skippable_sibling and not event_is_window:
-            return None
+        return self._event_queue.get_dropped_counts()
 
-        def is_same(x):
-            return (
-                x.type == event.type
-                and x.source == event.source
-                and x.detail1 == event.detail1
-                and x.detail2 == event.detail2
-                and x.any_data == event.any_data
-            )
+    @dbus_service.getter
+    def get_obsoleted_event_counts(self) -> dict[str, int]:
+        """Returns the number of events dropped as obsolete, keyed by obsolescence rule."""
 
-        def obsoletes_if_same_type_in_sibling(x):
-            if not event_is_skippable_sibling:
-                return False
-            if (
-                x.type != event.type
-                or x.detail1 != event.detail1
-                or x.detail2 != event.detail2
-                or x.any_data != event.any_data
-            ):
-                return False
-            return AXObject.get_parent(x.source) == AXObject.get_parent(event.source)
+        return dict(self._obsoleted_counts)
 
-        def obsoletes_window_event(x):
-            if not event_is_window:
-                return False
-            if x.source != event.source:
-                return False
-            return x.type.startswith(EventManager._SKIPPABLE_WINDOW_PREFIXES)
+    @staticmethod
+    def _hashable(value: object) -> int:
+        """Returns a hash for value, falling back on its identity if it is unhashable."""
 
-        with self._event_queue.mutex:
-            try:
-                events = list(reversed(self._event_queue.queue))
-            except queue.Empty as error:
-                msg = f"EVENT MANAGER: Exception in _is_obsoleted_by: {error}"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                events = []
+        try:
+            return hash(value)
+        except TypeError:
+            return id(value)
 
-        for _priority, _counter, e in events:
-            if e == event:
-                return None
-            if is_same(e):
-                tokens = ["EVENT MANAGER:", event, "obsoleted by", e, "more recent duplicate"]
-                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-                return e
-            if obsoletes_if_same_type_in_sibling(e):
-                tokens = [
-                    "EVENT MANAGER:",
-                    event,
-                    "obsoleted by",
-                    e,
-                    "more recent event of same type from sibling",
-                ]
-                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-                return e
-            if obsoletes_window_event(e):
+    def _get_obsolescence_keys(
+        self,
+        event: Atspi.Event,
+    ) -> tuple[
+        tuple[str, int, int, int, int] | None,
+        tuple[str, int, int, int, int] | None,
+        int | None,
+    ]:
+        """Returns the (duplicate, sibling, window) index keys for event, None if inapplicable."""
+
+        is_sibling = event.type.startswith(EventManager._SKIPPABLE_SIBLING_PREFIXES)
+        is_window = event.type.startswith(EventManager._SKIPPABLE_WINDOW_PREFIXES)
+        if not (is_sibling or is_window):
+            return None, None, None
+
+        any_data = self._hashable(event.any_data)
+        duplicate_key = (event.type, hash(event.source), event.detail1, event.detail2, any_data)
+        sibling_key = None
+        if is_sibling:
+            parent = hash(AXObject.get_parent(event.source))
+            sibling_key = (event.type, parent, event.detail1, event.detail2, any_data)
+        window_key = hash(event.source) if is_window else None
+        return duplicate_key, sibling_key, window_key
+
+    def _index_event(self, event: Atspi.Event, counter: int) -> None:
+        """Records event as the newest queued event for each obsolescence rule it belongs to."""
+
+        if event.type.startswith(EventManager._SKIPPABLE_SAME_TYPE_PREFIXES):
+            self._latest_event[(event.type, hash(event.source))] = counter
+
+        duplicate_key, sibling_key, window_key = self._get_obsolescence_keys(event)
+        if duplicate_key is not None:
+            self._latest_duplicate[duplicate_key] = counter, event
+        if sibling_key is not None:
+            self._latest_sibling[sibling_key] = counter, event
+        if window_key is not None:
+            self._latest_window[window_key] = counter, event
+
+    def _clear_obsolescence_index(self) -> None:
+        """Clears the index of newest queued events. Callers must hold the _gidle_lock."""
+
+        self._latest_event = {}
+        self._latest_duplicate = {}
+        self._latest_sibling = {}
+        self._latest_window = {}
+
+    def _note_obsoleted(self, rule: str, event: Atspi.Event, tokens: list) -> None:
+        """Counts event as having been dropped by rule and logs why."""
+
+        self._obsoleted_counts[rule] += 1
+        count = self._obsoleted_counts[rule]
+        tokens = ["EVENT MANAGER:", event, *tokens, f"(rule: {rule}, total: {count})"]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+    def _is_obsoleted_by(self, event: Atspi.Event, counter: int = -1) -> Atspi.Event | None:
+        """Returns the event which renders this one no longer worthy of being processed."""
+
+        if counter < 0:
+            return None
+
+        if event.type.startswith(EventManager._SKIPPABLE_SAME_TYPE_PREFIXES):
+            latest = self._latest_event.get((event.type, hash(event.source)), -1)
+            if latest > counter:
                 tokens = [
-                    "EVENT MANAGER:",
-                    event,
-                    "obsoleted by",
-                    e,
-                    "more recent window (de)activation event",
+                    f"(#{counter}) obsoleted: a newer {event.type} for same source"
+                    f" is queued (#{latest})",
                 ]
-                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-                return e
+                self._note_obsoleted("same-type", event, tokens)
+                return event
+
+        duplicate_key, sibling_key, window_key = self._get_obsolescence_keys(event)
+        candidates: list[tuple[str, tuple[int, Atspi.Event] | None, str]] = []
+        if duplicate_key is not None:
+            entry = self._latest_duplicate.get(duplicate_key)
+            candidates.append(("duplicate", entry, "more recent duplicate"))
+        if sibling_key is not None:
+            entry = self._latest_sibling.get(sibling_key)
+            candidates.append(("sibling", entry, "more recent event of same type from sibling"))
+        if window_key is not None:
+            entry = self._latest_window.get(window_key)
+            candidates.append(("window", entry, "more recent window (de)activation event"))
+
+        for rule, entry, reason in candidates:
+            if entry is not None and entry[0] > counter:
+                self._note_obsoleted(rule, event, ["obsoleted by", entry[1], reason])
+                return entry[1]
 
         return None
 
@@ -388,14 +884,20 @@ class EventManager:
         """Returns True if the event is spam, or None if inconclusive."""
 
         event_type = event.type
-        last_app, last_time = self._event_history.get(event_type, (None, 0))
         app = AXUtilities.get_application(event.source)
-        ignore = last_app == hash(app) and time.time() - last_time < 0.1
-        self._event_history[event_type] = hash(app), time.time()
-        if ignore:
-            msg = f"EVENT_MANAGER: Ignoring {event_type} due to multiple instances in short time"
-            debug.print_message(debug.LEVEL_INFO, msg, True)
-            return True
+        if not event_type.startswith(self._RATE_LIMIT_EXEMPT_PREFIXES):
+            if self._rate_limits is None:
+                self._rate_limits = self.get_rate_limits()
+            rates = self._rate_limits
+            rate = rates.get(_EventRateLimiter.get_family(event_type), rates["default"])
+            key = event_type, hash(app), self._hashable(event.source)
+            now = time.time()
+            allowed = self._rate_limiter.allow(key, rate, now)
+            self._log_rate_limit_summary(now)
+            if not allowed:
+                msg = f"EVENT_MANAGER: Ignoring {event_type} due to rate limit ({rate}/s)"
+                debug.print_message(debug.LEVEL_INFO, msg, True)
+                return True
 
         if AXUtilities.is_mutter_x11_frames(app):
             msg = f"EVENT MANAGER: Ignoring {event_type} based on application"
@@ -404,6 +906,21 @@ class EventManager:
 
         return None
 
+    def _log_rate_limit_summary(self, now: float) -> None:
+        """Logs the events suppressed by the rate limiter if there were many."""
+
+        threshold = self.get_rate_limit_summary_threshold()
+        elapsed, counts = self._rate_limiter.take_summary(now, threshold)
+        if not counts:
+            return
+
+        details = ", ".join(f"{event_type}: {count}" for event_type, count in counts.items())
+        msg = (
+            f"EVENT MANAGER: Rate limiter suppressed {sum(counts.values())} event(s) in "
+            f"{elapsed:.1f} s. {details}"
+        )
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+
     def _ignore_children_changed(
         self,
         event: Atspi.Event,
@@ -656,11 +1173,16 @@ class EventManager:
     def _enqueue_object_event(self, e: Atspi.Event) -> None:
         """Callback for Atspi object events."""
 
+        received = time.monotonic()
+
         # If we are enqueuing events, we're not dead and should not be killed
         # and restarted by systemd.
         if self._event_queue.qsize() > 75 and systemd.get_manager().is_systemd_managed():
             systemd.get_manager().notify_alive("Event queue size > 75")
 
+        # The mirrors are patched from every event received, including those ignored below.
+        ax_tree_mirror.get_mirror().handle_event(e)
+        ax_text_mirror.get_mirror().handle_event(e)
         if self._ignore(e):
             return
 
@@ -680,9 +1202,14 @@ class EventManager:
         priority = self._get_priority(e)
         with self._gidle_lock:
             counter = next(self._counter)
-            self._event_queue.put((priority, counter, e))
-            if e.type.startswith(EventManager._SKIPPABLE_SAME_TYPE_PREFIXES):
-                self._latest_event[(e.type, hash(e.source))] = counter
+            latency_tracker.get_tracker().event_queued(counter, e.type, received)
+            shed = self._event_queue.put((priority, counter, e), app)
+            if shed is not None:
+                tokens = ["EVENT MANAGER: Queue for", app, "is full. Dropped", shed[2]]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                latency_tracker.get_tracker().event_discarded(shed[1])
+            if shed is None or shed[1] != counter:
+                self._index_event(e, counter)
             if not self._gidle_id:
                 self._gidle_id = GLib.idle_add(self._dequeue_object_event)
         tokens = ["EVENT MANAGER: Queued", e, f"priority: {priority.name}, counter: {counter}"]
@@ -699,34 +1226,66 @@ class EventManager:
 
         return False
 
+    def _should_yield(self, start_time: float, budget: float, keyboard_serial: int) -> str:
+        """Returns the reason the current dispatch batch should end, or an empty string."""
+
+        if time.monotonic() - start_time >= budget:
+            return "budget exhausted"
+        if input_event_manager.get_manager().get_keyboard_event_serial() != keyboard_serial:
+            return "keyboard event arrived"
+        return ""
+
     def _dequeue_object_event(self) -> bool:
         """Handles all object events destined for scripts."""
 
+        budget = self.get_dispatch_budget() / 1000
+        batch_start = time.monotonic()
+        keyboard_serial = input_event_manager.get_manager().get_keyboard_event_serial()
+        processed = 0
+        reason = ""
         rerun = True
         try:
-            priority, counter, event = self._event_queue.get_nowait()
-            self._queue_println(event, is_enqueue=False)
-            msg = f"priority: {priority.name}, counter: {counter}"
-            tokens = ["EVENT MANAGER: Dequeued", event, msg]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-            start_time = time.time()
-            msg = (
-                f"\nvvvvv START {priority.name}-PRIORITY OBJECT EVENT {event.type.upper()} "
-                f"(queue size: {self._event_queue.qsize()}) vvvvv"
-            )
-            debug.print_message(debug.LEVEL_INFO, msg, False)
-            self._process_object_event(event, counter)
-            msg = (
-                f"TOTAL PROCESSING TIME: {time.time() - start_time:.4f}"
-                f"\n^^^^^ FINISHED {priority.name}-PRIORITY OBJECT EVENT "
-                f"{event.type.upper()} ^^^^^\n"
-            )
-            debug.print_message(debug.LEVEL_INFO, msg, False)
-            with self._gidle_lock:
-                if self._event_queue.empty():
-                    GLib.timeout_add(2500, self._on_no_focus)
-                    self._gidle_id = 0
-                    rerun = False  # destroy and don't call again
+            while True:
+                active_script = script_manager.get_manager().get_active_script()
+                active_app = active_script.app if active_script is not None else None
+                priority, counter, event = self._event_queue.get_nowait(active_app)
+                self._queue_println(event, is_enqueue=False)
+                msg = f"priority: {priority.name}, counter: {counter}"
+                tokens = ["EVENT MANAGER: Dequeued", event, msg]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                start_time = time.time()
+                msg = (
+                    f"\nvvvvv START {priority.name}-PRIORITY OBJECT EVENT {event.type.upper()} "
+                    f"(queue size: {self._event_queue.qsize()}) vvvvv"
+                )
+                debug.print_message(debug.LEVEL_INFO, msg, False)
+                latency_tracker.get_tracker().begin_span(counter)
+                trace_args = {"counter": counter, "priority": priority.name}
+                try:
+                    with trace_recorder.get_recorder().slice(event.type, "event", trace_args):
+                        self._process_object_event(event, counter)
+                finally:
+                    latency_tracker.get_tracker().end_span()
+                processed += 1
+                msg = (
+                    f"TOTAL PROCESSING TIME: {time.time() - start_time:.4f}"
+                    f"\n^^^^^ FINISHED {priority.name}-PRIORITY OBJECT EVENT "
+                    f"{event.type.upper()} ^^^^^\n"
+                )
+                debug.print_message(debug.LEVEL_INFO, msg, False)
+                with self._gidle_lock:
+                    if self._event_queue.empty():
+                        self._clear_obsolescence_index()
+                        GLib.timeout_add(2500, self._on_no_focus)
+                        self._gidle_id = 0
+                        rerun = False  # destroy and don't call again
+                        reason = "queue empty"
+                        break
+                if budget <= 0:
+                    break
+                reason = self._should_yield(batch_start, budget, keyboard_serial)
+                if reason:
+                    break
         except queue.Empty:
             msg = "EVENT MANAGER: Attempted dequeue, but the event queue is empty"
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -739,8 +1298,38 @@ class EventManager:
                 self._gidle_id = GLib.idle_add(self._dequeue_object_event)
             raise
 
+        if processed and budget > 0:
+            msg = (
+                f"EVENT MANAGER: Dispatched {processed} event(s) in "
+                f"{(time.monotonic() - batch_start) * 1000:.1f} ms "
+                f"(budget: {budget * 1000:.0f} ms). Yielding: {reason}."
+            )
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+
         return rerun
 
+    def _subscribe(self, event_type: str) -> None:
+        """Asks the registry to start sending events of event_type."""
+
+        msg = f"EVENT MANAGER: Subscribing to: {event_type}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        self._listener.register(event_type)
+
+    def _unsubscribe(self, event_type: str) -> None:
+        """Asks the registry to stop sending events of event_type."""
+
+        msg = f"EVENT MANAGER: Unsubscribing from: {event_type}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        if event_type.startswith("object:children-changed"):
+            ax_tree_mirror.get_mirror().clear(f"No longer receiving {event_type}.")
+        elif event_type.startswith("object:text-changed"):
+            ax_text_mirror.get_mirror().clear(f"No longer receiving {event_type}.")
+        try:
+            self._listener.deregister(event_type)
+        except GLib.GError as error:
+            msg = f"EVENT MANAGER: Exception deregistering listener for {event_type}: {error}"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+
     def register_listener(self, event_type: str) -> None:
         """Tells this module to listen for the given event type.
 
@@ -753,9 +1342,11 @@ class EventManager:
 
         if event_type in self._script_listener_counts:
             self._script_listener_counts[event_type] += 1
-        else:
-            self._listener.register(event_type)
-            self._script_listener_counts[event_type] = 1
+            return
+
+        self._script_listener_counts[event_type] = 1
+        if event_type not in self._suspended_event_types:
+            self._subscribe(event_type)
 
     def deregister_listener(self, event_type: str) -> None:
         """Tells this module to stop listening for the given event type.
@@ -772,41 +1363,73 @@ class EventManager:
 
         self._script_listener_counts[event_type] -= 1
         if self._script_listener_counts[event_type] == 0:
-            try:
-                self._listener.deregister(event_type)
-            except GLib.GError as error:
-                msg = f"EVENT MANAGER: Exception deregistering listener for {event_type}: {error}"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
             del self._script_listener_counts[event_type]
+            if event_type not in self._suspended_event_types:
+                self._unsubscribe(event_type)
+
+    def suspend_listeners(self, event_types: Iterable[str]) -> None:
+        """Stops listening for event_types, without forgetting which scripts need them."""
+
+        for event_type in event_types:
+            if event_type in self._suspended_event_types:
+                continue
+            self._suspended_event_types.add(event_type)
+            if event_type in self._script_listener_counts:
+                self._unsubscribe(event_type)
+
+    def resume_listeners(self, event_types: Iterable[str]) -> None:
+        """Resumes listening for the event_types previously suspended, if still needed."""
+
+        for event_type in event_types:
+            if event_type not in self._suspended_event_types:
+                continue
+            self._suspended_event_types.discard(event_type)
+            if event_type in self._script_listener_counts:
+                self._subscribe(event_type)
 
     def register_script_listeners(self, script: default.Script) -> None:
         """Tells the event manager to start listening for all the event types
-        of interest to the script.
+        handled by the script. Registering a script more than once has no effect.
 
         Arguments:
         - script: the script.
         """
 
-        tokens = ["EVENT MANAGER: Registering listeners for:", script]
+        if script in self._script_event_types:
+            return
+
+        event_types = script.get_handled_event_types()
+        tokens = ["EVENT MANAGER: Registering", len(event_types), "listeners for:", script]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        for event_type in script.listeners:
+        self._script_event_types[script] = event_types
+        for event_type in event_types:
             self.register_listener(event_type)
 
     def deregister_script_listeners(self, script: default.Script) -> None:
         """Tells the event manager to stop listening for all the event types
-        of interest to the script.
+        handled by the script, unless another registered script also handles them.
 
         Arguments:
         - script: the script.
         """
 
+        event_types = self._script_event_types.pop(script, None)
+        if event_types is None:
+            return
+
         tokens = ["EVENT MANAGER: De-registering listeners for:", script]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        for event_type in script.listeners:
+        for event_type in event_types:
             self.deregister_listener(event_type)
 
+    @dbus_service.getter
+    def get_subscribed_event_types(self) -> list[str]:
+        """Returns the event types the registry is currently asked to send."""
+
+        return sorted(set(self._script_listener_counts) - self._suspended_event_types)
+
     def _get_script_for_event(
         self,
         event: Atspi.Event,
@@ -1040,7 +1663,12 @@ class EventManager:
             debug.print_message(debug.LEVEL_INFO, msg, True)
             return
 
-        listener(event)
+        name = getattr(listener, "__qualname__", event.type)
+        with (
+            latency_tracker.get_tracker().measure("listener"),
+            trace_recorder.get_recorder().slice(name, "script"),
+        ):
+            listener(event)
 
 
 _manager: EventManager = EventManager()
@@ -36,7 +36,16 @@ import gi
 gi.require_version("Atspi", "2.0")
 from gi.repository import Atspi
 
-from . import ax_cache_manager, braille, debug, focus_manager, messages, object_properties
+from . import (
+    ax_cache_manager,
+    braille,
+    debug,
+    focus_manager,
+    latency_tracker,
+    messages,
+    object_properties,
+    trace_recorder,
+)
 from .ax_object import AXObject
 from .ax_text import AXText
 from .ax_utilities import AXUtilities
@@ -124,6 +133,7 @@ class _GeneratorCache:
     IS_DESCRIPTION_USED_FOR_NAME = "Generator.is-description-used-for-name"
     IS_DESCRIPTION_USED_FOR_STATIC_TEXT = "Generator.is-description-used-for-static-text"
     _CACHE_CLEAR_INTERVAL_SECONDS = 2
+    _CACHE_MAX_ENTRIES = 2000
 
     def __init__(self) -> None:
         manager = ax_cache_manager.get_manager()
@@ -148,6 +158,7 @@ class _GeneratorCache:
                 lifetime=ax_cache_manager.Lifetime.PROCESS,
                 clear_on_demand=ax_cache_manager.ClearPolicy.PRESERVE,
                 clear_interval_seconds=self._CACHE_CLEAR_INTERVAL_SECONDS,
+                max_entries=self._CACHE_MAX_ENTRIES,
             )
         self._caches = {
             namespace: manager.get_cache(self, namespace)
@@ -513,7 +524,12 @@ class Generator:
             role_subject=obj,
             include_context=include_context,
         )
-        result = _generator(obj)  # type: ignore[misc]
+        name = f"{self._mode.name} {getattr(_generator, '__name__', 'generate')}"
+        with (
+            latency_tracker.get_tracker().measure("generator"),
+            trace_recorder.get_recorder().slice(name, "generator"),
+        ):
+            result = _generator(obj)  # type: ignore[misc]
         self._context = original_context
 
         tokens = [f"{self._mode.name} GENERATOR: Results:", result]
@@ -146,11 +146,14 @@ class GSettingsRegistry:
         self._ignore_runtime: bool = False
         self._cache = _GSettingsRegistryCache()
         self._profile_change_observers: list[Callable[[str], None]] = []
+        self._value_change_observers: list[Callable[[], None]] = []
 
     def clear_value_cache(self) -> None:
         """Clears the cached GSettings lookup values."""
 
         self._cache.clear()
+        for observer in self._value_change_observers:
+            observer()
 
     def set_ignore_runtime(self, ignore: bool) -> None:
         """Sets whether layered_lookup should skip runtime overrides."""
@@ -464,6 +467,11 @@ class GSettingsRegistry:
 
         self._profile_change_observers.append(observer)
 
+    def add_value_change_observer(self, observer: Callable[[], None]) -> None:
+        """Registers a callback invoked whenever looked-up setting values may have changed."""
+
+        self._value_change_observers.append(observer)
+
     def set_active_profile(self, profile: str) -> None:
         """Sets the active profile for GSettings lookups."""
 
@@ -53,6 +53,7 @@ class InputEventManager:
         self._paused: bool = False
         self._previous_non_modifier_key_event: input_event.KeyboardEvent | None = None
         self._previous_braille_event: input_event.BrailleEvent | None = None
+        self._keyboard_event_serial: int = 0
 
     def start_key_watcher(self) -> None:
         """Starts the watcher for keyboard input events."""
@@ -137,6 +138,7 @@ class InputEventManager:
     ) -> bool:
         """Processes this Atspi keyboard event."""
 
+        self._keyboard_event_serial += 1
         if self._paused:
             msg = "INPUT EVENT MANAGER: Keyboard event processing is paused."
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -249,6 +251,11 @@ class InputEventManager:
 
         return self._last_input_event.get_click_count() + 1
 
+    def get_keyboard_event_serial(self) -> int:
+        """Returns a number which increases each time a keyboard event arrives."""
+
+        return self._keyboard_event_serial
+
     def last_event_was_keyboard(self, within: float | None = None) -> bool:
         """Returns True if the last event was a keyboard event, optionally within recent seconds."""
 
@@ -53,6 +53,7 @@ class _LabelInferenceCache:
     LINE_CONTENTS = "LabelInference.line-contents"
     TEXT_EXTENTS = "LabelInference.text-extents"
     IS_WIDGET = "LabelInference.is-widget"
+    _MAX_ENTRIES = 1000
 
     def __init__(self) -> None:
         self._manager = ax_cache_manager.get_manager()
@@ -67,6 +68,7 @@ class _LabelInferenceCache:
                 lifetime=ax_cache_manager.Lifetime.OWNER,
                 clear_on_demand=ax_cache_manager.ClearPolicy.PRESERVE,
                 clear_interval_seconds=None,
+                max_entries=self._MAX_ENTRIES,
             )
         self._line_contents_cache = self._manager.get_cache(self, self.LINE_CONTENTS)
         self._text_extents_cache = self._manager.get_cache(self, self.TEXT_EXTENTS)
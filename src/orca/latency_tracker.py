@@ -0,0 +1,210 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Measures how long accessible events take from receipt to speech and braille output."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from . import dbus_service, debug
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from . import input_event
+    from .scripts import default
+
+
+@dataclass
+class _Span:
+    """The timings of one accessible event, identified by its event manager counter."""
+
+    event_id: int
+    event_type: str
+    received: float
+    dequeued: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+
+
+class LatencyTracker:
+    """Measures how long accessible events take from receipt to speech and braille output."""
+
+    # The stages reported, in the order an event passes through them. "queue" is the wait
+    # between receipt and dispatch; "listener" and "generator" are time spent in the script
+    # and generators; "speech", "braille", and "total" are measured from receipt.
+    STAGES = ("queue", "listener", "generator", "speech", "braille", "total")
+    PERCENTILES = (50, 95, 99)
+    MAX_SAMPLES = 1000
+
+    def __init__(self) -> None:
+        self._received: dict[int, tuple[str, float]] = {}
+        self._span: _Span | None = None
+        self._depths: dict[str, int] = {}
+        self._samples: dict[str, dict[str, collections.deque[float]]] = {}
+        dbus_service.get_remote_controller().register_decorated_module("LatencyTracker", self)
+
+    def event_queued(self, event_id: int, event_type: str, received: float) -> None:
+        """Records that the event with event_id, received at time received, was queued."""
+
+        self._received[event_id] = event_type, received
+
+    def event_discarded(self, event_id: int) -> None:
+        """Forgets the queued event with event_id, which will not be dispatched."""
+
+        self._received.pop(event_id, None)
+
+    def clear_queued(self) -> None:
+        """Forgets all queued events, e.g. because the event queue was cleared."""
+
+        self._received = {}
+
+    def begin_span(self, event_id: int) -> None:
+        """Starts timing the dispatch of the queued event with event_id."""
+
+        event_type, received = self._received.pop(event_id, ("", 0.0))
+        if not event_type:
+            self._span = None
+            return
+
+        now = time.monotonic()
+        self._span = _Span(event_id, event_type, received, now)
+        self._span.stages["queue"] = now - received
+
+    def end_span(self) -> None:
+        """Finishes timing the current event and adds its stages to the statistics."""
+
+        span, self._span = self._span, None
+        self._depths = {}
+        if span is None:
+            return
+
+        span.stages["total"] = time.monotonic() - span.received
+        samples = self._samples.setdefault(span.event_type, {})
+        for stage, value in span.stages.items():
+            if stage not in samples:
+                samples[stage] = collections.deque(maxlen=self.MAX_SAMPLES)
+            samples[stage].append(value)
+
+        if debug.debugLevel <= debug.LEVEL_INFO:
+            timings = ", ".join(
+                f"{stage}: {span.stages[stage] * 1000:.1f} ms"
+                for stage in self.STAGES
+                if stage in span.stages
+            )
+            msg = f"LATENCY TRACKER: #{span.event_id} {span.event_type}. {timings}"
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+
+    @contextlib.contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Adds the time spent in the with-block to stage of the current event, if any."""
+
+        if self._span is None:
+            yield
+            return
+
+        # Generators call generate() recursively; only the outermost call is timed.
+        depth = self._depths.get(stage, 0)
+        if depth:
+            self._depths[stage] = depth + 1
+            try:
+                yield
+            finally:
+                self._depths[stage] = depth
+            return
+
+        self._depths[stage] = 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._depths[stage] = 0
+            if self._span is not None:
+                elapsed = time.monotonic() - start
+                self._span.stages[stage] = self._span.stages.get(stage, 0.0) + elapsed
+
+    def note_output(self, stage: str) -> None:
+        """Records the first speech or braille output caused by the current event."""
+
+        if self._span is None or stage in self._span.stages:
+            return
+
+        self._span.stages[stage] = time.monotonic() - self._span.received
+
+    @staticmethod
+    def _percentile(ordered: list[float], percentile: int) -> float:
+        """Returns the nearest-rank percentile of the sorted, non-empty list ordered."""
+
+        index = round(percentile / 100 * (len(ordered) - 1))
+        return ordered[min(index, len(ordered) - 1)]
+
+    @dbus_service.getter
+    def get_statistics(self) -> dict[str, dict[str, float]]:
+        """Returns the p50, p95, and p99 latencies in ms of each stage, by event type."""
+
+        result: dict[str, dict[str, float]] = {}
+        for event_type, stages in self._samples.items():
+            entry: dict[str, float] = {}
+            for stage in self.STAGES:
+                values = stages.get(stage)
+                if not values:
+                    continue
+                ordered = sorted(values)
+                entry[f"{stage}-count"] = float(len(ordered))
+                for percentile in self.PERCENTILES:
+                    value = self._percentile(ordered, percentile) * 1000
+                    entry[f"{stage}-p{percentile}"] = round(value, 3)
+            result[event_type] = entry
+        return result
+
+    @dbus_service.command
+    def reset_statistics(
+        self,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = True,
+    ) -> bool:
+        """Discards all the latency measurements collected so far."""
+
+        tokens = [
+            "LATENCY TRACKER: reset_statistics. Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        self._samples = {}
+        return True
+
+
+_tracker: LatencyTracker = LatencyTracker()
+
+
+def get_tracker() -> LatencyTracker:
+    """Returns the Latency Tracker singleton."""
+
+    return _tracker
@@ -552,6 +552,29 @@ DEBUG_CLEAR_CACHE_FAILED = _("Clearing cache failed.")
 # bug. This message is presented when the user performs the command.
 DEBUG_CLEAR_CACHE = _("Clearing cache.")
 
+# Translators: Orca has a command for advanced users and developers to save the
+# most recent debug messages, which Orca keeps in memory even when debugging is
+# turned off, to a file. This message is presented when the file was written.
+# The string substituted is the path of the file.
+DEBUG_FLIGHT_RECORDER_DUMPED = _("Recent debug messages saved to %s.")
+
+# Translators: Orca has a command for advanced users and developers to save the
+# most recent debug messages, which Orca keeps in memory even when debugging is
+# turned off, to a file. This is the brief message presented when the file was
+# written.
+DEBUG_FLIGHT_RECORDER_DUMPED_BRIEF = C_("debug messages", "Saved.")
+
+# Translators: Orca has a command for advanced users and developers to save the
+# most recent debug messages, which Orca keeps in memory even when debugging is
+# turned off, to a file. This message is presented when the file could not be
+# written.
+DEBUG_FLIGHT_RECORDER_DUMP_FAILED = _("Saving debug messages failed.")
+
+# Translators: Orca has a command for advanced users and developers to write
+# how often each of its caches of information about accessible objects was used
+# to the debug output. This message is presented when that has been done.
+DEBUG_CACHE_STATISTICS_PRINTED = _("Cache statistics printed.")
+
 # Translators: The "default" button in a dialog box is the button that gets
 # activated when Enter is pressed anywhere within that dialog box. The string
 # substitution is the name of the button (e.g. "OK" or "Close").
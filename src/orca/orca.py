@@ -54,6 +54,9 @@ from . import (
     presentation_manager,
     script_manager,
     systemd,
+    text_mirror_manager,
+    trace_recorder,
+    tree_mirror_manager,
 )
 from .ax_utilities import AXUtilities
 
@@ -83,6 +86,9 @@ def load_user_settings(script=None, skip_reload_message=False, is_reload=True):
     if presenter.get_is_enabled():
         presenter.activate()
 
+    tree_mirror_manager.get_manager().apply_settings()
+    text_mirror_manager.get_manager().apply_settings()
+
     # Handle the case where a change was made in the Orca Preferences dialog.
     orca_modifier_manager.get_manager().refresh_orca_modifiers("Loading user settings.")
     event_manager.get_manager().pause_queuing(False, False, "User settings loaded.")
@@ -145,6 +151,7 @@ def shutdown(_event=None, _signum=None):
     debug.print_message(debug.LEVEL_INFO, "ORCA: Quitting Atspi main event loop", True)
     Atspi.event_quit()  # pylint: disable=no-value-for-parameter
     debug.print_message(debug.LEVEL_INFO, "ORCA: Shutdown complete", True)
+    trace_recorder.get_recorder().shutdown()
     debug.shutdown()
     return True
 
@@ -245,6 +252,7 @@ def main():
     """The main entry point for Orca."""
 
     _setup_signal_handlers()
+    sys.excepthook = debugging_tools_manager.get_manager().on_unhandled_exception
     systemd.get_manager().start_watchdog()
 
     error = _ensure_accessibility_enabled()
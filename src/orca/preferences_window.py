@@ -812,9 +812,7 @@ class OrcaSetupGUI(Gtk.ApplicationWindow):  # pylint: disable=too-many-instance-
         msg = f"PREFERENCES: Re-registering events. {reason}"
         debug.print_message(debug.LEVEL_ALL, msg, True)
 
-        manager = event_manager.get_manager()
-        for event in self._EVENTS_TO_SUSPEND:
-            manager.register_listener(event)
+        event_manager.get_manager().resume_listeners(self._EVENTS_TO_SUSPEND)
         return False
 
     def suspend_events(self, reason: str = "") -> None:
@@ -823,9 +821,7 @@ class OrcaSetupGUI(Gtk.ApplicationWindow):  # pylint: disable=too-many-instance-
         msg = f"PREFERENCES: Suspending events. {reason}"
         debug.print_message(debug.LEVEL_ALL, msg, True)
 
-        manager = event_manager.get_manager()
-        for event in self._EVENTS_TO_SUSPEND:
-            manager.deregister_listener(event)
+        event_manager.get_manager().suspend_listeners(self._EVENTS_TO_SUSPEND)
 
     def _get_current_profile_label(self) -> str:
         """Get the display label for the current profile, including pending renames."""
@@ -30,10 +30,17 @@
 from __future__ import annotations
 
 import unicodedata
+from collections import deque
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+
+import gi
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi, GLib
 
 from . import (
+    ax_cache_manager,
     ax_event_synthesizer,
     dbus_service,
     debug,
@@ -52,17 +59,13 @@ from . import (
 )
 from .acss import ACSS
 from .ax_object import AXObject
+from .ax_text import AXText
 from .ax_utilities import AXUtilities
 from .ax_utilities_text import CaretSetReason
 from .extension import Extension
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-
-    import gi
-
-    gi.require_version("Atspi", "2.0")
-    from gi.repository import Atspi
+    from collections.abc import Generator, Hashable, Iterable, Iterator
 
     from .command import Command
     from .say_all_presenter_preferences_grid import SayAllPreferencesGrid
@@ -86,6 +89,26 @@ class SayAllStyle(Enum):
         return self.name.lower()
 
 
+class _SayAllUnit(NamedTuple):
+    """A line or sentence read by Say All, starting at obj and offset."""
+
+    obj: Atspi.Accessible
+    offset: int
+    contents: list[tuple[Atspi.Accessible, int, int, str]]
+    filtered: list[tuple[Atspi.Accessible, int, int, str]]
+
+
+class _SayAllChunk(NamedTuple):
+    """An utterance produced by Say All, possibly ahead of being spoken."""
+
+    context: speechserver.SayAllContext
+    voice: ACSS
+    # The unit this is the first utterance of, or None if it is not the first.
+    unit: _SayAllUnit | None
+    # The character count of context.obj when the utterance was produced.
+    character_count: int
+
+
 @gsettings_registry.get_registry().gsettings_schema("org.gnome.Orca.SayAll", name="say-all")
 class SayAllPresenter(Extension):
     """Module for commands related to the current accessible object."""
@@ -119,13 +142,27 @@ class SayAllPresenter(Extension):
 
     GROUP_LABEL = guilabels.GENERAL_SAY_ALL
 
+    # The number of utterances produced during idle time ahead of the one being spoken.
+    LOOKAHEAD_SIZE = 4
+
+    # The number of spoken lines or sentences kept for rewind and fast forward. Those which
+    # are older are found again in the document when needed.
+    HISTORY_SIZE = 200
+
     def __init__(self) -> None:
         self._script: default.Script | None = None
-        self._contents: list[tuple[Atspi.Accessible, int, int, str]] = []
-        self._contexts: list[speechserver.SayAllContext] = []
+        self._history: deque[_SayAllUnit] = deque()
+        self._history_start: int = 0
+        self._history_index: dict[Hashable, int] = {}
+        self._contexts: deque[speechserver.SayAllContext] = deque(maxlen=self.HISTORY_SIZE)
         self._current_context: speechserver.SayAllContext | None = None
         self._prior_obj: Atspi.Accessible | None = None
         self._say_all_is_running: bool = False
+        self._session: object | None = None
+        self._producer: Iterator[_SayAllChunk] | None = None
+        self._lookahead: deque[_SayAllChunk] = deque()
+        self._lookahead_id: int = 0
+        self._spoken_unit: _SayAllUnit | None = None
         super().__init__()
 
     def _get_commands(self) -> list[Command]:
@@ -167,12 +204,6 @@ class SayAllPresenter(Extension):
     ) -> bool:
         """Speaks the entire document or text, starting from the current position."""
 
-        self._contexts = []
-        self._contents = []
-        self._current_context = None
-        self._prior_obj = None
-        self._say_all_is_running = False
-
         tokens = [
             "SAY ALL PRESENTER: say_all. Script:",
             script,
@@ -183,6 +214,23 @@ class SayAllPresenter(Extension):
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
+        self._clear_history()
+        return self._start_say_all(script, obj, offset)
+
+    def _start_say_all(
+        self,
+        script: default.Script,
+        obj: Atspi.Accessible | None = None,
+        offset: int | None = None,
+    ) -> bool:
+        """Starts speaking at obj and offset, keeping the history of what was spoken."""
+
+        self._cancel_lookahead()
+        self._contexts.clear()
+        self._current_context = None
+        self._prior_obj = None
+        self._say_all_is_running = False
+
         self._script = script
         presentation_manager.get_manager().interrupt_presentation()
         obj = obj or focus_manager.get_manager().get_locus_of_focus()
@@ -240,8 +288,9 @@ class SayAllPresenter(Extension):
     def stop(self) -> None:
         """Stops the current Say All."""
 
-        self._contexts = []
-        self._contents = []
+        self._cancel_lookahead()
+        self._contexts.clear()
+        self._clear_history()
         self._current_context = None
         self._prior_obj = None
         self._say_all_is_running = False
@@ -326,11 +375,6 @@ class SayAllPresenter(Extension):
         ):
             return None, 0
 
-        if next_obj is not None:
-            tokens = ["SAY ALL PRESENTER: Updating focus to", next_obj]
-            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-            focus_manager.get_manager().set_locus_of_focus(None, next_obj, notify_script=False)
-
         return next_obj, next_offset
 
     def _build_displayed_text_context(
@@ -361,21 +405,12 @@ class SayAllPresenter(Extension):
 
         combined = " ".join(parts)
         context = speechserver.SayAllContext(first_obj, combined, first_start, last_end)
-        self._contexts.append(context)
         tokens = [
-            "SAY ALL PRESENTER: Speaking (displayed-text):",
+            "SAY ALL PRESENTER: Produced (displayed-text):",
             first_obj,
             f"'{combined}' ({first_start}-{last_end})",
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-        self._script.utilities.set_caret_offset(
-            first_obj, first_start, reason=CaretSetReason.SAY_ALL_COMMAND
-        )
-        ax_event_synthesizer.get_synthesizer().scroll_into_view(
-            context.obj,
-            context.start_offset,
-            context.end_offset,
-        )
         return context, ACSS()
 
     def _generate_speech_contexts(
@@ -425,21 +460,12 @@ class SayAllPresenter(Extension):
                     continue
 
                 context = speechserver.SayAllContext(content_obj, element, start, end)
-                self._contexts.append(context)
                 tokens = [
-                    "SAY ALL PRESENTER: Speaking (contents):",
+                    "SAY ALL PRESENTER: Produced (contents):",
                     content_obj,
                     f"'{element}' ({start}-{end})",
                 ]
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
-                self._script.utilities.set_caret_offset(
-                    content_obj, start, reason=CaretSetReason.SAY_ALL_COMMAND
-                )
-                ax_event_synthesizer.get_synthesizer().scroll_into_view(
-                    context.obj,
-                    context.start_offset,
-                    context.end_offset,
-                )
                 yield [context, voice]
 
     def _say_all_iter(
@@ -451,9 +477,8 @@ class SayAllPresenter(Extension):
 
         assert self._script is not None, "Script must be set before calling _say_all_iter."
 
+        self._cancel_lookahead()
         self._prior_obj = obj
-        say_all_by_sentence = self.get_style() == "sentence"
-
         if offset is None:
             offset = self._script.utilities.get_caret_context()[-1] or 0
 
@@ -461,6 +486,32 @@ class SayAllPresenter(Extension):
         if restrict_to is None and (AXUtilities.is_text(obj) or AXUtilities.is_terminal(obj)):
             restrict_to = obj
 
+        # The next utterance is produced while the current one is spoken, so that there is
+        # no gap between them. A newer Say All, or a cancelled one, ends this session.
+        session = self._session = object()
+        self._producer = self._produce_chunks(obj, offset, restrict_to)
+        while self._session is session:
+            chunk = self._next_chunk(restrict_to)
+            if chunk is None:
+                break
+            self._present_chunk(chunk)
+            self._schedule_lookahead()
+            yield [chunk.context, chunk.voice]
+
+        if self._session is session:
+            self.stop()
+
+    def _produce_chunks(
+        self,
+        obj: Atspi.Accessible | None,
+        offset: int,
+        restrict_to: Atspi.Accessible | None,
+    ) -> Generator[_SayAllChunk, None, None]:
+        """Yields the utterances of each line or sentence, starting at obj and offset."""
+
+        assert self._script is not None, "Script must be set before calling _produce_chunks."
+
+        say_all_by_sentence = self.get_style() == "sentence"
         prev_obj, prev_offset = None, None
         while obj:
             if obj == prev_obj and offset == prev_offset:
@@ -492,17 +543,211 @@ class SayAllPresenter(Extension):
                 contents = [c for c in contents if AXUtilities.is_ancestor(c[0], restrict_to, True)]
 
             filtered = self._script.utilities.filter_contents_for_presentation(contents)
-            self._contents.extend(filtered)
-
+            unit: _SayAllUnit | None = _SayAllUnit(obj, offset, contents, filtered)
+            pairs: Iterable[list[speechserver.SayAllContext | ACSS]] = []
             if self.get_only_speak_displayed_text():
                 if (result := self._build_displayed_text_context(filtered)) is not None:
-                    yield list(result)
+                    pairs = [list(result)]
             else:
-                yield from self._generate_speech_contexts(filtered)
+                pairs = self._generate_speech_contexts(filtered)
+
+            for context, voice in pairs:
+                assert isinstance(context, speechserver.SayAllContext)
+                assert isinstance(voice, ACSS)
+                count = AXText.get_character_count(context.obj)
+                yield _SayAllChunk(context, voice, unit, count)
+                unit = None
 
             obj, offset = self._advance_to_next(obj, offset, contents, restrict_to)
 
-        self.stop()
+    def _produce_chunk(self) -> _SayAllChunk | None:
+        """Returns the next utterance from the producer, or None if there are no more."""
+
+        if self._producer is None:
+            return None
+
+        try:
+            return next(self._producer)
+        except StopIteration:
+            self._producer = None
+            return None
+
+    def _next_chunk(self, restrict_to: Atspi.Accessible | None) -> _SayAllChunk | None:
+        """Returns the next utterance to speak, producing it again if the content changed."""
+
+        while self._lookahead:
+            chunk = self._lookahead.popleft()
+            if self._chunk_is_current(chunk):
+                return chunk
+
+            tokens = [
+                f"SAY ALL PRESENTER: Discarding {len(self._lookahead) + 1} stale utterance(s)",
+                "starting with",
+                chunk.context.obj,
+            ]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            self._restart_producer(restrict_to)
+
+        return self._produce_chunk()
+
+    @staticmethod
+    def _chunk_is_current(chunk: _SayAllChunk) -> bool:
+        """Returns True if the content of chunk is unchanged since it was produced."""
+
+        obj = chunk.context.obj
+        return AXObject.is_valid(obj) and AXText.get_character_count(obj) == chunk.character_count
+
+    def _restart_producer(self, restrict_to: Atspi.Accessible | None) -> None:
+        """Discards the produced utterances and produces those after the spoken unit again."""
+
+        self._lookahead.clear()
+        self._producer = None
+        unit = self._spoken_unit
+        if unit is None:
+            return
+
+        obj, offset = self._advance_to_next(unit.obj, unit.offset, unit.contents, restrict_to)
+        if obj is not None:
+            self._prior_obj = self._contexts[-1].obj if self._contexts else unit.obj
+            self._producer = self._produce_chunks(obj, offset, restrict_to)
+
+    def _present_chunk(self, chunk: _SayAllChunk) -> None:
+        """Updates the focus, caret, and scroll position for the utterance about to be spoken."""
+
+        assert self._script is not None, "Script must be set before calling _present_chunk."
+
+        context = chunk.context
+        if chunk.unit is not None:
+            if self._spoken_unit is not None:
+                tokens = ["SAY ALL PRESENTER: Updating focus to", chunk.unit.obj]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+                focus_manager.get_manager().set_locus_of_focus(
+                    None, chunk.unit.obj, notify_script=False
+                )
+            self._spoken_unit = chunk.unit
+            self._add_to_history(chunk.unit)
+
+        self._contexts.append(context)
+        tokens = [
+            "SAY ALL PRESENTER: Speaking:",
+            context.obj,
+            f"'{context.utterance}' ({context.start_offset}-{context.end_offset})",
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        self._script.utilities.set_caret_offset(
+            context.obj, context.start_offset, reason=CaretSetReason.SAY_ALL_COMMAND
+        )
+        ax_event_synthesizer.get_synthesizer().scroll_into_view(
+            context.obj,
+            context.start_offset,
+            context.end_offset,
+        )
+
+    def _schedule_lookahead(self) -> None:
+        """Schedules the idle-time production of the utterances after the current one."""
+
+        if self._lookahead_id or self._producer is None:
+            return
+        if len(self._lookahead) < self.LOOKAHEAD_SIZE:
+            self._lookahead_id = GLib.idle_add(self._fill_lookahead)
+
+    def _fill_lookahead(self) -> bool:
+        """Produces one utterance ahead, returning True if more are to be produced."""
+
+        chunk = self._produce_chunk()
+        if chunk is not None:
+            self._lookahead.append(chunk)
+        if chunk is None or len(self._lookahead) >= self.LOOKAHEAD_SIZE:
+            self._lookahead_id = 0
+            return False
+        return True
+
+    def _cancel_lookahead(self) -> None:
+        """Ends the current session, discarding the utterances produced ahead."""
+
+        if self._lookahead_id:
+            GLib.source_remove(self._lookahead_id)
+            self._lookahead_id = 0
+        self._session = None
+        self._producer = None
+        self._lookahead.clear()
+        self._spoken_unit = None
+
+    @staticmethod
+    def _get_history_key(obj: Atspi.Accessible, offset: int) -> Hashable:
+        """Returns the key under which the content starting at obj and offset is indexed."""
+
+        return ax_cache_manager.get_object_key(obj), offset
+
+    def _add_to_history(self, unit: _SayAllUnit) -> None:
+        """Adds the spoken unit to the history, dropping the oldest unit if it is full."""
+
+        if len(self._history) >= self.HISTORY_SIZE:
+            dropped = self._history.popleft()
+            for obj, start, _end, _string in dropped.filtered:
+                key = self._get_history_key(obj, start)
+                if self._history_index.get(key) == self._history_start:
+                    del self._history_index[key]
+            self._history_start += 1
+
+        position = self._history_start + len(self._history)
+        self._history.append(unit)
+        for obj, start, _end, _string in unit.filtered:
+            self._history_index[self._get_history_key(obj, start)] = position
+
+    def _clear_history(self) -> None:
+        """Discards the history of spoken units."""
+
+        self._history.clear()
+        self._history_index.clear()
+        self._history_start = 0
+
+    def _truncate_history(self, position: int | None) -> None:
+        """Discards the units from position onward, or all units if position is None."""
+
+        if position is None:
+            self._clear_history()
+            return
+
+        # Say All restarts at position, so these units are added again as they are spoken.
+        while self._history and self._history_start + len(self._history) > position:
+            dropped = self._history.pop()
+            dropped_position = self._history_start + len(self._history)
+            for obj, start, _end, _string in dropped.filtered:
+                key = self._get_history_key(obj, start)
+                if self._history_index.get(key) == dropped_position:
+                    del self._history_index[key]
+
+    def _get_history_position(self, context: speechserver.SayAllContext | None) -> int | None:
+        """Returns the position of the unit in which context was spoken, if known."""
+
+        if context is None:
+            return None
+
+        return self._history_index.get(self._get_history_key(context.obj, context.start_offset))
+
+    def _get_history_unit(
+        self, context: speechserver.SayAllContext | None, delta: int = 0
+    ) -> _SayAllUnit | None:
+        """Returns the unit delta units from the one in which context was spoken, if known."""
+
+        position = self._get_history_position(context)
+        if position is None:
+            return None
+
+        index = position - self._history_start + delta
+        if not 0 <= index < len(self._history):
+            return None
+        return self._history[index]
+
+    def _restart_at(self, obj: Atspi.Accessible, offset: int, position: int) -> None:
+        """Starts Say All again at obj and offset, the unit at position in the history."""
+
+        assert self._script is not None, "Script must be set before calling _restart_at."
+        focus_manager.get_manager().set_locus_of_focus(None, obj, notify_script=False)
+        self._script.utilities.set_caret_context(obj, offset)
+        self._truncate_history(position)
+        self._start_say_all(self._script, obj=obj, offset=offset)
 
     def _rewind(
         self,
@@ -515,12 +760,20 @@ class SayAllPresenter(Extension):
         if context is None:
             context = self._current_context
 
+        position = self._get_history_position(context)
+        unit = self._get_history_unit(context, -1)
+        if position is not None and unit is not None and AXObject.is_valid(unit.obj):
+            tokens = ["SAY ALL PRESENTER: Rewinding to", unit.obj, f"offset {unit.offset}."]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            self._restart_at(unit.obj, unit.offset, position - 1)
+            return True
+
+        # The previous unit is older than the history, so it is found again in the document.
         obj = None
-        try:
-            obj, start, _end, _string = self._contents[0]
-        except IndexError:
-            if context is not None:
-                obj, start = context.obj, context.start_offset
+        if (unit := self._get_history_unit(context)) is not None:
+            obj, start, _end, _string = unit.filtered[0]
+        elif context is not None:
+            obj, start = context.obj, context.start_offset
 
         if obj is None:
             return False
@@ -529,8 +782,10 @@ class SayAllPresenter(Extension):
         assert self._script is not None, "Script must be set before calling _rewind."
         self._script.utilities.set_caret_context(obj, start)
 
+        # The history only keeps the units which precede where Say All resumes.
         prev_obj, prev_offset = self._script.utilities.previous_context(obj, start, True)
-        self.say_all(self._script, obj=prev_obj, offset=prev_offset)
+        self._truncate_history(position)
+        self._start_say_all(self._script, obj=prev_obj, offset=prev_offset)
         return True
 
     def _fast_forward(
@@ -544,12 +799,19 @@ class SayAllPresenter(Extension):
         if context is None:
             context = self._current_context
 
+        position = self._get_history_position(context)
+        unit = self._get_history_unit(context, 1)
+        if position is not None and unit is not None and AXObject.is_valid(unit.obj):
+            tokens = ["SAY ALL PRESENTER: Fast forwarding to", unit.obj, f"offset {unit.offset}."]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            self._restart_at(unit.obj, unit.offset, position + 1)
+            return True
+
         obj = None
-        try:
-            obj, _start, end, _string = self._contents[-1]
-        except IndexError:
-            if context is not None:
-                obj, end = context.obj, context.end_offset
+        if (unit := self._get_history_unit(context)) is not None:
+            obj, _start, end, _string = unit.filtered[-1]
+        elif context is not None:
+            obj, end = context.obj, context.end_offset
 
         if obj is None:
             return False
@@ -559,7 +821,8 @@ class SayAllPresenter(Extension):
         self._script.utilities.set_caret_context(obj, end)
 
         next_obj, next_offset = self._script.utilities.next_context(obj, end, True)
-        self.say_all(self._script, obj=next_obj, offset=next_offset)
+        self._truncate_history(None if position is None else position + 1)
+        self._start_say_all(self._script, obj=next_obj, offset=next_offset)
         return True
 
     def _progress_callback(  # pylint: disable=too-many-return-statements
@@ -584,6 +847,7 @@ class SayAllPresenter(Extension):
         if progress_type == speechserver.SayAllContext.INTERRUPTED:
             tokens = ["SAY ALL PROGRESS CALLBACK: Interrupted", context]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            self._cancel_lookahead()
             manager = input_event_manager.get_manager()
             if manager.last_event_was_keyboard():
                 if manager.last_event_was_caret_navigation():
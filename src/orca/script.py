@@ -172,6 +172,16 @@ class Script:
             "window:destroy": self._on_window_destroyed,
         }
 
+    def get_handled_event_types(self) -> list[str]:
+        """Returns the event types for which this script overrides the no-op listener."""
+
+        result = []
+        for event_type, listener in self.listeners.items():
+            func = getattr(listener, "__func__", listener)
+            if func is not getattr(Script, getattr(func, "__name__", ""), None):
+                result.append(event_type)
+        return result
+
     def set_up_commands(self) -> None:
         """Sets up commands with CommandManager."""
 
@@ -82,9 +82,15 @@ class ScriptManager:
             self._default_script.deregister_event_listeners()
         self._default_script = None
         self.set_active_script(None, "deactivate")
+        for app in {*self.app_scripts, *self.toolkit_scripts, *self.custom_scripts}:
+            for script in self._get_scripts_for_app(app):
+                script.deregister_event_listeners()
+        for script in self._sleep_mode_scripts.values():
+            script.deregister_event_listeners()
         self.app_scripts = {}
         self.toolkit_scripts = {}
         self.custom_scripts = {}
+        self._sleep_mode_scripts = {}
         self._active = False
         debug.print_message(debug.LEVEL_INFO, "SCRIPT MANAGER: Deactivated", True)
 
@@ -220,6 +226,36 @@ class ScriptManager:
 
         return script
 
+    def _get_scripts_for_app(self, app: Atspi.Accessible) -> list[default.Script]:
+        """Returns the app, toolkit, and custom scripts which have been created for app."""
+
+        scripts = [self.app_scripts.get(app)]
+        scripts.extend(self.toolkit_scripts.get(app, {}).values())
+        scripts.extend(self.custom_scripts.get(app, {}).values())
+        return [script for script in scripts if script is not None]
+
+    def _update_event_listeners(self, app: Atspi.Accessible | None) -> None:
+        """Registers the listeners of the scripts for app which can currently get events."""
+
+        if app is None:
+            return
+
+        asleep = sleep_mode_manager.get_manager().is_active_for_app(app)
+        for script in self._get_scripts_for_app(app):
+            if asleep:
+                script.deregister_event_listeners()
+            else:
+                script.register_event_listeners()
+
+        sleep_mode_script = self._sleep_mode_scripts.get(app)
+        if sleep_mode_script is None:
+            return
+
+        if asleep:
+            sleep_mode_script.register_event_listeners()
+        else:
+            sleep_mode_script.deregister_event_listeners()
+
     def get_or_create_sleep_mode_script(self, app: Atspi.Accessible) -> sleepmode.Script:
         """Gets or crates the sleep mode script."""
 
@@ -244,6 +280,7 @@ class ScriptManager:
         custom_script: default.Script | None = None
         app_script: default.Script | None = None
         toolkit_script: default.Script | None = None
+        created = False
 
         role_name = self._script_for_role(obj)
         if role_name:
@@ -252,6 +289,7 @@ class ScriptManager:
             if not custom_script:
                 custom_script = self._new_named_script(app, role_name)
                 custom_scripts[role_name] = custom_script
+                created = True
             self.custom_scripts[app] = custom_scripts
 
         obj_toolkit = self._toolkit_for_object(obj)
@@ -263,6 +301,7 @@ class ScriptManager:
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
                 toolkit_script = self._create_script(app, obj)
                 toolkit_scripts[obj_toolkit] = toolkit_script
+                created = True
             self.toolkit_scripts[app] = toolkit_scripts
 
         try:
@@ -275,12 +314,16 @@ class ScriptManager:
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
                 app_script = self._create_script(app, None)
                 self.app_scripts[app] = app_script
+                created = True
         except (KeyError, AttributeError, ImportError) as error:
             tokens = ["EXCEPTION: Exception getting app script for", app, ":", error]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             app_script = self.get_default_script()
 
         assert app_script is not None
+        if created:
+            self._update_event_listeners(app)
+
         if sleep_mode_manager.get_manager().is_active_for_app(app):
             tokens = ["SCRIPT MANAGER: Sleep-mode toggled on for", app_script, app]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
@@ -336,6 +379,7 @@ class ScriptManager:
             self._active_script.deactivate()
             if old_app is not None and (new_script is None or new_script.app != old_app):
                 sleep_mode_manager.get_manager().on_app_deactivated(old_app)
+                self._update_event_listeners(old_app)
 
         self._active_script = new_script
         if new_script is None:
@@ -348,6 +392,7 @@ class ScriptManager:
         tokens = ["SCRIPT MANAGER: Setting active script to", new_script, "reason:", reason]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
         new_script.activate()
+        self._update_event_listeners(new_script.app)
 
         speech_manager.get_manager().check_speech_setting()
         command_manager.get_manager().check_keyboard_settings()
@@ -375,8 +420,12 @@ class ScriptManager:
             tokens = ["SCRIPT MANAGER: Old script for app found:", app_script, app_script.app]
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
+            app_script.deregister_event_listeners()
+            for script in self._get_scripts_for_app(app):
+                script.deregister_event_listeners()
+
             with contextlib.suppress(KeyError):
-                self._sleep_mode_scripts.pop(app)
+                self._sleep_mode_scripts.pop(app).deregister_event_listeners()
 
             with contextlib.suppress(KeyError):
                 self.toolkit_scripts.pop(app)
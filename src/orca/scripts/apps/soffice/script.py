@@ -224,7 +224,7 @@ class Script(default.Script):
             focus_manager.get_manager().set_locus_of_focus(event, event.any_data)
             return True
 
-        AXUtilities.clear_all_cache_now(event.source, "children-changed event.")
+        AXUtilities.clear_subtree_cache_now(event.source, "children-changed event.")
 
         manager = focus_manager.get_manager()
         if AXUtilities.is_last_cell(event.any_data):
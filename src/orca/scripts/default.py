@@ -403,13 +403,13 @@ class Script(script.Script):
     def _on_children_added(self, event: Atspi.Event) -> bool:
         """Callback for object:children-changed:add accessibility events."""
 
-        AXUtilities.clear_all_cache_now(event.source, "children-changed event.")
+        AXUtilities.clear_subtree_cache_now(event.source, "children-changed event.")
         return True
 
     def _on_children_removed(self, event: Atspi.Event) -> bool:
         """Callback for object:children-changed:remove accessibility events."""
 
-        AXUtilities.clear_all_cache_now(event.source, "children-changed event.")
+        AXUtilities.clear_subtree_cache_now(event.source, "children-changed event.")
         return True
 
     # pylint: disable-next=too-many-return-statements
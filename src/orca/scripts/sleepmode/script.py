@@ -31,6 +31,7 @@ from typing import TYPE_CHECKING
 from orca import (
     command_manager,
     debug,
+    event_manager,
     focus_manager,
     messages,
     orca_modifier_manager,
@@ -68,6 +69,16 @@ class Script(script.Script):
         command_manager.get_manager().set_all_suspended(False)
         orca_modifier_manager.get_manager().refresh_orca_modifiers("Leaving sleep mode.")
 
+    def register_event_listeners(self) -> None:
+        """Registers for listeners needed by this script."""
+
+        event_manager.get_manager().register_script_listeners(self)  # type: ignore[arg-type]
+
+    def deregister_event_listeners(self) -> None:
+        """De-registers the listeners needed by this script."""
+
+        event_manager.get_manager().deregister_script_listeners(self)  # type: ignore[arg-type]
+
     def locus_of_focus_changed(
         self,
         event: Atspi.Event | None,
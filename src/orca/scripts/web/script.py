@@ -1005,7 +1005,8 @@ class Script(default.Script):
     def _on_children_added(self, event: Atspi.Event) -> bool:
         """Callback for object:children-changed:add accessibility events."""
 
-        AXUtilities.clear_all_cache_now(event.source, "children-changed event.")
+        self.utilities.discard_cached_objects(event.source, event.any_data)
+        AXUtilities.clear_subtree_cache_now(event.source, "children-changed event.")
 
         if self.utilities.event_is_browser_ui_noise_deprecated(event):
             msg = "WEB: Ignoring event believed to be browser UI noise"
@@ -1015,23 +1016,14 @@ class Script(default.Script):
         is_live_region = AXUtilities.is_live_region(event.source)
         document = self.utilities.get_top_level_document_for_object(event.source)
         if document and not is_live_region:
-            focus = focus_manager.get_manager().get_locus_of_focus()
-            if event.source == focus:
-                msg = "WEB: Dumping cache: source is focus"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                self.utilities.dump_cache(document, preserve_context=True)
-            elif focus_manager.get_manager().focus_is_dead():
+            if focus_manager.get_manager().focus_is_dead():
                 msg = "WEB: Dumping cache: dead focus"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
                 self.utilities.dump_cache(document, preserve_context=True)
-            elif AXUtilities.find_ancestor(focus, lambda x: x == event.source):
-                msg = "WEB: Dumping cache: source is ancestor of focus"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                self.utilities.dump_cache(document, preserve_context=True)
             else:
                 msg = "WEB: Not dumping full cache"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                self.utilities.clear_cached_objects()
+                self.utilities.patch_cache(event.source)
         elif is_live_region:
             msg = "WEB: Ignoring event from live region."
             debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -1076,7 +1068,8 @@ class Script(default.Script):
     def _on_children_removed(self, event: Atspi.Event) -> bool:
         """Callback for object:children-changed:removed accessibility events."""
 
-        AXUtilities.clear_all_cache_now(event.source, "children-changed event.")
+        self.utilities.discard_cached_objects(event.source, event.any_data)
+        AXUtilities.clear_subtree_cache_now(event.source, "children-changed event.")
 
         if not self.utilities.in_document_content(event.source):
             msg = "WEB: Event source is not in document content."
@@ -1099,23 +1092,14 @@ class Script(default.Script):
 
         document = self.utilities.get_top_level_document_for_object(event.source)
         if document:
-            focus = focus_manager.get_manager().get_locus_of_focus()
-            if event.source == focus:
-                msg = "WEB: Dumping cache: source is focus"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                self.utilities.dump_cache(document, preserve_context=True)
-            elif focus_manager.get_manager().focus_is_dead():
+            if focus_manager.get_manager().focus_is_dead():
                 msg = "WEB: Dumping cache: dead focus"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
                 self.utilities.dump_cache(document, preserve_context=True)
-            elif AXUtilities.find_ancestor(focus, lambda x: x == event.source):
-                msg = "WEB: Dumping cache: source is ancestor of focus"
-                debug.print_message(debug.LEVEL_INFO, msg, True)
-                self.utilities.dump_cache(document, preserve_context=True)
             else:
                 msg = "WEB: Not dumping full cache"
                 debug.print_message(debug.LEVEL_INFO, msg, True)
-                self.utilities.clear_cached_objects()
+                self.utilities.patch_cache(event.source)
 
         if self.utilities.handle_event_for_removed_child(event):
             msg = "WEB: Event handled for removed child."
@@ -1567,7 +1551,7 @@ class Script(default.Script):
 
         msg = "WEB: Clearing content cache due to text deletion"
         debug.print_message(debug.LEVEL_INFO, msg, True)
-        self.utilities.clear_content_cache()
+        self.utilities.clear_content_cache(event.source)
 
         if reason in (TextEventReason.DELETE, TextEventReason.BACKSPACE):
             msg = "WEB: Event believed to be due to editable text deletion"
@@ -1661,7 +1645,7 @@ class Script(default.Script):
 
         msg = "WEB: Clearing content cache due to text insertion"
         debug.print_message(debug.LEVEL_INFO, msg, True)
-        self.utilities.clear_content_cache()
+        self.utilities.clear_content_cache(event.source)
 
         document = self.utilities.get_top_level_document_for_object(event.source)
         if focus_manager.get_manager().focus_is_dead():
@@ -40,7 +40,7 @@ from typing import TYPE_CHECKING, Any
 import gi
 
 gi.require_version("Atspi", "2.0")
-from gi.repository import Atspi
+from gi.repository import Atspi, GLib
 
 from orca import (
     ax_cache_manager,
@@ -54,6 +54,7 @@ from orca import (
 )
 from orca.ax_component import AXComponent
 from orca.ax_hypertext import AXHypertext
+from orca.ax_linearized_document import AXLinearizedDocument
 from orca.ax_object import AXObject
 from orca.ax_text import AXText
 from orca.ax_utilities import AXUtilities
@@ -61,7 +62,7 @@ from orca.ax_utilities_debugging import AXUtilitiesDebugging
 from orca.ax_utilities_hypertext import CaretPolicy
 
 if TYPE_CHECKING:
-    from collections.abc import Hashable, Iterator
+    from collections.abc import Callable, Hashable, Iterator
 
     from orca.ax_utilities_text import CaretSetReason
 
@@ -142,9 +143,16 @@ class _WebUtilitiesCache:
 
     TEMPORARY_CONTEXT_NAMESPACES = (CAN_HAVE_CARET_CONTEXT,)
 
+    # Namespaces keyed by object whose values can be discarded for the subtree of a change.
+    SUBTREE_NAMESPACES = OBJECT_DECISION_NAMESPACES + TEMPORARY_CONTEXT_NAMESPACES
+
     _CONTENT_KEY = "contents"
+    _LINES_KEY = "lines"
+    _LINE_LINKS_KEY = "line-links"
     _CONTEXTS_KEY = "contexts"
     _FIND_CONTAINER_KEY = "container"
+    _MAX_DECISIONS = 5000
+    _MAX_LINES = 16
 
     def __init__(self) -> None:
         self._manager = ax_cache_manager.get_manager()
@@ -164,6 +172,10 @@ class _WebUtilitiesCache:
                 lifetime=ax_cache_manager.Lifetime.OWNER,
                 clear_on_demand=ax_cache_manager.ClearPolicy.PRESERVE,
                 clear_interval_seconds=None,
+                keyed_by_object=namespace in self.SUBTREE_NAMESPACES,
+                max_entries=(
+                    self._MAX_DECISIONS if namespace in self.OBJECT_DECISION_NAMESPACES else None
+                ),
             )
         self._caches = {
             namespace: self._manager.get_cache(self, namespace)
@@ -209,6 +221,23 @@ class _WebUtilitiesCache:
             if cache := self._caches.get(namespace):
                 cache.invalidate(reason)
 
+    def discard_object_decisions(
+        self, obj: Atspi.Accessible, ancestors: list[Atspi.Accessible], reason: str = ""
+    ) -> int:
+        """Discards the object and caret-context decisions for the subtree of obj.
+
+        The subtree is obj, its ancestors, and its descendants known to the cache manager.
+        Returns the number of decisions discarded.
+        """
+
+        return self._manager.discard_subtree(
+            self,
+            self.SUBTREE_NAMESPACES,
+            ax_cache_manager.get_object_key(obj),
+            [ax_cache_manager.get_object_key(x) for x in ancestors],
+            reason,
+        )
+
     def clear_namespace(self, namespace: str, reason: str = "") -> None:
         """Clears one cached web namespace."""
 
@@ -248,6 +277,116 @@ class _WebUtilitiesCache:
             if cache := self._caches.get(namespace):
                 cache.invalidate(reason)
 
+    @staticmethod
+    def get_line_key(line: list[tuple[Atspi.Accessible, int, int, str]]) -> Hashable:
+        """Returns the key of line, which is the object and offset where it starts."""
+
+        return ax_cache_manager.get_object_key(line[0][0]), line[0][1]
+
+    def _get_line_window(
+        self,
+    ) -> tuple[
+        dict[Hashable, tuple[tuple[Atspi.Accessible, int, int, str], ...]],
+        dict[tuple[Hashable, bool, bool], Hashable],
+    ]:
+        """Returns copies of the cached lines, least recently used first, and their links."""
+
+        cache = self._caches.get(self.LINE_CONTENTS)
+        if cache is None:
+            return {}, {}
+
+        return dict(cache.get(self._LINES_KEY, {})), dict(cache.get(self._LINE_LINKS_KEY, {}))
+
+    def _set_line_window(
+        self,
+        lines: dict[Hashable, tuple[tuple[Atspi.Accessible, int, int, str], ...]],
+        links: dict[tuple[Hashable, bool, bool], Hashable],
+    ) -> None:
+        """Stores the cached lines and their links."""
+
+        cache = self._caches.get(self.LINE_CONTENTS)
+        if cache is not None:
+            cache.put(self._LINES_KEY, lines)
+            cache.put(self._LINE_LINKS_KEY, links)
+
+    def get_lines(self) -> list[list[tuple[Atspi.Accessible, int, int, str]]]:
+        """Returns the cached lines, most recently used first."""
+
+        lines, _links = self._get_line_window()
+        return [list(line) for line in reversed(lines.values())]
+
+    def put_line(self, line: list[tuple[Atspi.Accessible, int, int, str]]) -> None:
+        """Stores line as the most recently used line, evicting the least recently used."""
+
+        if not line:
+            return
+
+        lines, links = self._get_line_window()
+        key = self.get_line_key(line)
+        lines.pop(key, None)
+        lines[key] = tuple(line)
+        while len(lines) > self._MAX_LINES:
+            del lines[next(iter(lines))]
+
+        links = {
+            link: target for link, target in links.items() if link[0] in lines and target in lines
+        }
+        self._set_line_window(lines, links)
+
+    def link_lines(
+        self,
+        line: list[tuple[Atspi.Accessible, int, int, str]],
+        adjacent: list[tuple[Atspi.Accessible, int, int, str]],
+        is_next: bool,
+        skip_space: bool,
+    ) -> None:
+        """Records that adjacent is the next or previous line of line in document order."""
+
+        if not (line and adjacent):
+            return
+
+        lines, links = self._get_line_window()
+        key, adjacent_key = self.get_line_key(line), self.get_line_key(adjacent)
+        if key in lines and adjacent_key in lines and key != adjacent_key:
+            links[key, is_next, skip_space] = adjacent_key
+            self._set_line_window(lines, links)
+
+    def get_adjacent_line(
+        self,
+        line: list[tuple[Atspi.Accessible, int, int, str]],
+        is_next: bool,
+        skip_space: bool,
+    ) -> list[tuple[Atspi.Accessible, int, int, str]] | None:
+        """Returns the cached next or previous line of line, or None if it is not known."""
+
+        if not line:
+            return None
+
+        lines, links = self._get_line_window()
+        adjacent_key = links.get((self.get_line_key(line), is_next, skip_space))
+        if adjacent_key not in lines:
+            return None
+
+        lines[adjacent_key] = lines.pop(adjacent_key)
+        self._set_line_window(lines, links)
+        return list(lines[adjacent_key])
+
+    def discard_lines(self, is_affected: Callable[[Atspi.Accessible], bool], reason: str) -> int:
+        """Discards the cached lines with an object for which is_affected is True.
+
+        All links are discarded too, because content can have been added between two lines
+        which are themselves unaffected. Returns the number of lines discarded.
+        """
+
+        lines, _links = self._get_line_window()
+        kept = {
+            key: line for key, line in lines.items() if not any(is_affected(x[0]) for x in line)
+        }
+        msg = f"WEB: Discarded {len(lines) - len(kept)} of {len(lines)} cached lines: {reason}"
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        self._set_line_window(kept, {})
+        return len(lines) - len(kept)
+
     def get_caret_context_decision(self, obj: Atspi.Accessible) -> bool | None:
         """Returns the cached caret-context decision for obj."""
 
@@ -321,15 +460,14 @@ class _WebUtilitiesCache:
 
         return self._get_contexts(self.CARET_CONTEXTS)
 
-    def replace_caret_contexts(
-        self,
-        contexts: dict[Hashable, tuple[Atspi.Accessible | None, int]],
-    ) -> None:
-        """Replaces cached caret contexts."""
+    def discard_invalid_contexts(self, namespace: str) -> int:
+        """Removes the cached contexts whose object is no longer valid and returns the count."""
 
-        cache = self._caches.get(self.CARET_CONTEXTS)
-        if cache is not None:
-            cache.put(self._CONTEXTS_KEY, contexts)
+        contexts = self._get_contexts(namespace)
+        valid = {key: context for key, context in contexts.items() if AXObject.is_valid(context[0])}
+        if len(valid) != len(contexts) and (cache := self._caches.get(namespace)):
+            cache.put(self._CONTEXTS_KEY, valid)
+        return len(contexts) - len(valid)
 
     def clear_prior_contexts(self, reason: str = "") -> None:
         """Clears cached prior caret contexts."""
@@ -358,6 +496,9 @@ class _WebUtilitiesCache:
 class Utilities(script_utilities.Utilities):
     """Utilities for providing information about objects and events in web content."""
 
+    # The number of lines cached during idle time in the direction of line navigation.
+    LINE_PREFETCH_COUNT = 3
+
     def __init__(self, script: Script) -> None:
         super().__init__(script)
         self._cache = _WebUtilitiesCache()
@@ -372,13 +513,17 @@ class Utilities(script_utilities.Utilities):
         self._valid_child_roles: dict[Atspi.Role, list[Atspi.Role]] = {
             Atspi.Role.LIST: [Atspi.Role.LIST_ITEM],
         }
+        self._line_prefetch_id: int = 0
+        self._linearized_document = AXLinearizedDocument(self.caret_policy)
+        self._cache_update_counts: dict[str, int] = {"dumps": 0, "patches": 0}
 
     def _cleanup_contexts(self) -> None:
-        contexts = self._cache.get_caret_contexts()
-        contexts = {
-            key: context for key, context in contexts.items() if AXObject.is_valid(context[0])
-        }
-        self._cache.replace_caret_contexts(contexts)
+        self._cache.discard_invalid_contexts(self._cache.CARET_CONTEXTS)
+
+    def get_cache_update_counts(self) -> dict[str, int]:
+        """Returns how often the cache was dumped in full and patched for a change."""
+
+        return dict(self._cache_update_counts)
 
     def dump_cache(
         self,
@@ -395,6 +540,7 @@ class Utilities(script_utilities.Utilities):
             self._cache.CARET_CONTEXTS,
             document_parent,
         )
+        self._cache_update_counts["dumps"] += 1
         tokens = [
             "WEB: Clearing all cached info for",
             document,
@@ -402,6 +548,8 @@ class Utilities(script_utilities.Utilities):
             preserve_context,
             "Context:",
             context,
+            "Cache updates:",
+            self._cache_update_counts,
         ]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
@@ -428,10 +576,77 @@ class Utilities(script_utilities.Utilities):
         self._cleanup_contexts()
         self._cache.clear_prior_contexts("web clear cached objects")
 
-    def clear_content_cache(self) -> None:
-        """Clears the cached line, word, object, character contents."""
+    def discard_cached_objects(
+        self, obj: Atspi.Accessible, child: Atspi.Accessible | None = None
+    ) -> None:
+        """Discards the object decisions which a change to the children of obj can affect.
+
+        These are the decisions for obj, its ancestors, and its known descendants, along with
+        those for the known descendants of the added or removed child. This must be called
+        before the tree links of the subtree are dropped by AXUtilities.clear_subtree_cache_now.
+        """
+
+        ancestors: list[Atspi.Accessible] = []
+        parent = AXObject.get_parent(obj)
+        while parent is not None and parent != obj and parent not in ancestors:
+            ancestors.append(parent)
+            parent = AXObject.get_parent(parent)
+
+        reason = "web children changed"
+        removed = self._cache.discard_object_decisions(obj, ancestors, reason)
+        if child is not None:
+            removed += self._cache.discard_object_decisions(child, [], reason)
+
+        tokens = ["WEB: Discarded", removed, "cached decisions for the subtree of", obj]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        self._cache.clear_content("web clear content cache")
+    def patch_cache(self, obj: Atspi.Accessible) -> None:
+        """Updates the cached information affected by a change to the children of obj.
+
+        Unlike dump_cache, this keeps the caret context, the unaffected cached lines, and the
+        decisions not discarded by discard_cached_objects. Contexts whose object is no longer
+        valid are dropped.
+        """
+
+        self._cache_update_counts["patches"] += 1
+        removed = self._cache.discard_invalid_contexts(self._cache.CARET_CONTEXTS)
+        removed += self._cache.discard_invalid_contexts(self._cache.PRIOR_CONTEXTS)
+        tokens = [
+            "WEB: Patching cached info for",
+            obj,
+            f"Discarded {removed} invalid context(s). Cache updates:",
+            self._cache_update_counts,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        self.clear_content_cache(obj)
+
+    def clear_content_cache(self, obj: Atspi.Accessible | None = None) -> None:
+        """Clears the cached line, word, object, character contents.
+
+        If obj is provided, only the cached lines and linearized runs with content in the block
+        containing obj are discarded.
+        """
+
+        self._cancel_line_prefetch()
+        if obj is None or not AXObject.is_valid(obj):
+            self._cache.clear_content("web clear content cache")
+            self._linearized_document.clear("web clear content cache")
+            return
+
+        for namespace in self._cache.CONTENT_NAMESPACES:
+            if namespace != self._cache.LINE_CONTENTS:
+                self._cache.clear_namespace(namespace, "web clear content cache")
+
+        root = AXUtilities.get_nearest_block_ancestor(obj) or obj
+
+        def is_affected(x: Atspi.Accessible) -> bool:
+            return x == root or AXUtilities.is_ancestor(x, root)
+
+        tokens = ["WEB: Clearing cached lines with content in", root]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        self._cache.discard_lines(is_affected, "web content changed")
+        if self._linearized_document.get_statistics()["runs"]:
+            self._linearized_document.discard(is_affected, "web content changed")
 
     def is_document(self, obj: Atspi.Accessible) -> bool:
         """Returns True if obj is a document."""
@@ -621,16 +836,11 @@ class Utilities(script_utilities.Utilities):
         if obj is None:
             obj, offset = self.get_caret_context()
 
-        next_obj, next_offset = AXUtilities.find_next_context(obj, offset, self.caret_policy)
+        next_obj, next_offset = self._find_next_context(obj, offset)
         if skip_space:
             seen = {(next_obj, next_offset)}
-            while (
-                self.treat_as_text_object(next_obj)
-                and AXText.get_character_at_offset(next_obj, next_offset)[0].isspace()
-            ):
-                next_obj, next_offset = AXUtilities.find_next_context(
-                    next_obj, next_offset, self.caret_policy
-                )
+            while self._is_space_context(next_obj, next_offset):
+                next_obj, next_offset = self._find_next_context(next_obj, next_offset)
                 if (next_obj, next_offset) in seen:
                     msg = "WEB: Cycle detected in next_context skip_space. Breaking."
                     debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -651,16 +861,11 @@ class Utilities(script_utilities.Utilities):
         if obj is None:
             obj, offset = self.get_caret_context()
 
-        prev_obj, prev_offset = AXUtilities.find_previous_context(obj, offset, self.caret_policy)
+        prev_obj, prev_offset = self._find_previous_context(obj, offset)
         if skip_space:
             seen = {(prev_obj, prev_offset)}
-            while (
-                self.treat_as_text_object(prev_obj)
-                and AXText.get_character_at_offset(prev_obj, prev_offset)[0].isspace()
-            ):
-                prev_obj, prev_offset = AXUtilities.find_previous_context(
-                    prev_obj, prev_offset, self.caret_policy
-                )
+            while self._is_space_context(prev_obj, prev_offset):
+                prev_obj, prev_offset = self._find_previous_context(prev_obj, prev_offset)
                 if (prev_obj, prev_offset) in seen:
                     msg = "WEB: Cycle detected in previous_context skip_space. Breaking."
                     debug.print_message(debug.LEVEL_INFO, msg, True)
@@ -669,6 +874,60 @@ class Utilities(script_utilities.Utilities):
 
         return prev_obj, prev_offset
 
+    def _get_linearized_document(self) -> AXLinearizedDocument | None:
+        """Returns the linearized document if it is to be used, otherwise None."""
+
+        if document_presenter.get_presenter().get_use_linearized_model():
+            return self._linearized_document
+
+        if self._linearized_document.get_statistics()["runs"]:
+            self._linearized_document.clear("Linearized model disabled.")
+        return None
+
+    def _find_context(
+        self, obj: Atspi.Accessible | None, offset: int, previous: bool
+    ) -> tuple[Atspi.Accessible | None, int]:
+        """Returns the next or previous caret context, using the linearized document if known."""
+
+        model = self._get_linearized_document() if obj is not None else None
+        if model is not None and (rv := model.find_context(obj, offset, previous)) is not None:
+            return rv
+
+        if previous:
+            rv = AXUtilities.find_previous_context(obj, offset, self.caret_policy)
+        else:
+            rv = AXUtilities.find_next_context(obj, offset, self.caret_policy)
+
+        if model is not None:
+            model.record(obj, offset, rv, previous)
+        return rv
+
+    def _find_next_context(
+        self, obj: Atspi.Accessible | None, offset: int
+    ) -> tuple[Atspi.Accessible | None, int]:
+        """Returns the next caret context in document order from obj at offset."""
+
+        return self._find_context(obj, offset, previous=False)
+
+    def _find_previous_context(
+        self, obj: Atspi.Accessible | None, offset: int
+    ) -> tuple[Atspi.Accessible | None, int]:
+        """Returns the previous caret context in document order from obj at offset."""
+
+        return self._find_context(obj, offset, previous=True)
+
+    def _is_space_context(self, obj: Atspi.Accessible | None, offset: int) -> bool:
+        """Returns True if obj is a text object whose character at offset is whitespace."""
+
+        model = self._get_linearized_document() if obj is not None else None
+        if model is not None and (char := model.get_character(obj, offset)) is not None:
+            return char.isspace()
+
+        return (
+            self.treat_as_text_object(obj)
+            and AXText.get_character_at_offset(obj, offset)[0].isspace()
+        )
+
     def last_context(self, root: Atspi.Accessible) -> tuple[Atspi.Accessible, int]:
         """Returns the last viable/valid caret context in root."""
 
@@ -1244,9 +1503,7 @@ class Utilities(script_utilities.Utilities):
                 if AXHypertext.get_character_offset_in_parent(first_obj) == 0:
                     break
 
-            prev_object, prev_offset = AXUtilities.find_previous_context(
-                first_obj, first_start, self.caret_policy
-            )
+            prev_object, prev_offset = self._find_previous_context(first_obj, first_start)
             on_left = self._get_contents_for_obj(prev_object, prev_offset, granularity)
             on_left = list(filter(lambda x: x not in objects, on_left))
             ends_on_left = list(filter(_treat_as_sentence_end, on_left))
@@ -1263,9 +1520,7 @@ class Utilities(script_utilities.Utilities):
         # Check for things in the same sentence after this object.
         while not _treat_as_sentence_end(objects[-1]):
             last_obj, _last_start, last_end, _last_string = objects[-1]
-            next_obj, next_offset = AXUtilities.find_next_context(
-                last_obj, last_end - 1, self.caret_policy
-            )
+            next_obj, next_offset = self._find_next_context(last_obj, last_end - 1)
             on_right = self._get_contents_for_obj(next_obj, next_offset, granularity)
             on_right = list(filter(lambda x: x not in objects, on_right))
             if not on_right:
@@ -1375,9 +1630,7 @@ class Utilities(script_utilities.Utilities):
 
         # Check for things in the same word to the left of this object.
         first_obj, first_start, _first_end, first_string = objects[0]
-        prev_obj, prev_offset = AXUtilities.find_previous_context(
-            first_obj, first_start, self.caret_policy
-        )
+        prev_obj, prev_offset = self._find_previous_context(first_obj, first_start)
         while prev_obj and first_string and prev_obj != first_obj:
             char = AXText.get_character_at_offset(prev_obj, prev_offset)[0]
             if not char or char.isspace():
@@ -1390,16 +1643,12 @@ class Utilities(script_utilities.Utilities):
 
             objects[0:0] = on_left
             first_obj, first_start, _first_end, first_string = objects[0]
-            prev_obj, prev_offset = AXUtilities.find_previous_context(
-                first_obj, first_start, self.caret_policy
-            )
+            prev_obj, prev_offset = self._find_previous_context(first_obj, first_start)
 
         # Check for things in the same word to the right of this object.
         last_obj, _last_start, last_end, last_string = objects[-1]
         while last_obj and last_string and not last_string[-1].isspace():
-            next_obj, next_offset = AXUtilities.find_next_context(
-                last_obj, last_end - 1, self.caret_policy
-            )
+            next_obj, next_offset = self._find_next_context(last_obj, last_end - 1)
             if next_obj == last_obj:
                 break
 
@@ -1492,9 +1741,7 @@ class Utilities(script_utilities.Utilities):
             return []
 
         last_obj, _last_start, last_end, _last_string = objects[-1]
-        next_obj, next_offset = AXUtilities.find_next_context(
-            last_obj, last_end - 1, self.caret_policy
-        )
+        next_obj, next_offset = self._find_next_context(last_obj, last_end - 1)
         while next_obj:
             on_right = self._get_contents_for_obj(next_obj, next_offset, None)
             on_right = list(filter(_include, on_right))
@@ -1503,9 +1750,7 @@ class Utilities(script_utilities.Utilities):
 
             objects.extend(on_right)
             last_obj, last_end = objects[-1][0], objects[-1][2]
-            next_obj, next_offset = AXUtilities.find_next_context(
-                last_obj, last_end - 1, self.caret_policy
-            )
+            next_obj, next_offset = self._find_next_context(last_obj, last_end - 1)
 
         if use_cache:
             self._cache.set_content(self._cache.OBJECT_CONTENTS, objects)
@@ -1627,8 +1872,8 @@ class Utilities(script_utilities.Utilities):
                 offset = 0
 
         if use_cache:
-            cached = self._cache.get_content(self._cache.LINE_CONTENTS)
-            if cached and self.find_object_in_contents(obj, offset, cached, use_cache=True) != -1:
+            cached = self._get_cached_line_contents(obj, offset)
+            if cached:
                 self._debug_contents_info(obj, offset, cached, "Line (cached)")
                 return cached
 
@@ -1741,7 +1986,7 @@ class Utilities(script_utilities.Utilities):
         objects = self._get_contents_for_obj(obj, offset, granularity)
         if not layout_mode:
             if use_cache:
-                self._cache.set_content(self._cache.LINE_CONTENTS, objects)
+                self._cache.put_line(objects)
 
             self._debug_contents_info(obj, offset, objects, "Line (not layout mode)")
             return objects
@@ -1765,12 +2010,8 @@ class Utilities(script_utilities.Utilities):
             last_end += 1
 
         document = self.get_document_for_object(obj)
-        prev_obj, prev_offset = AXUtilities.find_previous_context(
-            first_obj, first_start, self.caret_policy
-        )
-        next_obj, next_offset = AXUtilities.find_next_context(
-            last_obj, max(last_end - 1, last_start), self.caret_policy
-        )
+        prev_obj, prev_offset = self._find_previous_context(first_obj, first_start)
+        next_obj, next_offset = self._find_next_context(last_obj, max(last_end - 1, last_start))
 
         # Check for things on the same line to the left of this object.
         while prev_obj and self.get_document_for_object(prev_obj) == document:
@@ -1782,9 +2023,7 @@ class Utilities(script_utilities.Utilities):
             objects[0:0] = on_left
             seen.update(on_left)
             first_obj, first_start = objects[0][0], objects[0][1]
-            prev_obj, prev_offset = AXUtilities.find_previous_context(
-                first_obj, first_start, self.caret_policy
-            )
+            prev_obj, prev_offset = self._find_previous_context(first_obj, first_start)
 
         # Check for things on the same line to the right of this object.
         while next_obj and self.get_document_for_object(next_obj) == document:
@@ -1800,16 +2039,84 @@ class Utilities(script_utilities.Utilities):
                 last_obj, last_end = self.last_context(last_obj)
                 last_end += 1
 
-            next_obj, next_offset = AXUtilities.find_next_context(
-                last_obj, max(last_end - 1, last_start), self.caret_policy
-            )
+            next_obj, next_offset = self._find_next_context(last_obj, max(last_end - 1, last_start))
 
         if use_cache:
-            self._cache.set_content(self._cache.LINE_CONTENTS, objects)
+            self._cache.put_line(objects)
 
         self._debug_contents_info(obj, offset, objects, "Line (layout mode)")
         return objects
 
+    def _get_cached_line_contents(
+        self,
+        obj: Atspi.Accessible,
+        offset: int,
+    ) -> list[tuple[Atspi.Accessible, int, int, str]]:
+        """Returns the cached line containing obj at offset, or an empty list."""
+
+        lines = self._cache.get_lines()
+        contents = [x for line in lines for x in line]
+        index = self.find_object_in_contents(obj, offset, contents, use_cache=True)
+        if index == -1:
+            return []
+
+        for line in lines:
+            if index < len(line):
+                self._cache.put_line(line)
+                return line
+            index -= len(line)
+
+        return []
+
+    def _schedule_line_prefetch(
+        self,
+        line: list[tuple[Atspi.Accessible, int, int, str]],
+        is_next: bool,
+        layout_mode: bool | None,
+    ) -> None:
+        """Schedules the idle-time caching of the lines after or before line."""
+
+        self._cancel_line_prefetch()
+        if line and line[0] and self.LINE_PREFETCH_COUNT:
+            self._line_prefetch_id = GLib.idle_add(
+                self._prefetch_line, line, is_next, layout_mode, self.LINE_PREFETCH_COUNT
+            )
+
+    def _cancel_line_prefetch(self) -> None:
+        """Cancels the pending idle-time caching of lines, if any."""
+
+        if self._line_prefetch_id:
+            GLib.source_remove(self._line_prefetch_id)
+            self._line_prefetch_id = 0
+
+    def _prefetch_line(
+        self,
+        line: list[tuple[Atspi.Accessible, int, int, str]],
+        is_next: bool,
+        layout_mode: bool | None,
+        remaining: int,
+    ) -> bool:
+        """Caches the line after or before line, then schedules the one beyond it."""
+
+        self._line_prefetch_id = 0
+        obj, offset = line[0][0], line[0][1]
+        if not AXObject.is_valid(obj):
+            return False
+
+        tokens = ["WEB: Prefetching line", "after" if is_next else "before", obj, ", ", offset]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+        with self._hypertext_content_building_scope():
+            if is_next:
+                adjacent = self._get_next_line_contents(obj, offset, layout_mode)
+            else:
+                adjacent = self._get_previous_line_contents(obj, offset, layout_mode)
+
+        if adjacent and adjacent[0] and adjacent != line and remaining > 1:
+            self._line_prefetch_id = GLib.idle_add(
+                self._prefetch_line, adjacent, is_next, layout_mode, remaining - 1
+            )
+        return False
+
     def get_previous_line_contents(
         self,
         obj: Atspi.Accessible | None = None,
@@ -1820,7 +2127,11 @@ class Utilities(script_utilities.Utilities):
         """Returns a list of (obj, start, end, string) tuples for the previous line."""
 
         with self._hypertext_content_building_scope():
-            return self._get_previous_line_contents(obj, offset, layout_mode, use_cache)
+            contents = self._get_previous_line_contents(obj, offset, layout_mode, use_cache)
+
+        if use_cache:
+            self._schedule_line_prefetch(contents, False, layout_mode)
+        return contents
 
     def _get_previous_line_contents(
         self,
@@ -1850,11 +2161,15 @@ class Utilities(script_utilities.Utilities):
         if not (line and line[0]):
             return []
 
+        skip_space = not speech_presenter.get_presenter().get_speak_blank_lines()
+        if use_cache and (cached := self._cache.get_adjacent_line(line, False, skip_space)):
+            self._debug_contents_info(line[0][0], line[0][1], cached, "Previous line (cached)")
+            return cached
+
         first_obj, first_offset = line[0][0], line[0][1]
         tokens = ["WEB: First context on line is: ", first_obj, ", ", first_offset]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        skip_space = not speech_presenter.get_presenter().get_speak_blank_lines()
         obj, offset = self.previous_context(first_obj, first_offset, skip_space)
         if not obj and first_obj:
             self.clear_cached_objects()
@@ -1885,6 +2200,8 @@ class Utilities(script_utilities.Utilities):
                 debug.print_tokens(debug.LEVEL_INFO, tokens, True)
                 contents = self.get_line_contents_at_offset(obj, offset, layout_mode, use_cache)
 
+        if use_cache and contents and contents[0] and contents != line:
+            self._cache.link_lines(line, contents, False, skip_space)
         return contents
 
     def get_next_line_contents(
@@ -1897,7 +2214,11 @@ class Utilities(script_utilities.Utilities):
         """Returns a list of (obj, start, end, string) tuples for the next line."""
 
         with self._hypertext_content_building_scope():
-            return self._get_next_line_contents(obj, offset, layout_mode, use_cache)
+            contents = self._get_next_line_contents(obj, offset, layout_mode, use_cache)
+
+        if use_cache:
+            self._schedule_line_prefetch(contents, True, layout_mode)
+        return contents
 
     def _get_next_line_contents(
         self,
@@ -1927,6 +2248,11 @@ class Utilities(script_utilities.Utilities):
         if not (line and line[0]):
             return []
 
+        skip_space = not speech_presenter.get_presenter().get_speak_blank_lines()
+        if use_cache and (cached := self._cache.get_adjacent_line(line, True, skip_space)):
+            self._debug_contents_info(line[0][0], line[0][1], cached, "Next line (cached)")
+            return cached
+
         last_obj, last_offset = line[-1][0], line[-1][2] - 1
         math = AXUtilities.find_ancestor_inclusive(last_obj, AXUtilities.is_math)
         if math:
@@ -1935,7 +2261,6 @@ class Utilities(script_utilities.Utilities):
         tokens = ["WEB: Last context on line is: ", last_obj, ", ", last_offset]
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
 
-        skip_space = not speech_presenter.get_presenter().get_speak_blank_lines()
         obj, offset = self.next_context(last_obj, last_offset, skip_space)
         if not obj and last_obj:
             self.clear_cached_objects()
@@ -1965,6 +2290,8 @@ class Utilities(script_utilities.Utilities):
             debug.print_tokens(debug.LEVEL_INFO, tokens, True)
             return []
 
+        if use_cache and contents[0] and contents != line:
+            self._cache.link_lines(line, contents, True, skip_space)
         return contents
 
     def unrelated_labels(
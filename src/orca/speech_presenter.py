@@ -58,6 +58,7 @@ from . import (
     speech_monitor,
     speech_presenter_command_definitions,
     speechserver,
+    trace_recorder,
 )
 from .acss import ACSS
 from .ax_hypertext import AXHypertext
@@ -2081,7 +2082,8 @@ class SpeechPresenter(Extension):
         msg = f"SPEECH OUTPUT: '{text}' {resolved_voice}"
         debug.print_message(debug.LEVEL_INFO, msg, True)
         if not consumed:
-            server.speak(text, resolved_voice)
+            with trace_recorder.get_recorder().slice("speak", "speech", {"text": text}):
+                server.speak(text, resolved_voice)
         self._record_speech(text, resolved_voice)
         self.write_to_monitor(text)
 
@@ -2215,10 +2217,11 @@ class SpeechPresenter(Extension):
 
         server = speech_manager.get_manager().get_server()
         if server and not consumed:
-            if text == event_string:
-                server.speak_key_event(event, acss)
-            else:
-                server.speak(text, acss)
+            with trace_recorder.get_recorder().slice("speak key", "speech", {"text": text}):
+                if text == event_string:
+                    server.speak_key_event(event, acss)
+                else:
+                    server.speak(text, acss)
         self.write_key_to_monitor(text)
 
     def speak_accessible_text(
@@ -2602,10 +2605,11 @@ class SpeechPresenter(Extension):
 
         server = speech_manager.get_manager().get_server()
         if server and not consumed:
-            if text == character and len(text) == 1:
-                server.speak_character(character, acss=acss, cap_style=cap_style)
-            else:
-                server.speak(text, acss)
+            with trace_recorder.get_recorder().slice("speak character", "speech", {"text": text}):
+                if text == character and len(text) == 1:
+                    server.speak_character(character, acss=acss, cap_style=cap_style)
+                else:
+                    server.speak(text, acss)
         self._record_speech(text, acss)
         self.write_to_monitor(text)
 
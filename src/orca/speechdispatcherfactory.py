@@ -34,7 +34,7 @@ from typing import TYPE_CHECKING, Any
 
 from gi.repository import GLib
 
-from . import debug, guilabels, speechserver, systemd
+from . import debug, guilabels, latency_tracker, speechserver, systemd
 from .acss import ACSS
 from .speechserver import CapitalizationStyle, PunctuationStyle
 from .ssml import SSML, SSMLCapabilities
@@ -395,6 +395,7 @@ class SpeechServer(speechserver.SpeechServer):
         if not text:
             return
 
+        latency_tracker.get_tracker().note_output("speech")
         if len(text) == 1:
             if (
                 text.isupper()
@@ -41,7 +41,7 @@ try:
 except Exception:
     _SPIEL_AVAILABLE = False
 
-from . import debug, guilabels, speechserver, systemd
+from . import debug, guilabels, latency_tracker, speechserver, systemd
 from .acss import ACSS
 from .speechserver import CapitalizationStyle, VoiceFamily
 from .ssml import SSML, SSMLCapabilities
@@ -390,6 +390,7 @@ class SpeechServer(speechserver.SpeechServer):
         if not text:
             return
 
+        latency_tracker.get_tracker().note_output("speech")
         if not acss:
             acss = ACSS(self._default_voice)
 
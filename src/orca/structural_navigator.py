@@ -28,6 +28,7 @@
 
 from __future__ import annotations
 
+import bisect
 import functools
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -38,6 +39,7 @@ gi.require_version("Atspi", "2.0")
 from gi.repository import Atspi
 
 from . import (
+    ax_cache_manager,
     command_manager,
     dbus_service,
     debug,
@@ -60,6 +62,7 @@ from .ax_object import AXObject
 from .ax_table import AXTable
 from .ax_text import AXText
 from .ax_utilities import AXUtilities
+from .ax_utilities_collection import MatchPredicate
 from .ax_utilities_text import CaretSetReason
 from .extension import Extension
 
@@ -109,6 +112,55 @@ class NavigationType(Enum):
     CLICKABLE = "clickable"
 
 
+class _StructuralIndex(list):
+    """The matches of a structural query in document order, with positions read lazily.
+
+    The path of a match is its order key. It is read from AT-SPI only when a search probes
+    that match, and then kept for as long as the index is.
+    """
+
+    def __init__(
+        self,
+        query: Callable[[], list[Atspi.Accessible]],
+        matches: list[Atspi.Accessible] | None = None,
+    ) -> None:
+        super().__init__(query() if matches is None else matches)
+        self._query = query
+        self._paths: dict[int, list[int]] = {}
+        self._positions: dict[Atspi.Accessible, int] | None = None
+
+    def rebuild(self) -> None:
+        """Runs the query again, replacing the matches and everything known about them."""
+
+        self[:] = self._query()
+        self._paths.clear()
+        self._positions = None
+
+    def get_positions(self) -> dict[Atspi.Accessible, int]:
+        """Returns a dictionary of the matches and their positions in the index."""
+
+        if self._positions is None:
+            self._positions = {match: i for i, match in enumerate(self)}
+        return self._positions
+
+    def get_path(self, index: int) -> list[int]:
+        """Returns the path of the match at index."""
+
+        if (path := self._paths.get(index)) is None:
+            path = self._paths[index] = AXObject.get_path(self[index])
+        return path
+
+    def bisect_left(self, path: list[Any]) -> int:
+        """Returns the position of the first match whose path is not before path."""
+
+        return bisect.bisect_left(range(len(self)), path, key=self.get_path)
+
+    def bisect_right(self, path: list[Any]) -> int:
+        """Returns the position of the first match whose path is after path."""
+
+        return bisect.bisect_right(range(len(self)), path, key=self.get_path)
+
+
 @gsettings_registry.get_registry().gsettings_schema(
     "org.gnome.Orca.StructuralNavigation",
     name="structural-navigation",
@@ -134,6 +186,8 @@ class StructuralNavigator(Extension):
         )
 
     GROUP_LABEL = guilabels.KB_GROUP_STRUCTURAL_NAVIGATION
+    INDEXES = "StructuralNavigator.indexes"
+    MAX_INDEXES = 64
 
     def __init__(self) -> None:
         self._last_input_event: InputEvent | None = None
@@ -143,6 +197,26 @@ class StructuralNavigator(Extension):
         self._suspended: bool = False
         self._mode_for_script: dict[default.Script, NavigationMode] = {}
         self._previous_mode_for_script: dict[default.Script, NavigationMode] = {}
+
+        # The matches of document queries, keyed by root and query. Mutations clear them via
+        # the cache manager: children-changed events clear those of the affected subtree.
+        manager = ax_cache_manager.get_manager()
+        manager.register_cache(
+            self,
+            self.INDEXES,
+            lifetime=ax_cache_manager.Lifetime.PROCESS,
+            clear_on_demand=ax_cache_manager.ClearPolicy.CLEAR,
+            keyed_by_object=True,
+            max_entries=self.MAX_INDEXES,
+        )
+        self._indexes = manager.get_cache(self, self.INDEXES)
+        self._partitions = self._get_partitions()
+
+        # The GUI-mode predicate. Collection checks the showing state, eliminating most objects.
+        self._non_document_object = MatchPredicate(
+            states=(Atspi.StateType.SHOWING,),
+            residual=self._is_not_document_descendant,
+        )
         super().__init__()
 
     @staticmethod
@@ -168,6 +242,107 @@ class StructuralNavigator(Extension):
 
         return wrapper
 
+    @staticmethod
+    def indexed_query(func):
+        """Decorator that keeps the matches of a document query in a per-document index."""
+
+        @functools.wraps(func)
+        def wrapper(self, script, *args) -> list[Atspi.Accessible]:
+            if self._indexes is None or self.get_mode(script) != NavigationMode.DOCUMENT:
+                return func(self, script, *args)
+
+            root = self._determine_root_container(script)
+            if root is None:
+                return func(self, script, *args)
+
+            key = (ax_cache_manager.get_object_key(root), func.__name__, *args)
+            index = self._indexes.get(key)
+            if index is ax_cache_manager.MISSING and (func.__name__, *args) in self._partitions:
+                self._index_all_partitions(script, root)
+                index = self._indexes.get(key)
+            if index is ax_cache_manager.MISSING:
+                index = _StructuralIndex(functools.partial(func, self, script, *args))
+                self._indexes.put(key, index)
+                tokens = ["STRUCTURAL NAVIGATOR:", func.__name__, f"indexed {len(index)} in", root]
+                debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            return index
+
+        return wrapper
+
+    def _get_partitions(
+        self,
+    ) -> dict[tuple[Any, ...], tuple[list[Atspi.Role], Callable[[Atspi.Accessible], bool] | None]]:
+        """Returns the role-based document queries which are answered by a single sweep.
+
+        Each key is the name and arguments of a query. Each value is the roles and predicate
+        which, applied to the descendants of the root, give the same matches as the query does
+        in document mode.
+        """
+
+        def is_not_layout_table(obj):
+            return AXObject.get_attribute(obj, "layout-guess") != "true"
+
+        def is_focusable_form_field(obj):
+            return AXUtilities.is_focusable(obj) and self._is_not_noneditable_document_frame(obj)
+
+        partitions: dict[
+            tuple[Any, ...], tuple[list[Atspi.Role], Callable[[Atspi.Accessible], bool] | None]
+        ] = {
+            ("_get_all_annotations",): (AXUtilities.get_annotation_roles(), None),
+            ("_get_all_blockquotes",): ([Atspi.Role.BLOCK_QUOTE], None),
+            ("_get_all_buttons",): ([Atspi.Role.BUTTON, Atspi.Role.TOGGLE_BUTTON], None),
+            ("_get_all_checkboxes",): ([Atspi.Role.CHECK_BOX], None),
+            ("_get_all_comboboxes",): ([Atspi.Role.COMBO_BOX], None),
+            ("_get_all_form_fields",): (
+                AXUtilities.get_form_field_roles(),
+                is_focusable_form_field,
+            ),
+            ("_get_all_headings",): ([Atspi.Role.HEADING], None),
+            ("_get_all_iframes",): ([Atspi.Role.INTERNAL_FRAME], None),
+            ("_get_all_landmarks",): ([Atspi.Role.LANDMARK], None),
+            ("_get_all_lists",): (
+                [Atspi.Role.LIST, Atspi.Role.DESCRIPTION_LIST, Atspi.Role.PAGE_TAB_LIST],
+                None,
+            ),
+            ("_get_all_list_items",): (
+                [Atspi.Role.LIST_ITEM, Atspi.Role.DESCRIPTION_TERM, Atspi.Role.PAGE_TAB],
+                None,
+            ),
+            ("_get_all_math",): ([Atspi.Role.MATH], None),
+            ("_get_all_radio_buttons",): ([Atspi.Role.RADIO_BUTTON], None),
+            ("_get_all_separators",): ([Atspi.Role.SEPARATOR], None),
+            ("_get_all_tables",): ([Atspi.Role.TABLE], is_not_layout_table),
+            ("_get_all_links",): ([Atspi.Role.LINK], AXUtilities.is_focusable),
+        }
+
+        for level in range(1, 7):
+
+            def is_at_level(obj, level=level):
+                return AXObject.get_attribute(obj, "level") == str(level)
+
+            partitions["_get_all_headings", level] = ([Atspi.Role.HEADING], is_at_level)
+
+        return partitions
+
+    def _index_all_partitions(self, script: default.Script, root: Atspi.Accessible) -> None:
+        """Indexes the matches of every role-based document query in root with one sweep."""
+
+        if self._indexes is None:
+            return
+
+        root_key = ax_cache_manager.get_object_key(root)
+        found = AXUtilities.find_all_partitioned_by_role(root, self._partitions)
+        for (name, *args), matches in found.items():
+            key = (root_key, name, *args)
+            if self._indexes.get(key) is not ax_cache_manager.MISSING:
+                continue
+            func = getattr(self, name).__wrapped__
+            query = functools.partial(func, self, script, *args)
+            self._indexes.put(key, _StructuralIndex(query, matches))
+
+        tokens = ["STRUCTURAL NAVIGATOR:", f"indexed {len(found)} queries in", root]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
     def _get_commands(self) -> list[Command]:
         return structural_navigator_command_definitions.get_commands(self)
 
@@ -549,10 +724,50 @@ class StructuralNavigator(Extension):
         if should_wrap is None:
             should_wrap = self.get_navigation_wraps()
 
+        if isinstance(objects, _StructuralIndex):
+            result = self._find_in_index(objects, is_next, nav_type, should_wrap, notify_user)
+            if result is None or not AXObject.is_dead(result):
+                return result
+
+            tokens = ["STRUCTURAL NAVIGATOR: Result", result, "is dead. Rebuilding index."]
+            debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+            objects.rebuild()
+            if not objects:
+                return None
+            return self._find_in_index(objects, is_next, nav_type, should_wrap, notify_user)
+
         index_by_object = {match: i for i, match in enumerate(objects)}
 
         # If we're in a matching object, return the next/previous one in the list.
         obj = focus_manager.get_manager().get_locus_of_focus()
+        index = self._get_index_of_containing_match(obj, index_by_object, is_next, nav_type)
+        if index is not None:
+            return self._get_adjacent_or_wrap(objects, index, is_next, should_wrap, notify_user)
+
+        # If we're not in a matching object, find the next/previous one based on the path.
+        ordered = objects if is_next else objects[::-1]
+        current_path = AXObject.get_path(obj)
+        for match in ordered:
+            path = AXObject.get_path(match)
+            comparison = AXUtilities.path_comparison(path, current_path)
+            # A descendant of the focused object is always "after" it in path terms,
+            # but the caret may have already moved past that descendant's location.
+            if comparison > 0 and self._caret_is_past_descendant(obj, match):
+                comparison = -1
+            if (comparison > 0 and is_next) or (comparison < 0 and not is_next):
+                return match
+
+        return self._wrap(obj, ordered[0], is_next, should_wrap, notify_user)
+
+    def _get_index_of_containing_match(
+        self,
+        obj: Atspi.Accessible,
+        index_by_object: dict[Atspi.Accessible, int],
+        is_next: bool,
+        nav_type: NavigationType,
+    ) -> int | None:
+        """Returns the index of the match which is or contains obj, or None if there is none."""
+
         candidate = obj
         while candidate:
             if (index := index_by_object.get(candidate)) is None:
@@ -563,29 +778,58 @@ class StructuralNavigator(Extension):
                 alternative = self._get_container_for_nested_item(candidate, nav_type)
                 if (alternative_index := index_by_object.get(alternative)) is not None:
                     index = alternative_index
+            return index
 
-            return self._get_adjacent_or_wrap(
-                objects,
-                index,
-                is_next,
-                should_wrap,
-                notify_user,
-            )
+        return None
 
-        # If we're not in a matching object, find the next/previous one based on the path.
-        if not is_next:
-            objects.reverse()
+    def _find_in_index(
+        self,
+        objects: _StructuralIndex,
+        is_next: bool,
+        nav_type: NavigationType,
+        should_wrap: bool,
+        notify_user: bool,
+    ) -> Atspi.Accessible | None:
+        """Returns the next/previous match in objects by searching on the path of the focus."""
+
+        obj = focus_manager.get_manager().get_locus_of_focus()
+        positions = objects.get_positions()
+        index = self._get_index_of_containing_match(obj, positions, is_next, nav_type)
+        if index is not None:
+            return self._get_adjacent_or_wrap(objects, index, is_next, should_wrap, notify_user)
 
+        # The matches after the focus begin with its descendants, if any. The caret is past a
+        # prefix of those descendants, so the first one it is not past is also found by bisection.
         current_path = AXObject.get_path(obj)
-        for match in objects:
-            path = AXObject.get_path(match)
-            comparison = AXUtilities.path_comparison(path, current_path)
-            # A descendant of the focused object is always "after" it in path terms,
-            # but the caret may have already moved past that descendant's location.
-            if comparison > 0 and self._caret_is_past_descendant(obj, match):
-                comparison = -1
-            if (comparison > 0 and is_next) or (comparison < 0 and not is_next):
-                return match
+        start = objects.bisect_right(current_path)
+        end = objects.bisect_left([*current_path, float("inf")])
+        low, high = start, end
+        while low < high:
+            middle = (low + high) // 2
+            if self._caret_is_past_descendant(obj, objects[middle]):
+                low = middle + 1
+            else:
+                high = middle
+
+        if is_next and low < len(objects):
+            return objects[low]
+        if not is_next:
+            previous = low if low > start else objects.bisect_left(current_path)
+            if previous > 0:
+                return objects[previous - 1]
+
+        target = objects[0] if is_next else objects[-1]
+        return self._wrap(obj, target, is_next, should_wrap, notify_user)
+
+    @staticmethod
+    def _wrap(
+        obj: Atspi.Accessible,
+        target: Atspi.Accessible,
+        is_next: bool,
+        should_wrap: bool,
+        notify_user: bool,
+    ) -> Atspi.Accessible | None:
+        """Returns target unless it is obj, presenting the wrap message if wrapping is enabled."""
 
         if not should_wrap:
             return None
@@ -593,7 +837,7 @@ class StructuralNavigator(Extension):
         wrap_msg = messages.WRAPPING_TO_TOP if is_next else messages.WRAPPING_TO_BOTTOM
         if notify_user:
             presentation_manager.get_manager().present_message(wrap_msg)
-        return objects[0] if obj != objects[0] else None
+        return target if obj != target else None
 
     def _caret_is_past_descendant(
         self,
@@ -846,6 +1090,10 @@ class StructuralNavigator(Extension):
         debug.print_tokens(debug.LEVEL_INFO, tokens, True)
         return root
 
+    @staticmethod
+    def _is_not_document_descendant(obj: Atspi.Accessible) -> bool:
+        return not AXUtilities.is_document_descendant(obj, inclusive=True)
+
     def _is_non_document_object(self, obj: Atspi.Accessible, must_be_showing: bool = True) -> bool:
         if AXUtilities.is_document_descendant(obj, inclusive=True):
             return False
@@ -857,10 +1105,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_annotations(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_annotations(root, pred=pred)
@@ -916,10 +1165,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_blockquotes(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_block_quotes(root, pred=pred)
@@ -962,10 +1212,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_buttons(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_buttons(root, pred=pred)
@@ -1008,10 +1259,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_checkboxes(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_check_boxes(root, pred=pred)
@@ -1127,10 +1379,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_comboboxes(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_combo_boxes(root, pred=pred)
@@ -1173,17 +1426,15 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_entries(self, script: default.Script) -> list[Atspi.Accessible]:
         def parent_is_not_editable(obj):
             parent = AXObject.get_parent(obj)
             return parent is not None and not AXUtilities.is_editable(parent)
 
+        pred: Callable[[Atspi.Accessible], bool] = parent_is_not_editable
         if self.get_mode(script) == NavigationMode.GUI:
-
-            def pred(x):
-                return self._is_non_document_object(x)
-        else:
-            pred = parent_is_not_editable
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_editable_objects(root, pred=pred)
@@ -1226,16 +1477,17 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
-    def _get_all_form_fields(self, script: default.Script) -> list[Atspi.Accessible]:
-        def is_not_noneditable_doc_frame(obj):
-            if AXUtilities.is_document_frame(obj):
-                return AXUtilities.is_editable(obj)
-            return True
+    @staticmethod
+    def _is_not_noneditable_document_frame(obj: Atspi.Accessible) -> bool:
+        if AXUtilities.is_document_frame(obj):
+            return AXUtilities.is_editable(obj)
+        return True
 
-        def pred(x):
-            if self.get_mode(script) == NavigationMode.GUI:
-                return self._is_non_document_object(x)
-            return is_not_noneditable_doc_frame(x)
+    @indexed_query
+    def _get_all_form_fields(self, script: default.Script) -> list[Atspi.Accessible]:
+        pred: Callable[[Atspi.Accessible], bool] = self._is_not_noneditable_document_frame
+        if self.get_mode(script) == NavigationMode.GUI:
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_form_fields(root, pred=pred)
@@ -1282,6 +1534,7 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_headings(
         self,
         script: default.Script,
@@ -1289,7 +1542,7 @@ class StructuralNavigator(Extension):
     ) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         if level is None:
@@ -1553,10 +1806,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_iframes(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_internal_frames(root, pred=pred)
@@ -1659,10 +1913,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_landmarks(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_landmarks(root, pred=pred)
@@ -1720,10 +1975,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_lists(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_lists(
@@ -1778,10 +2034,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_list_items(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_list_items(
@@ -1829,10 +2086,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_live_regions(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_live_regions(root, pred=pred)
@@ -1883,10 +2141,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_math(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_math(root, pred=pred)
@@ -1984,10 +2243,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_radio_buttons(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_radio_buttons(root, pred=pred)
@@ -2040,10 +2300,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_separators(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_separators(root, pred=pred)
@@ -2072,10 +2333,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_tables(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_tables(root, pred=pred)
@@ -2144,7 +2406,7 @@ class StructuralNavigator(Extension):
     def _get_all_unvisited_links(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_unvisited_links(root, pred=pred)
@@ -2202,7 +2464,7 @@ class StructuralNavigator(Extension):
     def _get_all_visited_links(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_visited_links(root, pred=pred)
@@ -2255,10 +2517,11 @@ class StructuralNavigator(Extension):
     #                      #
     ########################
 
+    @indexed_query
     def _get_all_links(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         return AXUtilities.find_all_links(root, pred=pred)
@@ -2308,7 +2571,7 @@ class StructuralNavigator(Extension):
     def _get_all_clickables(self, script: default.Script) -> list[Atspi.Accessible]:
         pred = None
         if self.get_mode(script) == NavigationMode.GUI:
-            pred = self._is_non_document_object
+            pred = self._non_document_object
 
         root = self._determine_root_container(script)
         result = AXUtilities.find_all_clickables(root, pred=pred)
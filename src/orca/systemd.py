@@ -97,8 +97,26 @@ class Systemd:
 
     def _ping_watchdog(self) -> None:
         """Send a watchdog ping and update last-ping timestamp"""
+        # Ping first: we are already late, and the dump below must not make us later.
+        now = time.time()
+        elapsed_ms = (now - self._last_ping) * 1000
         self._notify(b"WATCHDOG=1")
-        self._last_ping = time.time()
+        last_ping = self._last_ping
+        self._last_ping = now
+
+        # We normally ping every quarter of the deadline. A gap of three quarters means the main
+        # loop came close to being stalled long enough for systemd to restart us.
+        if (
+            last_ping
+            and self._watchdog_interval
+            and (elapsed_ms >= self._watchdog_interval * 3 // 4)
+        ):
+            msg = (
+                f"SYSTEMD: Watchdog ping is {elapsed_ms:.0f} ms after the last one "
+                f"(deadline: {self._watchdog_interval} ms)"
+            )
+            debug.print_message(debug.LEVEL_SEVERE, msg, True)
+            debug.dump_flight_recorder(msg, automatic=True, background=True)
 
     def notify_alive(self, reason: str = "") -> None:
         """Tell systemd that Orca is still alive"""
@@ -0,0 +1,126 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Configures the local mirror of the text of accessible objects."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from . import ax_text_mirror, dbus_service, debug, gsettings_registry
+
+if TYPE_CHECKING:
+    from .dbus_service import UInt32
+
+
+@gsettings_registry.get_registry().gsettings_schema(
+    "org.gnome.Orca.TextMirror",
+    name="text-mirror",
+)
+class TextMirrorManager:
+    """Configures the local mirror of the text of accessible objects."""
+
+    _SCHEMA = "text-mirror"
+    KEY_ENABLED = "enabled"
+    KEY_MAX_CHARACTERS = "max-characters"
+
+    def __init__(self) -> None:
+        dbus_service.get_remote_controller().register_decorated_module("TextMirrorManager", self)
+
+    def apply_settings(self) -> None:
+        """Applies the current settings to the text mirror."""
+
+        mirror = ax_text_mirror.get_mirror()
+        mirror.set_max_characters(self.get_max_characters())
+        mirror.set_enabled(self.get_is_enabled())
+
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_ENABLED,
+        schema="text-mirror",
+        gtype="b",
+        default=False,
+        summary="Mirror the text of editors and terminals to reduce accessibility calls",
+    )
+    @dbus_service.getter
+    def get_is_enabled(self) -> bool:
+        """Returns whether the text of editors and terminals is mirrored locally."""
+
+        return gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_ENABLED,
+            "b",
+            default=False,
+        )
+
+    @dbus_service.setter
+    def set_is_enabled(self, value: bool) -> bool:
+        """Sets whether the text of editors and terminals is mirrored locally."""
+
+        msg = f"TEXT MIRROR MANAGER: Setting enabled to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(self._SCHEMA, self.KEY_ENABLED, value)
+        ax_text_mirror.get_mirror().set_enabled(value)
+        return True
+
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_MAX_CHARACTERS,
+        schema="text-mirror",
+        gtype="i",
+        default=1000000,
+        summary="Maximum number of characters mirrored per object",
+    )
+    @dbus_service.getter
+    def get_max_characters(self) -> UInt32:
+        """Returns the maximum number of characters mirrored per object."""
+
+        return gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_MAX_CHARACTERS,
+            "i",
+            default=1000000,
+        )
+
+    @dbus_service.setter
+    def set_max_characters(self, value: UInt32) -> bool:
+        """Sets the maximum number of characters mirrored per object."""
+
+        if value <= 0:
+            msg = f"TEXT MIRROR MANAGER: Invalid maximum number of characters: {value}."
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return False
+
+        msg = f"TEXT MIRROR MANAGER: Setting maximum number of characters to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(
+            self._SCHEMA,
+            self.KEY_MAX_CHARACTERS,
+            value,
+        )
+        ax_text_mirror.get_mirror().set_max_characters(value)
+        return True
+
+
+_manager: TextMirrorManager = TextMirrorManager()
+
+
+def get_manager() -> TextMirrorManager:
+    """Returns the Text Mirror Manager singleton."""
+
+    return _manager
@@ -0,0 +1,327 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Records a timeline of event processing and presentation in Trace Event Format."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import gi
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi
+
+from . import dbus_service, debug
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from . import input_event
+    from .scripts import default
+
+
+class TraceRecorder:
+    """Records a timeline of event processing and presentation in Trace Event Format.
+
+    The file written can be loaded in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+    Tracing is off unless the ORCA_TRACE environment variable names the file to write, or the
+    StartTracing D-Bus command is used. When off, each instrumented call costs one check.
+    """
+
+    # The AT-SPI interfaces whose functions are timed while tracing. The functions are wrapped
+    # when tracing starts and restored when it stops.
+    ATSPI_INTERFACES = (
+        "Accessible",
+        "Action",
+        "Collection",
+        "Component",
+        "Document",
+        "EditableText",
+        "Hyperlink",
+        "Hypertext",
+        "Image",
+        "Selection",
+        "Table",
+        "TableCell",
+        "Text",
+        "Value",
+    )
+    MAX_EVENTS = 1000000
+
+    def __init__(self) -> None:
+        self._active: bool = False
+        self._path: str = ""
+        self._events: list[dict[str, Any]] = []
+        self._dropped: int = 0
+        self._async_ids = itertools.count(1)
+        self._wrapped: list[tuple[type, str, Any]] = []
+        dbus_service.get_remote_controller().register_decorated_module("TraceRecorder", self)
+        if path := os.environ.get("ORCA_TRACE"):
+            self._start(path)
+
+    def is_active(self) -> bool:
+        """Returns True if a trace is being recorded."""
+
+        return self._active
+
+    def _add(self, event: dict[str, Any]) -> None:
+        """Adds event to the trace unless the trace is full."""
+
+        if len(self._events) >= self.MAX_EVENTS:
+            self._dropped += 1
+            return
+
+        event["pid"] = os.getpid()
+        event["tid"] = threading.get_native_id()
+        self._events.append(event)
+
+    @staticmethod
+    def _now() -> float:
+        """Returns the current time in microseconds, the unit of the Trace Event Format."""
+
+        return time.perf_counter_ns() / 1000
+
+    @contextlib.contextmanager
+    def slice(
+        self,
+        name: str,
+        category: str,
+        args: dict[str, Any] | None = None,
+    ) -> Iterator[None]:
+        """Records the with-block as a slice on the current thread's track."""
+
+        if not self._active:
+            yield
+            return
+
+        start = self._now()
+        try:
+            yield
+        finally:
+            event = {"ph": "X", "name": name, "cat": category, "ts": start}
+            event["dur"] = self._now() - start
+            if args:
+                event["args"] = args
+            self._add(event)
+
+    @contextlib.contextmanager
+    def async_slice(self, name: str, category: str) -> Iterator[None]:
+        """Records the with-block as an async slice, e.g. for work done on a worker thread."""
+
+        if not self._active:
+            yield
+            return
+
+        async_id = next(self._async_ids)
+        self._add({"ph": "b", "name": name, "cat": category, "id": async_id, "ts": self._now()})
+        try:
+            yield
+        finally:
+            self._add({"ph": "e", "name": name, "cat": category, "id": async_id, "ts": self._now()})
+
+    def instant(self, name: str, category: str, args: dict[str, Any] | None = None) -> None:
+        """Records a point in time on the current thread's track."""
+
+        if not self._active:
+            return
+
+        event = {"ph": "i", "s": "t", "name": name, "cat": category, "ts": self._now()}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def _trace_function(self, name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        """Returns a wrapper which records each call of the AT-SPI function as a slice."""
+
+        @functools.wraps(function)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.slice(name, "atspi"):
+                return function(*args, **kwargs)
+
+        return _wrapper
+
+    def _wrap_atspi_functions(self) -> None:
+        """Replaces the functions of ATSPI_INTERFACES with ones which record slices."""
+
+        for interface_name in self.ATSPI_INTERFACES:
+            interface = getattr(Atspi, interface_name, None)
+            if interface is None:
+                continue
+
+            for name in dir(interface):
+                if name.startswith(("_", "new")):
+                    continue
+                function = getattr(interface, name, None)
+                static = inspect.getattr_static(interface, name, None)
+                if (
+                    not callable(function)
+                    or isinstance(function, type)
+                    or isinstance(static, (staticmethod, classmethod))
+                    or name not in vars(interface)
+                ):
+                    continue
+                setattr(interface, name, self._trace_function(f"{interface_name}.{name}", function))
+                self._wrapped.append((interface, name, static))
+
+        msg = f"TRACE RECORDER: Timing {len(self._wrapped)} AT-SPI functions."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+
+    def _unwrap_atspi_functions(self) -> None:
+        """Restores the functions replaced by _wrap_atspi_functions."""
+
+        for interface, name, original in reversed(self._wrapped):
+            setattr(interface, name, original)
+        self._wrapped = []
+
+    def _start(self, path: str) -> bool:
+        """Starts recording a trace which will be written to path."""
+
+        if self._active:
+            msg = f"TRACE RECORDER: Already recording a trace to {self._path}."
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return False
+
+        msg = f"TRACE RECORDER: Recording a trace to {path}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        self._path = path
+        self._events = []
+        self._dropped = 0
+        self._wrap_atspi_functions()
+        self._active = True
+        return True
+
+    def _stop(self) -> str:
+        """Stops recording and writes the trace, returning the path or "" on failure."""
+
+        if not self._active:
+            return ""
+
+        self._active = False
+        self._unwrap_atspi_functions()
+        events, self._events = self._events, []
+
+        thread_names = [
+            {
+                "ph": "M",
+                "name": "thread_name",
+                "pid": os.getpid(),
+                "tid": thread.native_id,
+                "args": {"name": thread.name},
+            }
+            for thread in threading.enumerate()
+            if thread.native_id is not None
+        ]
+        trace = {
+            "traceEvents": thread_names + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"droppedEvents": self._dropped},
+        }
+
+        try:
+            with open(self._path, "w", encoding="utf-8") as trace_file:
+                json.dump(trace, trace_file)
+        except (OSError, TypeError, ValueError) as error:
+            msg = f"TRACE RECORDER: Could not write trace to {self._path}: {error}"
+            debug.print_message(debug.LEVEL_WARNING, msg, True)
+            return ""
+
+        msg = (
+            f"TRACE RECORDER: Wrote {len(events)} trace events to {self._path}. "
+            f"Dropped: {self._dropped}."
+        )
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        return self._path
+
+    def shutdown(self) -> None:
+        """Writes the trace being recorded, if any. Called when Orca exits."""
+
+        self._stop()
+
+    @dbus_service.getter
+    def get_is_tracing(self) -> bool:
+        """Returns True if a trace is being recorded."""
+
+        return self._active
+
+    @dbus_service.parameterized_command
+    def start_tracing(
+        self,
+        path: str,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = False,
+    ) -> bool:
+        """Starts recording a trace of event processing to be written to path."""
+
+        tokens = [
+            "TRACE RECORDER: start_tracing. Path:",
+            path,
+            "Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        if not path:
+            return False
+
+        return self._start(os.path.expanduser(path))
+
+    @dbus_service.command
+    def stop_tracing(
+        self,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = True,
+    ) -> bool:
+        """Stops recording the trace of event processing and writes it to its file."""
+
+        tokens = [
+            "TRACE RECORDER: stop_tracing. Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        return bool(self._stop())
+
+
+_recorder: TraceRecorder = TraceRecorder()
+
+
+def get_recorder() -> TraceRecorder:
+    """Returns the Trace Recorder singleton."""
+
+    return _recorder
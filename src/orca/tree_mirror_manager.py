@@ -0,0 +1,170 @@
+# Orca
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Configures and reports on the local mirror of the accessible tree of documents."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from . import ax_tree_mirror, dbus_service, debug, gsettings_registry
+
+if TYPE_CHECKING:
+    from . import input_event
+    from .dbus_service import UInt32
+    from .scripts import default
+
+
+@gsettings_registry.get_registry().gsettings_schema(
+    "org.gnome.Orca.TreeMirror",
+    name="tree-mirror",
+)
+class TreeMirrorManager:
+    """Configures and reports on the local mirror of the accessible tree of documents."""
+
+    _SCHEMA = "tree-mirror"
+    KEY_ENABLED = "enabled"
+    KEY_MAX_OBJECTS = "max-objects"
+
+    def __init__(self) -> None:
+        dbus_service.get_remote_controller().register_decorated_module("TreeMirrorManager", self)
+
+    def apply_settings(self) -> None:
+        """Applies the current settings to the tree mirror."""
+
+        mirror = ax_tree_mirror.get_mirror()
+        mirror.set_max_objects(self.get_max_objects())
+        mirror.set_enabled(self.get_is_enabled())
+
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_ENABLED,
+        schema="tree-mirror",
+        gtype="b",
+        default=False,
+        summary="Mirror the structure of documents to reduce accessibility calls",
+    )
+    @dbus_service.getter
+    def get_is_enabled(self) -> bool:
+        """Returns whether the structure of documents is mirrored locally."""
+
+        return gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_ENABLED,
+            "b",
+            default=False,
+        )
+
+    @dbus_service.setter
+    def set_is_enabled(self, value: bool) -> bool:
+        """Sets whether the structure of documents is mirrored locally."""
+
+        msg = f"TREE MIRROR MANAGER: Setting enabled to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(self._SCHEMA, self.KEY_ENABLED, value)
+        ax_tree_mirror.get_mirror().set_enabled(value)
+        return True
+
+    @gsettings_registry.get_registry().gsetting(
+        key=KEY_MAX_OBJECTS,
+        schema="tree-mirror",
+        gtype="i",
+        default=20000,
+        summary="Maximum number of objects mirrored per document",
+    )
+    @dbus_service.getter
+    def get_max_objects(self) -> UInt32:
+        """Returns the maximum number of objects mirrored per document."""
+
+        return gsettings_registry.get_registry().layered_lookup(
+            self._SCHEMA,
+            self.KEY_MAX_OBJECTS,
+            "i",
+            default=20000,
+        )
+
+    @dbus_service.setter
+    def set_max_objects(self, value: UInt32) -> bool:
+        """Sets the maximum number of objects mirrored per document."""
+
+        if value <= 0:
+            msg = f"TREE MIRROR MANAGER: Invalid maximum number of objects: {value}."
+            debug.print_message(debug.LEVEL_INFO, msg, True)
+            return False
+
+        msg = f"TREE MIRROR MANAGER: Setting maximum number of objects to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        gsettings_registry.get_registry().set_runtime_value(
+            self._SCHEMA,
+            self.KEY_MAX_OBJECTS,
+            value,
+        )
+        ax_tree_mirror.get_mirror().set_max_objects(value)
+        return True
+
+    @dbus_service.getter
+    def get_verify_reads(self) -> bool:
+        """Returns whether each read of the mirror is compared with the accessibility tree."""
+
+        return ax_tree_mirror.get_mirror().get_verify_reads()
+
+    @dbus_service.setter
+    def set_verify_reads(self, value: bool) -> bool:
+        """Sets whether each read of the mirror is compared with the accessibility tree."""
+
+        msg = f"TREE MIRROR MANAGER: Setting verify reads to {value}."
+        debug.print_message(debug.LEVEL_INFO, msg, True)
+        ax_tree_mirror.get_mirror().set_verify_reads(value)
+        return True
+
+    @dbus_service.getter
+    def get_statistics(self) -> dict[str, int]:
+        """Returns the number of mirrored documents and objects."""
+
+        return ax_tree_mirror.get_mirror().get_statistics()
+
+    @dbus_service.command
+    def check_consistency(
+        self,
+        script: default.Script | None = None,
+        event: input_event.InputEvent | None = None,
+        notify_user: bool = True,
+    ) -> bool:
+        """Compares the mirror with the accessibility tree, logging each mismatch."""
+
+        tokens = [
+            "TREE MIRROR MANAGER: check_consistency. Script:",
+            script,
+            "Event:",
+            event,
+            "notify_user:",
+            notify_user,
+        ]
+        debug.print_tokens(debug.LEVEL_INFO, tokens, True)
+
+        return not ax_tree_mirror.get_mirror().check_consistency()
+
+
+_manager: TreeMirrorManager = TreeMirrorManager()
+
+
+def get_manager() -> TreeMirrorManager:
+    """Returns the Tree Mirror Manager singleton."""
+
+    return _manager
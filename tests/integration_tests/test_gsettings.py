@@ -46,6 +46,7 @@ class TestSchemaRegistration:
             "caret-navigation",
             "chat",
             "document",
+            "event-manager",
             "extensions",
             "flat-review",
             "keybindings",
@@ -63,6 +64,8 @@ class TestSchemaRegistration:
             "system-information",
             "table-navigation",
             "text-attributes",
+            "text-mirror",
+            "tree-mirror",
             "typing-echo",
             "voice",
         }
@@ -0,0 +1,497 @@
+# Orca Event Replay - Recorded AT-SPI event streams as benchmarks
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+# pylint: disable=unused-argument
+
+"""Replays recorded AT-SPI event streams through the event manager.
+
+Recordings are made with `tools/dump-events.py --save FILE`. Each one holds the events
+received from an application plus a snapshot of the objects those events touched. The
+replayer turns the snapshot into mock accessibles, feeds the events to the event manager
+in the bursts in which they arrived, and reports how many events were dispatched, how
+long that took, and the latency of each stage. Because time.time() follows the recorded
+timestamps and speech goes to a null server, the same recording always produces the same
+dispatch decisions, so it can run in CI without a desktop session.
+
+Usage:
+    def test_slack_channel_load(test_context, tmp_path):
+        recording = EventRecording.load("slack-channel-load.json.gz")
+        result = EventReplayer(test_context, recording).run()
+        print(result.summary())
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import gi
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi  # pylint: disable=wrong-import-position
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from .orca_test_context import OrcaTestContext
+
+# Must match RECORDING_VERSION in tools/dump-events.py.
+RECORDING_VERSION = 1
+
+
+class EventRecording:
+    """An AT-SPI event stream plus a snapshot of the objects it touches."""
+
+    def __init__(
+        self,
+        application: str,
+        nodes: dict[int, dict[str, Any]],
+        events: list[list[Any]],
+    ) -> None:
+        self.application = application
+        self.nodes = nodes
+        self.events = events
+
+    @classmethod
+    def load(cls, path: str) -> EventRecording:
+        """Returns the recording saved at path, which may be gzip-compressed."""
+
+        with open(path, "rb") as recording_file:
+            data = recording_file.read()
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+
+        recording = json.loads(data)
+        version = recording.get("version")
+        if version != RECORDING_VERSION:
+            msg = f"Unsupported recording version {version} in {path}"
+            raise ValueError(msg)
+
+        nodes = {int(node_id): node for node_id, node in recording["nodes"].items()}
+        return cls(recording.get("application", ""), nodes, recording["events"])
+
+    def save(self, path: str) -> None:
+        """Saves this recording to path, gzip-compressed if path ends in .gz."""
+
+        recording = {
+            "version": RECORDING_VERSION,
+            "application": self.application,
+            "nodes": self.nodes,
+            "events": self.events,
+        }
+        data = json.dumps(recording, separators=(",", ":")).encode("utf-8")
+        if path.endswith(".gz"):
+            data = gzip.compress(data)
+        with open(path, "wb") as recording_file:
+            recording_file.write(data)
+
+
+class NullSpeechServer:
+    """Stands in for the speech server, noting when speech would have started."""
+
+    def __init__(self) -> None:
+        self.utterances = 0
+
+    def speak(self, text: str | None = None, acss: Any = None) -> None:
+        """Discards text, recording the output like the real servers do."""
+
+        if not text:
+            return
+
+        from orca import latency_tracker
+
+        latency_tracker.get_tracker().note_output("speech")
+        self.utterances += 1
+
+    def stop(self) -> None:
+        """Does nothing; there is no speech to stop."""
+
+
+class _ReplayEvent:
+    """A recorded event with the attributes of Atspi.Event the event manager uses."""
+
+    __slots__ = ("any_data", "detail1", "detail2", "source", "type")
+
+    def __init__(
+        self,
+        event_type: str,
+        source: Any,
+        detail1: int,
+        detail2: int,
+        any_data: Any,
+    ) -> None:
+        self.type = event_type
+        self.source = source
+        self.detail1 = detail1
+        self.detail2 = detail2
+        self.any_data = any_data
+
+
+class _ReplayTree:
+    """The mock accessibles of a recording, and the recorded facts about them."""
+
+    MENU_RELATED_ROLES: ClassVar[set[Atspi.Role]] = {
+        Atspi.Role.CHECK_MENU_ITEM,
+        Atspi.Role.MENU,
+        Atspi.Role.MENU_BAR,
+        Atspi.Role.MENU_ITEM,
+        Atspi.Role.RADIO_MENU_ITEM,
+        Atspi.Role.TEAROFF_MENU_ITEM,
+    }
+    LIVE_REGION_ROLES: ClassVar[set[Atspi.Role]] = {
+        Atspi.Role.LOG,
+        Atspi.Role.MARQUEE,
+        Atspi.Role.TIMER,
+    }
+
+    def __init__(self, test_context: OrcaTestContext, nodes: dict[int, dict[str, Any]]) -> None:
+        self.desktop = test_context.Mock(name="desktop")
+        self._objects = {node_id: test_context.Mock(name=f"node-{node_id}") for node_id in nodes}
+        self._nodes: dict[Any, dict[str, Any]] = {}
+        for node_id, node in nodes.items():
+            nick = node.get("role", "").replace("-", "_").replace(" ", "_").upper()
+            self._nodes[self._objects[node_id]] = {
+                "name": node.get("name", ""),
+                "role": getattr(Atspi.Role, nick, Atspi.Role.INVALID),
+                "states": set(node.get("states", [])),
+                "parent": self.get_object(node.get("parent")),
+                "app": self.get_object(node.get("app")),
+            }
+
+    def get_object(self, node_id: int | None) -> Any:
+        """Returns the mock accessible for node_id."""
+
+        if node_id is None:
+            return None
+        return self._objects.get(node_id)
+
+    def get(self, obj: Any, key: str, default: Any = None) -> Any:
+        """Returns the recorded key of obj."""
+
+        node = self._nodes.get(obj)
+        if node is None:
+            return default
+        return node[key]
+
+    def has_state(self, obj: Any, state: str) -> bool:
+        """Returns True if obj was recorded with state."""
+
+        return state in self.get(obj, "states", ())
+
+
+class _ReplayAXObject:
+    """Answers the AXObject queries of the event manager from the recorded snapshot."""
+
+    def __init__(self, tree: _ReplayTree) -> None:
+        self._tree = tree
+
+    def get_name(self, obj: Any) -> str:
+        """Returns the recorded name of obj."""
+
+        return self._tree.get(obj, "name", "")
+
+    def get_role(self, obj: Any) -> Atspi.Role:
+        """Returns the recorded role of obj."""
+
+        return self._tree.get(obj, "role", Atspi.Role.INVALID)
+
+    def get_parent(self, obj: Any) -> Any:
+        """Returns the recorded parent of obj."""
+
+        return self._tree.get(obj, "parent")
+
+    def get_state_set(self, obj: Any) -> set[str]:
+        """Returns the recorded states of obj."""
+
+        return self._tree.get(obj, "states", set())
+
+    def is_dead(self, obj: Any, app: Any = None) -> bool:
+        """Returns True if obj was recorded as defunct."""
+
+        return obj is not None and self._tree.has_state(obj, "defunct")
+
+    @staticmethod
+    def get_attribute(obj: Any, name: str) -> None:
+        """Returns None; object attributes are not recorded."""
+
+        return None
+
+    @staticmethod
+    def check_hung(obj: Any, app: Any = None) -> bool:
+        """Returns False; recorded applications are never hung."""
+
+        return False
+
+    @staticmethod
+    def object_is_known_dead(obj: Any) -> bool:
+        """Returns False; objects are only dead if recorded as defunct."""
+
+        return False
+
+    @staticmethod
+    def revalidate_if_known_dead(obj: Any) -> bool:
+        """Returns False; dead objects cannot be revalidated."""
+
+        return False
+
+
+class _ReplayAXUtilities:
+    """Answers the AXUtilities queries of the event manager from the recorded snapshot."""
+
+    def __init__(self, tree: _ReplayTree) -> None:
+        self._tree = tree
+
+    def __getattr__(self, name: str) -> Any:
+        """Returns a role or state check for is_<role> and is_<state>, else one returning False."""
+
+        tree = self._tree
+        suffix = name.removeprefix("is_").upper()
+        if name.startswith("is_") and hasattr(Atspi.Role, suffix):
+            role = getattr(Atspi.Role, suffix)
+            return lambda obj, *_args: tree.get(obj, "role") == role
+        if name.startswith("is_") and hasattr(Atspi.StateType, suffix):
+            state = suffix.lower().replace("_", "-")
+            return lambda obj, *_args: tree.has_state(obj, state)
+        return lambda *_args: False
+
+    def get_application(self, obj: Any) -> Any:
+        """Returns the recorded application of obj."""
+
+        return self._tree.get(obj, "app")
+
+    def get_desktop(self) -> Any:
+        """Returns the desktop, which is not part of the snapshot."""
+
+        return self._tree.desktop
+
+    def is_mutter_x11_frames(self, app: Any) -> bool:
+        """Returns True if app is the mutter-x11-frames application."""
+
+        return self._tree.get(app, "name") == "mutter-x11-frames"
+
+    def is_dialog_or_alert(self, obj: Any, *_args: Any) -> bool:
+        """Returns True if obj is a dialog or alert."""
+
+        return self._tree.get(obj, "role") in (Atspi.Role.DIALOG, Atspi.Role.ALERT)
+
+    def is_menu_related(self, obj: Any, *_args: Any) -> bool:
+        """Returns True if obj is a menu or menu item."""
+
+        return self._tree.get(obj, "role") in _ReplayTree.MENU_RELATED_ROLES
+
+    def has_live_region_role(self, obj: Any, *_args: Any) -> bool:
+        """Returns True if obj has an implicitly live role."""
+
+        return self._tree.get(obj, "role") in _ReplayTree.LIVE_REGION_ROLES
+
+    def manages_descendants(self, obj: Any, *_args: Any) -> bool:
+        """Returns True if obj was recorded as managing its descendants."""
+
+        return self._tree.has_state(obj, "manages-descendants")
+
+    @staticmethod
+    def is_application_in_desktop(app: Any) -> bool:
+        """Returns True; recorded applications are in the desktop."""
+
+        return True
+
+    def is_invalid_role(self, obj: Any, *_args: Any) -> bool:
+        """Returns True if obj has the invalid role."""
+
+        return self._tree.get(obj, "role", Atspi.Role.INVALID) == Atspi.Role.INVALID
+
+
+@dataclass
+class ReplayResult:
+    """The outcome of replaying a recording."""
+
+    events: int
+    queued: int
+    dispatched: int
+    utterances: int
+    elapsed: float
+    obsoleted: dict[str, int] = field(default_factory=dict)
+    dropped: dict[str, int] = field(default_factory=dict)
+    latency: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def ignored(self) -> int:
+        """The number of events the event manager did not queue."""
+
+        return self.events - self.queued
+
+    @property
+    def events_per_second(self) -> float:
+        """The number of recorded events handled per second."""
+
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        """Returns a human-readable report of this result."""
+
+        lines = [
+            (
+                f"{self.events} event(s) in {self.elapsed * 1000:.1f} ms "
+                f"({self.events_per_second:.0f} events/s)"
+            ),
+            (
+                f"ignored: {self.ignored}, queued: {self.queued}, "
+                f"dispatched: {self.dispatched}, utterances: {self.utterances}"
+            ),
+            f"obsoleted: {self.obsoleted}, dropped: {self.dropped}",
+        ]
+        for event_type, stats in sorted(self.latency.items()):
+            timings = ", ".join(
+                f"{key}: {value:.3f}" for key, value in stats.items() if key.endswith("-p95")
+            )
+            lines.append(f"{event_type}: {timings}")
+        return "\n".join(lines)
+
+
+class EventReplayer:
+    """Feeds a recording through EventManager._enqueue_object_event with mock accessibles."""
+
+    def __init__(
+        self,
+        test_context: OrcaTestContext,
+        recording: EventRecording,
+        burst_gap: float = 5.0,
+        dispatch_budget: int = 0,
+    ) -> None:
+        """Prepares to replay recording.
+
+        Events less than burst_gap ms apart are queued together before the queue is drained,
+        as happens when they arrive while Orca is busy. The dispatch_budget is in ms.
+        """
+
+        self._recording = recording
+        self._burst_gap = burst_gap
+        self._clock = 0.0
+        self._dispatched = 0
+        self.speech_server = NullSpeechServer()
+        self._tree = _ReplayTree(test_context, recording.nodes)
+        self._events = [
+            _ReplayEvent(
+                event_type,
+                self._tree.get_object(source),
+                detail1,
+                detail2,
+                self._tree.get_object(any_data["ref"]) if isinstance(any_data, dict) else any_data,
+            )
+            for _timestamp, event_type, source, detail1, detail2, any_data in recording.events
+        ]
+
+        self._setup_dependencies(test_context)
+        from orca import event_manager, latency_tracker
+
+        self._tracker = latency_tracker.get_tracker()
+        self._tracker.reset_statistics(notify_user=False)
+        self._manager = event_manager.EventManager()
+        if dispatch_budget:
+            self._manager.set_dispatch_budget(dispatch_budget)
+        self._manager.activate()
+
+    def _setup_dependencies(self, test_context: OrcaTestContext) -> None:
+        """Mocks everything but the event manager, answering AX queries from the snapshot."""
+
+        # A previous replay in the same test holds references to its own mocks.
+        for module_name in ("orca.event_manager", "orca.latency_tracker"):
+            sys.modules.pop(module_name, None)
+
+        additional_modules = [
+            "orca.input_event_manager",
+            "orca.orca_modifier_manager",
+            "orca.ax_utilities_debugging",
+            "orca.ax_utilities",
+            "orca.braille_presenter",
+            "orca.systemd",
+        ]
+        essential_modules = test_context.setup_shared_dependencies(additional_modules)
+        essential_modules["orca.debug"].debugLevel = essential_modules["orca.debug"].LEVEL_SEVERE
+        essential_modules["orca.ax_object"].AXObject = _ReplayAXObject(self._tree)
+        essential_modules["orca.ax_utilities"].AXUtilities = _ReplayAXUtilities(self._tree)
+
+        input_manager = essential_modules["orca.input_event_manager"].get_manager.return_value
+        input_manager.get_keyboard_event_serial.return_value = 0
+        focus_manager = essential_modules["orca.focus_manager"].get_manager.return_value
+        focus_manager.get_locus_of_focus.return_value = None
+        focus_manager.get_active_window.return_value = None
+
+        script = self._make_script(test_context)
+        script_manager = essential_modules["orca.script_manager"].get_manager.return_value
+        script_manager.get_active_script.return_value = script
+        script_manager.get_script.return_value = script
+
+        test_context.patch("orca.event_manager.GLib.idle_add", return_value=1)
+        test_context.patch("orca.event_manager.GLib.timeout_add", return_value=1)
+        test_context.patch("time.time", side_effect=lambda: self._clock)
+
+    def _make_script(self, test_context: OrcaTestContext) -> MagicMock:
+        """Returns a script for the recorded application that speaks every event it gets."""
+
+        def on_event(event: _ReplayEvent) -> None:
+            self._dispatched += 1
+            name = self._tree.get(event.source, "name", "")
+            self.speech_server.speak(f"{event.type} {name}".strip())
+
+        script = test_context.Mock()
+        script.app = self._tree.get(self._events[0].source, "app") if self._events else None
+        script.listeners = {event.type: on_event for event in self._events}
+        script.present_if_inactive = False
+        script.is_activatable_event.return_value = True
+        script.force_script_activation.return_value = False
+        return script
+
+    def _drain(self) -> None:
+        """Dispatches queued events until the event manager is idle."""
+
+        while not self._manager.is_idle():
+            self._manager._dequeue_object_event()
+
+    def run(self) -> ReplayResult:
+        """Replays the recording and returns the result."""
+
+        start = time.perf_counter()
+        previous = None
+        for (timestamp, *_rest), event in zip(self._recording.events, self._events, strict=True):
+            if previous is not None and timestamp - previous >= self._burst_gap:
+                self._drain()
+            previous = timestamp
+            self._clock = timestamp / 1000
+            self._manager._enqueue_object_event(event)
+        self._drain()
+        elapsed = time.perf_counter() - start
+
+        return ReplayResult(
+            events=len(self._events),
+            queued=next(self._manager._counter),
+            dispatched=self._dispatched,
+            utterances=self.speech_server.utterances,
+            elapsed=elapsed,
+            obsoleted=self._manager.get_obsoleted_event_counts(),
+            dropped=self._manager.get_dropped_event_counts(),
+            latency=self._tracker.get_statistics(),
+        )
@@ -27,8 +27,10 @@ from __future__ import annotations
 
 import gc
 import sys
+import threading
 import weakref
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -98,6 +100,9 @@ class TestAXCacheManager:
         clear_on_demand: ClearPolicy = ClearPolicy.CLEAR,
         clear_interval_seconds: float | None = None,
         invalidation_groups: set[str] | frozenset[str] = frozenset(),
+        keyed_by_object: bool = False,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
     ) -> CacheAccessor:
         """Registers a cache and returns its accessor."""
 
@@ -109,6 +114,9 @@ class TestAXCacheManager:
                 clear_on_demand=clear_on_demand,
                 clear_interval_seconds=clear_interval_seconds,
                 invalidation_groups=invalidation_groups,
+                keyed_by_object=keyed_by_object,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
             )
             is True
         )
@@ -650,6 +658,445 @@ class TestAXCacheManager:
             assert memo_cache.get_scoped(scope, "key") is MISSING
             assert preserved_cache.get_scoped(scope, "key") == "value"
 
+    def test_invalidate_subtree_discards_only_affected_objects(self) -> None:
+        """Test subtree invalidation of an object, its ancestors, and its known descendants."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        by_object = self._register_cache(manager, owner, "by-object", keyed_by_object=True)
+        compound = self._register_cache(manager, owner, "compound", keyed_by_object=True)
+        by_event = self._register_cache(manager, owner, "by-event")
+        preserved = self._register_cache(
+            manager, owner, "preserved", clear_on_demand=ClearPolicy.PRESERVE, keyed_by_object=True
+        )
+
+        # document -> section -> list -> item; document -> sidebar; the list's child is changed.
+        for child, parent in (("section", "document"), ("list", "section"), ("item", "list")):
+            manager.note_parent(child, parent)
+        manager.note_parent("sidebar", "document")
+        for key in ("document", "section", "list", "item", "sidebar", "unrelated"):
+            by_object.put(key, key)
+            compound.put((key, "name"), key)
+            preserved.put(key, key)
+        by_event.put("event", "reason")
+
+        manager.invalidate_subtree("list", ["window"], "Children changed.")
+
+        for key in ("document", "section", "list", "item"):
+            assert by_object.get(key) is MISSING
+            assert compound.get((key, "name")) is MISSING
+            assert preserved.get(key) == key
+        for key in ("sidebar", "unrelated"):
+            assert by_object.get(key) == key
+            assert compound.get((key, "name")) == key
+        assert by_event.get("event") is MISSING
+
+        # The changed object's descendants are forgotten until their parents are looked up again.
+        by_object.put("section", "section")
+        manager.invalidate_subtree("item", [], "Children changed.")
+        assert by_object.get("section") == "section"
+
+    def test_invalidate_subtree_clears_scoped_values_of_affected_objects(self) -> None:
+        """Test subtree invalidation removes active scoped values for affected objects."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", keyed_by_object=True)
+        manager.note_parent("child", "parent")
+
+        with manager.begin_scope() as scope:
+            cache.put_scoped(scope, "child", "value")
+            cache.put_scoped(scope, "other", "value")
+            manager.invalidate_subtree("parent", [], "Changed.")
+            assert cache.get_scoped(scope, "child") is MISSING
+            assert cache.get_scoped(scope, "other") == "value"
+
+    def test_discard_subtree_affects_only_named_owned_caches(self) -> None:
+        """Test that discarding a subtree ignores clear policy and keeps the tree links."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        other_owner = Owner()
+        preserved = self._register_cache(
+            manager, owner, "preserved", clear_on_demand=ClearPolicy.PRESERVE, keyed_by_object=True
+        )
+        unnamed = self._register_cache(manager, owner, "unnamed", keyed_by_object=True)
+        other = self._register_cache(manager, other_owner, "preserved", keyed_by_object=True)
+        manager.note_parent("list", "section")
+        manager.note_parent("item", "list")
+        for key in ("section", "list", "item", "sidebar"):
+            preserved.put(key, key)
+            unnamed.put(key, key)
+            other.put(key, key)
+
+        assert manager.discard_subtree(owner, ["preserved"], "list", [], "Changed.") == 3
+        assert manager.discard_subtree(Owner(), ["preserved"], "list", [], "Changed.") == 0
+
+        for key in ("section", "list", "item"):
+            assert preserved.get(key) is MISSING
+            assert unnamed.get(key) == key
+            assert other.get(key) == key
+        assert preserved.get("sidebar") == "sidebar"
+        assert manager._children == {"section": {"list"}, "list": {"item"}}
+
+    def test_tree_link_limit_clears_links_and_values(self, test_context: OrcaTestContext) -> None:
+        """Test that reaching the tree link limit forgets the links and clears dependent values."""
+
+        test_context.patch_object(ax_cache_manager, "MAX_TREE_LINKS", new=2)
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", keyed_by_object=True)
+        manager.note_parent("first", "root")
+        manager.note_parent("second", "root")
+        cache.put("first", "value")
+
+        manager.note_parent("third", "root")
+
+        assert cache.get("first") is MISSING
+        assert manager._parents == {"third": "root"}
+        assert manager._children == {"root": {"third"}}
+
+    def test_note_parent_moves_reparented_child(self) -> None:
+        """Test that a child recorded under a new parent is no longer a descendant of the old."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", keyed_by_object=True)
+        manager.note_parent("child", "old")
+        manager.note_parent("child", "new")
+        cache.put("child", "value")
+
+        manager.invalidate_subtree("old", [], "Changed.")
+        assert cache.get("child") == "value"
+        manager.invalidate_subtree("new", [], "Changed.")
+        assert cache.get("child") is MISSING
+
+    def test_statistics_count_hits_and_misses(self) -> None:
+        """Test the hit and miss counts reported for each cache and reset."""
+
+        manager = AXCacheManager()
+        first_owner = Owner()
+        second_owner = Owner()
+        first = self._register_cache(manager, first_owner, "values")
+        second = self._register_cache(manager, second_owner, "values")
+        other = self._register_cache(manager, first_owner, "other")
+        first.put("key", None)
+        second.put("key", "value")
+        assert first.get("key", "default") is None
+        assert second.get("key") == "value"
+        assert second.get("missing") is MISSING
+        assert other.get("missing") is MISSING
+
+        statistics = manager.get_statistics()
+        assert statistics["values"]["hits"] == 2
+        assert statistics["values"]["misses"] == 1
+        assert statistics["values"]["entries"] == 2
+        assert statistics["other"]["hits"] == 0
+        assert statistics["other"]["misses"] == 1
+        assert statistics["other"]["entries"] == 0
+        assert manager.get_hit_rate() == pytest.approx(0.5)
+
+        manager.reset_statistics()
+        statistics = manager.get_statistics()
+        assert (statistics["values"]["hits"], statistics["values"]["misses"]) == (0, 0)
+        assert statistics["values"]["entries"] == 2
+        assert manager.get_hit_rate() == 0.0
+
+    @pytest.mark.parametrize("budget", [0, -1, 1.5, True, "10"])
+    def test_register_cache_rejects_invalid_budgets(
+        self, test_context: OrcaTestContext, budget: object
+    ) -> None:
+        """Test that budgets which are not positive integers are rejected."""
+
+        print_message = test_context.patch_object(debug, "print_message")
+        manager = AXCacheManager()
+        owner = Owner()
+        assert (
+            manager.register_cache(
+                owner,
+                "entries",
+                lifetime=Lifetime.OWNER,
+                max_entries=budget,  # type: ignore[arg-type]
+            )
+            is False
+        )
+        assert (
+            manager.register_cache(
+                owner,
+                "bytes",
+                lifetime=Lifetime.OWNER,
+                max_bytes=budget,  # type: ignore[arg-type]
+            )
+            is False
+        )
+        assert print_message.call_count == 2
+
+    def test_max_entries_evicts_values_not_read_since_stored(self) -> None:
+        """Test that a cache over its entry budget gives values which were read a second chance."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=2)
+        cache.put("first", 1)
+        cache.put("second", 2)
+        assert cache.get("first") == 1
+        cache.put("third", 3)
+
+        assert cache.get("second") is MISSING
+        assert cache.get("first") == 1
+        assert cache.get("third") == 3
+        assert manager.get_statistics()["values"]["evictions"] == 1
+
+    def test_max_entries_evicts_oldest_when_all_were_read(self) -> None:
+        """Test that eviction terminates when every value was read since it was stored."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=2)
+        cache.put("first", 1)
+        cache.put("second", 2)
+        assert cache.get("first") == 1
+        assert cache.get("second") == 2
+        cache.put("third", 3)
+
+        assert cache.get("first") is MISSING
+        assert cache.get("second") == 2
+        assert cache.get("third") == 3
+
+    def test_max_bytes_evicts_until_within_budget(self) -> None:
+        """Test that a cache over its size budget evicts values until it fits."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_bytes=1000)
+        for index in range(3):
+            cache.put(index, "x" * 300)
+        assert cache.get(0) is MISSING
+        assert cache.get(1) is not MISSING
+        assert cache.get(2) is not MISSING
+
+        cache.put("large", "x" * 2000)
+        assert cache.get("large") is MISSING
+        assert manager.get_statistics()["values"]["bytes"] <= 1000
+
+    def test_memory_usage_follows_values(self, test_context: OrcaTestContext) -> None:
+        """Test that the memory usage reflects stored, replaced, and removed values."""
+
+        clock = FakeClock()
+        manager = AXCacheManager(clock)
+        test_context.patch_object(manager, "_start_cache_cleanup_thread")
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=100)
+        assert manager.get_memory_usage() == 0
+
+        cache.put("key", "x" * 100)
+        first_usage = manager.get_memory_usage()
+        cache.put("key", "x" * 200)
+        assert manager.get_memory_usage() == first_usage + 100
+        cache.put("other", ["x" * 100], expires_at=1)
+        assert manager.get_memory_usage() > first_usage + 200
+
+        clock.now = 2
+        manager._clear_due_values()
+        cache.discard("key")
+        assert manager.get_memory_usage() == 0
+
+        cache.put("key", "value")
+        manager.invalidate_cache(owner, "values")
+        assert manager.get_memory_usage() == 0
+
+    def test_memory_limit_evicts_from_coldest_caches_first(self) -> None:
+        """Test that exceeding the memory limit evicts from the least recently used caches."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cold = self._register_cache(manager, owner, "cold", max_entries=100)
+        warm = self._register_cache(manager, owner, "warm", max_entries=100)
+        for index in range(4):
+            cold.put(index, "x" * 1000)
+            warm.put(index, "x" * 1000)
+        assert warm.get(0) is not MISSING
+
+        manager.set_memory_limit(manager.get_memory_usage() - 1)
+
+        statistics = manager.get_statistics()
+        assert statistics["cold"]["evictions"] == 1
+        assert statistics["warm"]["evictions"] == 0
+        assert cold.get(0) is MISSING
+        assert manager.get_memory_usage() <= manager._memory_limit * 0.9
+
+        manager.set_memory_limit(None)
+        cold.put("large", "x" * 100000)
+        assert cold.get("large") is not MISSING
+
+    def test_unbounded_caches_are_not_measured(self, test_context: OrcaTestContext) -> None:
+        """Test that values put in caches without a budget are stored without being measured."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values")
+        get_entry_size = test_context.patch("orca.ax_cache_manager._get_entry_size")
+        cache.put("key", {"nested": ["x" * 100]})
+        assert cache.get("key") == {"nested": ["x" * 100]}
+        get_entry_size.assert_not_called()
+        assert manager.get_statistics()["values"]["bytes"] == 0
+        assert manager.get_memory_usage() == 0
+
+    def test_memory_limit_never_evicts_from_unbounded_caches(self) -> None:
+        """Test that only caches registered with a budget give up values to the memory limit."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        state = self._register_cache(manager, owner, "state")
+        bounded = self._register_cache(manager, owner, "bounded", max_entries=100)
+        for index in range(4):
+            state.put(index, "x" * 1000)
+        bounded.put("key", "x" * 1000)
+        state.put("newest", "x" * 1000)
+
+        manager.set_memory_limit(1000)
+
+        statistics = manager.get_statistics()
+        assert statistics["state"]["evictions"] == 0
+        assert statistics["bounded"]["evictions"] == 1
+        assert all(state.get(key) is not MISSING for key in [0, 1, 2, 3, "newest"])
+        assert bounded.get("key") is MISSING
+
+        state.put("more", "x" * 1000)
+        assert state.get("more") is not MISSING
+        assert manager.get_statistics()["state"]["evictions"] == 0
+
+    def test_cache_accessor_get_does_not_wait_for_lock(self) -> None:
+        """Test that reading a cached value does not wait for another thread holding the lock."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=10)
+        cache.put("key", "value")
+        results: list[Any] = []
+
+        def _read() -> None:
+            results.append(cache.get("key"))
+            results.append(cache.get("missing", "default"))
+
+        with manager._lock:
+            reader = threading.Thread(target=_read, daemon=True)
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+
+        assert results == ["value", "default"]
+
+    def test_second_chance_is_used_up_when_passed_over(self) -> None:
+        """Test that eviction passes over read values once, in order, and then evicts them."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=3)
+        for key in ["a", "b", "c"]:
+            cache.put(key, key)
+        assert cache.get("a") == "a"
+        assert cache.get("c") == "c"
+
+        cache.put("d", "d")
+        assert cache.get("b") is MISSING
+        cache.put("e", "e")
+        assert cache.get("d") is MISSING
+        assert [cache.get(key) for key in ["a", "c", "e"]] == ["a", "c", "e"]
+
+        # Every remaining value has just been read, so each is passed over once and then evicted.
+        cache.put("f", "f")
+        cache.put("g", "g")
+        cache.put("h", "h")
+        cache.put("i", "i")
+        assert [cache.get(key) for key in ["a", "c", "e", "f"]] == [MISSING] * 4
+        assert [cache.get(key) for key in ["g", "h", "i"]] == ["g", "h", "i"]
+        assert manager.get_statistics()["values"]["evictions"] == 6
+
+    def test_replacing_a_value_makes_it_newest(self) -> None:
+        """Test that storing a value again for a key moves it behind the other values."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=2)
+        cache.put("first", 1)
+        cache.put("second", 2)
+        cache.put("first", 10)
+        cache.put("third", 3)
+
+        assert cache.get("second") is MISSING
+        assert cache.get("first") == 10
+        assert cache.get("third") == 3
+
+    def test_values_which_stay_cached_are_never_removed(self) -> None:
+        """Test that replacing and passing over values never removes them, even briefly."""
+
+        class RecordingValues(OrderedDict):
+            """Records the keys removed from the cache's values."""
+
+            def __init__(self) -> None:
+                super().__init__()
+                self.removed: list = []
+
+            def pop(self, key, *args):
+                self.removed.append(key)
+                return super().pop(key, *args)
+
+            def __delitem__(self, key):
+                self.removed.append(key)
+                super().__delitem__(key)
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=2)
+        values = manager._owner_caches[id(owner)].caches["values"].values = RecordingValues()
+        cache.put("first", 1)
+        cache.put("second", 2)
+        assert cache.get("first") == 1
+        cache.put("second", 20)
+        cache.put("third", 3)
+
+        assert values.removed == ["second"]
+        assert cache.get("first") == 1
+        assert cache.get("third") == 3
+
+    def test_concurrent_gets_and_puts_stay_consistent(self) -> None:
+        """Test that threads reading and storing values see only stored values and keep budgets."""
+
+        manager = AXCacheManager()
+        owner = Owner()
+        cache = self._register_cache(manager, owner, "values", max_entries=50)
+        cache.put("shared", "shared")
+        errors: list[str] = []
+        start = threading.Barrier(4)
+
+        def _exercise(thread_index: int) -> None:
+            start.wait(5)
+            for index in range(2000):
+                key = (thread_index, index % 100)
+                cache.put(key, (key, index))
+                value = cache.get(key)
+                if value is not MISSING and value[0] != key:
+                    errors.append(f"{key}: {value}")
+                shared = cache.get("shared")
+                if shared not in (MISSING, "shared"):
+                    errors.append(f"shared: {shared}")
+
+        threads = [threading.Thread(target=_exercise, args=(i,), daemon=True) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+            assert not thread.is_alive()
+
+        assert not errors
+        statistics = manager.get_statistics()["values"]
+        assert statistics["entries"] <= 50
+        assert statistics["puts"] == 4 * 2000 + 1
+        assert statistics["bytes"] == manager.get_memory_usage()
+        sizes = manager._owner_caches[id(owner)].caches["values"].sizes
+        assert statistics["bytes"] == sum(sizes.values())
+
     def test_register_timed_caches_starts_one_worker(self, test_context: OrcaTestContext) -> None:
         """Test one automatic-clearing worker handles all timed caches."""
 
@@ -0,0 +1,139 @@
+# Unit tests for ax_linearized_document.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+
+"""Unit tests for ax_linearized_document.py methods."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import gi
+import pytest
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi
+
+if TYPE_CHECKING:
+    from orca.ax_linearized_document import AXLinearizedDocument
+
+    from .orca_test_context import OrcaTestContext
+
+
+@pytest.mark.unit
+class TestAXLinearizedDocument:
+    """Test AXLinearizedDocument class methods."""
+
+    def _setup(
+        self, test_context: OrcaTestContext, texts: dict[object, str]
+    ) -> AXLinearizedDocument:
+        """Returns a model whose text objects and their text are given by texts."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca import ax_linearized_document
+        from orca.ax_object import AXObject
+        from orca.ax_text import AXText
+        from orca.ax_utilities_hypertext import CaretPolicy
+
+        test_context.patch_object(AXObject, "is_valid", return_value=True)
+        test_context.patch_object(AXText, "get_all_text", side_effect=lambda obj: texts[obj])
+        policy = CaretPolicy(
+            can_have_caret_context=lambda _obj: True,
+            treat_as_text_object=lambda obj: obj in texts,
+            treat_as_whole=lambda _obj, _offset: False,
+            in_document_content=lambda _obj: True,
+            is_boundary=lambda _obj: False,
+            is_text_block_element=lambda _obj: False,
+        )
+        return ax_linearized_document.AXLinearizedDocument(policy)
+
+    def test_contexts_within_and_between_runs(self, test_context: OrcaTestContext) -> None:
+        """Test that contexts within a run are computed and those between runs are linked."""
+
+        paragraph = Mock(spec=Atspi.Accessible, name="paragraph")
+        link = Mock(spec=Atspi.Accessible, name="link")
+        model = self._setup(test_context, {paragraph: "a \ufffcb", link: "xy"})
+
+        assert model.find_context(paragraph, 0, False) is None
+        model.record(paragraph, 1, (link, 0), False)
+        model.record(link, 1, (paragraph, 3), False)
+
+        assert model.find_context(paragraph, 0, False) == (paragraph, 1)
+        assert model.find_context(paragraph, 1, False) == (link, 0)
+        assert model.find_context(link, 0, False) == (link, 1)
+        assert model.find_context(link, 1, False) == (paragraph, 3)
+        assert model.find_context(paragraph, 3, False) is None
+        assert model.find_context(link, 0, True) is None
+        assert model.find_context(link, 1, True) == (link, 0)
+
+        assert model.get_character(paragraph, 1) == " "
+        assert model.get_character(paragraph, 2) is None
+        assert model.get_statistics() == {"runs": 3, "links": 2, "hits": 5, "misses": 3}
+
+    def test_contexts_in_middle_of_text_run_are_not_linked(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that only the ends of a text run are linked to other runs."""
+
+        paragraph = Mock(spec=Atspi.Accessible, name="paragraph")
+        button = Mock(spec=Atspi.Accessible, name="button")
+        model = self._setup(test_context, {paragraph: "abc"})
+
+        model.record(paragraph, 1, (button, 0), False)
+        assert model.get_statistics()["links"] == 0
+
+        model.record(paragraph, 2, (button, 0), False)
+        model.record(button, 0, (paragraph, 2), True)
+        assert model.find_context(paragraph, 2, False) == (button, 0)
+        assert model.find_context(button, 0, True) == (paragraph, 2)
+
+    def test_discard_keeps_unaffected_runs_without_links(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that discarding removes the affected runs and every link."""
+
+        first = Mock(spec=Atspi.Accessible, name="first")
+        second = Mock(spec=Atspi.Accessible, name="second")
+        model = self._setup(test_context, {first: "ab", second: "cd"})
+        model.record(first, 1, (second, 0), False)
+
+        assert model.discard(lambda x: x is second, "test reason") == 1
+        assert model.find_context(first, 0, False) == (first, 1)
+        assert model.find_context(first, 1, False) is None
+        assert model.get_statistics()["runs"] == 1
+
+        model.clear("test reason")
+        assert model.find_context(first, 0, False) is None
+
+    def test_model_over_run_limit_is_cleared(self, test_context: OrcaTestContext) -> None:
+        """Test that adding a run beyond the limit clears the model."""
+
+        objects = [Mock(spec=Atspi.Accessible, name=f"obj{i}") for i in range(3)]
+        model = self._setup(test_context, {})
+        test_context.patch_object(model, "MAX_RUNS", new=2)
+
+        model.record(objects[0], 0, (objects[1], 0), False)
+        model.record(objects[1], 0, (objects[2], 0), False)
+        assert model.get_statistics()["runs"] == 1
+        assert model.find_context(objects[1], 0, False) is None
@@ -708,6 +708,7 @@ class TestAXObject:
         for call in register.call_args_list[:3]:
             assert call.kwargs["lifetime"] is ax_cache_manager.Lifetime.PROCESS
             assert call.kwargs["clear_on_demand"] is ax_cache_manager.ClearPolicy.CLEAR
+            assert call.kwargs["keyed_by_object"] is True
             assert "clear_interval_seconds" not in call.kwargs
         hung_registration = register.call_args_list[3]
         assert hung_registration.kwargs["lifetime"] is ax_cache_manager.Lifetime.PROCESS
@@ -2199,6 +2200,29 @@ class TestAXObject:
         result = AXObject.get_child(mock_accessible, 1)
         assert result == mock_child
 
+    def test_get_child_links_child_for_subtree_invalidation(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test AXObject.get_child records the child so clearing obj's subtree reaches it."""
+
+        self._setup_dependencies(test_context)
+        from orca import ax_cache_manager
+        from orca.ax_object import AXObject
+
+        mock_accessible = test_context.Mock(spec=Atspi.Accessible)
+        mock_child = test_context.Mock(spec=Atspi.Accessible)
+        test_context.patch_object(AXObject, "is_valid", return_value=True)
+        test_context.patch_object(AXObject, "get_child_count", return_value=1)
+        sys.modules["gi.repository"].Atspi.Accessible.get_child_at_index = lambda obj, idx: (
+            mock_child
+        )
+        note_parent = test_context.patch_object(ax_cache_manager.get_manager(), "note_parent")
+        assert AXObject.get_child(mock_accessible, 0) == mock_child
+        note_parent.assert_called_once_with(
+            ax_cache_manager.get_object_key(mock_child),
+            ax_cache_manager.get_object_key(mock_accessible),
+        )
+
     def test_get_role_name_invalid_obj(self, test_context: OrcaTestContext) -> None:
         """Test AXObject.get_role_name with invalid obj."""
 
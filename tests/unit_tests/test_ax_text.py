@@ -3469,3 +3469,73 @@ class TestAXTextWholeCharacters:
         from orca.ax_text import AXText
 
         assert AXText._adjust_to_whole_characters(text, start, end) == expected
+
+
+@pytest.mark.unit
+class TestAXTextMirroredText:
+    """Test AXText reads answered from the text mirror."""
+
+    def _setup_dependencies(self, test_context: OrcaTestContext) -> dict[str, MagicMock]:
+        """Set up mocks for ax_text dependencies."""
+
+        additional_modules = [
+            "locale",
+            "orca.colornames",
+            "orca.ax_utilities_role",
+            "orca.ax_utilities_state",
+        ]
+        essential_modules = test_context.setup_shared_dependencies(additional_modules)
+        essential_modules["orca.debug"].debugLevel = 0
+        essential_modules["orca.ax_object"].AXObject.supports_text = test_context.Mock(
+            return_value=True
+        )
+        return essential_modules
+
+    @pytest.mark.parametrize(
+        "text, offset, expected",
+        [
+            pytest.param("hello world", 0, (0, 6), id="first_word"),
+            pytest.param("hello world", 5, (0, 6), id="trailing_space"),
+            pytest.param("hello world", 8, (6, 11), id="last_word"),
+            pytest.param("  hello", 1, (0, 2), id="leading_space"),
+            pytest.param("don't stop", 3, (0, 6), id="apostrophe"),
+            pytest.param("one, two", 3, (0, 5), id="punctuation"),
+            pytest.param("line\nnext", 4, (0, 5), id="newline"),
+            pytest.param("x" * 1000 + " y", 900, (0, 1001), id="beyond_margin"),
+        ],
+    )
+    def test_find_word_boundaries(
+        self,
+        text: str,
+        offset: int,
+        expected: tuple[int, int],
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test AXText._find_word_boundaries matches Atspi.TextGranularity.WORD."""
+
+        self._setup_dependencies(test_context)
+        from orca.ax_text import AXText
+
+        assert AXText._find_word_boundaries(text, offset) == expected
+
+    def test_mirrored_text_reads_make_no_atspi_calls(self, test_context: OrcaTestContext) -> None:
+        """Test that reads of mirrored text are answered without AT-SPI calls."""
+
+        self._setup_dependencies(test_context)
+        from orca import ax_text_mirror
+        from orca.ax_text import AXText
+
+        mirror = test_context.Mock()
+        mirror.is_enabled.return_value = True
+        mirror.get_text.return_value = "One two. Three."
+        test_context.patch_object(ax_text_mirror, "get_mirror", return_value=mirror)
+        atspi_text = test_context.patch("gi.repository.Atspi.Text", new=test_context.Mock())
+
+        obj = test_context.Mock(spec=Atspi.Accessible)
+        assert AXText.get_character_count(obj) == 15
+        assert AXText.get_substring(obj, 4, -1) == "two. Three."
+        assert AXText.get_all_text(obj) == "One two. Three."
+        assert AXText.get_character_at_offset(obj, 4) == ("t", 4, 5)
+        assert AXText.get_word_at_offset(obj, 5) == ("two. ", 4, 9)
+        assert AXText.get_sentence_at_offset(obj, 10) == ("Three.", 9, 15)
+        assert not atspi_text.mock_calls
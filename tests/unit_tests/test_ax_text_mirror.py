@@ -0,0 +1,215 @@
+# Unit tests for ax_text_mirror.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+
+"""Unit tests for ax_text_mirror.py methods."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import gi
+import pytest
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi
+
+if TYPE_CHECKING:
+    from orca.ax_text_mirror import AXTextMirror
+
+    from .orca_test_context import OrcaTestContext
+
+
+class _FakeText:
+    """Stands in for the text of an object in an application."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def get_character_count(self, _obj: object) -> int:
+        """Returns the length of the text."""
+
+        self.calls += 1
+        return len(self.text)
+
+    def get_text(self, _obj: object, start: int, end: int) -> str:
+        """Returns the text between start and end."""
+
+        self.calls += 1
+        return self.text[start:end]
+
+
+@pytest.mark.unit
+class TestAXTextMirror:
+    """Test AXTextMirror class methods."""
+
+    def _setup(self, test_context: OrcaTestContext, text: str) -> tuple[AXTextMirror, _FakeText]:
+        """Returns an enabled mirror and the fake text it reads."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca import ax_text_mirror
+
+        fake = _FakeText(text)
+        for name in ("get_character_count", "get_text"):
+            test_context.patch_object(Atspi.Text, name, new=getattr(fake, name), create=True)
+
+        mirror = ax_text_mirror.AXTextMirror()
+        mirror.set_enabled(True)
+        return mirror, fake
+
+    @staticmethod
+    def _event(
+        event_type: str,
+        source: object,
+        detail1: int = 0,
+        detail2: int = 0,
+        any_data: object = None,
+    ) -> Mock:
+        """Returns an Atspi.Event-like object."""
+
+        return Mock(
+            type=event_type,
+            source=source,
+            detail1=detail1,
+            detail2=detail2,
+            any_data=any_data,
+        )
+
+    def test_seeded_text_is_patched_from_events(self, test_context: OrcaTestContext) -> None:
+        """Test that insertions and deletions are applied to the mirrored text."""
+
+        from orca import ax_cache_manager
+
+        mirror, fake = self._setup(test_context, "hello world")
+        obj = Mock(spec=Atspi.Accessible)
+        assert mirror.get_text(obj) is ax_cache_manager.MISSING
+        assert mirror.seed(obj) == "hello world"
+        assert fake.calls == 2
+
+        fake.calls = 0
+        mirror.handle_event(self._event("object:text-changed:insert", obj, 5, 1, ","))
+        assert mirror.get_text(obj) == "hello, world"
+        mirror.handle_event(self._event("object:text-changed:delete:system", obj, 0, 7, "hello, "))
+        assert mirror.get_text(obj) == "world"
+        mirror.handle_event(self._event("object:text-changed:delete", obj, 4, 1, ""))
+        assert mirror.get_text(obj) == "worl"
+        assert fake.calls == 0
+
+    def test_mismatched_event_discards_text(self, test_context: OrcaTestContext) -> None:
+        """Test that an event which does not fit the mirrored text discards it."""
+
+        from orca import ax_cache_manager
+
+        mirror, _fake = self._setup(test_context, "hello")
+        obj = Mock(spec=Atspi.Accessible)
+        mirror.seed(obj)
+        mirror.handle_event(self._event("object:text-changed:delete", obj, 0, 2, "xy"))
+        assert mirror.get_text(obj) is ax_cache_manager.MISSING
+
+        mirror.seed(obj)
+        mirror.handle_event(self._event("object:text-changed:insert", obj, 9, 1, "!"))
+        assert mirror.get_text(obj) is ax_cache_manager.MISSING
+
+        mirror.seed(obj)
+        mirror.handle_event(self._event("object:text-changed:insert", obj, 0, 3, "!"))
+        assert mirror.get_text(obj) is ax_cache_manager.MISSING
+
+    def test_text_over_character_limit_is_not_mirrored(self, test_context: OrcaTestContext) -> None:
+        """Test that text longer than the limit is not mirrored, including through growth."""
+
+        mirror, _fake = self._setup(test_context, "hello")
+        mirror.set_max_characters(5)
+        obj = Mock(spec=Atspi.Accessible)
+        assert mirror.seed(obj) == "hello"
+        mirror.handle_event(self._event("object:text-changed:insert", obj, 5, 1, "!"))
+        assert mirror.get_text(obj) is None
+
+        mirror.set_max_characters(4)
+        assert mirror.seed(obj) is None
+        assert mirror.get_text(obj) is None
+
+    def test_excluded_object_is_dropped_when_it_becomes_editable(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that an excluded object is reconsidered when its editable state changes."""
+
+        from orca import ax_cache_manager
+
+        mirror, _fake = self._setup(test_context, "hello")
+        obj = Mock(spec=Atspi.Accessible)
+        mirror.exclude(obj)
+        assert mirror.get_text(obj) is None
+        mirror.handle_event(self._event("object:text-changed:insert", obj, 0, 1, "!"))
+        assert mirror.get_text(obj) is None
+
+        mirror.handle_event(self._event("object:state-changed:editable", obj, 1))
+        assert mirror.get_text(obj) is ax_cache_manager.MISSING
+
+    def test_exclusions_are_not_evicted_by_mirrored_text(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that mirroring more objects than fit in the budget keeps their exclusions."""
+
+        mirror, _fake = self._setup(test_context, "hello")
+        excluded = [Mock(spec=Atspi.Accessible) for _i in range(mirror.MAX_OBJECTS)]
+        for obj in excluded:
+            mirror.exclude(obj)
+        for _i in range(mirror.MAX_OBJECTS + 1):
+            mirror.seed(Mock(spec=Atspi.Accessible))
+
+        assert all(mirror.get_text(obj) is None for obj in excluded)
+
+    def test_disabled_mirror_holds_nothing(self, test_context: OrcaTestContext) -> None:
+        """Test that disabling the mirror discards the text and stops seeding."""
+
+        mirror, fake = self._setup(test_context, "hello")
+        obj = Mock(spec=Atspi.Accessible)
+        mirror.seed(obj)
+        mirror.set_enabled(False)
+        assert mirror.get_text(obj) is None
+        assert mirror.seed(obj) is None
+
+        mirror.set_enabled(True)
+        fake.calls = 0
+        assert mirror.seed(obj) == "hello"
+        assert fake.calls == 2
+
+    @pytest.mark.parametrize(
+        "toolkit_name, expected",
+        [
+            pytest.param("gtk", True, id="gtk"),
+            pytest.param("vte", True, id="vte"),
+            pytest.param("gecko", False, id="gecko"),
+            pytest.param("chromium", False, id="chromium"),
+            pytest.param("webkitgtk", False, id="webkitgtk"),
+        ],
+    )
+    def test_is_reliable_toolkit(
+        self, test_context: OrcaTestContext, toolkit_name: str, expected: bool
+    ) -> None:
+        """Test that web toolkits are not trusted to send text-changed events for every change."""
+
+        mirror, _fake = self._setup(test_context, "")
+        assert mirror.is_reliable_toolkit(toolkit_name) is expected
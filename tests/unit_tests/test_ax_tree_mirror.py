@@ -0,0 +1,326 @@
+# Unit tests for ax_tree_mirror.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+
+"""Unit tests for ax_tree_mirror.py methods."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import gi
+import pytest
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi
+
+if TYPE_CHECKING:
+    from orca.ax_tree_mirror import AXTreeMirror
+
+    from .orca_test_context import OrcaTestContext
+
+
+class _FakeTree:
+    """Stands in for the accessibility tree of an application."""
+
+    def __init__(self) -> None:
+        self.parents: dict[object, object] = {}
+        self.children: dict[object, list[object]] = {}
+        self.calls: int = 0
+        self.counts: Counter[str] = Counter()
+
+    def new_object(self, name: str, parent: object | None = None) -> Mock:
+        """Returns a new object, appended to the children of parent if given."""
+
+        obj = Mock(spec=Atspi.Accessible, name=name)
+        self.children[obj] = []
+        if parent is not None:
+            self.parents[obj] = parent
+            self.children[parent].append(obj)
+        return obj
+
+    def get_parent(self, obj: object) -> object | None:
+        """Returns the parent of obj."""
+
+        self.calls += 1
+        self.counts["get_parent"] += 1
+        return self.parents.get(obj)
+
+    def get_child_count(self, obj: object) -> int:
+        """Returns the number of children of obj."""
+
+        self.calls += 1
+        self.counts["get_child_count"] += 1
+        return len(self.children[obj])
+
+    def get_child_at_index(self, obj: object, index: int) -> object:
+        """Returns the child of obj at index."""
+
+        self.calls += 1
+        self.counts["get_child_at_index"] += 1
+        return self.children[obj][index]
+
+    def get_index_in_parent(self, obj: object) -> int:
+        """Returns the index of obj in its parent."""
+
+        self.calls += 1
+        self.counts["get_index_in_parent"] += 1
+        if (parent := self.parents.get(obj)) is None:
+            return -1
+        return self.children[parent].index(obj)
+
+    def get_descendants(self, obj: object) -> list[object]:
+        """Returns the descendants of obj in canonical order."""
+
+        result = []
+        for child in self.children[obj]:
+            result.append(child)
+            result.extend(self.get_descendants(child))
+        return result
+
+
+@pytest.mark.unit
+class TestAXTreeMirror:
+    """Test AXTreeMirror class methods."""
+
+    def _setup(self, test_context: OrcaTestContext) -> tuple[AXTreeMirror, _FakeTree, Mock]:
+        """Returns an enabled mirror, a fake tree, and its document with two paragraphs."""
+
+        self._idle_callbacks: list = []
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca import ax_tree_mirror
+
+        tree = _FakeTree()
+        for name in ("get_parent", "get_child_count", "get_child_at_index", "get_index_in_parent"):
+            test_context.patch_object(Atspi.Accessible, name, new=getattr(tree, name), create=True)
+        test_context.patch_object(
+            ax_tree_mirror.AXTreeMirror,
+            "_get_all_descendants",
+            new=staticmethod(tree.get_descendants),
+        )
+        test_context.patch_object(
+            ax_tree_mirror.GLib,
+            "idle_add",
+            new=lambda callback: self._idle_callbacks.append(callback) or 1,
+        )
+        test_context.patch_object(ax_tree_mirror.GLib, "source_remove", new=Mock())
+
+        document = tree.new_object("document")
+        for name in ("p1", "p2"):
+            paragraph = tree.new_object(name, document)
+            tree.new_object(f"{name}-link", paragraph)
+
+        mirror = ax_tree_mirror.AXTreeMirror()
+        mirror.set_enabled(True)
+        return mirror, tree, document
+
+    def _run_idle(self) -> int:
+        """Runs the captured idle callbacks until each is done, returning the iterations run."""
+
+        iterations = 0
+        while self._idle_callbacks:
+            iterations += 1
+            if not self._idle_callbacks[0]():
+                self._idle_callbacks.pop(0)
+        return iterations
+
+    @staticmethod
+    def _event(event_type: str, source: object, detail1: int = 0, any_data: object = None) -> Mock:
+        """Returns an Atspi.Event-like object."""
+
+        return Mock(type=event_type, source=source, detail1=detail1, any_data=any_data)
+
+    def test_seeded_mirror_answers_without_atspi_calls(self, test_context: OrcaTestContext) -> None:
+        """Test that the mirror answers structural queries without AT-SPI calls once seeded."""
+
+        mirror, tree, document = self._setup(test_context)
+        mirror.handle_event(self._event("document:load-complete", document))
+        self._run_idle()
+        assert mirror.get_statistics() == {"documents": 1, "objects": 5}
+
+        tree.calls = 0
+        p1, p2 = tree.children[document]
+        link = tree.children[p2][0]
+        assert mirror.get_children(document) == [p1, p2]
+        assert mirror.get_parent(link) == p2
+        assert mirror.get_index_in_parent(p2) == 1
+        assert mirror.get_children(link) == []
+        assert tree.calls == 0
+        assert not mirror.check_consistency()
+
+    def test_disabled_mirror_does_not_seed(self, test_context: OrcaTestContext) -> None:
+        """Test that nothing is mirrored while mirroring is disabled."""
+
+        mirror, _tree, document = self._setup(test_context)
+        mirror.set_enabled(False)
+        mirror.handle_event(self._event("document:load-complete", document))
+        self._run_idle()
+        assert mirror.get_children(document) is None
+        assert mirror.get_index_in_parent(document) == -1
+
+    def test_seeding_is_deferred_and_reads_only_child_counts(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that seeding happens in idle slices and derives parents from canonical order."""
+
+        test_context.patch("orca.ax_tree_mirror.SEED_SLICE_SIZE", new=2)
+        mirror, tree, document = self._setup(test_context)
+        mirror.handle_event(self._event("document:load-complete", document))
+        assert tree.calls == 0
+        assert mirror.get_statistics() == {"documents": 0, "objects": 0}
+
+        assert self._run_idle() == 2
+        assert mirror.get_statistics() == {"documents": 1, "objects": 5}
+        assert tree.counts == {"get_child_count": 5}
+        assert not mirror.check_consistency()
+
+    def test_seeding_restarts_when_document_changes(self, test_context: OrcaTestContext) -> None:
+        """Test that a document which changes while it is being seeded is seeded again."""
+
+        test_context.patch("orca.ax_tree_mirror.SEED_SLICE_SIZE", new=1)
+        mirror, tree, document = self._setup(test_context)
+        mirror.handle_event(self._event("document:load-complete", document))
+        assert self._idle_callbacks[0]()
+
+        p1 = tree.children[document][0]
+        heading = tree.new_object("heading", p1)
+        mirror.handle_event(self._event("object:children-changed:add", p1, 1, heading))
+        self._run_idle()
+        assert mirror.get_statistics() == {"documents": 1, "objects": 6}
+        assert mirror.get_children(p1) == [tree.children[p1][0], heading]
+        assert not mirror.check_consistency()
+
+    def test_clear_abandons_pending_seed(self, test_context: OrcaTestContext) -> None:
+        """Test that discarding all mirrors also abandons seeding which has not finished."""
+
+        mirror, _tree, document = self._setup(test_context)
+        mirror.handle_event(self._event("document:load-complete", document))
+        mirror.set_enabled(False)
+        mirror.set_enabled(True)
+        self._run_idle()
+        assert mirror.get_statistics() == {"documents": 0, "objects": 0}
+
+    def test_document_over_object_limit_is_not_mirrored(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that a document with more objects than the limit is not mirrored."""
+
+        mirror, _tree, document = self._setup(test_context)
+        mirror.set_max_objects(4)
+        assert not mirror.seed(document)
+        assert mirror.get_statistics() == {"documents": 0, "objects": 0}
+
+    def test_children_changed_events_patch_mirror(self, test_context: OrcaTestContext) -> None:
+        """Test that children-changed events insert and remove children and renumber siblings."""
+
+        mirror, tree, document = self._setup(test_context)
+        mirror.seed(document)
+        p1, p2 = tree.children[document]
+
+        heading = Mock(spec=Atspi.Accessible, name="heading")
+        tree.children[heading] = []
+        tree.parents[heading] = document
+        tree.children[document].insert(0, heading)
+        mirror.handle_event(self._event("object:children-changed:add", document, 0, heading))
+        assert mirror.get_children(document) == [heading, p1, p2]
+        assert mirror.get_index_in_parent(p2) == 2
+        assert mirror.get_parent(heading) == document
+        assert mirror.get_children(heading) is None
+
+        tree.children[document].remove(p1)
+        mirror.handle_event(self._event("object:children-changed:remove", document, 1, p1))
+        assert mirror.get_children(document) == [heading, p2]
+        assert mirror.get_index_in_parent(p2) == 1
+        assert mirror.get_parent(p1) is None
+        assert mirror.get_statistics() == {"documents": 1, "objects": 4}
+        assert not mirror.check_consistency()
+
+    def test_growth_beyond_object_limit_discards_mirror(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that a mirror which grows beyond the object limit is discarded."""
+
+        mirror, tree, document = self._setup(test_context)
+        mirror.seed(document)
+        mirror.set_max_objects(5)
+        child = tree.new_object("p3", document)
+        mirror.handle_event(self._event("object:children-changed:add", document, 2, child))
+        assert mirror.get_statistics() == {"documents": 0, "objects": 0}
+
+    def test_child_added_without_object_forgets_children(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that children are read from AT-SPI when an event lacks the child."""
+
+        mirror, _tree, document = self._setup(test_context)
+        mirror.seed(document)
+        mirror.handle_event(self._event("object:children-changed:add", document, 0, None))
+        assert mirror.get_children(document) is None
+        assert mirror.get_statistics()["documents"] == 1
+
+    def test_defunct_object_is_removed(self, test_context: OrcaTestContext) -> None:
+        """Test that an object which becomes defunct is removed with its subtree."""
+
+        mirror, tree, document = self._setup(test_context)
+        mirror.seed(document)
+        p1, p2 = tree.children[document]
+        mirror.handle_event(self._event("object:state-changed:defunct", p1, 1))
+        assert mirror.get_children(document) == [p2]
+        assert mirror.get_statistics() == {"documents": 1, "objects": 3}
+
+        mirror.handle_event(self._event("object:state-changed:defunct", document, 1))
+        assert mirror.get_statistics() == {"documents": 0, "objects": 0}
+
+    def test_verify_reads_discards_mirror_on_mismatch(self, test_context: OrcaTestContext) -> None:
+        """Test that a read which does not match AT-SPI discards the mirror."""
+
+        mirror, tree, document = self._setup(test_context)
+        mirror.seed(document)
+        mirror.set_verify_reads(True)
+        p1, p2 = tree.children[document]
+        assert mirror.get_children(document) == [p1, p2]
+
+        # The removal of p1 is missed.
+        tree.children[document].remove(p1)
+        assert mirror.get_index_in_parent(p2) == -1
+        assert mirror.get_statistics() == {"documents": 0, "objects": 0}
+
+    def test_check_consistency_reports_mismatches(self, test_context: OrcaTestContext) -> None:
+        """Test that the consistency check reports each difference from AT-SPI."""
+
+        mirror, tree, document = self._setup(test_context)
+        mirror.seed(document)
+        p1, p2 = tree.children[document]
+        tree.children[document].remove(p1)
+        del tree.parents[p1]
+        mismatches = mirror.check_consistency()
+        assert mismatches == [
+            f"{document}: children differ",
+            f"{p1}: parent differs",
+            f"{p1}: index in parent differs",
+            f"{p2}: index in parent differs",
+        ]
+        assert mirror.get_statistics()["documents"] == 1
@@ -203,6 +203,7 @@ class TestAXUtilities:
         for call in cache_calls:
             assert call.kwargs["lifetime"] is ax_cache_manager.Lifetime.PROCESS
             assert call.kwargs["clear_on_demand"] is ax_cache_manager.ClearPolicy.CLEAR
+            assert call.kwargs["keyed_by_object"] is True
             assert "clear_interval_seconds" not in call.kwargs
 
     def test_manager_clear_cache_now_clears_utility_cache(
@@ -1293,6 +1294,48 @@ class TestAXUtilities:
         manager.clear_cache_now.assert_called_once_with("test reason")
         manager.invalidate_group.assert_not_called()
 
+    def test_clear_subtree_cache_now_passes_ancestors(self, test_context: OrcaTestContext) -> None:
+        """Test AXUtilities.clear_subtree_cache_now with an object in a tree."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca import ax_cache_manager
+        from orca.ax_utilities import AXUtilities
+
+        essential_modules[
+            "orca.ax_utilities_role"
+        ].AXUtilitiesRole.is_table_related = test_context.Mock(return_value=False)
+        mock_obj = test_context.Mock(spec=Atspi.Accessible)
+        mock_parent = test_context.Mock(spec=Atspi.Accessible)
+        mock_root = test_context.Mock(spec=Atspi.Accessible)
+        parents = {mock_obj: mock_parent, mock_parent: mock_root, mock_root: mock_parent}
+        test_context.patch_object(
+            essential_modules["orca.ax_object"].AXObject, "get_parent", side_effect=parents.get
+        )
+        manager = test_context.Mock()
+        test_context.patch_object(ax_cache_manager, "get_manager", return_value=manager)
+        AXUtilities.clear_subtree_cache_now(mock_obj, "test reason")
+        manager.invalidate_subtree.assert_called_once_with(
+            hash(mock_obj), [hash(mock_parent), hash(mock_root)], "test reason"
+        )
+        manager.clear_cache_now.assert_not_called()
+        manager.invalidate_group.assert_not_called()
+
+    def test_clear_subtree_cache_now_without_object(self, test_context: OrcaTestContext) -> None:
+        """Test AXUtilities.clear_subtree_cache_now without specific object."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca import ax_cache_manager
+        from orca.ax_utilities import AXUtilities
+
+        essential_modules[
+            "orca.ax_utilities_role"
+        ].AXUtilitiesRole.is_table_related = test_context.Mock(return_value=False)
+        manager = test_context.Mock()
+        test_context.patch_object(ax_cache_manager, "get_manager", return_value=manager)
+        AXUtilities.clear_subtree_cache_now(None, "test reason")
+        manager.clear_cache_now.assert_called_once_with("test reason")
+        manager.invalidate_subtree.assert_not_called()
+
     def test_get_set_members_with_basic_set(self, test_context: OrcaTestContext) -> None:
         """Test AXUtilities.get_set_members with basic set."""
 
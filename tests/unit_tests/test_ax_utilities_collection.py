@@ -0,0 +1,217 @@
+# Unit tests for ax_utilities_collection.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+
+# pylint: disable=import-outside-toplevel
+
+"""Unit tests for ax_utilities_collection.py methods."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import gi
+import pytest
+
+gi.require_version("Atspi", "2.0")
+from gi.repository import Atspi
+
+if TYPE_CHECKING:
+    from .orca_test_context import OrcaTestContext
+
+
+@pytest.mark.unit
+class TestAXUtilitiesCollection:
+    """Test AXUtilitiesCollection class methods."""
+
+    def test_find_all_partitioned_by_role(self, test_context: OrcaTestContext) -> None:
+        """Test that one query's matches are partitioned by role and predicate in order."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca import ax_utilities_collection
+        from orca.ax_utilities_collection import AXUtilitiesCollection
+
+        heading = Mock(name="heading")
+        button = Mock(name="button")
+        link = Mock(name="link")
+        focusable_link = Mock(name="focusable_link")
+        roles = {
+            heading: Atspi.Role.HEADING,
+            button: Atspi.Role.BUTTON,
+            link: Atspi.Role.LINK,
+            focusable_link: Atspi.Role.LINK,
+        }
+
+        ax_collection = Mock()
+        ax_collection.get_all_matches.return_value = [heading, link, button, focusable_link]
+        test_context.patch_object(ax_utilities_collection, "AXCollection", new=ax_collection)
+        ax_object = Mock()
+        ax_object.get_role.side_effect = roles.get
+        test_context.patch_object(ax_utilities_collection, "AXObject", new=ax_object)
+
+        root = Mock(name="root")
+        result = AXUtilitiesCollection.find_all_partitioned_by_role(
+            root,
+            {
+                "headings": ([Atspi.Role.HEADING], None),
+                "links": ([Atspi.Role.LINK], lambda obj: obj is focusable_link),
+                "controls": ([Atspi.Role.BUTTON, Atspi.Role.LINK], None),
+                "paragraphs": ([Atspi.Role.PARAGRAPH], None),
+            },
+        )
+
+        assert result == {
+            "headings": [heading],
+            "links": [focusable_link],
+            "controls": [link, button, focusable_link],
+            "paragraphs": [],
+        }
+        ax_collection.get_all_matches.assert_called_once()
+        rule_roles = ax_collection.create_match_rule.call_args.kwargs["roles"]
+        assert sorted(rule_roles) == sorted(
+            [Atspi.Role.HEADING, Atspi.Role.LINK, Atspi.Role.BUTTON, Atspi.Role.PARAGRAPH]
+        )
+        assert AXUtilitiesCollection.find_all_partitioned_by_role(None, {}) == {}
+
+    @pytest.mark.parametrize(
+        "criteria, predicate, expected_criteria, expects_residual",
+        [
+            pytest.param(
+                {"roles": ["LINK"], "role_match_type": "ANY", "states": ["FOCUSABLE"]},
+                {"states": ("SHOWING",)},
+                {"states": ["FOCUSABLE", "SHOWING"], "state_match_type": "ALL"},
+                False,
+                id="states_added_to_all_of",
+            ),
+            pytest.param(
+                {"states": ["VISITED"], "state_match_type": "NONE"},
+                {"states": ("SHOWING",)},
+                {"states": ["VISITED"], "state_match_type": "NONE"},
+                True,
+                id="states_not_added_to_none_of",
+            ),
+            pytest.param(
+                {"roles": ["BUTTON", "LINK"], "role_match_type": "ANY"},
+                {"roles": ("LINK", "HEADING")},
+                {"roles": ["LINK"], "role_match_type": "ANY"},
+                False,
+                id="roles_intersected",
+            ),
+            pytest.param(
+                {"roles": ["TABLE_CELL"], "role_match_type": "NONE"},
+                {"roles": ("LINK", "TABLE_CELL")},
+                {"roles": ["LINK"], "role_match_type": "ANY"},
+                False,
+                id="excluded_roles_removed",
+            ),
+            pytest.param(
+                {"roles": ["HEADING"], "attributes": ["level:2"]},
+                {"attributes": ("level:3",)},
+                {"attributes": ["level:2"]},
+                True,
+                id="attribute_alternative_not_added",
+            ),
+            pytest.param(
+                {"roles": ["HEADING"]},
+                {"attributes": ("level:3",), "interfaces": ("Text",)},
+                {"attributes": ["level:3"], "interfaces": ["Text"]},
+                False,
+                id="attributes_and_interfaces_added",
+            ),
+        ],
+    )
+    def test_match_predicate_push_down(
+        self,
+        test_context: OrcaTestContext,
+        criteria: dict,
+        predicate: dict,
+        expected_criteria: dict,
+        expects_residual: bool,
+    ) -> None:
+        """Test that the conditions which fit the match rule are added to it."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca.ax_utilities_collection import MatchPredicate
+
+        def resolve(value):
+            if isinstance(value, str) and value.isupper():
+                for enum in (Atspi.Role, Atspi.StateType, Atspi.CollectionMatchType):
+                    if hasattr(enum, value):
+                        return getattr(enum, value)
+            if isinstance(value, (list, tuple)):
+                return type(value)(resolve(item) for item in value)
+            return value
+
+        criteria = {key: resolve(value) for key, value in criteria.items()}
+        pred = MatchPredicate(**{key: resolve(value) for key, value in predicate.items()})
+        result = pred.push_down(criteria)
+        assert result is not None
+        new_criteria, residual, _pushed = result
+        for key, value in expected_criteria.items():
+            assert new_criteria[key] == resolve(value)
+        assert (residual is not None) == expects_residual
+
+    def test_match_predicate_push_down_without_possible_match(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that a predicate whose roles exclude those of the rule cannot match."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca.ax_utilities_collection import MatchPredicate
+
+        pred = MatchPredicate(roles=(Atspi.Role.HEADING,))
+        criteria = {"roles": [Atspi.Role.BUTTON], "role_match_type": Atspi.CollectionMatchType.ANY}
+        assert pred.push_down(criteria) is None
+
+    def test_find_all_applies_only_residual_conditions(self, test_context: OrcaTestContext) -> None:
+        """Test that pushed conditions are left to Collection and the rest applied in Orca."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        essential_modules["orca.debug"].LEVEL_ALL = 0
+        from orca import ax_utilities_collection
+        from orca.ax_utilities_collection import AXUtilitiesCollection, MatchPredicate
+
+        kept = Mock(name="kept")
+        dropped = Mock(name="dropped")
+        ax_collection = Mock()
+        ax_collection.get_all_matches.return_value = [kept, dropped]
+        test_context.patch_object(ax_utilities_collection, "AXCollection", new=ax_collection)
+        ax_object = Mock()
+        test_context.patch_object(ax_utilities_collection, "AXObject", new=ax_object)
+
+        pred = MatchPredicate(states=(Atspi.StateType.SHOWING,), residual=lambda obj: obj is kept)
+        result = AXUtilitiesCollection.find_all_links(Mock(name="root"), pred=pred)
+
+        assert result == [kept]
+        kwargs = ax_collection.create_match_rule.call_args_list[0].kwargs
+        assert kwargs["states"] == [Atspi.StateType.FOCUSABLE, Atspi.StateType.SHOWING]
+        ax_object.has_state.assert_not_called()
+
+        # At the most verbose level, the rule without the added conditions is also run, to
+        # report how many candidates Collection eliminated.
+        assert ax_collection.get_all_matches.call_count == 2
+        assert ax_collection.create_match_rule.call_args_list[1].kwargs["states"] == [
+            Atspi.StateType.FOCUSABLE
+        ]
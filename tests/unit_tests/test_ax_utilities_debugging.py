@@ -166,6 +166,27 @@ class TestAXUtilitiesDebugging:
         assert "focus:in for" in result
         assert "TestApp" in result
 
+    def test_as_brief_string_makes_no_calls(self, test_context: OrcaTestContext) -> None:
+        """Test AXUtilitiesDebugging.as_brief_string describes objects without querying them."""
+
+        self._setup_dependencies(test_context)
+        from orca.ax_utilities_debugging import AXUtilitiesDebugging
+
+        mock_obj = test_context.Mock(spec=Atspi.Accessible)
+        mock_event = test_context.Mock(spec=Atspi.Event)
+        mock_event.type = "object:state-changed:focused"
+        mock_event.source = mock_obj
+        mock_event.detail1 = 1
+        mock_event.detail2 = 0
+        get_name = test_context.patch("orca.ax_utilities_debugging.AXObject.get_name")
+        get_role_name = test_context.patch("orca.ax_utilities_debugging.AXObject.get_role_name")
+
+        result = AXUtilitiesDebugging.as_brief_string([mock_event, {"focus": mock_obj}])
+        source = f"[accessible ({hex(id(mock_obj))})]"
+        assert result == f"[object:state-changed:focused for {source} (1, 0), {{focus: {source}}}]"
+        get_name.assert_not_called()
+        get_role_name.assert_not_called()
+
     def test_actions_as_string(self, test_context: OrcaTestContext) -> None:
         """Test AXUtilitiesDebugging.actions_as_string."""
 
@@ -255,6 +255,8 @@ class TestAXUtilitiesEvent:
         assert len(event_calls) == 12
         for call in event_calls:
             assert call.kwargs["lifetime"] is ax_cache_manager.Lifetime.PROCESS
+            keyed_by_object = call.args[1] != AXUtilitiesEvent._CACHE.TEXT_EVENT_REASON
+            assert call.kwargs["keyed_by_object"] is keyed_by_object
 
     @pytest.mark.parametrize(
         "case",
@@ -83,6 +83,7 @@ class TestAXUtilitiesRelation:
         for call in register.call_args_list:
             assert call.kwargs["lifetime"] is ax_cache_manager.Lifetime.PROCESS
             assert call.kwargs["clear_on_demand"] is ax_cache_manager.ClearPolicy.CLEAR
+            assert call.kwargs["keyed_by_object"] is True
             assert "clear_interval_seconds" not in call.kwargs
 
     def test_cached_target_lists_are_isolated_from_callers(
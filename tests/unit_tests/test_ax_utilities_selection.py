@@ -81,6 +81,7 @@ class TestAXUtilitiesSelectionCache:
             AXUtilitiesSelection._CACHE.IS_ALL_ITEMS_SELECTED,
             lifetime=ax_cache_manager.Lifetime.PROCESS,
             clear_interval_seconds=None,
+            keyed_by_object=True,
         )
 
     def test_manager_clear_cache_now_clears_selected_all_state(
@@ -71,8 +71,10 @@ class TestBrailleLineRanges:
                 "orca.brltablenames": test_context.Mock(),
                 "orca.cmdnames": test_context.Mock(),
                 "orca.debug": debug_mock,
+                "orca.latency_tracker": test_context.Mock(),
                 "orca.script_manager": test_context.Mock(),
                 "orca.text_attribute_manager": test_context.Mock(),
+                "orca.trace_recorder": test_context.Mock(),
                 "orca.ax_event_synthesizer": ax_event_synthesizer_mock,
                 "orca.ax_hypertext": ax_hypertext_mock,
                 "orca.ax_object": ax_object_mock,
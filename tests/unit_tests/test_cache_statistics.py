@@ -0,0 +1,135 @@
+# Unit tests for cache_statistics.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+
+"""Unit tests for cache_statistics.py methods."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from orca.ax_cache_manager import AXCacheManager
+    from orca.cache_statistics import CacheStatistics
+
+    from .orca_test_context import OrcaTestContext
+
+
+class _Owner:
+    """Provides a weak-referenceable cache owner for tests."""
+
+
+@pytest.mark.unit
+class TestCacheStatistics:
+    """Test CacheStatistics class methods."""
+
+    def _setup(self, test_context: OrcaTestContext) -> tuple[CacheStatistics, AXCacheManager]:
+        """Returns a new CacheStatistics reporting on a new, empty cache manager."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        from orca import ax_cache_manager
+        from orca.cache_statistics import CacheStatistics
+
+        manager = ax_cache_manager.AXCacheManager()
+        test_context.patch_object(ax_cache_manager, "get_manager", return_value=manager)
+        return CacheStatistics(), manager
+
+    def test_statistics_follow_cache_use(self, test_context: OrcaTestContext) -> None:
+        """Test that each kind of cache use is counted under its cache's name."""
+
+        statistics, manager = self._setup(test_context)
+        from orca.ax_cache_manager import MISSING, Lifetime
+
+        owner = _Owner()
+        manager.register_cache(owner, "names", lifetime=Lifetime.OWNER, max_entries=1)
+        cache = manager.get_cache(owner, "names")
+        assert cache is not None
+        cache.put("first", "one")
+        cache.put("second", "two")
+        assert cache.get("first") is MISSING
+        assert cache.get("second") == "two"
+        manager.clear_cache_now("children-changed event.")
+        manager.clear_cache_now("children-changed event.")
+        manager.clear_cache_now("")
+
+        assert statistics.get_statistics()["names"] == {
+            "gets": 2,
+            "hits": 1,
+            "misses": 1,
+            "puts": 2,
+            "invalidations": 3,
+            "evictions": 1,
+            "entries": 0,
+            "bytes": 0,
+        }
+        assert statistics.get_invalidation_reasons() == {
+            "names": {"children-changed event.": 2, "Unspecified.": 1}
+        }
+        assert statistics.get_hit_rate() == pytest.approx(0.5)
+        assert statistics.get_memory_usage() == 0
+
+        assert statistics.reset_statistics() is True
+        assert statistics.get_statistics()["names"]["gets"] == 0
+        assert statistics.get_invalidation_reasons() == {"names": {}}
+
+    def test_invalidation_reasons_are_bounded(self, test_context: OrcaTestContext) -> None:
+        """Test that reasons beyond MAX_INVALIDATION_REASONS are counted together."""
+
+        statistics, manager = self._setup(test_context)
+        from orca import ax_cache_manager
+
+        test_context.patch_object(ax_cache_manager, "MAX_INVALIDATION_REASONS", new=2)
+        owner = _Owner()
+        manager.register_cache(owner, "names", lifetime=ax_cache_manager.Lifetime.OWNER)
+        for reason in ("first", "second", "third", "fourth", "first"):
+            manager.invalidate_cache(owner, "names", reason)
+
+        assert statistics.get_invalidation_reasons()["names"] == {
+            "first": 2,
+            "second": 1,
+            "Other.": 2,
+        }
+
+    def test_report_lists_busiest_caches_first(self, test_context: OrcaTestContext) -> None:
+        """Test the table returned by get_report."""
+
+        statistics, manager = self._setup(test_context)
+        from orca.ax_cache_manager import Lifetime
+
+        owner = _Owner()
+        for name, gets in (("quiet", 1), ("busy", 3)):
+            manager.register_cache(owner, name, lifetime=Lifetime.OWNER)
+            cache = manager.get_cache(owner, name)
+            assert cache is not None
+            cache.put("key", "value")
+            for _i in range(gets):
+                cache.get("key")
+        manager.invalidate_cache(owner, "quiet", "Changed.")
+
+        report = statistics.get_report()
+        assert report[0].startswith("Hit rate: 100.0%.")
+        assert report[1].split()[:3] == ["cache", "gets", "hits"]
+        assert report[2].split()[:3] == ["busy", "3", "3"]
+        assert report[3].split()[:3] == ["quiet", "1", "1"]
+        assert report[4].split() == ["1", "invalidated:", "Changed."]
@@ -0,0 +1,204 @@
+# Unit tests for debug.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+
+"""Unit tests for debug.py methods."""
+
+from __future__ import annotations
+
+import collections
+import io
+import sys
+import threading
+import types
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from orca import debug as debug_module
+
+
+class _BlockingFile(io.StringIO):
+    """A debug file whose first write blocks until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, s: str) -> int:
+        if not self.entered.is_set():
+            self.entered.set()
+            self.release.wait(5)
+        return super().write(s)
+
+
+@pytest.mark.unit
+class TestDebug:
+    """Test the deferred debug record writer."""
+
+    def _get_debug(self, monkeypatch: pytest.MonkeyPatch, debug_file: io.StringIO):
+        """Returns the debug module, logging everything to debug_file."""
+
+        from orca import debug
+
+        monkeypatch.setattr(debug, "debugLevel", debug.LEVEL_ALL)
+        monkeypatch.setattr(debug, "debugFile", debug_file)
+        return debug
+
+    def test_plain_tokens_are_formatted_by_writer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that plain tokens are joined, and spaces before punctuation removed."""
+
+        debug_file = io.StringIO()
+        debug: debug_module = self._get_debug(monkeypatch, debug_file)
+        debug.print_tokens(debug.LEVEL_INFO, ["EVENT MANAGER:", 3, "event(s)", ".", None, True])
+        debug.print_message(debug.LEVEL_INFO, "done")
+        debug.flush()
+
+        assert debug_file.getvalue() == "EVENT MANAGER: 3 event(s). None True\ndone\n"
+
+    def test_objects_are_described_on_calling_thread(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that tokens other than plain values are stringified when the record is made."""
+
+        def as_string(_obj: object) -> str:
+            return f"<{threading.current_thread().name}>"
+
+        fake = types.ModuleType("orca.ax_utilities_debugging")
+        fake.AXUtilitiesDebugging = types.SimpleNamespace(as_string=as_string)  # type: ignore
+        monkeypatch.setitem(sys.modules, "orca.ax_utilities_debugging", fake)
+
+        debug_file = io.StringIO()
+        debug: debug_module = self._get_debug(monkeypatch, debug_file)
+        debug.print_tokens(debug.LEVEL_INFO, ["Focus:", object()])
+        debug.flush()
+
+        assert debug_file.getvalue() == f"Focus: <{threading.current_thread().name}>\n"
+
+    def test_filtered_tokens_are_not_described(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that tokens below both debugLevel and the flight recorder are not stringified."""
+
+        described: list[object] = []
+        fake = types.ModuleType("orca.ax_utilities_debugging")
+        namespace = types.SimpleNamespace(as_string=described.append)
+        fake.AXUtilitiesDebugging = namespace  # type: ignore
+        monkeypatch.setitem(sys.modules, "orca.ax_utilities_debugging", fake)
+
+        debug_file = io.StringIO()
+        debug: debug_module = self._get_debug(monkeypatch, debug_file)
+        monkeypatch.setattr(debug, "debugLevel", debug.LEVEL_SEVERE)
+        debug.print_tokens(debug.LEVEL_ALL, ["Focus:", object()])
+        debug.flush()
+
+        assert not described
+        assert not debug_file.getvalue()
+
+    def test_records_dropped_when_queue_is_full(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that records are counted, not queued, while the writer is too far behind."""
+
+        debug_file = _BlockingFile()
+        debug: debug_module = self._get_debug(monkeypatch, debug_file)
+        dropped = debug.get_dropped_record_count()
+
+        debug.print_message(debug.LEVEL_INFO, "first")
+        assert debug_file.entered.wait(5)
+        for i in range(debug.MAX_QUEUED_RECORDS + 2):
+            debug.print_message(debug.LEVEL_INFO, f"record {i}")
+        assert debug.get_dropped_record_count() == dropped + 2
+
+        debug_file.release.set()
+        debug.flush()
+        lines = debug_file.getvalue().splitlines()
+        assert lines[0] == "first"
+        assert lines[1] == "DEBUG: Dropped 2 record(s). Queue was full."
+        assert len(lines) == debug.MAX_QUEUED_RECORDS + 2
+
+    def test_flight_recorder_keeps_records_when_logging_is_off(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that INFO records are recorded and dumped while debugLevel is SEVERE."""
+
+        debug_file = io.StringIO()
+        debug: debug_module = self._get_debug(monkeypatch, debug_file)
+        monkeypatch.setattr(debug, "debugLevel", debug.LEVEL_SEVERE)
+        monkeypatch.setattr(debug, "_flight_recorder", collections.deque(maxlen=2))
+
+        debug.print_message(debug.LEVEL_INFO, "dropped from the ring")
+        debug.print_tokens(debug.LEVEL_INFO, ["EVENT MANAGER:", 2, "event(s)", "."])
+        debug.print_message(debug.LEVEL_INFO, "still recorded")
+        debug.print_message(debug.LEVEL_ALL, "below the recorder level")
+        debug.flush()
+        assert not debug_file.getvalue()
+
+        path = str(tmp_path / "recorder.out")
+        assert debug.dump_flight_recorder("Test.", path) == path
+        lines = (tmp_path / "recorder.out").read_text().splitlines()
+        assert lines[0] == "Flight recorder: 2 record(s). Reason: Test."
+        assert lines[1].endswith(" - EVENT MANAGER: 2 event(s).")
+        assert lines[2].endswith(" - still recorded")
+        assert len(lines) == 3
+
+    def test_flight_recorder_describes_tokens_briefly_when_logging_is_off(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that recorded tokens are described cheaply when made, and dumped in background."""
+
+        fake = types.ModuleType("orca.ax_utilities_debugging")
+        fake.AXUtilitiesDebugging = types.SimpleNamespace(  # type: ignore
+            as_string=lambda _obj: "<full>",
+            as_brief_string=lambda _obj: "<brief>",
+        )
+        monkeypatch.setitem(sys.modules, "orca.ax_utilities_debugging", fake)
+
+        debug: debug_module = self._get_debug(monkeypatch, io.StringIO())
+        monkeypatch.setattr(debug, "debugLevel", debug.LEVEL_SEVERE)
+        monkeypatch.setattr(debug, "_flight_recorder", collections.deque(maxlen=2))
+
+        debug.print_tokens(debug.LEVEL_INFO, ["Focus:", object()])
+        assert debug._flight_recorder[0][2] == ("Focus:", "<brief>")
+
+        path = str(tmp_path / "recorder.out")
+        assert debug.dump_flight_recorder("Test.", path, background=True) == path
+        for thread in threading.enumerate():
+            if thread.name == "orca-flight-recorder":
+                thread.join(5)
+        lines = (tmp_path / "recorder.out").read_text().splitlines()
+        assert lines[1].endswith(" - Focus: <brief>")
+        debug.flush()
+
+    def test_automatic_dumps_are_throttled(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that automatic dumps go to the state directory at most once per interval."""
+
+        debug: debug_module = self._get_debug(monkeypatch, io.StringIO())
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+        monkeypatch.setattr(debug._STATE, "last_automatic_dump", 0.0)
+
+        path = debug.dump_flight_recorder("Hang.", automatic=True)
+        assert path.startswith(str(tmp_path / "orca" / "flight-recorder-"))
+        assert not debug.dump_flight_recorder("Hang again.", automatic=True)
+        assert debug.dump_flight_recorder("User request.")
+        debug.flush()
@@ -54,6 +54,7 @@ class TestDebuggingToolsManager:
         """Set up mocks for debugging_tools_manager dependencies."""
 
         additional_modules = [
+            "orca.cache_statistics",
             "orca.orca_platform",
             "orca.ax_utilities",
             "orca.ax_utilities_debugging",
@@ -76,6 +77,8 @@ class TestDebuggingToolsManager:
         cmdnames_mock = essential_modules["orca.cmdnames"]
         cmdnames_mock.DEBUG_CYCLE_LEVEL = "cycleDebugLevel"
         cmdnames_mock.DEBUG_CLEAR_ATSPI_CACHE_FOR_APPLICATION = "clearAtSpiCache"
+        cmdnames_mock.DEBUG_DUMP_FLIGHT_RECORDER = "dumpFlightRecorder"
+        cmdnames_mock.DEBUG_PRINT_CACHE_STATISTICS = "printCacheStatistics"
 
         input_event_mock = essential_modules["orca.input_event"]
         input_event_handler_mock = test_context.Mock()
@@ -97,6 +100,10 @@ class TestDebuggingToolsManager:
         messages_mock = essential_modules["orca.messages"]
         messages_mock.DEBUG_CLEAR_CACHE_FAILED = "Failed to clear cache"
         messages_mock.DEBUG_CLEAR_CACHE = "Cache cleared"
+        messages_mock.DEBUG_FLIGHT_RECORDER_DUMPED = "Saved to %s."
+        messages_mock.DEBUG_FLIGHT_RECORDER_DUMPED_BRIEF = "Saved."
+        messages_mock.DEBUG_FLIGHT_RECORDER_DUMP_FAILED = "Saving failed."
+        messages_mock.DEBUG_CACHE_STATISTICS_PRINTED = "Cache statistics printed."
 
         orca_platform_mock = essential_modules["orca.orca_platform"]
         orca_platform_mock.version = "3.50.0"
@@ -184,6 +191,86 @@ class TestDebuggingToolsManager:
         cmd_manager = command_manager.get_manager()
         assert cmd_manager.get_keyboard_command("cycleDebugLevelHandler") is not None
         assert cmd_manager.get_keyboard_command("clear_atspi_app_cache") is not None
+        assert cmd_manager.get_keyboard_command("dump_flight_recorder") is not None
+        assert cmd_manager.get_keyboard_command("print_cache_statistics") is not None
+
+    @pytest.mark.parametrize(
+        "path,expected_args",
+        [
+            pytest.param("/tmp/recorder.out", ("Saved to /tmp/recorder.out.", "Saved."), id="ok"),
+            pytest.param("", ("Saving failed.",), id="failed"),
+        ],
+    )
+    def test_dump_flight_recorder(
+        self,
+        test_context: OrcaTestContext,
+        path: str,
+        expected_args: tuple[str, ...],
+    ) -> None:
+        """Test DebuggingToolsManager.dump_flight_recorder reports where the records went."""
+
+        essential_modules: dict[str, MagicMock] = self._setup_dependencies(test_context)
+        debug_mock = essential_modules["orca.debug"]
+        debug_mock.dump_flight_recorder = test_context.Mock(return_value=path)
+        from orca import presentation_manager
+        from orca.debugging_tools_manager import DebuggingToolsManager
+
+        manager = DebuggingToolsManager()
+        present_message = presentation_manager.get_manager().present_message
+        present_message.reset_mock()
+
+        assert manager.dump_flight_recorder(test_context.Mock()) is True
+        debug_mock.dump_flight_recorder.assert_called_once_with("User request.")
+        present_message.assert_called_once_with(*expected_args)
+
+        present_message.reset_mock()
+        assert manager.dump_flight_recorder(notify_user=False) is True
+        present_message.assert_not_called()
+
+    def test_print_cache_statistics(self, test_context: OrcaTestContext) -> None:
+        """Test DebuggingToolsManager.print_cache_statistics prints each line of the report."""
+
+        essential_modules: dict[str, MagicMock] = self._setup_dependencies(test_context)
+        statistics = essential_modules["orca.cache_statistics"].get_statistics.return_value
+        statistics.get_report.return_value = ["Hit rate: 50.0%.", "cache gets"]
+        debug_mock = essential_modules["orca.debug"]
+        from orca import presentation_manager
+        from orca.debugging_tools_manager import DebuggingToolsManager
+
+        manager = DebuggingToolsManager()
+        present_message = presentation_manager.get_manager().present_message
+        present_message.reset_mock()
+        debug_mock.print_message.reset_mock()
+
+        assert manager.print_cache_statistics(test_context.Mock()) is True
+        debug_mock.print_message.assert_any_call(
+            debug_mock.LEVEL_SEVERE, "DEBUGGING TOOLS MANAGER: Hit rate: 50.0%.", True
+        )
+        debug_mock.print_message.assert_any_call(
+            debug_mock.LEVEL_SEVERE, "DEBUGGING TOOLS MANAGER: cache gets", True
+        )
+        present_message.assert_called_once_with("Cache statistics printed.")
+
+        present_message.reset_mock()
+        assert manager.print_cache_statistics(notify_user=False) is True
+        present_message.assert_not_called()
+
+    def test_unhandled_exception_dumps_flight_recorder(self, test_context: OrcaTestContext) -> None:
+        """Test DebuggingToolsManager.on_unhandled_exception dumps, then reports the exception."""
+
+        essential_modules: dict[str, MagicMock] = self._setup_dependencies(test_context)
+        debug_mock = essential_modules["orca.debug"]
+        debug_mock.dump_flight_recorder = test_context.Mock(return_value="")
+        mock_excepthook = test_context.patch("sys.__excepthook__")
+        from orca.debugging_tools_manager import DebuggingToolsManager
+
+        error = ValueError("bad value")
+        DebuggingToolsManager().on_unhandled_exception(ValueError, error, None)
+        debug_mock.dump_flight_recorder.assert_called_once_with(
+            "DEBUGGING TOOLS MANAGER: Unhandled ValueError: bad value",
+            automatic=True,
+        )
+        mock_excepthook.assert_called_once_with(ValueError, error, None)
 
     @pytest.mark.parametrize(
         "initial_level,expected_level,expected_message,expected_brief,has_event",
@@ -173,6 +173,27 @@ class TestDocumentPresenter:
 
         assert result is True
 
+    def test_get_use_linearized_model_default(self, test_context: OrcaTestContext) -> None:
+        """Test get_use_linearized_model returns default value."""
+
+        module, _mocks = self._setup_presenter(test_context)
+
+        presenter = module.get_presenter()
+        result = presenter.get_use_linearized_model()
+
+        assert result is False
+
+    def test_set_use_linearized_model(self, test_context: OrcaTestContext) -> None:
+        """Test set_use_linearized_model updates setting."""
+
+        module, _mocks = self._setup_presenter(test_context)
+
+        presenter = module.get_presenter()
+        result = presenter.set_use_linearized_model(True)
+
+        assert result is True
+        assert presenter.get_use_linearized_model() is True
+
     def test_get_page_summary_on_load_default(self, test_context: OrcaTestContext) -> None:
         """Test get_page_summary_on_load returns default value."""
 
@@ -33,7 +33,6 @@
 from __future__ import annotations
 
 import itertools
-import queue
 from typing import TYPE_CHECKING
 from unittest.mock import call
 
@@ -201,9 +200,10 @@ class TestEventManager:
         assert manager._active is False
         assert manager._paused is False
         assert isinstance(manager._counter, itertools.count)
-        assert isinstance(manager._event_queue, queue.PriorityQueue)
+        assert manager._event_queue.empty()
+        assert not manager.get_queue_depths()
         assert manager._gidle_id == 0
-        assert not manager._event_history
+        assert not manager.get_suppressed_event_counts()
 
     @pytest.mark.parametrize(
         "case",
@@ -285,13 +285,10 @@ class TestEventManager:
         from orca.event_manager import EventManager
 
         manager = EventManager()
-        original_queue = manager._event_queue
+        manager._event_queue.put((5, 0, test_context.Mock(spec=Atspi.Event)))
         manager.pause_queuing(case["pause"], case["clear_queue"], case["reason"])
         assert manager._paused == case["pause"]
-        if case["clear_queue"]:
-            assert manager._event_queue is not original_queue
-        else:
-            assert manager._event_queue is original_queue
+        assert manager._event_queue.empty() is case["clear_queue"]
 
     @pytest.mark.parametrize(
         "case",
@@ -522,7 +519,7 @@ class TestEventManager:
         focus_mgr.get_locus_of_focus.return_value = None
         ax_utilities.is_window.return_value = False
         test_context.patch("time.time", return_value=1000.0)
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_app = test_context.Mock()
         test_context.patch("orca.event_manager.AXUtilities.is_window", return_value=False)
@@ -570,7 +567,7 @@ class TestEventManager:
         ax_utilities.is_section.return_value = False
 
         self._setup_ignore_event_ax_utilities_mocks(test_context, mock_time=5000.0, is_text=True)
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_event.type = "object:text-changed:insert"
         result = manager._ignore(mock_event)
@@ -674,7 +671,7 @@ class TestEventManager:
 
         focus_mgr.get_locus_of_focus.return_value = None
         test_context.patch("time.time", return_value=3000.0)
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_event.type = "object:test-event"
         test_context.patch("orca.event_manager.AXUtilities.is_window", return_value=False)
@@ -731,11 +728,14 @@ class TestEventManager:
         ax_object.get_attribute.return_value = "off"
         mock_app = test_context.Mock()
         ax_utilities.get_application.return_value = mock_app
-        manager._event_history = {}
+        manager._rate_limiter.clear()
         assert manager._ignore(mock_event) is False
 
-    def test_ignore_spam_filtering(self, test_context: OrcaTestContext) -> None:
-        """Test EventManager._ignore spam filtering mechanism."""
+    def _setup_rate_limit_test(
+        self,
+        test_context: OrcaTestContext,
+    ) -> tuple[object, dict[str, MagicMock], MagicMock, list[float]]:
+        """Returns an active manager, its dependencies, an event, and the settable clock."""
 
         essential_modules: dict[str, MagicMock] = self._setup_dependencies(test_context)
         from orca.event_manager import EventManager
@@ -749,20 +749,10 @@ class TestEventManager:
         mock_event.detail1 = 0
         mock_event.detail2 = 0
         mock_event.any_data = test_context.Mock()
-        mock_app = test_context.Mock()
-        original_hash = hash
+        essential_modules["focus_manager_instance"].get_locus_of_focus.return_value = None
 
-        def mock_hash(obj):
-            if obj is mock_app:
-                return 12345
-            return original_hash(obj)
-
-        test_context.patch("builtins.hash", new=mock_hash)
-        focus_mgr = essential_modules["focus_manager_instance"]
-        focus_mgr.get_locus_of_focus.return_value = None
-
-        manager._event_history = {}
-        test_context.patch("time.time", return_value=100.0)
+        clock = [100.0]
+        test_context.patch("time.time", side_effect=lambda: clock[0])
         test_context.patch("orca.event_manager.AXUtilities.is_window", return_value=False)
         test_context.patch("orca.event_manager.AXUtilities.is_frame", return_value=False)
         test_context.patch("orca.event_manager.AXUtilities.is_text", return_value=False)
@@ -772,49 +762,115 @@ class TestEventManager:
         test_context.patch("orca.event_manager.AXUtilities.is_focused", return_value=False)
         test_context.patch("orca.event_manager.AXUtilities.is_section", return_value=False)
         test_context.patch("orca.event_manager.AXUtilities.manages_descendants", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.get_application", return_value=mock_app)
+        test_context.patch(
+            "orca.event_manager.AXUtilities.get_application", return_value=test_context.Mock()
+        )
         test_context.patch(
             "orca.event_manager.AXUtilities.is_mutter_x11_frames", return_value=False
         )
         test_context.patch("orca.event_manager.AXObject.get_attribute", return_value=None)
-        test_context.patch("orca.event_manager.focus_manager.get_manager", return_value=focus_mgr)
+        return manager, essential_modules, mock_event, clock
+
+    def test_ignore_spam_filtering(self, test_context: OrcaTestContext) -> None:
+        """Test EventManager._ignore rate-limits each source with a token bucket."""
+
+        manager, _modules, mock_event, clock = self._setup_rate_limit_test(test_context)
+
+        # The default rate is 10 events/s, with a full bucket holding 0.3 s worth.
+        for _i in range(3):
+            assert manager._ignore(mock_event) is False
+        assert manager._ignore(mock_event) is True
+
+        # Another source of the same event type has its own bucket.
+        other_event = test_context.Mock(spec=Atspi.Event)
+        other_event.type = mock_event.type
+        other_event.source = test_context.Mock()
+        other_event.detail1 = 0
+        other_event.detail2 = 0
+        other_event.any_data = test_context.Mock()
+        assert manager._ignore(other_event) is False
+
+        # The bucket refills at the configured rate.
+        clock[0] = 100.2
+        assert manager._ignore(mock_event) is False
+        assert manager._ignore(mock_event) is False
+        assert manager._ignore(mock_event) is True
+        assert manager.get_suppressed_event_counts() == {"test-event": 2}
+
+    def test_ignore_rate_limit_per_family(self, test_context: OrcaTestContext) -> None:
+        """Test EventManager._ignore uses the configured rate for the event family."""
+
+        manager, _modules, mock_event, _clock = self._setup_rate_limit_test(test_context)
+        assert manager.set_rate_limits({"test-event": 0.0}) is False
+        assert manager.set_rate_limits({"test-event": 1.0}) is True
+        assert manager.get_rate_limits()["test-event"] == 1.0
+        assert manager.get_rate_limits()["children-changed"] == 100.0
+
         assert manager._ignore(mock_event) is False
+        assert manager._ignore(mock_event) is True
 
-        test_context.patch("time.time", return_value=100.05)
-        test_context.patch("orca.event_manager.AXUtilities.is_window", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_frame", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_text", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_notification", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_alert", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_selected", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_focused", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_section", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.manages_descendants", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.get_application", return_value=mock_app)
-        test_context.patch(
-            "orca.event_manager.AXUtilities.is_mutter_x11_frames", return_value=False
+    def test_ignore_rate_limit_caches_limits(self, test_context: OrcaTestContext) -> None:
+        """Test EventManager._ignore looks the rate limits up again only when settings change."""
+
+        manager, _modules, mock_event, clock = self._setup_rate_limit_test(test_context)
+        get_rate_limits = test_context.patch_object(
+            manager, "get_rate_limits", wraps=manager.get_rate_limits
         )
-        test_context.patch("orca.event_manager.AXObject.get_attribute", return_value=None)
-        test_context.patch("orca.event_manager.focus_manager.get_manager", return_value=focus_mgr)
+        assert manager._ignore(mock_event) is False
+        assert manager._ignore(mock_event) is False
+        assert get_rate_limits.call_count == 1
+
+        assert manager.set_rate_limits({"test-event": 1.0}) is True
+        clock[0] = 200.0
+        assert manager._ignore(mock_event) is False
         assert manager._ignore(mock_event) is True
+        assert get_rate_limits.call_count == 2
 
-        test_context.patch("time.time", return_value=100.2)
-        test_context.patch("orca.event_manager.AXUtilities.is_window", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_frame", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_text", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_notification", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_alert", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_selected", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_focused", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_section", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.manages_descendants", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.get_application", return_value=mock_app)
+    def test_ignore_rate_limit_allows_children_changed_bursts(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test EventManager._ignore lets a live region's burst of additions through."""
+
+        manager, _modules, mock_event, _clock = self._setup_rate_limit_test(test_context)
+        mock_event.type = "object:children-changed:add"
         test_context.patch(
             "orca.event_manager.AXUtilities.is_mutter_x11_frames", return_value=False
         )
-        test_context.patch("orca.event_manager.AXObject.get_attribute", return_value=None)
-        test_context.patch("orca.event_manager.focus_manager.get_manager", return_value=focus_mgr)
+        for _i in range(20):
+            assert manager._ignore_by_spam_filter(mock_event) is None
+        assert not manager.get_suppressed_event_counts()
+
+    def test_ignore_rate_limit_exempts_focus_and_caret(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test EventManager._ignore never rate-limits focus and caret events."""
+
+        manager, _modules, mock_event, _clock = self._setup_rate_limit_test(test_context)
+        for event_type in ("object:text-caret-moved", "object:state-changed:focused"):
+            mock_event.type = event_type
+            for _i in range(10):
+                assert manager._ignore(mock_event) is False
+        assert not manager.get_suppressed_event_counts()
+
+    def test_ignore_rate_limit_summary(self, test_context: OrcaTestContext) -> None:
+        """Test EventManager._ignore logs a summary once many events have been suppressed."""
+
+        manager, essential_modules, mock_event, clock = self._setup_rate_limit_test(test_context)
+        manager.set_rate_limit_summary_threshold(2)
+        for _i in range(6):
+            manager._ignore(mock_event)
+
+        print_message = essential_modules["orca.debug"].print_message
+        print_message.reset_mock()
+        clock[0] = 101.5
         assert manager._ignore(mock_event) is False
+        messages = [args[0][1] for args in print_message.call_args_list]
+        expected = (
+            "EVENT MANAGER: Rate limiter suppressed 3 event(s) in 1.5 s. object:test-event: 3"
+        )
+        assert expected in messages
 
     def test_ignore_mutter_events(self, test_context: OrcaTestContext) -> None:
         """Test EventManager._ignore for mutter-x11-frames events."""
@@ -857,7 +913,7 @@ class TestEventManager:
         test_context.patch("orca.event_manager.AXUtilities.is_mutter_x11_frames", return_value=True)
         test_context.patch("orca.event_manager.AXObject.get_attribute", return_value=None)
         test_context.patch("orca.event_manager.focus_manager.get_manager", return_value=focus_mgr)
-        manager._event_history = {}
+        manager._rate_limiter.clear()
         assert manager._ignore(mock_event) is True
 
     @pytest.mark.parametrize(
@@ -1062,7 +1118,7 @@ class TestEventManager:
         manager = EventManager()
         manager._active = True
         manager._paused = False
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_event = test_context.Mock(spec=Atspi.Event)
         mock_event.type = case["event_type"]
@@ -1134,7 +1190,7 @@ class TestEventManager:
         manager = EventManager()
         manager._active = True
         manager._paused = False
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_event = test_context.Mock(spec=Atspi.Event)
         mock_event.type = "object:text-changed:insert"
@@ -1169,62 +1225,6 @@ class TestEventManager:
         result = manager._ignore(mock_event)
         assert result is False
 
-    def test_ignore_event_history_filtering(self, test_context: OrcaTestContext) -> None:
-        """Test EventManager._ignore with event history spam filtering."""
-
-        essential_modules: dict[str, MagicMock] = self._setup_dependencies(test_context)
-        from orca.event_manager import EventManager
-
-        manager = EventManager()
-        manager._active = True
-        manager._paused = False
-        manager._event_history = {}
-
-        mock_event = test_context.Mock(spec=Atspi.Event)
-        mock_event.type = "object:test-event"
-        mock_event.detail1 = 0
-        mock_event.detail2 = 0
-        mock_event.source = test_context.Mock()
-        mock_event.any_data = test_context.Mock()
-
-        mock_app = test_context.Mock()
-        focus_mgr = essential_modules["focus_manager_instance"]
-        focus_mgr.get_locus_of_focus.return_value = None
-
-        original_hash = hash
-
-        def mock_hash(obj):
-            if obj is mock_app:
-                return 12345
-            return original_hash(obj)
-
-        test_context.patch("builtins.hash", new=mock_hash)
-        test_context.patch("time.time", return_value=100.0)
-        test_context.patch("orca.event_manager.AXUtilities.is_window", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_frame", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_text", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_notification", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_alert", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_selected", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_focused", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.is_section", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.manages_descendants", return_value=False)
-        test_context.patch("orca.event_manager.AXUtilities.get_application", return_value=mock_app)
-        test_context.patch(
-            "orca.event_manager.AXUtilities.is_mutter_x11_frames", return_value=False
-        )
-        test_context.patch("orca.event_manager.AXObject.get_attribute", return_value=None)
-
-        # First call should not be ignored
-        result1 = manager._ignore(mock_event)
-        assert result1 is False
-        assert manager._event_history["object:test-event"] == (12345, 100.0)
-
-        # Second call within 0.1s should be ignored
-        test_context.patch("time.time", return_value=100.05)
-        result2 = manager._ignore(mock_event)
-        assert result2 is True
-
     def test_is_obsoleted_by_index_check(self, test_context: OrcaTestContext) -> None:
         """Test that _is_obsoleted_by uses the _latest_event index."""
 
@@ -1331,12 +1331,12 @@ class TestEventManager:
             ),
         )
 
-        queue_data = [(4, 1, sibling_event)]
-        with manager._event_queue.mutex:
-            manager._event_queue.queue = queue_data
-
-        result = manager._is_obsoleted_by(mock_event)
+        manager._index_event(mock_event, 0)
+        manager._index_event(sibling_event, 1)
+        result = manager._is_obsoleted_by(mock_event, 0)
         assert result == sibling_event
+        assert manager._is_obsoleted_by(sibling_event, 1) is None
+        assert manager.get_obsoleted_event_counts()["sibling"] == 1
 
     def test_is_obsoleted_by_window_events(self, test_context: OrcaTestContext) -> None:
         """Test EventManager._is_obsoleted_by with window event conditions."""
@@ -1355,12 +1355,68 @@ class TestEventManager:
         existing_event.type = "window:deactivate"
         existing_event.source = mock_source
 
-        queue_data = [(4, 1, existing_event)]
-        with manager._event_queue.mutex:
-            manager._event_queue.queue = queue_data
-
-        result = manager._is_obsoleted_by(mock_event)
+        manager._index_event(mock_event, 0)
+        manager._index_event(existing_event, 1)
+        result = manager._is_obsoleted_by(mock_event, 0)
         assert result == existing_event
+        assert manager.get_obsoleted_event_counts()["window"] == 1
+
+    def test_is_obsoleted_by_duplicate_events(self, test_context: OrcaTestContext) -> None:
+        """Test EventManager._is_obsoleted_by with a newer duplicate from the same source."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        mock_source = test_context.Mock()
+        events = []
+        for _ in range(2):
+            event = test_context.Mock(spec=Atspi.Event)
+            event.type = "object:state-changed:focused:system"
+            event.source = mock_source
+            event.detail1 = 1
+            event.detail2 = 0
+            event.any_data = None
+            events.append(event)
+
+        manager._latest_event = {}
+        manager._index_event(events[0], 3)
+        manager._index_event(events[1], 7)
+        manager._latest_event = {}
+        assert manager._is_obsoleted_by(events[0], 3) == events[1]
+        assert manager._is_obsoleted_by(events[1], 7) is None
+        assert manager._is_obsoleted_by(events[0]) is None
+        assert manager.get_obsoleted_event_counts() == {
+            "same-type": 0,
+            "duplicate": 1,
+            "sibling": 0,
+            "window": 0,
+        }
+
+    def test_obsolescence_index_cleared_when_queue_drains(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that the obsolescence index is emptied once the last queued event is handled."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventManager, EventPriority
+
+        manager = EventManager()
+        mock_event = test_context.Mock(spec=Atspi.Event)
+        mock_event.type = "window:activate"
+        mock_event.source = test_context.Mock()
+        mock_event.any_data = "Window"
+        manager._event_queue.put((EventPriority.IMPORTANT, 0, mock_event))
+        manager._index_event(mock_event, 0)
+        assert manager._latest_window
+        test_context.patch_object(manager, "_process_object_event", new=test_context.Mock())
+
+        assert manager._dequeue_object_event() is False
+        assert not manager._latest_event
+        assert not manager._latest_duplicate
+        assert not manager._latest_sibling
+        assert not manager._latest_window
 
     def test_focus_conditions_in_ignore(self, test_context: OrcaTestContext) -> None:
         """Test EventManager._ignore focus-related conditions."""
@@ -1371,7 +1427,7 @@ class TestEventManager:
         manager = EventManager()
         manager._active = True
         manager._paused = False
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_event = test_context.Mock(spec=Atspi.Event)
         mock_event.type = "object:test-event"
@@ -1402,7 +1458,7 @@ class TestEventManager:
         manager = EventManager()
         manager._active = True
         manager._paused = False
-        manager._event_history = {}
+        manager._rate_limiter.clear()
 
         mock_event = test_context.Mock(spec=Atspi.Event)
         mock_event.type = "object:test-event"
@@ -1528,6 +1584,188 @@ class TestEventManager:
         assert result is False
         assert manager._gidle_id == 0
 
+    def _queue_events_for_dispatch(
+        self,
+        test_context: OrcaTestContext,
+        manager,
+        count: int,
+    ) -> MagicMock:
+        """Queues count events on manager and returns the mocked _process_object_event."""
+
+        from orca.event_manager import EventPriority
+
+        for i in range(count):
+            mock_event = test_context.Mock(spec=Atspi.Event)
+            mock_event.type = "object:text-changed:insert"
+            manager._event_queue.put((EventPriority.NORMAL, i, mock_event))
+        mock_process = test_context.Mock()
+        test_context.patch_object(manager, "_process_object_event", new=mock_process)
+        return mock_process
+
+    def test_dequeue_object_event_one_event_without_budget(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that only one event is processed per callback when the budget is zero."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        manager.set_dispatch_budget(0)
+        mock_process = self._queue_events_for_dispatch(test_context, manager, 3)
+        assert manager._dequeue_object_event() is True
+        assert mock_process.call_count == 1
+        assert manager._event_queue.qsize() == 2
+
+    def test_dequeue_object_event_drains_within_budget(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that a dispatch budget lets one callback drain the queue despite pending work."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        essential_modules["glib"].MainContext.default.return_value.pending.return_value = True
+        essential_modules[
+            "input_event_manager_instance"
+        ].get_keyboard_event_serial = test_context.Mock(return_value=1)
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        manager.set_dispatch_budget(1000)
+        mock_process = self._queue_events_for_dispatch(test_context, manager, 3)
+        assert manager._dequeue_object_event() is False
+        assert mock_process.call_count == 3
+        assert manager._event_queue.empty()
+
+    def test_dequeue_object_event_yields_for_keyboard_event(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that a batch ends as soon as a keyboard event arrives."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        essential_modules[
+            "input_event_manager_instance"
+        ].get_keyboard_event_serial = test_context.Mock(side_effect=[1, 2, 2])
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        manager.set_dispatch_budget(1000)
+        mock_process = self._queue_events_for_dispatch(test_context, manager, 3)
+        assert manager._dequeue_object_event() is True
+        assert mock_process.call_count == 1
+        assert manager._event_queue.qsize() == 2
+
+    def _make_app_queue_items(
+        self,
+        test_context: OrcaTestContext,
+        priority: int,
+        counters: range,
+    ) -> list[tuple]:
+        """Returns queue items with the given priority and counters."""
+
+        items = []
+        for counter in counters:
+            mock_event = test_context.Mock(spec=Atspi.Event)
+            mock_event.type = f"event-{counter}"
+            items.append((priority, counter, mock_event))
+        return items
+
+    def test_application_queues_favor_active_app(self, test_context: OrcaTestContext) -> None:
+        """Test weighted round-robin dispatch between a noisy app and the active app."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventPriority, _ApplicationEventQueues
+
+        event_queue = _ApplicationEventQueues()
+        noisy_app = test_context.Mock()
+        active_app = test_context.Mock()
+        for item in self._make_app_queue_items(test_context, EventPriority.NORMAL, range(10)):
+            event_queue.put(item, noisy_app)
+        for item in self._make_app_queue_items(test_context, EventPriority.NORMAL, range(10, 20)):
+            event_queue.put(item, active_app)
+
+        counters = [event_queue.get_nowait(active_app)[1] for _ in range(10)]
+        assert counters == [10, 11, 12, 13, 0, 14, 15, 16, 17, 1]
+        assert event_queue.qsize() == 10
+
+    def test_application_queues_urgent_events_first(self, test_context: OrcaTestContext) -> None:
+        """Test that focus and window events are dispatched before other apps' events."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventPriority, _ApplicationEventQueues
+
+        event_queue = _ApplicationEventQueues()
+        noisy_app = test_context.Mock()
+        other_app = test_context.Mock()
+        for item in self._make_app_queue_items(test_context, EventPriority.NORMAL, range(5)):
+            event_queue.put(item, noisy_app)
+        focus_item = self._make_app_queue_items(test_context, EventPriority.HIGH, range(5, 6))[0]
+        event_queue.put(focus_item, other_app)
+
+        assert event_queue.get_nowait(noisy_app) == focus_item
+
+    def test_application_queues_shed_low_priority_events(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that a full application queue sheds its oldest low-priority events first."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventPriority, _ApplicationEventQueues
+
+        test_context.patch("orca.event_manager.AXObject.get_name", return_value="noisy")
+
+        event_queue = _ApplicationEventQueues()
+        event_queue.MAX_APP_QUEUE_SIZE = 3
+        app = test_context.Mock()
+        low_items = self._make_app_queue_items(test_context, EventPriority.LOW, range(2))
+        normal_items = self._make_app_queue_items(test_context, EventPriority.NORMAL, range(2, 5))
+        for item in [*low_items, normal_items[0]]:
+            assert event_queue.put(item, app) is None
+
+        assert event_queue.put(normal_items[1], app) == low_items[0]
+        assert event_queue.put(normal_items[2], app) == low_items[1]
+        assert event_queue.put(normal_items[2], app) is None
+        assert event_queue.qsize() == 4
+        assert event_queue.get_depths() == {"noisy": 4}
+        assert event_queue.get_dropped_counts() == {"noisy": 2}
+
+        event_queue.clear()
+        assert event_queue.empty()
+        assert event_queue.get_dropped_counts() == {"noisy": 2}
+
+    def test_application_queues_shed_skips_dispatched_events(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that shedding ignores dispatched events and does not query the app's name."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventPriority, _ApplicationEventQueues
+
+        get_name = test_context.patch("orca.event_manager.AXObject.get_name", return_value="app")
+
+        event_queue = _ApplicationEventQueues()
+        event_queue.MAX_APP_QUEUE_SIZE = 2
+        app = test_context.Mock()
+        low_items = self._make_app_queue_items(test_context, EventPriority.LOW, range(3))
+        normal_items = self._make_app_queue_items(test_context, EventPriority.NORMAL, range(3, 5))
+        event_queue.put(low_items[0], app)
+        event_queue.put(low_items[1], app)
+        assert event_queue.get_nowait(app) == low_items[0]
+
+        assert event_queue.put(low_items[2], app) is None
+        assert event_queue.put(normal_items[0], app) == low_items[1]
+        assert event_queue.put(normal_items[1], app) == low_items[2]
+        get_name.assert_not_called()
+
+        assert event_queue.get_nowait(app) == normal_items[0]
+        assert event_queue.get_nowait(app) == normal_items[1]
+        assert event_queue.empty()
+        assert event_queue.get_dropped_counts() == {"app": 2}
+
     @pytest.mark.parametrize(
         "case",
         [
@@ -1615,18 +1853,100 @@ class TestEventManager:
         test_context.patch_object(manager, method_name, new=mock_listener_method)
 
         mock_script = test_context.Mock()
-        mock_script.listeners = {
-            "object:text-changed:insert": test_context.Mock(),
-            "object:state-changed:focused": test_context.Mock(),
-        }
+        mock_script.get_handled_event_types.return_value = [
+            "object:text-changed:insert",
+            "object:state-changed:focused",
+        ]
+        if case["operation"] == "deregister":
+            manager._script_event_types[mock_script] = [
+                "object:text-changed:insert",
+                "object:state-changed:focused",
+            ]
 
         getattr(manager, f"{case['operation']}_script_listeners")(mock_script)
+        getattr(manager, f"{case['operation']}_script_listeners")(mock_script)
 
         expected_calls = [
             call("object:text-changed:insert"),
             call("object:state-changed:focused"),
         ]
         mock_listener_method.assert_has_calls(expected_calls, any_order=True)
+        assert mock_listener_method.call_count == 2
+
+    def test_subscriptions_follow_script_demand(self, test_context: OrcaTestContext) -> None:
+        """Test that event types are subscribed only while a registered script handles them."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        manager._listener = test_context.Mock()
+        default_script = test_context.Mock()
+        default_script.get_handled_event_types.return_value = ["window:activate"]
+        web_script = test_context.Mock()
+        web_script.get_handled_event_types.return_value = [
+            "document:load-complete",
+            "window:activate",
+        ]
+
+        manager.register_script_listeners(default_script)
+        manager.register_script_listeners(web_script)
+        assert manager.get_subscribed_event_types() == ["document:load-complete", "window:activate"]
+        assert manager._listener.register.call_count == 2
+
+        manager.deregister_script_listeners(web_script)
+        assert manager.get_subscribed_event_types() == ["window:activate"]
+        manager._listener.deregister.assert_called_once_with("document:load-complete")
+
+    def test_manager_event_types_subscribed_for_plain_scripts(
+        self,
+        test_context: OrcaTestContext,
+    ) -> None:
+        """Test that window:destroy is subscribed even if no script handles it."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        manager._listener = test_context.Mock()
+        plain_script = test_context.Mock()
+        plain_script.get_handled_event_types.return_value = []
+
+        manager.activate()
+        manager.register_script_listeners(plain_script)
+        assert "window:destroy" in manager.get_subscribed_event_types()
+        manager._listener.register.assert_any_call("window:destroy")
+
+        manager.deregister_script_listeners(plain_script)
+        assert "window:destroy" in manager.get_subscribed_event_types()
+
+        manager.deactivate()
+        manager._listener.deregister.assert_any_call("window:destroy")
+        assert not manager.get_subscribed_event_types()
+
+    def test_suspend_and_resume_listeners(self, test_context: OrcaTestContext) -> None:
+        """Test that suspended event types are unsubscribed regardless of script demand."""
+
+        self._setup_dependencies(test_context)
+        from orca.event_manager import EventManager
+
+        manager = EventManager()
+        manager._listener = test_context.Mock()
+        event_type = "object:children-changed:add"
+        manager.register_listener(event_type)
+        manager.register_listener(event_type)
+
+        manager.suspend_listeners([event_type, "object:selection-changed"])
+        manager.suspend_listeners([event_type])
+        manager._listener.deregister.assert_called_once_with(event_type)
+        assert not manager.get_subscribed_event_types()
+
+        manager.register_listener("object:selection-changed")
+        manager._listener.register.reset_mock()
+        manager.resume_listeners([event_type, "object:selection-changed"])
+        manager.resume_listeners([event_type])
+        assert manager._listener.register.call_count == 2
+        assert manager.get_subscribed_event_types() == [event_type, "object:selection-changed"]
 
     def test_get_script_for_event_focus(self, test_context: OrcaTestContext) -> None:
         """Test EventManager._get_script_for_event for focused events."""
@@ -0,0 +1,139 @@
+# Unit tests for replaying recorded event streams through event_manager.py.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+"""Unit tests for replaying recorded event streams through event_manager.py."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .event_replay import EventRecording, EventReplayer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .orca_test_context import OrcaTestContext
+
+
+def _make_channel_load_recording(bursts: int = 10, messages: int = 20) -> EventRecording:
+    """Returns a recording resembling a chat client loading the history of a channel."""
+
+    nodes = {
+        0: {"name": "Chat", "role": "application", "states": [], "parent": None, "app": 0},
+        1: {"name": "general", "role": "frame", "states": ["active"], "parent": 0, "app": 0},
+        2: {"name": "Messages", "role": "list", "states": ["showing"], "parent": 1, "app": 0},
+        3: {
+            "name": "Message general",
+            "role": "entry",
+            "states": ["focused", "editable", "showing"],
+            "parent": 1,
+            "app": 0,
+        },
+    }
+    events = [[0.0, "object:state-changed:focused", 3, 1, 0, None]]
+    timestamp = 10.0
+    for burst in range(bursts):
+        for message in range(messages):
+            node_id = len(nodes)
+            nodes[node_id] = {
+                "name": f"Message {burst}.{message}",
+                "role": "list-item",
+                "states": ["showing"],
+                "parent": 2,
+                "app": 0,
+            }
+            child = {"ref": node_id}
+            events.append([timestamp, "object:children-changed:add", 2, message, 0, child])
+            events.append([timestamp, "object:property-change:accessible-name", node_id, 0, 0, ""])
+            timestamp += 0.5
+        events.append([timestamp, "object:text-changed:insert", 3, 0, 1, "a"])
+        events.append([timestamp, "object:text-caret-moved", 3, 1, 0, None])
+        timestamp += 150.0
+
+    return EventRecording("Chat", nodes, events)
+
+
+@pytest.mark.unit
+class TestEventReplay:
+    """Test replaying recorded event streams through the event manager."""
+
+    def test_recording_round_trip(self, tmp_path: Path) -> None:
+        """Test that a saved recording loads back unchanged, compressed or not."""
+
+        recording = _make_channel_load_recording(bursts=2, messages=3)
+        for name in ("recording.json", "recording.json.gz"):
+            path = str(tmp_path / name)
+            recording.save(path)
+            loaded = EventRecording.load(path)
+            assert loaded.application == recording.application
+            assert loaded.nodes == recording.nodes
+            assert loaded.events == recording.events
+
+    def test_recording_version_mismatch(self, tmp_path: Path) -> None:
+        """Test that a recording in an unknown format is rejected."""
+
+        path = tmp_path / "recording.json"
+        path.write_text('{"version": 0, "nodes": {}, "events": []}')
+        with pytest.raises(ValueError, match="Unsupported recording version"):
+            EventRecording.load(str(path))
+
+    def test_replay_accounts_for_every_event(self, test_context: OrcaTestContext) -> None:
+        """Test that each replayed event is ignored, obsoleted, dropped, or dispatched."""
+
+        recording = _make_channel_load_recording()
+        result = EventReplayer(test_context, recording).run()
+
+        assert result.events == len(recording.events)
+        assert result.queued + result.ignored == result.events
+        discarded = sum(result.obsoleted.values()) + sum(result.dropped.values())
+        assert result.dispatched + discarded == result.queued
+        assert result.utterances == result.dispatched
+        assert result.dispatched > 0
+        assert result.events_per_second > 0
+        stats = result.latency["object:text-changed:insert"]
+        assert stats["speech-count"] == stats["total-count"]
+
+    def test_replay_is_deterministic(self, test_context: OrcaTestContext) -> None:
+        """Test that replaying a recording twice makes the same dispatch decisions."""
+
+        recording = _make_channel_load_recording(bursts=3)
+        first = EventReplayer(test_context, recording).run()
+        second = EventReplayer(test_context, recording).run()
+
+        assert (first.queued, first.dispatched, first.utterances) == (
+            second.queued,
+            second.dispatched,
+            second.utterances,
+        )
+        assert first.obsoleted == second.obsoleted
+
+    def test_replay_recording_from_environment(self, test_context: OrcaTestContext) -> None:
+        """Test replaying the recording named by ORCA_EVENT_RECORDING, printing the results."""
+
+        path = os.environ.get("ORCA_EVENT_RECORDING")
+        if not path:
+            pytest.skip("ORCA_EVENT_RECORDING is not set")
+
+        result = EventReplayer(test_context, EventRecording.load(path)).run()
+        print(f"\n{path}:\n{result.summary()}")
+        assert result.dispatched + result.ignored <= result.events
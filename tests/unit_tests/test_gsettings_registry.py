@@ -160,6 +160,20 @@ class TestActiveState:
         registry.set_active_profile("default")
         assert calls == ["spanish", "default"]
 
+    def test_value_changes_notify_observers(self, test_context: OrcaTestContext) -> None:
+        """Test runtime value and context changes invoke registered value-change observers."""
+
+        self._setup(test_context)
+        from orca import gsettings_registry
+
+        calls = []
+        registry = gsettings_registry.get_registry()
+        registry.add_value_change_observer(lambda: calls.append(True))
+        registry.set_runtime_value("event-manager", "rate-limits", {})
+        registry.remove_runtime_value("event-manager", "rate-limits")
+        registry.set_active_app(None)
+        assert len(calls) == 3
+
     def test_set_active_app_empty_string_becomes_none(self, test_context: OrcaTestContext) -> None:
         """Test set_active_app treats empty string as None."""
 
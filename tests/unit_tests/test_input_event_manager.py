@@ -422,8 +422,10 @@ class TestInputEventManager:
             "a",
         )
         input_event_manager._last_input_event = keyboard_event_instance
+        serial = input_event_manager.get_keyboard_event_serial()
         result = input_event_manager.process_keyboard_event(mock_device, True, 65, 97, 0, "a")
         assert result is False
+        assert input_event_manager.get_keyboard_event_serial() == serial + 1
         essential_modules["orca.debug"].print_message.assert_called()
 
     @pytest.mark.parametrize(
@@ -0,0 +1,105 @@
+# Unit tests for latency_tracker.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+
+"""Unit tests for latency_tracker.py methods."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from orca.latency_tracker import LatencyTracker
+
+    from .orca_test_context import OrcaTestContext
+
+
+@pytest.mark.unit
+class TestLatencyTracker:
+    """Test LatencyTracker class methods."""
+
+    def _get_tracker(self, test_context: OrcaTestContext, times: list[float]) -> LatencyTracker:
+        """Returns a new LatencyTracker whose clock returns each of times in turn."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        test_context.patch("time.monotonic", side_effect=times)
+        from orca.latency_tracker import LatencyTracker
+
+        return LatencyTracker()
+
+    def test_span_records_each_stage(self, test_context: OrcaTestContext) -> None:
+        """Test that one dispatched event contributes a sample to each stage it reached."""
+
+        tracker = self._get_tracker(test_context, [1.000, 1.010, 1.030, 1.040, 1.050, 1.050, 1.060])
+        tracker.event_queued(7, "object:state-changed:focused", 0.990)
+        tracker.begin_span(7)
+        with tracker.measure("listener"), tracker.measure("generator"):
+            with tracker.measure("generator"):
+                pass
+            tracker.note_output("speech")
+            tracker.note_output("speech")
+        tracker.end_span()
+
+        stats = tracker.get_statistics()["object:state-changed:focused"]
+        assert stats["queue-p50"] == pytest.approx(10.0)
+        assert stats["listener-p50"] == pytest.approx(40.0)
+        assert stats["generator-p50"] == pytest.approx(20.0)
+        assert stats["speech-p50"] == pytest.approx(50.0)
+        assert stats["total-p99"] == pytest.approx(70.0)
+        assert stats["speech-count"] == 1.0
+        assert "braille-p50" not in stats
+
+    def test_untracked_event_is_ignored(self, test_context: OrcaTestContext) -> None:
+        """Test that events which were not queued, or were discarded, are not measured."""
+
+        tracker = self._get_tracker(test_context, [])
+        tracker.event_queued(1, "object:children-changed:add", 0.5)
+        tracker.event_discarded(1)
+        tracker.begin_span(1)
+        with tracker.measure("listener"):
+            tracker.note_output("braille")
+        tracker.end_span()
+        assert not tracker.get_statistics()
+
+    def test_percentiles_and_reset(self, test_context: OrcaTestContext) -> None:
+        """Test the reported percentiles and that reset_statistics discards them."""
+
+        times = []
+        for i in range(100):
+            times.extend([float(i), float(i) + (i + 1) / 1000])
+        tracker = self._get_tracker(test_context, times)
+        for i in range(100):
+            tracker.event_queued(i, "object:text-caret-moved", float(i))
+            tracker.begin_span(i)
+            tracker.end_span()
+
+        stats = tracker.get_statistics()["object:text-caret-moved"]
+        assert stats["total-count"] == 100.0
+        assert stats["total-p50"] == pytest.approx(51.0)
+        assert stats["total-p95"] == pytest.approx(95.0)
+        assert stats["total-p99"] == pytest.approx(99.0)
+
+        assert tracker.reset_statistics() is True
+        assert not tracker.get_statistics()
@@ -315,7 +315,7 @@ class TestSayAllPresenter:
 
         essential_modules = self._setup_dependencies(test_context)
         from orca import speechserver
-        from orca.say_all_presenter import SayAllPresenter
+        from orca.say_all_presenter import SayAllPresenter, _SayAllUnit
 
         presenter = SayAllPresenter()
         mock_script = test_context.Mock()
@@ -326,18 +326,15 @@ class TestSayAllPresenter:
         mock_context = test_context.Mock(spec=speechserver.SayAllContext)
         mock_context.obj = "context_obj" if obj_valid else None
 
-        if direction == "rewind":
-            mock_context.start_offset = 15
-        else:
-            mock_context.end_offset = 25
+        mock_context.start_offset = 15
+        mock_context.end_offset = 25
 
         if contents_available:
             if direction == "rewind":
-                presenter._contents = [("content_obj", 5, 10, "text")]
+                contents = [("content_obj", 5, 10, "text")]
             else:
-                presenter._contents = [("first_obj", 0, 5, "first"), ("last_obj", 20, 30, "last")]
-        else:
-            presenter._contents = []
+                contents = [("first_obj", 0, 5, "first"), ("last_obj", 20, 30, "last")]
+            presenter._add_to_history(_SayAllUnit(contents[0][0], contents[0][1], [], contents))
 
         focus_manager_mock = essential_modules["orca.focus_manager"]
         focus_instance = test_context.Mock()
@@ -350,7 +347,7 @@ class TestSayAllPresenter:
         else:
             mock_script.utilities.next_context.return_value = ("next_obj", 35)
 
-        presenter.say_all = test_context.Mock(return_value=True)
+        presenter._start_say_all = test_context.Mock(return_value=True)
         navigation_method = getattr(presenter, f"_{direction}")
         result = navigation_method(mock_context)
         assert result == expected_result
@@ -362,7 +359,7 @@ class TestSayAllPresenter:
                 mock_script.utilities.previous_context.assert_called()
             else:
                 mock_script.utilities.next_context.assert_called()
-            presenter.say_all.assert_called_once()
+            presenter._start_say_all.assert_called_once()
 
     @pytest.mark.parametrize(
         "command_method",
@@ -501,7 +498,7 @@ class TestSayAllPresenter:
 
         essential_modules = self._setup_dependencies(test_context)
         from orca import speechserver
-        from orca.say_all_presenter import SayAllPresenter
+        from orca.say_all_presenter import SayAllPresenter, _SayAllUnit
 
         presenter = SayAllPresenter()
         mock_script = test_context.Mock()
@@ -514,23 +511,20 @@ class TestSayAllPresenter:
         )
         if context_provided and mock_context is not None:
             mock_context.obj = "provided_obj"
-            if direction == "rewind":
-                mock_context.start_offset = 10
-            else:
-                mock_context.end_offset = 20
+            mock_context.start_offset = 10
+            mock_context.end_offset = 20
 
         current_context = test_context.Mock(spec=speechserver.SayAllContext)
         current_context.obj = "current_obj"
-        if direction == "rewind":
-            current_context.start_offset = 5
-        else:
-            current_context.end_offset = 15
+        current_context.start_offset = 5
+        current_context.end_offset = 15
         presenter._current_context = current_context
 
         if direction == "rewind":
-            presenter._contents = [("content_obj", 0, 10, "text")]
+            contents = [("content_obj", 0, 10, "text")]
         else:
-            presenter._contents = [("first_obj", 0, 5, "first"), ("last_obj", 10, 20, "last")]
+            contents = [("first_obj", 0, 5, "first"), ("last_obj", 10, 20, "last")]
+        presenter._add_to_history(_SayAllUnit(contents[0][0], contents[0][1], [], contents))
 
         focus_manager_mock = essential_modules["orca.focus_manager"]
         focus_instance = test_context.Mock()
@@ -542,7 +536,7 @@ class TestSayAllPresenter:
         else:
             mock_script.utilities.next_context.return_value = ("next_obj", 25)
 
-        presenter.say_all = test_context.Mock(return_value=True)
+        presenter._start_say_all = test_context.Mock(return_value=True)
 
         navigation_method = getattr(presenter, f"_{direction}")
         result = navigation_method(mock_context, override_setting)
@@ -552,20 +546,20 @@ class TestSayAllPresenter:
         if expected_result:
             focus_instance.set_locus_of_focus.assert_called()
             mock_script.utilities.set_caret_context.assert_called()
-            presenter.say_all.assert_called_once()
+            presenter._start_say_all.assert_called_once()
 
     def test_say_all_initialization_clears_state(self, test_context: OrcaTestContext) -> None:
         """Test say_all method clears contexts, contents, and current_context at start."""
 
         essential_modules = self._setup_dependencies(test_context)
         from orca import speechserver
-        from orca.say_all_presenter import SayAllPresenter
+        from orca.say_all_presenter import SayAllPresenter, _SayAllUnit
 
         presenter = SayAllPresenter()
         mock_script = test_context.Mock()
 
         presenter._contexts = [test_context.Mock(spec=speechserver.SayAllContext)]
-        presenter._contents = [("old_obj", 0, 5, "old")]
+        presenter._add_to_history(_SayAllUnit("old_obj", 0, [], [("old_obj", 0, 5, "old")]))
         presenter._current_context = test_context.Mock(spec=speechserver.SayAllContext)
 
         focus_manager_mock = essential_modules["orca.focus_manager"]
@@ -587,7 +581,7 @@ class TestSayAllPresenter:
         assert result is True
 
         assert not presenter._contexts
-        assert not presenter._contents
+        assert not presenter._history
         assert presenter._current_context is None
 
     def test_progress_callback_sets_current_context(self, test_context: OrcaTestContext) -> None:
@@ -915,16 +909,182 @@ class TestSayAllPresenter:
             f"but was called with {actual_offset}"
         )
 
+    def _setup_lookahead(
+        self, test_context: OrcaTestContext, *producers: list[str]
+    ) -> tuple[Any, Any, dict[str, Any]]:
+        """Returns a presenter whose producers yield one utterance per string, and its script."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca import say_all_presenter, speechserver
+        from orca.acss import ACSS
+
+        essential_modules["orca.ax_text"].AXText.get_character_count.return_value = 5
+        test_context.patch_object(say_all_presenter.GLib, "idle_add", return_value=7)
+        test_context.patch_object(say_all_presenter.GLib, "source_remove")
+
+        def make_chunks(utterances: list[str]):
+            for i, utterance in enumerate(utterances):
+                obj = test_context.Mock(spec=Atspi.Accessible, name=utterance)
+                context = speechserver.SayAllContext(obj, utterance, 0, len(utterance))
+                unit = say_all_presenter._SayAllUnit(context.obj, 0, [], []) if i == 0 else None
+                yield say_all_presenter._SayAllChunk(context, ACSS(), unit, 5)
+
+        presenter = say_all_presenter.SayAllPresenter()
+        presenter._script = test_context.Mock()
+        test_context.patch_object(
+            presenter,
+            "_produce_chunks",
+            side_effect=[make_chunks(utterances) for utterances in producers],
+        )
+        return presenter, presenter._script, essential_modules
+
+    def test_lookahead_produces_utterances_ahead_of_presenting_them(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that utterances are produced ahead, up to a limit, and presented when spoken."""
+
+        presenter, script, _modules = self._setup_lookahead(
+            test_context, ["a", "b", "c", "d", "e", "f", "g"]
+        )
+        generator = presenter._say_all_iter(test_context.Mock(spec=Atspi.Accessible), 0)
+
+        assert next(generator)[0].utterance == "a"
+        while presenter._fill_lookahead():
+            pass
+        assert [chunk.context.utterance for chunk in presenter._lookahead] == ["b", "c", "d", "e"]
+        assert script.utilities.set_caret_offset.call_count == 1
+
+        assert next(generator)[0].utterance == "b"
+        assert script.utilities.set_caret_offset.call_count == 2
+        assert [context.utterance for context in presenter._contexts] == ["a", "b"]
+
+        presenter._lookahead_id = 7
+        presenter.stop()
+        assert not presenter._lookahead
+        assert list(generator) == []
+
+    def test_lookahead_discards_stale_utterances(self, test_context: OrcaTestContext) -> None:
+        """Test that utterances whose object changed are produced again after the spoken unit."""
+
+        presenter, _script, essential_modules = self._setup_lookahead(
+            test_context, ["a", "b", "c"], ["new b", "new c"]
+        )
+        restart_obj = test_context.Mock(spec=Atspi.Accessible)
+        advance = test_context.patch_object(
+            presenter, "_advance_to_next", return_value=(restart_obj, 3)
+        )
+        generator = presenter._say_all_iter(test_context.Mock(spec=Atspi.Accessible), 0)
+
+        assert next(generator)[0].utterance == "a"
+        while presenter._fill_lookahead():
+            pass
+
+        stale_obj = presenter._lookahead[0].context.obj
+        essential_modules["orca.ax_text"].AXText.get_character_count.side_effect = lambda obj: (
+            6 if obj is stale_obj else 5
+        )
+
+        assert next(generator)[0].utterance == "new b"
+        assert advance.call_args.args[0] is presenter._contexts[0].obj
+        assert presenter._produce_chunks.call_args.args[:2] == (restart_obj, 3)
+        assert [context.utterance for context, _voice in generator] == ["new c"]
+
+    def test_history_is_bounded_and_indexed_for_rewind_and_fast_forward(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that rewind and fast forward use the history, and older units are found again."""
+
+        self._setup_dependencies(test_context)
+        from orca import say_all_presenter, speechserver
+
+        presenter = say_all_presenter.SayAllPresenter()
+        script = presenter._script = test_context.Mock()
+        script.utilities.previous_context.return_value = ("prev_obj", 3)
+        presenter._start_say_all = test_context.Mock(return_value=True)
+        test_context.patch_object(presenter, "HISTORY_SIZE", new=3)
+
+        objs = [test_context.Mock(spec=Atspi.Accessible, name=f"obj{i}") for i in range(5)]
+        for obj in objs:
+            presenter._add_to_history(say_all_presenter._SayAllUnit(obj, 0, [], [(obj, 0, 5, "")]))
+        assert [unit.obj for unit in presenter._history] == objs[2:]
+        assert presenter._history_start == 2
+        assert len(presenter._history_index) == 3
+
+        def context(obj):
+            return speechserver.SayAllContext(obj, "text", 0, 5)
+
+        assert presenter._fast_forward(context(objs[3]), True) is True
+        presenter._start_say_all.assert_called_with(script, obj=objs[4], offset=0)
+        assert [unit.obj for unit in presenter._history] == objs[2:4]
+        assert presenter._rewind(context(objs[3]), True) is True
+        presenter._start_say_all.assert_called_with(script, obj=objs[2], offset=0)
+        assert not presenter._history
+        script.utilities.previous_context.assert_not_called()
+
+        assert presenter._rewind(context(objs[2]), True) is True
+        script.utilities.previous_context.assert_called_once_with(objs[2], 0, True)
+        presenter._start_say_all.assert_called_with(script, obj="prev_obj", offset=3)
+
+    def test_history_is_kept_across_consecutive_rewinds(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that restarting Say All to rewind keeps the history of what was spoken."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca import say_all_presenter, speechserver
+        from orca.acss import ACSS
+
+        essential_modules["orca.ax_text"].AXText.get_character_count.return_value = 5
+        test_context.patch_object(say_all_presenter.GLib, "idle_add", return_value=7)
+        test_context.patch_object(say_all_presenter.GLib, "source_remove")
+        speech = essential_modules["orca.speech_presenter"].get_presenter.return_value
+
+        objs = [test_context.Mock(spec=Atspi.Accessible, name=f"obj{i}") for i in range(4)]
+
+        def produce_chunks(obj, _offset, _restrict_to):
+            for other in objs[objs.index(obj) :]:
+                context = speechserver.SayAllContext(other, "text", 0, 5)
+                unit = say_all_presenter._SayAllUnit(other, 0, [], [(other, 0, 5, "text")])
+                yield say_all_presenter._SayAllChunk(context, ACSS(), unit, 5)
+
+        presenter = say_all_presenter.SayAllPresenter()
+        script = test_context.Mock()
+        test_context.patch_object(presenter, "_produce_chunks", side_effect=produce_chunks)
+
+        def speak(count: int) -> speechserver.SayAllContext:
+            iterator = speech.say_all.call_args.args[0]
+            for _i in range(count):
+                context, _voice = next(iterator)
+            return context
+
+        presenter.say_all(script, obj=objs[0], offset=0)
+        context = speak(4)
+        assert [unit.obj for unit in presenter._history] == objs
+
+        assert presenter._rewind(context, True) is True
+        context = speak(1)
+        assert context.obj is objs[2]
+        assert [unit.obj for unit in presenter._history] == objs[:3]
+
+        assert presenter._rewind(context, True) is True
+        context = speak(1)
+        assert context.obj is objs[1]
+        assert [unit.obj for unit in presenter._history] == objs[:2]
+        script.utilities.previous_context.assert_not_called()
+
+        presenter.say_all(script, obj=objs[3], offset=0)
+        assert not presenter._history
+
     def test_stop_clears_all_state(self, test_context: OrcaTestContext) -> None:
         """Test SayAllPresenter.stop clears contexts, contents, current_context and running flag."""
 
         essential_modules = self._setup_dependencies(test_context)
         from orca import speechserver
-        from orca.say_all_presenter import SayAllPresenter
+        from orca.say_all_presenter import SayAllPresenter, _SayAllUnit
 
         presenter = SayAllPresenter()
         presenter._contexts = [test_context.Mock(spec=speechserver.SayAllContext)]
-        presenter._contents = [("obj", 0, 5, "text")]
+        presenter._add_to_history(_SayAllUnit("obj", 0, [], [("obj", 0, 5, "text")]))
         presenter._current_context = test_context.Mock(spec=speechserver.SayAllContext)
         presenter._say_all_is_running = True
 
@@ -935,7 +1095,7 @@ class TestSayAllPresenter:
         presenter.stop()
 
         assert not presenter._contexts
-        assert not presenter._contents
+        assert not presenter._history
         assert presenter._current_context is None
         assert presenter._say_all_is_running is False
         manager_instance.reset_active_mode.assert_called_once_with(
@@ -950,7 +1110,7 @@ class TestSayAllPresenter:
 
         presenter = SayAllPresenter()
         assert not presenter._contexts
-        assert not presenter._contents
+        assert not presenter._history
         assert presenter._current_context is None
         assert presenter._say_all_is_running is False
 
@@ -961,7 +1121,7 @@ class TestSayAllPresenter:
         presenter.stop()
 
         assert not presenter._contexts
-        assert not presenter._contents
+        assert not presenter._history
         assert presenter._current_context is None
         assert presenter._say_all_is_running is False
         manager_instance.reset_active_mode.assert_called_once()
@@ -79,3 +79,23 @@ class TestScriptCache:
         ax_cache_manager.get_manager().clear_cache_now("test reason")
 
         assert cache.get_queued_event(event.type) is event
+
+    def test_handled_event_types_exclude_no_op_listeners(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test only the event types whose listeners a subclass overrides are reported."""
+
+        self._setup_dependencies(test_context)
+        from orca.script import Script
+
+        class _WindowScript(Script):
+            def _on_window_activated(self, event: Atspi.Event) -> bool:
+                return True
+
+        script = _WindowScript.__new__(_WindowScript)
+        script.listeners = script.get_listeners()
+        assert script.get_handled_event_types() == ["window:activate"]
+
+        base = Script.__new__(Script)
+        base.listeners = base.get_listeners()
+        assert not base.get_handled_event_types()
@@ -283,9 +283,11 @@ class TestScriptManager:
             mock_script = test_context.Mock()
             mock_script.deregister_event_listeners = test_context.Mock()
             manager._default_script = mock_script
-            manager.app_scripts = {"test": "script"}
-            manager.toolkit_scripts = {"test": "script"}
-            manager.custom_scripts = {"test": "script"}
+            app_script = test_context.Mock()
+            toolkit_script = test_context.Mock()
+            manager.app_scripts = {"app": app_script}
+            manager.toolkit_scripts = {"app": {"gtk": toolkit_script}}
+            manager.custom_scripts = {"app": {"terminal": None}}
 
         manager.deactivate()
         assert manager._active is False
@@ -297,6 +299,8 @@ class TestScriptManager:
             assert not manager.toolkit_scripts
             assert not manager.custom_scripts
             mock_script.deregister_event_listeners.assert_called_once()
+            app_script.deregister_event_listeners.assert_called_once()
+            toolkit_script.deregister_event_listeners.assert_called_once()
 
     @pytest.mark.parametrize(
         "case",
@@ -714,9 +718,21 @@ class TestScriptManager:
         class ToolkitScript:
             """Mock toolkit script class."""
 
+            def register_event_listeners(self) -> None:
+                """Registers for listeners needed by this script."""
+
+            def deregister_event_listeners(self) -> None:
+                """De-registers the listeners needed by this script."""
+
         class AppScript:
             """Mock app script class."""
 
+            def register_event_listeners(self) -> None:
+                """Registers for listeners needed by this script."""
+
+            def deregister_event_listeners(self) -> None:
+                """De-registers the listeners needed by this script."""
+
         mock_toolkit_script = test_context.Mock(spec=ToolkitScript)
         mock_app_script = test_context.Mock(spec=AppScript)
         sleep_mode_manager.is_active_for_app = test_context.Mock(
@@ -752,12 +768,15 @@ class TestScriptManager:
             assert hasattr(result, "register_event_listeners")
         elif case["expected_script_type"] == "sleep":
             assert result == mock_sleep_script
+            mock_app_script.register_event_listeners.assert_not_called()
         elif case["expected_script_type"] == "custom":
             assert result == mock_custom_script
         elif case["expected_script_type"] == "toolkit":
             assert result == mock_toolkit_script
         elif case["expected_script_type"] == "app":
             assert result == mock_app_script
+            mock_app_script.register_event_listeners.assert_called_once()
+            mock_app_script.deregister_event_listeners.assert_not_called()
 
     def test_get_script_exception_handling(self, test_context: OrcaTestContext) -> None:
         """Test ScriptManager.get_script handles exceptions."""
@@ -264,6 +264,7 @@ class TestGeneratorCache:
                 call.kwargs["clear_interval_seconds"]
                 == Generator._CACHE._CACHE_CLEAR_INTERVAL_SECONDS
             )
+            assert call.kwargs["max_entries"] == Generator._CACHE._CACHE_MAX_ENTRIES
         assert Generator._CACHE._CACHE_CLEAR_INTERVAL_SECONDS == 2
 
     def test_manager_clear_cache_now_preserves_generator_cache(
@@ -559,6 +559,162 @@ class TestStructuralNavigator:
         result = nav._get_object_in_direction(mock_script, [], True, False)
         assert result is None
 
+    def test_indexed_query_reuses_matches_in_document_mode(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that document queries are run once per root until the index is cleared."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca.structural_navigator import NavigationMode, get_navigator
+
+        nav = get_navigator()
+        mock_script = test_context.Mock()
+        entries = [test_context.Mock(), test_context.Mock()]
+        find_all_editable_objects = essential_modules["orca.AXUtilities"].find_all_editable_objects
+        find_all_editable_objects.return_value = entries
+        test_context.patch_object(nav, "get_mode", return_value=NavigationMode.DOCUMENT)
+        test_context.patch_object(
+            nav, "_determine_root_container", return_value=test_context.Mock()
+        )
+
+        first = nav._get_all_entries(mock_script)
+        second = nav._get_all_entries(mock_script)
+        assert first == entries
+        assert second is first
+        assert find_all_editable_objects.call_count == 1
+
+        nav._indexes.invalidate("test")
+        nav._get_all_entries(mock_script)
+        assert find_all_editable_objects.call_count == 2
+
+    def test_role_based_queries_are_indexed_by_one_sweep(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that the first role-based query indexes the matches of the others too."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca.structural_navigator import NavigationMode, get_navigator
+
+        nav = get_navigator()
+        mock_script = test_context.Mock()
+        headings = [test_context.Mock()]
+        level_two_headings = [test_context.Mock()]
+        links = [test_context.Mock(), test_context.Mock()]
+        ax_utilities = essential_modules["orca.AXUtilities"]
+        ax_utilities.find_all_partitioned_by_role.return_value = {
+            ("_get_all_headings",): headings,
+            ("_get_all_headings", 2): level_two_headings,
+            ("_get_all_links",): links,
+        }
+        test_context.patch_object(nav, "get_mode", return_value=NavigationMode.DOCUMENT)
+        test_context.patch_object(
+            nav, "_determine_root_container", return_value=test_context.Mock()
+        )
+
+        assert nav._get_all_headings(mock_script) == headings
+        assert nav._get_all_links(mock_script) == links
+        assert nav._get_all_headings(mock_script, 2) == level_two_headings
+        assert ax_utilities.find_all_partitioned_by_role.call_count == 1
+        ax_utilities.find_all_headings.assert_not_called()
+        ax_utilities.find_all_links.assert_not_called()
+
+        partitions = ax_utilities.find_all_partitioned_by_role.call_args.args[1]
+        assert ("_get_all_headings", 6) in partitions
+        assert ("_get_all_entries",) not in partitions
+
+    def test_indexed_query_is_not_reused_in_gui_mode(self, test_context: OrcaTestContext) -> None:
+        """Test that GUI queries are run each time."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca.structural_navigator import NavigationMode, get_navigator
+
+        nav = get_navigator()
+        mock_script = test_context.Mock()
+        find_all_buttons = essential_modules["orca.AXUtilities"].find_all_buttons
+        find_all_buttons.return_value = [test_context.Mock()]
+        test_context.patch_object(nav, "get_mode", return_value=NavigationMode.GUI)
+        test_context.patch_object(
+            nav, "_determine_root_container", return_value=test_context.Mock()
+        )
+
+        nav._get_all_buttons(mock_script)
+        nav._get_all_buttons(mock_script)
+        assert find_all_buttons.call_count == 2
+
+    @pytest.mark.parametrize(
+        "focus_path, is_next, expected_index",
+        [
+            pytest.param([0, 1], True, 1, id="next_after_gap"),
+            pytest.param([0, 1], False, 0, id="previous_before_gap"),
+            pytest.param([0, 3], True, 2, id="next_is_descendant"),
+            pytest.param([0, 3], False, 1, id="previous_before_ancestor"),
+            pytest.param([1], False, 2, id="previous_is_last"),
+            pytest.param([0, 0, 5], True, 1, id="next_from_unmatched_descendant"),
+        ],
+    )
+    def test_get_object_in_direction_bisects_index(
+        self,
+        test_context: OrcaTestContext,
+        focus_path: list[int],
+        is_next: bool,
+        expected_index: int,
+    ) -> None:
+        """Test that the next/previous match in an index is found from the path of the focus."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca.structural_navigator import NavigationType, _StructuralIndex, get_navigator
+
+        nav = get_navigator()
+        matches = [test_context.Mock(), test_context.Mock(), test_context.Mock()]
+        paths = {matches[0]: [0, 0], matches[1]: [0, 2], matches[2]: [0, 3, 1]}
+        focus = test_context.Mock()
+        paths[focus] = focus_path
+
+        essential_modules[
+            "orca.focus_manager"
+        ].get_manager.return_value.get_locus_of_focus.return_value = focus
+        essential_modules["orca.AXObject"].get_parent.return_value = None
+        essential_modules["orca.AXObject"].get_path.side_effect = lambda obj: paths.get(obj, [])
+        essential_modules["orca.AXObject"].is_dead.return_value = False
+        test_context.patch_object(nav, "_caret_is_past_descendant", return_value=False)
+
+        index = _StructuralIndex(lambda: list(matches))
+        result = nav._get_object_in_direction(
+            test_context.Mock(), index, is_next, NavigationType.LINK, should_wrap=False
+        )
+        assert result == matches[expected_index]
+        assert matches == list(index)
+
+    def test_get_object_in_direction_rebuilds_index_for_dead_result(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that an index whose result is dead is rebuilt before searching again."""
+
+        essential_modules = self._setup_dependencies(test_context)
+        from orca.structural_navigator import NavigationType, _StructuralIndex, get_navigator
+
+        nav = get_navigator()
+        dead = test_context.Mock()
+        alive = test_context.Mock()
+        focus = test_context.Mock()
+        paths = {dead: [0, 1], alive: [0, 2], focus: [0, 0]}
+        queries = [[dead], [alive]]
+
+        essential_modules[
+            "orca.focus_manager"
+        ].get_manager.return_value.get_locus_of_focus.return_value = focus
+        essential_modules["orca.AXObject"].get_parent.return_value = None
+        essential_modules["orca.AXObject"].get_path.side_effect = lambda obj: paths[obj]
+        essential_modules["orca.AXObject"].is_dead.side_effect = lambda obj: obj is dead
+        test_context.patch_object(nav, "_caret_is_past_descendant", return_value=False)
+
+        index = _StructuralIndex(lambda: queries.pop(0))
+        result = nav._get_object_in_direction(
+            test_context.Mock(), index, True, NavigationType.HEADING, should_wrap=False
+        )
+        assert result == alive
+        assert list(index) == [alive]
+
     def test_previous_button_method(self, test_context: OrcaTestContext) -> None:
         """Test StructuralNavigator.previous_button method."""
 
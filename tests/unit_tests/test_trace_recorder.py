@@ -0,0 +1,180 @@
+# Unit tests for trace_recorder.py methods.
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=import-outside-toplevel
+# pylint: disable=protected-access
+
+"""Unit tests for trace_recorder.py methods."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from orca.trace_recorder import TraceRecorder
+
+    from .orca_test_context import OrcaTestContext
+
+
+class _FakeText:
+    """Stands in for an Atspi interface class."""
+
+    @staticmethod
+    def get_character_count(obj: object) -> int:
+        """Returns a fixed character count."""
+
+        return len(str(obj))
+
+    def get_text(self, start: int, end: int) -> str:
+        """Returns a fixed string."""
+
+        return "hello"[start:end]
+
+    def _private(self) -> None:
+        """Is never wrapped."""
+
+
+@pytest.mark.unit
+class TestTraceRecorder:
+    """Test TraceRecorder class methods."""
+
+    def _get_recorder(self, test_context: OrcaTestContext) -> TraceRecorder:
+        """Returns a new TraceRecorder which is not recording."""
+
+        essential_modules = test_context.setup_shared_dependencies([])
+        essential_modules["orca.debug"].debugLevel = 0
+        test_context.patch("os.environ", new={})
+        from orca import trace_recorder
+
+        test_context.patch_object(trace_recorder.TraceRecorder, "ATSPI_INTERFACES", new=())
+        return trace_recorder.TraceRecorder()
+
+    def test_inactive_recorder_records_nothing(
+        self,
+        test_context: OrcaTestContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test that nothing is recorded or written unless tracing was started."""
+
+        recorder = self._get_recorder(test_context)
+        with recorder.slice("focus", "event"), recorder.async_slice("write", "brlapi"):
+            recorder.instant("mark", "event")
+        assert not recorder.get_is_tracing()
+        assert not recorder._events
+        assert not recorder.stop_tracing()
+        assert not list(tmp_path.iterdir())
+
+    def test_trace_file_contents(self, test_context: OrcaTestContext, tmp_path: Path) -> None:
+        """Test that slices, async slices, and instants are written in Trace Event Format."""
+
+        recorder = self._get_recorder(test_context)
+        path = tmp_path / "orca.json"
+        assert recorder.start_tracing(str(path))
+        assert not recorder.start_tracing(str(path))
+        assert recorder.get_is_tracing()
+
+        with (
+            recorder.slice("object:state-changed:focused", "event", {"counter": 3}),
+            recorder.slice("speak", "speech"),
+        ):
+            recorder.instant("mark", "event")
+        with recorder.async_slice("writeText", "brlapi"):
+            pass
+
+        assert recorder.stop_tracing()
+        assert not recorder.get_is_tracing()
+
+        trace = json.loads(path.read_text())
+        assert trace["otherData"]["droppedEvents"] == 0
+        events = [event for event in trace["traceEvents"] if event["ph"] != "M"]
+        assert [(event["ph"], event["name"]) for event in events] == [
+            ("i", "mark"),
+            ("X", "speak"),
+            ("X", "object:state-changed:focused"),
+            ("b", "writeText"),
+            ("e", "writeText"),
+        ]
+        outer, inner = events[2], events[1]
+        assert outer["args"] == {"counter": 3}
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+        assert events[3]["id"] == events[4]["id"]
+        assert any(event["name"] == "thread_name" for event in trace["traceEvents"])
+
+    def test_full_trace_counts_dropped_events(
+        self,
+        test_context: OrcaTestContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test that events beyond MAX_EVENTS are counted rather than recorded."""
+
+        recorder = self._get_recorder(test_context)
+        test_context.patch_object(recorder, "MAX_EVENTS", new=2)
+        path = tmp_path / "orca.json"
+        recorder.start_tracing(str(path))
+        for _i in range(5):
+            recorder.instant("mark", "event")
+        recorder.stop_tracing()
+
+        trace = json.loads(path.read_text())
+        assert trace["otherData"]["droppedEvents"] == 3
+
+    def test_atspi_functions_wrapped_while_tracing(
+        self,
+        test_context: OrcaTestContext,
+        tmp_path: Path,
+    ) -> None:
+        """Test that AT-SPI functions are timed while tracing and restored afterwards."""
+
+        recorder = self._get_recorder(test_context)
+        from orca import trace_recorder
+
+        atspi = test_context.Mock(spec=["Text"])
+        atspi.Text = _FakeText
+        test_context.patch_object(trace_recorder, "Atspi", new=atspi)
+        test_context.patch_object(recorder, "ATSPI_INTERFACES", new=("Text", "Missing"))
+        original_get_text = _FakeText.__dict__["get_text"]
+        original_count = _FakeText.__dict__["get_character_count"]
+
+        path = tmp_path / "orca.json"
+        recorder.start_tracing(str(path))
+        assert _FakeText.__dict__["get_text"] is not original_get_text
+        assert _FakeText.__dict__["get_character_count"] is original_count
+        assert _FakeText().get_text(1, 3) == "el"
+        recorder.stop_tracing()
+
+        assert _FakeText.__dict__["get_text"] is original_get_text
+        trace = json.loads(path.read_text())
+        names = [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"]
+        assert names == ["Text.get_text"]
+
+    def test_unwritable_trace_file(self, test_context: OrcaTestContext, tmp_path: Path) -> None:
+        """Test that failing to write the trace stops tracing and reports failure."""
+
+        recorder = self._get_recorder(test_context)
+        recorder.start_tracing(str(tmp_path / "missing" / "orca.json"))
+        recorder.instant("mark", "event")
+        assert not recorder.stop_tracing()
+        assert not recorder.get_is_tracing()
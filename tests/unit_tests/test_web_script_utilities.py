@@ -131,6 +131,11 @@ class TestWebUtilitiesCache:
                 assert call.kwargs["lifetime"] is ax_cache_manager.Lifetime.OWNER
                 assert call.kwargs["clear_on_demand"] is ax_cache_manager.ClearPolicy.PRESERVE
                 assert call.kwargs["clear_interval_seconds"] is None
+                assert call.kwargs["keyed_by_object"] is (call.args[1] in cache.SUBTREE_NAMESPACES)
+                if call.args[1] in cache.OBJECT_DECISION_NAMESPACES:
+                    assert call.kwargs["max_entries"] == cache._MAX_DECISIONS
+                else:
+                    assert call.kwargs["max_entries"] is None
 
     def test_clear_object_decisions_clears_object_decision_namespaces(
         self, test_context: OrcaTestContext
@@ -166,6 +171,56 @@ class TestWebUtilitiesCache:
 
         assert cache.get_for_object(cache.IS_LINK, mock_obj) is False
 
+    def test_discard_object_decisions_discards_only_subtree(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that the decisions of objects outside the changed subtree are kept."""
+
+        self._setup_dependencies(test_context)
+        from orca import ax_cache_manager
+
+        web_utilities_cache = self._load_script_utilities_module()._WebUtilitiesCache
+        cache = web_utilities_cache()
+        document, feed, item, sidebar = (test_context.Mock(spec=Atspi.Accessible) for _ in range(4))
+        manager = ax_cache_manager.get_manager()
+        manager.note_parent(hash(item), hash(feed))
+        for obj in (document, feed, item, sidebar):
+            cache.set_for_object(cache.TREAT_AS_DIV, obj, True)
+            cache.set_caret_context_decision(obj, True)
+
+        assert cache.discard_object_decisions(feed, [document], "test reason") == 6
+
+        for obj in (document, feed, item):
+            assert cache.get_for_object(cache.TREAT_AS_DIV, obj) is ax_cache_manager.MISSING
+            assert cache.get_caret_context_decision(obj) is None
+        assert cache.get_for_object(cache.TREAT_AS_DIV, sidebar) is True
+        assert cache.get_caret_context_decision(sidebar) is True
+
+    def test_patch_cache_keeps_valid_contexts_and_counts_updates(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test that patching drops only invalid contexts and is counted apart from dumps."""
+
+        self._setup_dependencies(test_context)
+        web_module = self._load_script_utilities_module()
+        utilities = web_module.Utilities(test_context.Mock())
+        parent, valid, removed = (test_context.Mock(spec=Atspi.Accessible) for _ in range(3))
+        test_context.patch_object(
+            web_module.AXObject, "is_valid", side_effect=lambda obj: obj is not removed
+        )
+        clear_content = test_context.patch_object(utilities, "clear_content_cache")
+        cache = utilities._cache
+        cache.set_context_for_parent(cache.CARET_CONTEXTS, parent, (valid, 1))
+        cache.set_context_for_parent(cache.CARET_CONTEXTS, valid, (removed, 0))
+        cache.set_context_for_parent(cache.PRIOR_CONTEXTS, parent, (removed, 2))
+
+        utilities.patch_cache(parent)
+
+        assert cache.get_caret_contexts() == {hash(parent): (valid, 1)}
+        assert cache.get_context_for_parent(cache.PRIOR_CONTEXTS, parent) is None
+        clear_content.assert_called_once_with(parent)
+        assert utilities.get_cache_update_counts() == {"dumps": 0, "patches": 1}
+
     def test_clear_content_clears_content_namespaces(self, test_context: OrcaTestContext) -> None:
         """Test direct web clearing removes cached contents."""
 
@@ -199,6 +254,54 @@ class TestWebUtilitiesCache:
 
         assert cache.get_content(cache.LINE_CONTENTS) == contents
 
+    def test_line_window_keeps_recent_lines_and_their_links(
+        self, test_context: OrcaTestContext
+    ) -> None:
+        """Test the line window evicts the least recently used line and links to it."""
+
+        self._setup_dependencies(test_context)
+
+        web_utilities_cache = self._load_script_utilities_module()._WebUtilitiesCache
+        cache = web_utilities_cache()
+        test_context.patch_object(cache, "_MAX_LINES", new=2)
+        mock_obj = test_context.Mock(spec=Atspi.Accessible)
+        first, second, third = ([(mock_obj, i * 10, i * 10 + 10, "x")] for i in range(3))
+
+        cache.put_line(first)
+        cache.put_line(second)
+        cache.link_lines(first, second, True, True)
+        assert cache.get_adjacent_line(first, True, True) == second
+        assert cache.get_adjacent_line(first, True, False) is None
+        assert cache.get_adjacent_line(second, False, True) is None
+        assert cache.get_lines() == [second, first]
+
+        cache.put_line(first)
+        cache.put_line(third)
+        assert cache.get_lines() == [third, first]
+        assert cache.get_adjacent_line(first, True, True) is None
+
+        cache.clear_content("test reason")
+        assert not cache.get_lines()
+
+    def test_discard_lines_keeps_unaffected_lines(self, test_context: OrcaTestContext) -> None:
+        """Test discarding lines removes only affected lines, and all links."""
+
+        self._setup_dependencies(test_context)
+
+        web_utilities_cache = self._load_script_utilities_module()._WebUtilitiesCache
+        cache = web_utilities_cache()
+        changed = test_context.Mock(spec=Atspi.Accessible)
+        unchanged = test_context.Mock(spec=Atspi.Accessible)
+        first = [(unchanged, 0, 5, "hello")]
+        second = [(unchanged, 5, 6, " "), (changed, 0, 5, "world")]
+        cache.put_line(first)
+        cache.put_line(second)
+        cache.link_lines(first, second, True, True)
+
+        assert cache.discard_lines(lambda x: x is changed, "test reason") == 1
+        assert cache.get_lines() == [first]
+        assert cache.get_adjacent_line(first, True, True) is None
+
     def test_clear_caret_context_decisions_clears_context_namespace(
         self, test_context: OrcaTestContext
     ) -> None:
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# benchmark_cache_gets.py
+#
+# Measures the cost of reading a value from an AXCacheManager cache, with and
+# without taking the manager's lock, so that the benefit of lock-free reads can
+# be checked on a given machine. Nothing is asserted; the timings are printed.
+#
+# Usage: python tools/benchmark_cache_gets.py [ITERATIONS]
+#
+# Copyright 2026 Igalia, S.L.
+# Author: Joanmarie Diggs <jdiggs@igalia.com>
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the
+# Free Software Foundation, Inc., Franklin Street, Fifth Floor,
+# Boston MA  02110-1301 USA.
+
+# pylint: disable=wrong-import-position
+
+"""Measures the cost of reading a value from an AXCacheManager cache."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from orca.ax_cache_manager import AXCacheManager, CacheAccessor, Lifetime
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_DEFAULT_ITERATIONS = 200000
+_ROUNDS = 5
+
+
+class _Owner:
+    """Owns the benchmarked caches."""
+
+
+def _time_per_call(function: Callable[[], object], iterations: int) -> float:
+    """Returns the fastest of several rounds of calling function, in nanoseconds per call."""
+
+    best = float("inf")
+    for _round in range(_ROUNDS):
+        start = time.perf_counter_ns()
+        for _i in range(iterations):
+            function()
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+    return best
+
+
+def _report(label: str, lock_free: float, locked: float) -> None:
+    """Prints the timings of one kind of read."""
+
+    print(f"{label:<28} {lock_free:>8.0f} ns {locked:>8.0f} ns {locked / lock_free:>8.2f}x")
+
+
+def main() -> None:
+    """Prints the cost of cache hits and misses with and without the manager's lock."""
+
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_ITERATIONS
+    manager = AXCacheManager()
+    owner = _Owner()
+    for name, budget in (("unbounded", None), ("bounded", 1000)):
+        manager.register_cache(
+            owner, name, lifetime=Lifetime.OWNER, clear_interval_seconds=None, max_entries=budget
+        )
+
+    lock = manager._lock  # pylint: disable=protected-access
+
+    def read(cache: CacheAccessor, key: str, locked: bool) -> Callable[[], object]:
+        if not locked:
+            return lambda: cache.get(key)
+
+        def locked_get() -> object:
+            with lock:
+                return cache.get(key)
+
+        return locked_get
+
+    def measure(label: str, cache: CacheAccessor, key: str) -> None:
+        _report(
+            label,
+            _time_per_call(read(cache, key, False), iterations),
+            _time_per_call(read(cache, key, True), iterations),
+        )
+
+    print(f"{iterations} reads, fastest of {_ROUNDS} rounds.")
+    print(f"{'':<28} {'no lock':>11} {'lock':>11} {'ratio':>9}")
+    for name in ("unbounded", "bounded"):
+        cache = manager.get_cache(owner, name)
+        assert cache is not None
+        cache.put("key", "value")
+        measure(f"{name} hit", cache, "key")
+        measure(f"{name} miss", cache, "missing")
+
+    # Reads made while another thread keeps storing values show the cost of contention. The
+    # writer stores fewer values than the budget, so the value read is never evicted.
+    bounded = manager.get_cache(owner, "bounded")
+    assert bounded is not None
+    stop = threading.Event()
+
+    def store() -> None:
+        index = 0
+        while not stop.is_set():
+            bounded.put(index % 500, index)
+            index += 1
+
+    writer = threading.Thread(target=store, daemon=True)
+    writer.start()
+    try:
+        measure("bounded hit, with a writer", bounded, "key")
+    finally:
+        stop.set()
+        writer.join()
+
+
+if __name__ == "__main__":
+    main()
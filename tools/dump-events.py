@@ -4,7 +4,7 @@
 # Command-line tool to listen for and display accessibility events for a named
 # application.
 #
-# Usage: dump-events.py <APP_NAME> [EVENT_TYPE]
+# Usage: dump-events.py [--save FILE] <APP_NAME> [EVENT_TYPE]
 #
 # Copyright 2026 Igalia, S.L.
 # Author: Joanmarie Diggs <jdiggs@igalia.com>
@@ -29,8 +29,11 @@
 
 """Command-line tool to listen for and display accessibility events for a named application."""
 
+import gzip
+import json
 import signal
 import sys
+import time
 from types import SimpleNamespace
 
 import gi
@@ -45,8 +48,21 @@ _state = SimpleNamespace(
     all_app_names=set(),
     event_count=0,
     event_filter="",
+    save_path="",
+    start_time=0.0,
+    nodes={},
+    node_ids={},
+    events=[],
 )
 
+# The version of the file written by --save. The file is JSON, gzip-compressed if its name
+# ends in ".gz", containing the application name, the recorded events, and a snapshot of the
+# objects those events touch plus their ancestors. Each node is stored under a numeric id as
+# {"name", "role", "states", "parent", "app"}, where "parent" and "app" are node ids or None.
+# Each event is stored as [ms since first event, type, source id, detail1, detail2, any_data];
+# an any_data which is an accessible object is stored as {"ref": node id}.
+RECORDING_VERSION = 1
+
 
 def get_name_and_role(obj):
     """Get the name and role of an accessible object, falling back on labelled-by."""
@@ -109,6 +125,86 @@ def matches_app(obj):
     return False
 
 
+def _get_node_id(obj):
+    """Returns the snapshot id of obj, adding obj and its ancestors to the snapshot if needed."""
+
+    if obj is None:
+        return None
+
+    node_id = _state.node_ids.get(obj)
+    if node_id is not None:
+        return node_id
+
+    node_id = len(_state.node_ids)
+    _state.node_ids[obj] = node_id
+    try:
+        states = Atspi.Accessible.get_state_set(obj).get_states()
+        parent = Atspi.Accessible.get_parent(obj)
+        app = Atspi.Accessible.get_application(obj)
+        role = Atspi.Accessible.get_role(obj)
+    except GLib.GError:
+        _state.nodes[node_id] = {"name": "", "role": "invalid", "states": ["defunct"]}
+        return node_id
+
+    # The parent of the application is the desktop, which is not part of the snapshot.
+    if role == Atspi.Role.APPLICATION:
+        parent = app = None
+
+    name, role_name = get_name_and_role(obj)
+    _state.nodes[node_id] = {
+        "name": name,
+        "role": role_name,
+        "states": [state.value_nick for state in states],
+        "parent": _get_node_id(parent) if parent != obj else None,
+        "app": _get_node_id(app) if app != obj else node_id,
+    }
+    return node_id
+
+
+def record_event(event):
+    """Adds event, and the objects it touches, to the recording to be saved."""
+
+    now = time.monotonic()
+    if not _state.events:
+        _state.start_time = now
+
+    any_data = event.any_data
+    if isinstance(any_data, Atspi.Accessible):
+        any_data = {"ref": _get_node_id(any_data)}
+    elif any_data is not None and not isinstance(any_data, (bool, int, float, str)):
+        any_data = str(any_data)
+
+    _state.events.append(
+        [
+            round((now - _state.start_time) * 1000, 3),
+            event.type,
+            _get_node_id(event.source),
+            event.detail1,
+            event.detail2,
+            any_data,
+        ]
+    )
+
+
+def save_recording():
+    """Writes the recorded events and accessible-tree snapshot to the save path."""
+
+    recording = {
+        "version": RECORDING_VERSION,
+        "application": _state.app_name,
+        "nodes": _state.nodes,
+        "events": _state.events,
+    }
+    data = json.dumps(recording, separators=(",", ":")).encode("utf-8")
+    if _state.save_path.endswith(".gz"):
+        data = gzip.compress(data)
+    with open(_state.save_path, "wb") as recording_file:
+        recording_file.write(data)
+
+    events, nodes = len(_state.events), len(_state.nodes)
+    print(f"Saved {events} event(s) and {nodes} object(s) to {_state.save_path}.")
+
+
 def on_event(event):
     """Callback for all accessibility events."""
 
@@ -119,6 +215,8 @@ def on_event(event):
         return
 
     _state.event_count += 1
+    if _state.save_path:
+        record_event(event)
 
     name, role = get_name_and_role(event.source)
     source = f"'{name}' ({role})" if name else f"<unnamed> ({role})"
@@ -151,22 +249,33 @@ def get_desktop_apps():
 def main():
     """Starts listening for events from the specified application."""
 
-    if len(sys.argv) < 2:
-        print("Usage: dump-events.py <APP_NAME> [EVENT_TYPE]")
+    args = sys.argv[1:]
+    if "--save" in args:
+        index = args.index("--save")
+        _state.save_path = args[index + 1] if index + 1 < len(args) else ""
+        del args[index : index + 2]
+        if not _state.save_path:
+            args = []
+
+    if not args:
+        print("Usage: dump-events.py [--save FILE] <APP_NAME> [EVENT_TYPE]")
         print()
         print("EVENT_TYPE is an optional prefix filter, e.g.:")
         print("  object:state-changed:focused")
         print("  object:text-changed")
         print("  window:")
         print()
+        print("--save FILE also writes the events, plus a snapshot of the objects they")
+        print("touch, to FILE (gzip-compressed if FILE ends in .gz) for replay in tests.")
+        print()
         apps = get_desktop_apps()
         print(f"Desktop has {len(apps)} accessible application(s):")
         for i, (name, _obj) in enumerate(apps):
             print(f"  {i + 1}. {name}")
         sys.exit(1)
 
-    _state.app_name = sys.argv[1]
-    _state.event_filter = sys.argv[2] if len(sys.argv) > 2 else ""
+    _state.app_name = args[0]
+    _state.event_filter = args[1] if len(args) > 1 else ""
 
     apps = get_desktop_apps()
     matches = [(n, o) for n, o in apps if _state.app_name.lower() in n.lower()]
@@ -209,6 +318,8 @@ def _on_sigint():
     """Handle Ctrl+C by quitting the event loop."""
 
     print(f"\nStopped. {_state.event_count} event(s) received.")
+    if _state.save_path:
+        save_recording()
     Atspi.event_quit()  # pylint: disable=no-value-for-parameter
     return GLib.SOURCE_REMOVE
 
@@ -9,6 +9,9 @@
 #
 # Usage: python tools/profile_orca.py
 #
+# With --trace FILE, Orca runs without cProfile and records a timeline of
+# event processing instead, which can be loaded in https://ui.perfetto.dev.
+#
 # Copyright 2026 Igalia, S.L.
 # Author: Joanmarie Diggs <jdiggs@igalia.com>
 #
@@ -282,6 +285,33 @@ def _load_merged_stats(directory: str) -> dict | None:
     return merged.stats  # type: ignore[attr-defined]
 
 
+def _record_trace(path: str) -> None:
+    """Launches Orca with the trace recorder writing to path."""
+
+    orca_bin = shutil.which("orca")
+    if orca_bin is None:
+        print("orca not found in PATH.", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Launching Orca recording a trace to {path} (debug output suppressed).")
+    print("Interact with Orca normally, then Ctrl+C when done.\n")
+
+    os.environ["ORCA_PROFILING"] = "1"
+    os.environ["ORCA_TRACE"] = path
+
+    sys.argv = [orca_bin, "--replace"]
+    try:
+        runpy.run_path(orca_bin, run_name="__main__")
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        # Orca writes the trace when it shuts down cleanly; this covers the other exits.
+        if (recorder_module := sys.modules.get("orca.trace_recorder")) is not None:
+            recorder_module.get_recorder().shutdown()
+
+    print(f"Trace written to {path}. Open it in https://ui.perfetto.dev or chrome://tracing.")
+
+
 def main() -> None:
     """Launches Orca under cProfile and prints the results."""
 
@@ -309,8 +339,17 @@ def main() -> None:
         default=0,
         help="Callee tree depth for --target (default: 0, summary only).",
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record a timeline of event processing to FILE instead of profiling.",
+    )
     args = parser.parse_args()
 
+    if args.trace:
+        _record_trace(os.path.abspath(args.trace))
+        return
+
     if args.load:
         loaded = _load_merged_stats(args.load)
         if loaded is None: